@@ -25,6 +25,7 @@ from ..core.cluster import (
     install_nccl_on_cluster,
     install_nri_on_cluster,
     set_jobset_on_cluster,
+    get_k8s_api_client,
     setup_k8s_env,
     count_nodes_on_cluster,
     update_cluster_with_gcpfilestore_driver_if_necessary,
@@ -35,10 +36,12 @@ from ..core.cluster import (
     update_cluster_with_workload_identity_if_necessary,
     update_cluster_with_mtc_if_necessary,
 )
+from ..core.cluster_journal import ClusterCreateJournal, discard_cluster_create_journal, get_inputs_fingerprint
 from ..core.cluster_private import authorize_private_cluster_access_if_necessary
-from ..core.commands import run_command_for_value, run_command_with_updates
+from ..core.commands import Command, run_command_for_value, run_command_with_updates
 from ..core.config import VERTEX_TENSORBOARD_FEATURE_FLAG
 from ..core.telemetry import MetricsCollector, MetricsEventMetadataKey
+from ..core.tracing import trace_phase
 from ..core.capacity import (
     H100_DEVICE_TYPE,
     get_capacity_type,
@@ -48,6 +51,7 @@ from ..core.reservation import (
     get_reservation_deployment_type,
 )
 from ..core.gcloud_context import (
+    GkeServerConfig,
     add_zone_and_project,
     get_gke_control_plane_version,
     get_gke_server_config,
@@ -55,6 +59,9 @@ from ..core.gcloud_context import (
     zone_to_region,
 )
 from ..core.jobset import update_jobset_resources_if_necessary
+from ..core.kube_api import is_native_kubernetes_reads_enabled, list_nodes
+from ..core.kubeconfig_cache import forget_cached_context, get_cached_kubeconfig_path
+from ..core.metadata_cache import CLUSTER_LOCATIONS
 from ..core.kueue_manager import (KueueConfig, KueueManager)
 from ..core.nap import enable_autoprovisioning_on_cluster
 from ..core.network import (
@@ -81,6 +88,7 @@ from ..core.vertex import create_vertex_tensorboard
 from ..core.workload import get_workload_list
 from ..utils.console import ask_for_user_consent, xpk_exit, xpk_print
 from ..utils.file import write_tmp_file
+from ..utils.task_graph import TaskGraph
 from ..utils.execution_context import is_dry_run, is_quiet
 from ..utils.validation import validate_dependencies_list, SystemDependency, should_validate_dependencies
 from . import cluster_gcluster
@@ -92,11 +100,13 @@ from .common import (
 )
 from jinja2 import Environment, FileSystemLoader
 from ..utils.templates import get_templates_absolute_path
+from dataclasses import asdict, dataclass, field
 import shutil
 import os
 from .managed_ml_diagnostics import install_mldiagnostics_prerequisites
 
 CLUSTER_PREHEAT_JINJA_FILE = 'cluster_preheat.yaml.j2'
+_MAX_PARALLEL_CLUSTER_PHASES = 4
 
 
 def cluster_adapt(args) -> None:
@@ -411,141 +421,328 @@ def cluster_create(args) -> None:
     )
     xpk_exit(0)
 
-  create_cluster_command_code = create_cluster_if_necessary(
-      args, gke_control_plane_version, system, release_channel=release_channel
+  state = _ClusterCreateState()
+  phases = _get_cluster_create_phases(
+      args,
+      system,
+      gke_server_config,
+      gke_control_plane_version,
+      release_channel,
+      state,
+  )
+  journal = None
+  completed_phases: set[str] = set()
+  if not is_dry_run():
+    journal = ClusterCreateJournal.load(
+        args.project, args.zone, args.cluster, get_inputs_fingerprint(args)
+    )
+    state.restore(journal.state)
+    completed_phases = set(journal.completed_phases) - phases.get_dependents(
+        _get_forced_phases(args, phases)
+    )
+  if completed_phases:
+    xpk_print(
+        'Skipping phases completed by a previous run with the same inputs:'
+        f' {", ".join(p for p in phases.task_names if p in completed_phases)}.'
+        ' Use --force-phase to run them again.'
+    )
+
+  # Dry runs print the commands in the usual sequential order.
+  return_code = phases.run(
+      max_parallelism=1 if is_dry_run() else _MAX_PARALLEL_CLUSTER_PHASES,
+      skip=completed_phases,
+      on_success=(
+          (lambda phase: journal.mark_completed(phase, state.to_json()))
+          if journal is not None
+          else None
+      ),
+  )
+  if return_code != 0:
+    xpk_exit(return_code)
+
+  xpk_print('GKE commands done! Resources are created.')
+  xpk_print(
+      'See your GKE Cluster here:'
+      # pylint: disable=line-too-long
+      f' https://console.cloud.google.com/kubernetes/clusters/details/{get_cluster_location(args.project, args.cluster, args.zone)}/{args.cluster}/details?project={args.project}'
   )
-  if create_cluster_command_code != 0:
-    xpk_exit(create_cluster_command_code)
 
-  authorize_private_cluster_access_command_code = (
-      authorize_private_cluster_access_if_necessary(args)
+  if args.managed_mldiagnostics:
+    return_code = install_mldiagnostics_prerequisites()
+    if return_code != 0:
+      xpk_print('Installation of MLDiagnostics failed.')
+      xpk_exit(return_code)
+
+  if journal is not None:
+    journal.discard()
+  xpk_exit(0)
+
+
+@dataclass
+class _ClusterCreateState:
+  """Values produced by cluster create phases for later phases."""
+
+  tensorboard_config: dict = field(default_factory=dict)
+  autoprovisioning_config: AutoprovisioningConfig | None = None
+
+  def to_json(self) -> dict:
+    return {
+        'tensorboard_config': self.tensorboard_config,
+        'autoprovisioning_config': (
+            asdict(self.autoprovisioning_config)
+            if self.autoprovisioning_config
+            else None
+        ),
+    }
+
+  def restore(self, data: dict) -> None:
+    self.tensorboard_config = data.get('tensorboard_config') or {}
+    autoprovisioning_config = data.get('autoprovisioning_config')
+    self.autoprovisioning_config = (
+        AutoprovisioningConfig(**autoprovisioning_config)
+        if autoprovisioning_config
+        else None
+    )
+
+
+def _get_forced_phases(args, phases: TaskGraph) -> list[str]:
+  forced_phases = getattr(args, 'force_phase', None) or []
+  if 'all' in forced_phases:
+    return phases.task_names
+  return forced_phases
+
+
+def _get_cluster_create_phases(
+    args,
+    system: SystemCharacteristics,
+    gke_server_config: GkeServerConfig,
+    gke_control_plane_version: str,
+    release_channel: ReleaseChannel,
+    state: _ClusterCreateState,
+) -> TaskGraph:
+  """Returns the phases of cluster create with their dependencies.
+
+  Phases updating the GKE cluster are chained, since GKE runs one cluster
+  operation at a time. Phases fetching credentials rewrite the kubeconfig, so
+  they do not run together with other phases using kubectl. The phases that
+  may run alongside them, 'storage-drivers', 'tensorboard' and 'network',
+  only run gcloud and Vertex AI requests.
+  """
+  phases = TaskGraph()
+  phases.add_task(
+      'control-plane',
+      lambda: create_cluster_if_necessary(
+          args, gke_control_plane_version, system, release_channel
+      ),
+  )
+  phases.add_task(
+      'private-access',
+      lambda: authorize_private_cluster_access_if_necessary(args),
+      ['control-plane'],
+  )
+  phases.add_task(
+      'workload-identity',
+      lambda: _enable_workload_identity_if_necessary(args),
+      ['private-access'],
+  )
+  phases.add_task(
+      'mtc-update',
+      lambda: _enable_mtc_if_necessary(args),
+      ['workload-identity'],
+  )
+  phases.add_task(
+      'credentials', lambda: _get_credentials_phase(args), ['mtc-update']
+  )
+  phases.add_task(
+      'coredns', lambda: update_coredns_if_necessary(args), ['credentials']
+  )
+  phases.add_task('storage-crd', _install_storage_crd, ['coredns'])
+  phases.add_task(
+      'storage-drivers', lambda: _install_storage_drivers(args), ['mtc-update']
+  )
+  phases.add_task(
+      'tensorboard',
+      lambda: _create_tensorboard(args, state),
+      ['control-plane'],
+  )
+  phases.add_task(
+      'network', lambda: _set_up_network(args, system), ['control-plane']
+  )
+  phases.add_task(
+      'network-config',
+      lambda: _create_network_config(args, system),
+      ['network', 'storage-crd'],
+  )
+  phases.add_task(
+      'nodepools',
+      lambda: _create_node_pools(args, system, gke_server_config),
+      # Node pool creation reads and updates the cluster configmaps.
+      ['storage-drivers', 'network', 'credentials'],
+  )
+  phases.add_task(
+      'autoprovisioning',
+      lambda: _enable_autoprovisioning(args, system, state),
+      ['nodepools'],
+  )
+  phases.add_task(
+      'configmaps',
+      lambda: _create_configmaps(args, system, state),
+      ['tensorboard', 'autoprovisioning', 'storage-crd'],
+  )
+  phases.add_task('jobset', lambda: _set_jobset(args), ['storage-crd'])
+  phases.add_task(
+      'jobset-resources',
+      update_jobset_resources_if_necessary,
+      ['jobset', 'nodepools'],
+  )
+  # Kueue is sized by the number of nodes, so it waits for the node pools.
+  kueue_dependencies = ['jobset', 'nodepools']
+  if args.enable_autoprovisioning:
+    kueue_dependencies.append('autoprovisioning')
+  phases.add_task(
+      'kueue',
+      lambda: _install_kueue(args, system, state.autoprovisioning_config),
+      kueue_dependencies,
+  )
+  phases.add_task('gpus', lambda: _prepare_gpus(system), ['storage-crd'])
+  phases.add_task(
+      'ray', lambda: _install_ray(args, system), ['kueue', 'nodepools']
   )
-  if authorize_private_cluster_access_command_code != 0:
-    xpk_exit(authorize_private_cluster_access_command_code)
+  phases.add_task(
+      'mtc',
+      lambda: _install_mtc(args, system),
+      ['network-config', 'configmaps', 'jobset-resources', 'gpus', 'ray'],
+  )
+  return phases
+
 
+def _enable_workload_identity_if_necessary(args) -> int:
   # ToDo(roshanin@) - Re-enable CloudDNS on Pathways clusters conditionally.
   # Enable WorkloadIdentity if not enabled already.
   if args.enable_workload_identity or args.enable_gcsfuse_csi_driver:
-    update_cluster_command_code = (
-        update_cluster_with_workload_identity_if_necessary(args)
-    )
-    if update_cluster_command_code != 0:
-      xpk_exit(update_cluster_command_code)
+    return update_cluster_with_workload_identity_if_necessary(args)
+  return 0
+
 
+def _enable_mtc_if_necessary(args) -> int:
   # Enable MTC if not enabled already.
   if getattr(args, 'enable_mtc', False):
-    update_cluster_command_code = update_cluster_with_mtc_if_necessary(args)
-    if update_cluster_command_code != 0:
-      xpk_exit(update_cluster_command_code)
+    return update_cluster_with_mtc_if_necessary(args)
+  return 0
+
 
+def _get_credentials_phase(args) -> int:
+  # Credentials errors surface in the kubectl commands of later phases.
   get_cluster_credentials(args)
+  return 0
 
-  update_coredns_command_code = update_coredns_if_necessary(args)
-  if update_coredns_command_code != 0:
-    xpk_exit(update_coredns_command_code)
 
+def _install_storage_crd() -> int:
+  # Fetching credentials again would rewrite the kubeconfig while other phases
+  # use kubectl, so the ones of the 'credentials' phase are used.
   if not is_dry_run():
-    k8s_client = setup_k8s_env(args)
-    install_storage_crd(k8s_client)
+    install_storage_crd(get_k8s_api_client())
+  return 0
 
+
+def _install_storage_drivers(args) -> int:
+  # Exits on errors.
   install_storage_csis(args)
+  return 0
+
 
+def _create_tensorboard(args, state: _ClusterCreateState) -> int:
   # create Vertex Tensorboard for new and existing clusters if create-vertex-tensorboard is set
-  tensorboard_config = {}
   if VERTEX_TENSORBOARD_FEATURE_FLAG and args.create_vertex_tensorboard:
-    tensorboard_config = create_vertex_tensorboard(args)
+    state.tensorboard_config = create_vertex_tensorboard(args)
     # exit if failed to create Tensorboard in Vertex AI
-    if not tensorboard_config:
-      xpk_exit(1)
+    if not state.tensorboard_config:
+      return 1
+  return 0
 
-  if system.device_type == H100_DEVICE_TYPE:
-    xpk_print('Setting up Network for cluster')
-    set_up_cluster_network_code = set_up_cluster_network_for_a3(args)
-    if set_up_cluster_network_code != 0:
-      xpk_exit(set_up_cluster_network_code)
 
-    xpk_print('Creating Network Config for cluster')
-    create_cluster_network_config_code = create_cluster_network_config(args)
-    if create_cluster_network_config_code != 0:
-      xpk_exit(create_cluster_network_config_code)
+def _set_up_network(args, system: SystemCharacteristics) -> int:
+  if system.device_type != H100_DEVICE_TYPE:
+    return 0
+  xpk_print('Setting up Network for cluster')
+  return set_up_cluster_network_for_a3(args)
+
+
+def _create_network_config(args, system: SystemCharacteristics) -> int:
+  if system.device_type != H100_DEVICE_TYPE:
+    return 0
+  xpk_print('Creating Network Config for cluster')
+  return create_cluster_network_config(args)
 
+
+def _create_node_pools(
+    args, system: SystemCharacteristics, gke_server_config: GkeServerConfig
+) -> int:
   # Check the control plane version of the cluster and determine the node pool
   # version to use.
   return_code, gke_node_pool_version = get_gke_node_pool_version(
       args, gke_server_config
   )
   if return_code != 0:
-    xpk_exit(return_code)
+    return return_code
   assert gke_node_pool_version
 
-  run_gke_node_pool_create_command_code = run_gke_node_pool_create_command(
-      args, system, gke_node_pool_version
-  )
-  if run_gke_node_pool_create_command_code != 0:
-    xpk_exit(run_gke_node_pool_create_command_code)
+  return run_gke_node_pool_create_command(args, system, gke_node_pool_version)
+
 
+def _enable_autoprovisioning(
+    args, system: SystemCharacteristics, state: _ClusterCreateState
+) -> int:
   # Provision node pools dynamically based on incoming workloads:
   # Currently autoprovisioning is not supported with Pathways.
-  autoprovisioning_config = None
-  if args.enable_autoprovisioning:
-    xpk_print('Enabling Autoprovisioning')
-    autoprovisioning_config, return_code = enable_autoprovisioning_on_cluster(
-        args, system
-    )
-    if return_code != 0:
-      xpk_exit(return_code)
+  if not args.enable_autoprovisioning:
+    return 0
+  xpk_print('Enabling Autoprovisioning')
+  state.autoprovisioning_config, return_code = (
+      enable_autoprovisioning_on_cluster(args, system)
+  )
+  return return_code
+
 
+def _create_configmaps(
+    args, system: SystemCharacteristics, state: _ClusterCreateState
+) -> int:
   xpk_print('Creating ConfigMap for cluster')
-  create_cluster_configmaps_code = create_cluster_configmaps(
-      args, system, tensorboard_config, autoprovisioning_config
+  return create_cluster_configmaps(
+      args, system, state.tensorboard_config, state.autoprovisioning_config
   )
-  if create_cluster_configmaps_code != 0:
-    xpk_exit(create_cluster_configmaps_code)
 
+
+def _set_jobset(args) -> int:
   xpk_print(
       'Enabling the jobset API on our cluster, to be deprecated when Jobset is'
       ' globally available'
   )
-  set_jobset_on_cluster_code = set_jobset_on_cluster(args)
-  if set_jobset_on_cluster_code != 0:
-    xpk_exit(set_jobset_on_cluster_code)
-  update_jobset_resources_code = update_jobset_resources_if_necessary()
-  if update_jobset_resources_code != 0:
-    xpk_exit(update_jobset_resources_code)
+  return set_jobset_on_cluster(args)
 
-  install_kueue_code = _install_kueue(args, system, autoprovisioning_config)
-  if install_kueue_code != 0:
-    xpk_exit(install_kueue_code)
 
+def _prepare_gpus(system: SystemCharacteristics) -> int:
   if system.accelerator_type == AcceleratorType.GPU:
     prepare_gpus(system)
+  return 0
 
-  if args.enable_ray_cluster:
-    return_code = install_ray_cluster(args, system)
-    if return_code != 0:
-      xpk_print('Installation of RayCluster failed.')
-      xpk_exit(return_code)
-
-  if hasattr(args, 'enable_mtc') and args.enable_mtc:
-    return_code = install_mtc_on_cluster(args, system)
-    if return_code != 0:
-      xpk_print('Installation of MTC failed.')
-      xpk_exit(return_code)
 
-  xpk_print('GKE commands done! Resources are created.')
-  xpk_print(
-      'See your GKE Cluster here:'
-      # pylint: disable=line-too-long
-      f' https://console.cloud.google.com/kubernetes/clusters/details/{get_cluster_location(args.project, args.cluster, args.zone)}/{args.cluster}/details?project={args.project}'
-  )
+def _install_ray(args, system: SystemCharacteristics) -> int:
+  if not args.enable_ray_cluster:
+    return 0
+  return_code = install_ray_cluster(args, system)
+  if return_code != 0:
+    xpk_print('Installation of RayCluster failed.')
+  return return_code
 
-  if args.managed_mldiagnostics:
-    return_code = install_mldiagnostics_prerequisites()
-    if return_code != 0:
-      xpk_print('Installation of MLDiagnostics failed.')
-      xpk_exit(return_code)
 
-  xpk_exit(0)
+def _install_mtc(args, system: SystemCharacteristics) -> int:
+  if not getattr(args, 'enable_mtc', False):
+    return 0
+  return_code = install_mtc_on_cluster(args, system)
+  if return_code != 0:
+    xpk_print('Installation of MTC failed.')
+  return return_code
 
 
 def cluster_delete(args) -> None:
@@ -571,6 +768,8 @@ def cluster_delete(args) -> None:
   if set_cluster_command_code != 0:
     xpk_exit(set_cluster_command_code)
 
+  if not is_dry_run():
+    discard_cluster_create_journal(args.project, args.zone, args.cluster)
   run_gke_cluster_delete_command_code = run_gke_cluster_delete_command(args)
 
   if run_gke_cluster_delete_command_code != 0:
@@ -653,10 +852,11 @@ def cluster_describe(args) -> None:
 
   get_cluster_credentials(args)
 
-  return_code, data_table = nodepools_build_table()
+  return_code, nodes = get_nodes()
   if return_code != 0:
     xpk_exit(return_code)
 
+  data_table = nodepools_build_table(nodes)
   if len(data_table) > 1:
     xpk_print(
         'Nodepools info:\n',
@@ -665,19 +865,23 @@ def cluster_describe(args) -> None:
   else:
     xpk_print('No nodepools info found')
 
-  return_code_node_output, node_output = run_command_for_value(
-      r'kubectl get node --no-headers=true'
-      r" --selector='cloud.google.com/gke-tpu-accelerator' | wc -l",
-      'Count TPU Nodes',
+  number_tpu_vms_in_cluster = sum(
+      1 for node in nodes if node.tpu_accelerator is not None
   )
-  if return_code_node_output != 0:
-    xpk_exit(return_code_node_output)
-  node_output = node_output.splitlines()[-1]
-  number_tpu_vms_in_cluster = int(node_output)
 
   return_code_pod_output, pod_output = run_command_for_value(
-      "kubectl get pod -o=custom-columns='Status:.status.phase' | grep -i"
-      ' Running | wc -l',
+      Command(
+          argv=[
+              'kubectl',
+              'get',
+              'pod',
+              '--no-headers=true',
+              '-o=custom-columns=STATUS:.status.phase',
+          ],
+          postprocess=lambda out: str(
+              sum(1 for line in out.splitlines() if line.strip() == 'Running')
+          ),
+      ),
       'Count TPU Pods',
   )
   if return_code_pod_output != 0:
@@ -693,179 +897,118 @@ def cluster_describe(args) -> None:
   xpk_exit(0)
 
 
-def nodepools_build_table() -> tuple[int, list[list]]:
-  table = [[
-      'NODEPOOL_NAME',
-      'SLICE',
-      'TYPE',
-      'EXPECTED_HEALTHY_NODES',
-      'ACTUAL_HEALTHY_NODES',
-      'TOTAL_NODES',
-  ]]
-
-  nodepools_data = {}
+@dataclass
+class NodeInfo:
+  nodepool: str | None
+  instance_type: str | None
+  ready: bool
+  tpu_accelerator: str | None
 
-  nodepools, return_code = get_node_pools_name()
-  if return_code != 0:
-    xpk_print(f'Get node pools name returned ERROR {return_code}')
-
-  for name in nodepools:
-    nodepools_data[name] = [name]
-
-  slices, return_code = get_slice_node_pool_size()
-  if return_code != 0:
-    xpk_print(f'Get slice node pool size returned ERROR {return_code}')
 
-  for line in slices:
-    s = line.split()
-    count, nodepool_name = s[0], s[1]
-    nodepools_data[nodepool_name].append(count)
+_NODE_INFO_COLUMNS = [
+    r'NODEPOOL:.metadata.labels.cloud\.google\.com/gke-nodepool',
+    r'TYPE:.metadata.labels.node\.kubernetes\.io/instance-type',
+    'READY:.status.conditions[?(@.type=="Ready")].status',
+    r'TPU:.metadata.labels.cloud\.google\.com/gke-tpu-accelerator',
+]
 
-  type_nodepool, return_code = get_node_pool_instance_type()
-  if return_code != 0:
-    xpk_print(f'Get node pool instance type returned ERROR {return_code}')
 
-  for line in type_nodepool:
-    tn = line.split()
-    nodepool_name, instance_type = tn[0], tn[1]
-    nodepools_data[nodepool_name].append(instance_type)
-
-  expected_healthy_nodes, return_code = get_expected_healthy_nodes()
-  if return_code != 0:
-    xpk_print(f'Get expected healthy nodes returned ERROR {return_code}')
-
-  for line in expected_healthy_nodes:
-    ehn = line.split()
-    count, nodepool_name = ehn[0], ehn[1]
-    nodepools_data[nodepool_name].append(count)
-
-  actual_healthy_nodes, return_code = get_actual_healthy_nodes()
-  if return_code != 0:
-    xpk_print(f'Get actual healthy nodes returned ERROR {return_code}')
-
-  for line in actual_healthy_nodes:
-    ahn = line.split()
-    count, nodepool_name = ahn[0], ahn[1]
-    nodepools_data[nodepool_name].append(count)
-
-  total_nodes, return_code = get_total_nodes_per_node_pool()
-  if return_code != 0:
-    xpk_print(f'Get total nodes per node pool returned ERROR {return_code}')
-
-  for line in total_nodes:
-    tn = line.split()
-    count, nodepool_name = tn[0], tn[1]
-    nodepools_data[nodepool_name].append(count)
-
-  for _, np_data in nodepools_data.items():
-    table.append(np_data)
-
-  return 0, table
-
-
-def get_node_pools_name() -> tuple[list[str], int]:
-  cmd_nodepools = (
-      'kubectl get node --no-headers=true -o'
-      " custom-columns='NODEPOOL:.metadata.labels.cloud\\.google\\.com/gke-nodepool'"
-      " | grep -v 'none' | sort | uniq"
-  )
-  return_code, out = run_command_for_value(cmd_nodepools, 'Nodepool list')
-  if return_code != 0:
-    return [], return_code
-
-  return out.splitlines(), 0
-
-
-def get_slice_node_pool_size() -> tuple[list[str], int]:
-  cmd_slices = (
-      'kubectl get node --no-headers=true -o'
-      " custom-columns=':metadata.labels.cloud\\.google\\.com/gke-nodepool'"
-      " | grep -v 'none'"
-      ' | sort'
-      ' | uniq -c'
-  )
-  return_code, out = run_command_for_value(
-      cmd_slices, 'Count nodes per nodepool slice'
-  )
-  if return_code != 0:
-    return [], return_code
-
-  return out.splitlines(), 0
-
-
-def get_node_pool_instance_type() -> tuple[list[str], int]:
-  cmd_type_nodepool = (
-      'kubectl get node --no-headers=true -o'
-      " custom-columns='NODEPOOL:.metadata.labels.cloud\\.google\\.com/gke-nodepool,"
-      " TYPE:.metadata.labels.node\\.kubernetes\\.io/instance-type' | grep -v"
-      " 'none' | sort | uniq"
-  )
-  return_code, out = run_command_for_value(
-      cmd_type_nodepool, 'Instance type of nodepools'
-  )
-  if return_code != 0:
-    return [], return_code
-
-  return out.splitlines(), 0
+def get_nodes() -> tuple[int, list[NodeInfo]]:
+  """Lists nodes of the cluster with a single kubectl call.
 
+  Returns:
+    0 and the nodes if successful, the error code and no nodes otherwise.
+  """
+  if is_native_kubernetes_reads_enabled():
+    items: list[dict] = []
+    return_code = list_nodes('List nodes', items.append)
+    if return_code != 0:
+      return return_code, []
+    return 0, [_get_node_info(item) for item in items]
 
-def get_expected_healthy_nodes() -> tuple[list[str], int]:
-  cmd_expected_healthy_nodes = (
-      'kubectl get node --no-headers=true -o'
-      " custom-columns=':metadata.labels.cloud\\.google\\.com/gke-nodepool'"
-      " | grep -v 'none'"
-      ' | sort'
-      ' | uniq -c'
-  )
   return_code, out = run_command_for_value(
-      cmd_expected_healthy_nodes,
-      'Count expected healthy nodes per nodepool',
+      Command(
+          argv=[
+              'kubectl',
+              'get',
+              'node',
+              '--no-headers=true',
+              f'-o=custom-columns={",".join(_NODE_INFO_COLUMNS)}',
+          ]
+      ),
+      'List nodes',
+      dry_run_return_val='',
   )
   if return_code != 0:
-    return [], return_code
-
-  return out.splitlines(), 0
-
-
-def get_actual_healthy_nodes() -> tuple[list[str], int]:
-  cmd_actual_healthy_nodes = (
-      'kubectl get node --no-headers=true -o'
-      " custom-columns='NODE_NAME:metadata.name,"
-      ' READY_STATUS:.status.conditions[?(@.type=="Ready")].status,'
-      " NODEPOOL:metadata.labels.cloud\\.google\\.com/gke-nodepool' "
-      ' | grep -w True'
-      " | grep -v 'none'"
-      " | awk {'print $3'}"
-      ' | sort'
-      ' | uniq -c'
-  )
-  return_code, out = run_command_for_value(
-      cmd_actual_healthy_nodes, 'Count actual healthy nodes per nodepool'
+    xpk_print(f'List nodes returned ERROR {return_code}')
+    return return_code, []
+
+  def get_label(value: str) -> str | None:
+    return None if value == '<none>' else value
+
+  nodes = []
+  for line in out.splitlines():
+    columns = line.split()
+    if len(columns) != len(_NODE_INFO_COLUMNS):
+      continue
+    nodepool, instance_type, ready, tpu_accelerator = columns
+    nodes.append(
+        NodeInfo(
+            nodepool=get_label(nodepool),
+            instance_type=get_label(instance_type),
+            ready=ready == 'True',
+            tpu_accelerator=get_label(tpu_accelerator),
+        )
+    )
+  return 0, nodes
+
+
+def _get_node_info(item: dict) -> NodeInfo:
+  labels = item.get('metadata', {}).get('labels') or {}
+  conditions = item.get('status', {}).get('conditions') or []
+  return NodeInfo(
+      nodepool=labels.get('cloud.google.com/gke-nodepool'),
+      instance_type=labels.get('node.kubernetes.io/instance-type'),
+      ready=any(
+          c.get('type') == 'Ready' and c.get('status') == 'True'
+          for c in conditions
+      ),
+      tpu_accelerator=labels.get('cloud.google.com/gke-tpu-accelerator'),
   )
-  if return_code != 0:
-    return [], return_code
-
-  return out.splitlines(), 0
 
 
-def get_total_nodes_per_node_pool() -> tuple[list[str], int]:
-  cmd_total_nodes = (
-      'kubectl get node --no-headers=true -o'
-      " custom-columns='NODE_NAME:metadata.name,"
-      ' READY_STATUS:.status.conditions[?(@.type=="Ready")].status,'
-      " NODEPOOL:metadata.labels.cloud\\.google\\.com/gke-nodepool'"
-      " | grep -v 'none'"
-      " | awk {'print $3'}"
-      ' | sort'
-      ' | uniq -c'
-  )
-  return_code, out = run_command_for_value(
-      cmd_total_nodes, 'Count total nodes per nodepool'
-  )
-  if return_code != 0:
-    return [], return_code
+def nodepools_build_table(nodes: list[NodeInfo]) -> list[list]:
+  table: list[list] = [[
+      'NODEPOOL_NAME',
+      'SLICE',
+      'TYPE',
+      'EXPECTED_HEALTHY_NODES',
+      'ACTUAL_HEALTHY_NODES',
+      'TOTAL_NODES',
+  ]]
 
-  return out.splitlines(), 0
+  nodes_by_nodepool: dict[str, list[NodeInfo]] = {}
+  for node in nodes:
+    if node.nodepool is not None:
+      nodes_by_nodepool.setdefault(node.nodepool, []).append(node)
+
+  for nodepool, nodepool_nodes in sorted(nodes_by_nodepool.items()):
+    instance_types = sorted({
+        node.instance_type
+        for node in nodepool_nodes
+        if node.instance_type is not None
+    })
+    total_nodes = len(nodepool_nodes)
+    table.append([
+        nodepool,
+        total_nodes,
+        ','.join(instance_types),
+        total_nodes,
+        sum(1 for node in nodepool_nodes if node.ready),
+        total_nodes,
+    ])
+
+  return table
 
 
 def cluster_list(args) -> None:
@@ -1150,6 +1293,7 @@ def coredns_deployment_exists(namespace: str = 'kube-system') -> bool:
     return False
 
 
+@trace_phase('coredns')
 def update_coredns_if_necessary(args) -> int:
   """Updates and deploys CoreDNS within the cluster if it's not already present.
 
@@ -1168,6 +1312,7 @@ def update_coredns_if_necessary(args) -> int:
     return update_coredns(args)
 
 
+@trace_phase('control-plane')
 def create_cluster_if_necessary(
     args,
     gke_control_plane_version: str,
@@ -1197,6 +1342,7 @@ def create_cluster_if_necessary(
     )
 
 
+@trace_phase('control-plane')
 def run_gke_cluster_delete_command(args) -> int:
   """Run the Delete GKE Cluster request.
 
@@ -1234,6 +1380,10 @@ def run_gke_cluster_delete_command(args) -> int:
   if return_code != 0:
     xpk_print(f'Cluster delete request returned ERROR {return_code}')
     return 1
+  forget_cached_context(
+      get_cached_kubeconfig_path(args.project, args.zone, args.cluster)
+  )
+  CLUSTER_LOCATIONS.invalidate(args.project, args.cluster)
 
   return_code = delete_cluster_subnets(args)
   if return_code != 0:
@@ -1379,6 +1529,7 @@ def run_gke_cluster_create_command(
   return 0
 
 
+@trace_phase('storage-drivers')
 def install_storage_csis(args):
   if args.enable_gcsfuse_csi_driver:
     update_cluster_command_code = (
@@ -1416,6 +1567,7 @@ def install_storage_csis(args):
       xpk_exit(update_cluster_command_code)
 
 
+@trace_phase('kueue')
 def _install_kueue(
     args,
     system: SystemCharacteristics,
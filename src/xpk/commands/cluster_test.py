@@ -22,10 +22,12 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from xpk.core.telemetry import MetricsCollector
-from xpk.commands.cluster import _install_kueue, _validate_cluster_create_args, _validate_private_cluster_args, _get_coredns_replica_count, run_gke_cluster_create_command, cluster_create, _log_cluster_create_telemetry
+from xpk.commands.cluster import _ClusterCreateState, _get_cluster_create_phases, _install_kueue, _validate_cluster_create_args, _validate_private_cluster_args, _get_coredns_replica_count, run_gke_cluster_create_command, cluster_create, _log_cluster_create_telemetry, get_nodes, nodepools_build_table
+from xpk.core.cluster_journal import CLUSTER_CREATE_PHASES
 from xpk.core.capacity import CapacityType
 from xpk.core.system_characteristics import SystemCharacteristics, UserFacingNameToSystemCharacteristics
 from xpk.core.testing.commands_tester import CommandsTester
+from xpk.core.tracing import Span, Tracer
 from xpk.utils.feature_flags import FeatureFlags
 from xpk.utils.versions import ReleaseChannel
 
@@ -49,6 +51,7 @@ class _ClusterCreateMocks:
   get_system_characteristics: MagicMock
   get_gke_node_pool_version: MagicMock
   setup_k8s_env: MagicMock
+  get_k8s_api_client: MagicMock
   get_cluster_location: MagicMock
   xpk_exit: MagicMock
   _log_cluster_create_telemetry: MagicMock
@@ -168,6 +171,9 @@ def cluster_create_mocks(mocker) -> _ClusterCreateMocks:
           return_value=(0, '1.2.3'),
       ),
       setup_k8s_env=mocker.patch('xpk.commands.cluster.setup_k8s_env'),
+      get_k8s_api_client=mocker.patch(
+          'xpk.commands.cluster.get_k8s_api_client'
+      ),
       get_cluster_location=mocker.patch(
           'xpk.commands.cluster.get_cluster_location',
           return_value='us-central1',
@@ -688,6 +694,183 @@ def test_cluster_create_calls_run_command_with_correct_channel_and_version(
   mocks.commands_tester.assert_command_run(*expected_command_parts)
 
 
+def test_cluster_create_stops_after_failed_phase(
+    mocks: _Mocks,
+    cluster_create_mocks: _ClusterCreateMocks,
+):
+  cluster_create_mocks.get_gke_control_plane_version.return_value = (
+      0,
+      '1.2.3',
+  )
+  mocks.commands_tester.set_result_for_command((1, ''), 'clusters create')
+
+  cluster_create(construct_args())
+
+  cluster_create_mocks.xpk_exit.assert_any_call(1)
+  mocks.commands_tester.assert_command_run('clusters create')
+  mocks.commands_tester.assert_command_not_run('get-credentials')
+  mocks.commands_tester.assert_command_not_run('node-pools create')
+
+
+def test_cluster_create_rerun_skips_phases_completed_by_failed_run(
+    mocks: _Mocks,
+    cluster_create_mocks: _ClusterCreateMocks,
+    mocker,
+):
+  cluster_create_mocks.get_gke_control_plane_version.return_value = (
+      0,
+      '1.2.3',
+  )
+  cluster_create_mocks.xpk_exit.side_effect = SystemExit
+  create_node_pools = mocker.patch(
+      'xpk.commands.cluster.run_gke_node_pool_create_command',
+      side_effect=[1, 0],
+  )
+  with pytest.raises(SystemExit):
+    cluster_create(construct_args())
+
+  with pytest.raises(SystemExit):
+    cluster_create(construct_args())
+
+  assert create_node_pools.call_count == 2
+  mocks.commands_tester.assert_command_run('clusters create', times=1)
+
+
+def test_cluster_create_rerun_runs_forced_phases(
+    mocks: _Mocks,
+    cluster_create_mocks: _ClusterCreateMocks,
+    mocker,
+):
+  cluster_create_mocks.get_gke_control_plane_version.return_value = (
+      0,
+      '1.2.3',
+  )
+  cluster_create_mocks.xpk_exit.side_effect = SystemExit
+  mocker.patch(
+      'xpk.commands.cluster.run_gke_node_pool_create_command',
+      side_effect=[1, 0],
+  )
+  with pytest.raises(SystemExit):
+    cluster_create(construct_args())
+
+  with pytest.raises(SystemExit):
+    cluster_create(construct_args(force_phase=['control-plane']))
+
+  mocks.commands_tester.assert_command_run('clusters create', times=2)
+
+
+def test_cluster_create_rerun_with_changed_inputs_runs_all_phases(
+    mocks: _Mocks,
+    cluster_create_mocks: _ClusterCreateMocks,
+    mocker,
+):
+  cluster_create_mocks.get_gke_control_plane_version.return_value = (
+      0,
+      '1.2.3',
+  )
+  cluster_create_mocks.xpk_exit.side_effect = SystemExit
+  mocker.patch(
+      'xpk.commands.cluster.run_gke_node_pool_create_command',
+      side_effect=[1, 0],
+  )
+  with pytest.raises(SystemExit):
+    cluster_create(construct_args())
+
+  with pytest.raises(SystemExit):
+    cluster_create(construct_args(num_slices=2))
+
+  mocks.commands_tester.assert_command_run('clusters create', times=2)
+
+
+def test_cluster_create_rerun_after_success_runs_all_phases(
+    mocks: _Mocks,
+    cluster_create_mocks: _ClusterCreateMocks,
+    mocker,
+):
+  cluster_create_mocks.get_gke_control_plane_version.return_value = (
+      0,
+      '1.2.3',
+  )
+  cluster_create_mocks.xpk_exit.side_effect = SystemExit
+  mocker.patch(
+      'xpk.commands.cluster.run_gke_node_pool_create_command',
+      return_value=0,
+  )
+  with pytest.raises(SystemExit):
+    cluster_create(construct_args())
+
+  with pytest.raises(SystemExit):
+    cluster_create(construct_args())
+
+  mocks.commands_tester.assert_command_run('clusters create', times=2)
+
+
+def test_cluster_create_traces_phases_by_their_names(
+    mocks: _Mocks,
+    cluster_create_mocks: _ClusterCreateMocks,
+    mocker,
+):
+  cluster_create_mocks.get_gke_control_plane_version.return_value = (
+      0,
+      '1.2.3',
+  )
+  cluster_create_mocks.xpk_exit.side_effect = SystemExit
+  mocker.patch(
+      'xpk.commands.cluster.run_gke_node_pool_create_command',
+      return_value=0,
+  )
+  spans: list[Span] = []
+  mocker.patch.object(Tracer, '_trace_file', 'trace.json')
+  mocker.patch.object(Tracer, '_spans', spans)
+
+  with pytest.raises(SystemExit):
+    cluster_create(construct_args())
+
+  phase_names = {span.name for span in spans if span.category == 'phase'}
+  assert 'control-plane' in phase_names
+  assert phase_names <= set(CLUSTER_CREATE_PHASES)
+
+
+def test_cluster_create_phases_match_declared_phases(mocker):
+  phases = _get_cluster_create_phases(
+      construct_args(),
+      TPU_TEST_SYSTEM,
+      mocker.Mock(),
+      '1.2.3',
+      ReleaseChannel.RAPID,
+      _ClusterCreateState(),
+  )
+
+  assert phases.task_names == list(CLUSTER_CREATE_PHASES)
+
+
+def test_cluster_create_phases_wait_for_credentials_and_node_pools(mocker):
+  phases = _get_cluster_create_phases(
+      construct_args(),
+      TPU_TEST_SYSTEM,
+      mocker.Mock(),
+      '1.2.3',
+      ReleaseChannel.RAPID,
+      _ClusterCreateState(),
+  )
+
+  assert 'nodepools' in phases.get_dependents(['credentials'])
+  assert 'kueue' in phases.get_dependents(['nodepools'])
+
+
+def test_cluster_create_phases_wait_for_control_plane(mocker):
+  phases = _get_cluster_create_phases(
+      construct_args(),
+      TPU_TEST_SYSTEM,
+      mocker.Mock(),
+      '1.2.3',
+      ReleaseChannel.RAPID,
+      _ClusterCreateState(),
+  )
+
+  assert phases.get_dependents(['control-plane']) == set(phases.task_names)
+
+
 def test_run_gke_cluster_create_command_with_super_slicing_enables_slice_controller(
     mocks: _Mocks,
 ):
@@ -881,3 +1064,65 @@ def test_get_coredns_replica_count_upper_limit_is_15():
       default_pool_cpu_num_nodes=20,
   )
   assert _get_coredns_replica_count(args) == 15
+
+
+def test_nodepools_build_table_aggregates_nodes_of_single_kubectl_call(
+    mocks: _Mocks,
+):
+  mocks.commands_tester.set_result_for_command(
+      (
+          0,
+          (
+              'np-1   ct6e-standard-4t   True    tpu-v6e-slice\n'
+              'np-1   ct6e-standard-4t   False   tpu-v6e-slice\n'
+              'np-2   n2-standard-8      True    <none>\n'
+              '<none> e2-medium          True    <none>\n'
+          ),
+      ),
+      'kubectl get node',
+  )
+
+  return_code, nodes = get_nodes()
+  table = nodepools_build_table(nodes)
+
+  assert return_code == 0
+  assert table[1:] == [
+      ['np-1', 2, 'ct6e-standard-4t', 2, 1, 2],
+      ['np-2', 1, 'n2-standard-8', 1, 1, 1],
+  ]
+  assert sum(1 for node in nodes if node.tpu_accelerator is not None) == 2
+  mocks.commands_tester.assert_command_run('kubectl get node', times=1)
+
+
+def test_get_nodes_returns_error_code_of_kubectl(mocks: _Mocks):
+  mocks.commands_tester.set_result_for_command(
+      (1, 'connection refused'), 'kubectl get node'
+  )
+
+  assert get_nodes() == (1, [])
+
+
+def test_get_nodes_reads_nodes_natively(mocks: _Mocks, mocker):
+  mocker.patch.object(FeatureFlags, 'NATIVE_KUBERNETES_READS_ENABLED', True)
+  node = {
+      'metadata': {
+          'labels': {
+              'cloud.google.com/gke-nodepool': 'np-1',
+              'node.kubernetes.io/instance-type': 'ct6e-standard-4t',
+              'cloud.google.com/gke-tpu-accelerator': 'tpu-v6e-slice',
+          }
+      },
+      'status': {'conditions': [{'type': 'Ready', 'status': 'True'}]},
+  }
+  mocker.patch(
+      'xpk.commands.cluster.list_nodes',
+      side_effect=lambda task, on_item: on_item(node) or 0,
+  )
+
+  return_code, nodes = get_nodes()
+
+  assert return_code == 0
+  assert nodepools_build_table(nodes)[1:] == [
+      ['np-1', 1, 'ct6e-standard-4t', 1, 1, 1]
+  ]
+  mocks.commands_tester.assert_command_not_run('kubectl get node')
@@ -14,8 +14,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import collections
+
 from ..core.cluster import get_cluster_credentials
-from ..core.commands import run_command_for_value
+from ..core.commands import Command, run_command_for_value
 from ..core.gcloud_context import add_zone_and_project, get_cluster_location
 from ..core.kueue_manager import CLUSTER_QUEUE_NAME, LOCAL_QUEUE_NAME
 from ..core.resources import ConfigMapType, get_config_map_name
@@ -27,6 +29,13 @@ from ..core.kueue_manager import has_sub_slicing_enabled, has_super_slicing_enab
 
 
 _SPACER = '========================================================'
+_NODEPOOL_COLUMN = r'NODEPOOL:.metadata.labels.cloud\.google\.com/gke-nodepool'
+
+
+def _count_values(values: list[str]) -> str:
+  """Formats occurrences of each value, like `sort | uniq -c`."""
+  counts = collections.Counter(values)
+  return '\n'.join(f'{counts[value]:>7} {value}' for value in sorted(counts))
 
 
 def inspector_run_command_helper(
@@ -169,6 +178,7 @@ def inspector(args) -> None:
   inspector_file = write_tmp_file(
       '==================\nXPK inspector OUTPUT:\n==================\n'
   )
+  cluster_location = get_cluster_location(args.project, args.cluster, args.zone)
   command_and_descriptions = [
       ('gcloud version', 'Local Setup: gcloud version'),
       (
@@ -179,11 +189,21 @@ def inspector(args) -> None:
           'Local Setup: Project / Zone / Region',
       ),
       (
-          (
-              'gcloud beta container clusters list --project'
-              f' {args.project} --location'
-              f' {get_cluster_location(args.project, args.cluster, args.zone)} |'
-              f' grep -e NAME -e {args.cluster}'
+          Command(
+              argv=[
+                  'gcloud',
+                  'beta',
+                  'container',
+                  'clusters',
+                  'list',
+                  f'--project={args.project}',
+                  f'--location={cluster_location}',
+              ],
+              postprocess=lambda out: '\n'.join(
+                  line
+                  for line in out.splitlines()
+                  if 'NAME' in line or args.cluster in line
+              ),
           ),
           'GKE: Cluster Details',
       ),
@@ -206,7 +226,7 @@ def inspector(args) -> None:
       (
           (
               f'gcloud beta container node-pools list --cluster {args.cluster} '
-              f' --project={args.project} --location={get_cluster_location(args.project, args.cluster, args.zone)}'
+              f' --project={args.project} --location={cluster_location}'
           ),
           'GKE: Node pool Details',
       ),
@@ -219,19 +239,35 @@ def inspector(args) -> None:
           'Kubectl: All Nodes',
       ),
       (
-          (
-              'kubectl get node -o'
-              " custom-columns=':metadata.labels.cloud\\.google\\.com/gke-nodepool'"
-              ' | sort | uniq -c'
+          Command(
+              argv=[
+                  'kubectl',
+                  'get',
+                  'node',
+                  '--no-headers=true',
+                  f'-o=custom-columns={_NODEPOOL_COLUMN}',
+              ],
+              postprocess=lambda out: _count_values(out.split()),
           ),
           'Kubectl: Number of Nodes per Node Pool',
       ),
       (
-          (
-              "kubectl get node -o custom-columns='NODE_NAME:metadata.name,"
-              ' READY_STATUS:.status.conditions[?(@.type=="Ready")].status,'
-              " NODEPOOL:metadata.labels.cloud\\.google\\.com/gke-nodepool' |"
-              " grep -w True | awk {'print $3'} | sort | uniq -c"
+          Command(
+              argv=[
+                  'kubectl',
+                  'get',
+                  'node',
+                  '--no-headers=true',
+                  (
+                      '-o=custom-columns=READY_STATUS:.status.conditions[?(@.type=="Ready")].status,'
+                      f'{_NODEPOOL_COLUMN}'
+                  ),
+              ],
+              postprocess=lambda out: _count_values([
+                  columns[1]
+                  for columns in map(str.split, out.splitlines())
+                  if columns[:1] == ['True'] and len(columns) == 2
+              ]),
           ),
           'Kubectl: Healthy Node Count Per Node Pool',
       ),
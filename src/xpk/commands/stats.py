@@ -0,0 +1,212 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import datetime
+import sqlite3
+import time
+from argparse import Namespace
+from collections import defaultdict
+
+from tabulate import tabulate
+
+from ..core.command_history import get_history_path, open_history_for_reading
+from ..utils.console import xpk_print
+
+table_fmt = 'plain'
+_DAY_SECONDS = 24 * 60 * 60
+
+
+def stats(args: Namespace) -> None:
+  """Prints latency statistics of past xpk invocations and their commands.
+
+  Args:
+    args: user provided arguments for running the command.
+  Returns:
+    None
+  """
+  connection = open_history_for_reading()
+  if connection is None:
+    xpk_print(f'No command history recorded yet in {get_history_path()}.')
+    return
+  since = time.time() - args.days * _DAY_SECONDS
+  cluster_filter = ''
+  parameters: tuple = (since,)
+  if args.cluster:
+    cluster_filter = ' AND i.cluster = ?'
+    parameters = (since, args.cluster)
+
+  try:
+    with connection:
+      subcommand_rows = _get_subcommand_latencies(
+          connection, cluster_filter, parameters
+      )
+      template_rows = _get_command_latencies(
+          connection, cluster_filter, parameters, args.days, args.limit
+      )
+      slowest_rows = _get_slowest_commands(
+          connection, cluster_filter, parameters, args.limit
+      )
+  except sqlite3.Error as e:
+    xpk_print(f'Unable to read command history: {e}')
+    return
+  finally:
+    connection.close()
+
+  xpk_print(f'Latency of xpk subcommands per week, last {args.days} days:')
+  xpk_print(
+      '\n'
+      + tabulate(
+          subcommand_rows,
+          headers=['Subcommand', 'Week', 'Runs', 'Failed', 'p50', 'p95'],
+          tablefmt=table_fmt,
+      )
+  )
+  xpk_print(
+      f'Latency of commands, last {args.days} days, compared with the'
+      f' {args.days} days before:'
+  )
+  xpk_print(
+      '\n'
+      + tabulate(
+          template_rows,
+          headers=['Command', 'Runs', 'p50', 'p95', 'p50 before', 'Total'],
+          tablefmt=table_fmt,
+      )
+  )
+  xpk_print(f'Slowest commands, last {args.days} days:')
+  xpk_print(
+      '\n'
+      + tabulate(
+          slowest_rows,
+          headers=[
+              'Started',
+              'Duration',
+              'Task',
+              'Subcommand',
+              'Cluster',
+              'Exit code',
+          ],
+          tablefmt=table_fmt,
+      )
+  )
+
+
+def _get_subcommand_latencies(
+    connection: sqlite3.Connection, cluster_filter: str, parameters: tuple
+) -> list[list]:
+  durations: dict[tuple[str, str], list[float]] = defaultdict(list)
+  failures: dict[tuple[str, str], int] = defaultdict(int)
+  for subcommand, started_at, duration, exit_code in connection.execute(
+      'SELECT i.subcommand, i.started_at, i.duration, i.exit_code FROM'
+      ' invocations i WHERE i.duration IS NOT NULL AND i.started_at >= ?'
+      + cluster_filter,
+      parameters,
+  ):
+    week = _get_week(started_at)
+    durations[(subcommand, week)].append(duration)
+    failures[(subcommand, week)] += 1 if exit_code else 0
+  return [
+      [
+          subcommand,
+          week,
+          len(values),
+          failures[(subcommand, week)],
+          _format_seconds(_percentile(values, 0.5)),
+          _format_seconds(_percentile(values, 0.95)),
+      ]
+      for (subcommand, week), values in sorted(durations.items())
+  ]
+
+
+def _get_command_latencies(
+    connection: sqlite3.Connection,
+    cluster_filter: str,
+    parameters: tuple,
+    days: int,
+    limit: int,
+) -> list[list]:
+  since = parameters[0]
+  previous_since = since - days * _DAY_SECONDS
+  current: dict[str, list[float]] = defaultdict(list)
+  previous: dict[str, list[float]] = defaultdict(list)
+  for template, started_at, duration in connection.execute(
+      'SELECT c.template, c.started_at, c.duration FROM commands c JOIN'
+      ' invocations i ON c.invocation_id = i.id WHERE c.started_at >= ?'
+      + cluster_filter,
+      (previous_since, *parameters[1:]),
+  ):
+    (current if started_at >= since else previous)[template].append(duration)
+  by_total_time = sorted(current.items(), key=lambda item: -sum(item[1]))
+  return [
+      [
+          template,
+          len(values),
+          _format_seconds(_percentile(values, 0.5)),
+          _format_seconds(_percentile(values, 0.95)),
+          (
+              _format_seconds(_percentile(previous[template], 0.5))
+              if previous[template]
+              else '-'
+          ),
+          _format_seconds(sum(values)),
+      ]
+      for template, values in by_total_time[:limit]
+  ]
+
+
+def _get_slowest_commands(
+    connection: sqlite3.Connection,
+    cluster_filter: str,
+    parameters: tuple,
+    limit: int,
+) -> list[list]:
+  return [
+      [
+          datetime.datetime.fromtimestamp(started_at).strftime(
+              '%Y-%m-%d %H:%M:%S'
+          ),
+          _format_seconds(duration),
+          task,
+          subcommand,
+          cluster or '',
+          exit_code,
+      ]
+      for started_at, duration, task, subcommand, cluster, exit_code in (
+          connection.execute(
+              'SELECT c.started_at, c.duration, c.task, i.subcommand,'
+              ' i.cluster, c.exit_code FROM commands c JOIN invocations i ON'
+              ' c.invocation_id = i.id WHERE c.started_at >= ?'
+              + cluster_filter
+              + ' ORDER BY c.duration DESC LIMIT ?',
+              (*parameters, limit),
+          )
+      )
+  ]
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+  ordered = sorted(values)
+  return ordered[min(len(ordered) - 1, int(percentile * len(ordered)))]
+
+
+def _format_seconds(seconds: float) -> str:
+  return f'{seconds:.1f}s'
+
+
+def _get_week(timestamp: float) -> str:
+  """Returns the Monday starting the week of the timestamp."""
+  date = datetime.date.fromtimestamp(timestamp)
+  return (date - datetime.timedelta(days=date.weekday())).isoformat()
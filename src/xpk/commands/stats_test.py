@@ -0,0 +1,60 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import time
+from argparse import Namespace
+
+import pytest
+
+from ..core.command_history import _CommandHistory
+from .stats import stats
+
+
+def _record_invocation(durations: list[float], started_at: float) -> None:
+  history = _CommandHistory()
+  history.start_invocation('cluster create', Namespace(cluster='my-cluster'))
+  for duration in durations:
+    history.record_command(
+        'Get credentials',
+        'gcloud container clusters get-credentials my-cluster',
+        started_at,
+        duration,
+        0,
+    )
+  history.finish_invocation(0)
+
+
+def test_stats_reports_latency_percentiles(capsys: pytest.CaptureFixture):
+  now = time.time()
+  _record_invocation([1.0] * 10, now - 40 * 24 * 60 * 60)
+  _record_invocation([2.0] * 18 + [20.0, 30.0], now)
+
+  stats(Namespace(days=30, limit=10, cluster=None))
+
+  output = capsys.readouterr().out
+  template_row = next(
+      line.split()
+      for line in output.splitlines()
+      if line.startswith('gcloud container clusters get-credentials *')
+  )
+  assert template_row[-5:] == ['20', '2.0s', '30.0s', '1.0s', '86.0s']
+  assert 'cluster create' in output
+
+
+def test_stats_without_history(capsys: pytest.CaptureFixture):
+  stats(Namespace(days=30, limit=10, cluster=None))
+
+  assert 'No command history recorded yet' in capsys.readouterr().out
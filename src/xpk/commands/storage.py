@@ -33,6 +33,7 @@ from ..core.cluster import (
     update_cluster_with_gcsfuse_driver_if_necessary,
     update_cluster_with_workload_identity_if_necessary,
 )
+from ..core.command_cache import invalidate_kubectl_cache
 from ..core.filestore import FilestoreClient, get_storage_class_name
 from ..core.storage import (
     GCP_FILESTORE_TYPE,
@@ -338,3 +339,4 @@ def delete_storage_resources(k8s_api_client: ApiClient, storage: Storage):
       storage.pvc,
       "Persistent Volume Claim finalizers",
   )
+  invalidate_kubectl_cache()
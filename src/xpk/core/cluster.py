@@ -22,6 +22,7 @@ from kubernetes.client.exceptions import ApiException
 from .kubectl_common import PatchResources, patch_controller_manager_resources
 from ..utils.console import xpk_exit, xpk_print
 from .capacity import H200_DEVICE_TYPE
+from .command_cache import invalidate_kubectl_cache
 from .commands import (
     run_command_for_value,
     run_command_with_updates,
@@ -33,8 +34,11 @@ from .gcloud_context import (
     get_project_number,
     zone_to_region,
 )
+from .kube_api import is_native_kubernetes_reads_enabled, list_nodes
+from .kubeconfig_cache import get_cached_kubeconfig_path, is_kubeconfig_cache_enabled, load_cached_context, save_current_context
 from .nodepool import recreate_nodes_in_existing_node_pools
 from .resources import get_cluster_system_characteristics
+from .tracing import trace_phase
 from .system_characteristics import INSTALLER_NCCL_TCPXO, SystemCharacteristics
 
 JOBSET_VERSION = 'v0.8.1'
@@ -46,6 +50,7 @@ XPK_SA = 'xpk-sa'
 
 # TODO(vbarr): Remove this function when jobsets gets enabled by default on
 # GKE clusters.
+@trace_phase('jobset')
 def set_jobset_on_cluster(args) -> int:
   """Add jobset command on server side and ask user to verify it is created.
 
@@ -149,6 +154,13 @@ def get_cluster_nodes_info() -> list[dict]:
     List of nodes info yaml objects.
   """
   xpk_print("Getting cluster's info...")
+  if is_native_kubernetes_reads_enabled():
+    nodes: list[dict] = []
+    err_code = list_nodes('Get cluster nodes info', nodes.append)
+    if err_code != 0:
+      xpk_exit(err_code)
+    return nodes
+
   command = 'kubectl get nodes -o yaml'
   err_code, val = run_command_for_value(
       command=command,
@@ -366,7 +378,11 @@ def setup_k8s_env(args) -> k8s_client.ApiClient:
   add_zone_and_project(args)
   get_cluster_credentials(args)
   args.project_number = get_project_number(args)
+  return get_k8s_api_client()
+
 
+def get_k8s_api_client() -> k8s_client.ApiClient:
+  """Returns a client for the current context, without fetching credentials."""
   config.load_kube_config()
   return k8s_client.ApiClient()
 
@@ -389,6 +405,7 @@ def setup_k8s_service_accounts() -> None:
   role_name = create_pod_reader_role()
   create_role_binding(default_sa, role_name)
   create_role_binding(XPK_SA, role_name)
+  invalidate_kubectl_cache()
 
 
 def create_xpk_k8s_service_account() -> None:
@@ -702,15 +719,29 @@ def update_cluster_with_mtc_if_necessary(args) -> int:
   return 0
 
 
+@trace_phase('credentials')
 def get_cluster_credentials(args) -> int:
   """Run cluster configuration command to set the kubectl config.
 
+  The kubeconfig context of the cluster is cached, and reused while kubectl
+  can still access the cluster with it.
+
   Args:
     args: user provided arguments for running the command.
 
   Returns:
     0 if successful and 1 otherwise.
   """
+  use_cache = is_kubeconfig_cache_enabled()
+  cached_kubeconfig = get_cached_kubeconfig_path(
+      args.project, args.zone, args.cluster
+  )
+  if use_cache and load_cached_context(cached_kubeconfig):
+    if _are_credentials_valid():
+      xpk_print('Reused cached credentials and kubectl setup.')
+      return 0
+    xpk_print('Cached credentials are not valid. Getting new credentials...')
+
   location = get_cluster_location(args.project, args.cluster, args.zone)
 
   return_code = _get_credentials(
@@ -731,6 +762,8 @@ def get_cluster_credentials(args) -> int:
     if return_code != 0:
       return return_code
 
+  if use_cache:
+    save_current_context(cached_kubeconfig)
   xpk_print('Finished get-credentials and kubectl setup.')
   return 0
 
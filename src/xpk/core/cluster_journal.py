@@ -0,0 +1,148 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from .config import XPK_CURRENT_VERSION
+from ..utils.console import xpk_print
+from ..utils.file import get_cache_dir, write_text_atomically
+
+# Phases of cluster create, in the order they are started.
+CLUSTER_CREATE_PHASES = (
+    'control-plane',
+    'private-access',
+    'workload-identity',
+    'mtc-update',
+    'credentials',
+    'coredns',
+    'storage-crd',
+    'storage-drivers',
+    'tensorboard',
+    'network',
+    'network-config',
+    'nodepools',
+    'autoprovisioning',
+    'configmaps',
+    'jobset',
+    'jobset-resources',
+    'kueue',
+    'gpus',
+    'ray',
+    'mtc',
+)
+
+# Phases whose only effect is on the local machine, e.g. the kubeconfig, which
+# may have changed since the previous run. They are not journaled, so they
+# always run.
+_LOCAL_PHASES = frozenset({'credentials'})
+
+# Arguments that do not change what cluster create does to the cluster.
+_ARGS_NOT_FINGERPRINTED = frozenset({
+    'dry_run',
+    'force_phase',
+    'quiet',
+    'skip_validation',
+    'trace_file',
+    'trace_format',
+})
+
+
+def get_inputs_fingerprint(args) -> str:
+  """Returns a fingerprint of the arguments and version of a cluster create."""
+  inputs = {
+      key: value
+      for key, value in vars(args).items()
+      if key not in _ARGS_NOT_FINGERPRINTED and not callable(value)
+  }
+  inputs['xpk_version'] = XPK_CURRENT_VERSION
+  serialized = json.dumps(inputs, sort_keys=True, default=str)
+  return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+class ClusterCreateJournal:
+  """Phases of a cluster create completed by a previous run that failed.
+
+  The journal is kept per cluster together with a fingerprint of the inputs of
+  the run, so that a rerun with the same inputs can skip the completed phases.
+  Values produced by the phases for later phases are kept alongside.
+  """
+
+  def __init__(self, path: Path, fingerprint: str):
+    self._path = path
+    self._fingerprint = fingerprint
+    self.completed_phases: list[str] = []
+    self.state: dict[str, Any] = {}
+
+  @classmethod
+  def load(
+      cls, project: str, zone: str, cluster: str, fingerprint: str
+  ) -> 'ClusterCreateJournal':
+    """Returns the journal of a cluster, empty if its inputs changed."""
+    journal = cls(_get_journal_path(project, zone, cluster), fingerprint)
+    try:
+      with open(journal._path, encoding='utf-8') as f:
+        data = json.load(f)
+    except (OSError, ValueError):
+      return journal
+    if data.get('fingerprint') != fingerprint:
+      xpk_print(
+          'Inputs of cluster create changed since its previous run, all'
+          ' phases will run.'
+      )
+      return journal
+    journal.completed_phases = [
+        phase
+        for phase in data.get('completed_phases', [])
+        if phase not in _LOCAL_PHASES
+    ]
+    journal.state = dict(data.get('state', {}))
+    return journal
+
+  def mark_completed(self, phase: str, state: dict[str, Any]) -> None:
+    """Records a completed phase and the current values produced by phases."""
+    if phase in _LOCAL_PHASES:
+      return
+    if phase not in self.completed_phases:
+      self.completed_phases.append(phase)
+    self.state = state
+    try:
+      write_text_atomically(
+          self._path,
+          json.dumps({
+              'fingerprint': self._fingerprint,
+              'completed_phases': self.completed_phases,
+              'state': self.state,
+          }),
+      )
+    except OSError as e:
+      xpk_print(f'Unable to record progress of cluster create: {e}')
+
+  def discard(self) -> None:
+    self._path.unlink(missing_ok=True)
+
+
+def discard_cluster_create_journal(
+    project: str, zone: str, cluster: str
+) -> None:
+  """Forgets the progress of a previous cluster create of a cluster."""
+  _get_journal_path(project, zone, cluster).unlink(missing_ok=True)
+
+
+def _get_journal_path(project: str, zone: str, cluster: str) -> Path:
+  return get_cache_dir() / 'cluster-create' / f'{project}_{zone}_{cluster}.json'
@@ -0,0 +1,68 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from argparse import Namespace
+
+from .cluster_journal import ClusterCreateJournal, discard_cluster_create_journal, get_inputs_fingerprint
+
+
+def _load(fingerprint: str = 'fingerprint') -> ClusterCreateJournal:
+  return ClusterCreateJournal.load('project', 'zone', 'cluster', fingerprint)
+
+
+def test_fingerprint_ignores_arguments_not_affecting_the_cluster():
+  args = Namespace(cluster='cluster', num_slices=1, func=print, dry_run=False)
+  same = Namespace(cluster='cluster', num_slices=1, func=len, dry_run=True)
+  changed = Namespace(
+      cluster='cluster', num_slices=2, func=print, dry_run=False
+  )
+
+  assert get_inputs_fingerprint(args) == get_inputs_fingerprint(same)
+  assert get_inputs_fingerprint(args) != get_inputs_fingerprint(changed)
+
+
+def test_journal_records_completed_phases_and_state():
+  _load().mark_completed('control-plane', {'tensorboard_config': {'a': 'b'}})
+
+  journal = _load()
+
+  assert journal.completed_phases == ['control-plane']
+  assert journal.state == {'tensorboard_config': {'a': 'b'}}
+
+
+def test_journal_does_not_record_local_phases():
+  _load().mark_completed('credentials', {})
+  _load().mark_completed('coredns', {})
+
+  assert _load().completed_phases == ['coredns']
+
+
+def test_journal_with_other_fingerprint_is_empty():
+  _load().mark_completed('control-plane', {})
+
+  journal = _load('other')
+
+  assert not journal.completed_phases
+  assert not journal.state
+
+
+def test_discarded_journal_is_empty():
+  _load().mark_completed('control-plane', {})
+  _load().mark_completed('coredns', {})
+
+  discard_cluster_create_journal('project', 'zone', 'cluster')
+
+  assert not _load().completed_phases
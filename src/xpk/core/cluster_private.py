@@ -23,8 +23,10 @@ from ..utils.execution_context import is_dry_run
 from ..utils.objects import is_text_true
 from .commands import run_command_for_value, run_command_with_updates
 from .gcloud_context import get_cluster_location
+from .tracing import trace_phase
 
 
+@trace_phase('private-access')
 def authorize_private_cluster_access_if_necessary(args) -> int:
   """Updates a GKE cluster to add authorize networks to access a private cluster's control plane, if not added already.
 
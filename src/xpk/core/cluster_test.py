@@ -40,6 +40,13 @@ def command_args(mocker: MockerFixture):
   )
 
 
+@pytest.fixture(autouse=True)
+def kubeconfig(tmp_path, monkeypatch):
+  path = tmp_path / "kube" / "config"
+  monkeypatch.setenv("KUBECONFIG", str(path))
+  return path
+
+
 @pytest.fixture(autouse=True)
 def mock_patch_controller_manager_resources(mocker: MockerFixture) -> MagicMock:
   return mocker.patch(
@@ -129,6 +136,65 @@ def test_get_cluster_credentials_retries_without_dns_when_dns_retrieval_returns_
   assert len(non_dns_endpoint_commands) == 1
 
 
+def _write_kubeconfig(path, server: str):
+  path.parent.mkdir(parents=True, exist_ok=True)
+  path.write_text(f"""
+current-context: gke
+clusters: [{{name: gke, cluster: {{server: "{server}"}}}}]
+users: [{{name: gke, user: {{}}}}]
+contexts: [{{name: gke, context: {{cluster: gke, user: gke}}}}]
+""")
+
+
+def test_get_cluster_credentials_reuses_cached_credentials(
+    commands_tester: CommandsTester, command_args, kubeconfig
+):
+  commands_tester.set_result_for_command(
+      (0, ""), "gcloud container clusters get-credentials"
+  )
+  commands_tester.set_result_for_command((0, ""), "kubectl get pods")
+  _write_kubeconfig(kubeconfig, "https://cluster")
+  assert get_cluster_credentials(command_args) == 0
+  kubeconfig.unlink()
+
+  assert get_cluster_credentials(command_args) == 0
+
+  assert (
+      len(
+          commands_tester.get_matching_commands(
+              "gcloud container clusters get-credentials"
+          )
+      )
+      == 1
+  )
+  commands_tester.assert_command_run(
+      "kubectl config set clusters.gke.server https://cluster",
+      "kubectl config use-context gke",
+  )
+
+
+def test_get_cluster_credentials_refreshes_invalid_cached_credentials(
+    commands_tester: CommandsTester, command_args, kubeconfig
+):
+  commands_tester.set_result_for_command(
+      (0, ""), "gcloud container clusters get-credentials"
+  )
+  _write_kubeconfig(kubeconfig, "https://cluster")
+  assert get_cluster_credentials(command_args) == 0
+  commands_tester.set_result_for_command((1, ""), "kubectl get pods")
+
+  assert get_cluster_credentials(command_args) == 0
+
+  assert (
+      len(
+          commands_tester.get_matching_commands(
+              "gcloud container clusters get-credentials"
+          )
+      )
+      == 3
+  )
+
+
 def test_update_cluster_with_lustre_driver_if_necessary_with_default_port_runs_correct_checks(
     commands_tester: CommandsTester, command_args
 ):
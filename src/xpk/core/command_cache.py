@@ -0,0 +1,262 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import shlex
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+from .config import COMMAND_CACHE_KEY, get_config
+from .retry import get_mutating_gcloud_api
+from ..utils.file import file_lock, get_cache_dir, write_text_atomically
+
+
+# Read-only commands whose results can be cached, with their TTL in seconds.
+_CACHEABLE_COMMANDS: list[tuple[re.Pattern, int]] = [
+    (re.compile(r'^gcloud container clusters list\b'), 300),
+    (re.compile(r'^gcloud (beta )?container clusters describe\b'), 60),
+    (re.compile(r'^gcloud container get-server-config\b'), 3600),
+    (re.compile(r'^gcloud (beta )?container node-pools (list|describe)\b'), 60),
+    (
+        re.compile(
+            r'^gcloud (beta |alpha )?compute reservations'
+            r' (describe|list|blocks list|sub-blocks list)\b'
+        ),
+        60,
+    ),
+    (re.compile(r'^kubectl get configmap\b'), 30),
+]
+
+_KUBECTL_MUTATING_VERBS = {
+    'annotate',
+    'apply',
+    'create',
+    'delete',
+    'edit',
+    'label',
+    'patch',
+    'replace',
+    'rollout',
+    'scale',
+    'set',
+    'taint',
+}
+
+_in_process_locks: dict[str, threading.Lock] = {}
+_in_process_locks_guard = threading.Lock()
+
+
+def is_command_cache_enabled() -> bool:
+  return get_config().get(COMMAND_CACHE_KEY) == 'true'
+
+
+def run_cached_command(
+    command: str,
+    variant: str,
+    run: Callable[[], tuple[int, str]],
+    on_cache_hit: Callable[[], None] | None = None,
+) -> tuple[int, str]:
+  """Runs a command, serving read-only commands from the cache when enabled.
+
+  Concurrent identical reads, from threads or other xpk processes, are
+  deduplicated: only one of them runs the command, the others wait for and
+  reuse its result.
+
+  Args:
+    command: command to execute.
+    variant: distinguishes different ways of capturing the command output.
+    run: executes the command, returns the return code and the output.
+    on_cache_hit: called when the result is served from the cache.
+
+  Returns:
+    tuple[int, str] as returned by `run`.
+  """
+  normalized_command = _normalize_command(command)
+  ttl = _get_ttl(normalized_command)
+  if ttl is None or not is_command_cache_enabled():
+    result = run()
+    invalidate_command_cache(command)
+    return result
+
+  partition_dir = _get_partition_dir(command)
+  if partition_dir is None:
+    return run()
+  try:
+    partition_dir.mkdir(parents=True, exist_ok=True)
+  except OSError:
+    return run()
+  key = _hash(f'{variant}\n{normalized_command}')
+  entry_path = partition_dir / f'{key}.json'
+
+  cached = _read_entry(entry_path, ttl)
+  if cached is None:
+    with _singleflight(partition_dir, key):
+      cached = _read_entry(entry_path, ttl)
+      if cached is None:
+        return_code, output = run()
+        if return_code == 0:
+          _write_entry(entry_path, output)
+        return return_code, output
+
+  if on_cache_hit is not None:
+    on_cache_hit()
+  return cached
+
+
+def invalidate_command_cache(command: str) -> None:
+  """Drops cached results that a mutating command may have made stale.
+
+  Args:
+    command: executed command, non-mutating commands do not invalidate.
+  """
+  if get_mutating_gcloud_api(command) is not None:
+    partition_dir = _get_partition_dir(command)
+    # The project is unknown, so any of the projects may be affected.
+    partition_dirs = (
+        [partition_dir]
+        if partition_dir is not None
+        else list(_get_cache_root().glob('project-*'))
+    )
+    for path in partition_dirs:
+      shutil.rmtree(path, ignore_errors=True)
+  elif _is_mutating_kubectl_command(command):
+    invalidate_kubectl_cache()
+
+
+def invalidate_kubectl_cache() -> None:
+  """Drops cached kubectl results of the current context.
+
+  Writes through the Kubernetes API do not run kubectl, so they call this.
+  """
+  shutil.rmtree(_get_kubectl_partition_dir(), ignore_errors=True)
+
+
+def _normalize_command(command: str) -> str:
+  try:
+    tokens = shlex.split(command)
+  except ValueError:
+    return ' '.join(command.split())
+  # Order of `--flag=value` options does not change the result.
+  options = sorted(t for t in tokens if t.startswith('--') and '=' in t)
+  others = [t for t in tokens if not (t.startswith('--') and '=' in t)]
+  return shlex.join(others + options)
+
+
+def _get_ttl(normalized_command: str) -> int | None:
+  for pattern, ttl in _CACHEABLE_COMMANDS:
+    if pattern.match(normalized_command):
+      return ttl
+  return None
+
+
+def _is_mutating_kubectl_command(command: str) -> bool:
+  tokens = command.split()
+  return any(
+      token == 'kubectl'
+      and i + 1 < len(tokens)
+      and tokens[i + 1] in _KUBECTL_MUTATING_VERBS
+      for i, token in enumerate(tokens)
+  )
+
+
+def _get_cache_root() -> Path:
+  return get_cache_dir() / 'commands'
+
+
+def _get_partition_dir(command: str) -> Path | None:
+  """Returns the cache directory of the project or cluster a command targets.
+
+  Returns:
+    The directory, None for gcloud commands whose project is unknown.
+  """
+  if not command.lstrip().startswith('gcloud'):
+    return _get_kubectl_partition_dir()
+  project_flag = re.search(r'--project[= ]([\w:.-]+)', command)
+  if project_flag:
+    project: str | None = project_flag.group(1)
+  else:
+    # pylint: disable=import-outside-toplevel
+    from .gcloud_context import get_gcloud_property
+
+    project = get_gcloud_property('core', 'project')
+  if project is None:
+    return None
+  return _get_cache_root() / f'project-{project}'
+
+
+def _get_kubectl_partition_dir() -> Path:
+  return _get_cache_root() / f'context-{_hash(_get_kube_context())[:16]}'
+
+
+def _get_kube_context() -> str:
+  """Returns the kubeconfig path and current context, without running kubectl."""
+  kubeconfig = os.environ.get('KUBECONFIG') or os.path.expanduser(
+      '~/.kube/config'
+  )
+  for path in kubeconfig.split(os.pathsep):
+    try:
+      with open(path, encoding='utf-8') as f:
+        match = re.search(
+            r'^current-context:\s*["\']?([^"\'\n]*)', f.read(), re.MULTILINE
+        )
+    except OSError:
+      continue
+    if match:
+      return f'{path}:{match.group(1)}'
+  return kubeconfig
+
+
+def _hash(value: str) -> str:
+  return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+
+def _read_entry(path: Path, ttl: int) -> tuple[int, str] | None:
+  try:
+    with open(path, encoding='utf-8') as f:
+      entry = json.load(f)
+  except (OSError, ValueError):
+    return None
+  if time.time() - entry.get('created_at', 0) > ttl:
+    return None
+  return 0, entry['output']
+
+
+def _write_entry(path: Path, output: str) -> None:
+  try:
+    write_text_atomically(
+        path, json.dumps({'created_at': time.time(), 'output': output})
+    )
+  except OSError:
+    pass
+
+
+@contextlib.contextmanager
+def _singleflight(partition_dir: Path, key: str) -> Iterator[None]:
+  """Holds a per-key lock across threads and xpk processes."""
+  with _in_process_locks_guard:
+    lock = _in_process_locks.setdefault(key, threading.Lock())
+  with lock:
+    # Invalidation from another process may have removed the directory.
+    partition_dir.mkdir(parents=True, exist_ok=True)
+    with file_lock(partition_dir / f'{key}.lock'):
+      yield
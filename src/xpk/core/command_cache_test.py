@@ -0,0 +1,204 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .command_cache import invalidate_command_cache, invalidate_kubectl_cache, run_cached_command
+from .config import COMMAND_CACHE_KEY, get_config
+
+CLUSTERS_LIST = (
+    'gcloud container clusters list --project=p --filter=name=c'
+    ' --format="value(location)"'
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_env(tmp_path, monkeypatch: pytest.MonkeyPatch):
+  kubeconfig = tmp_path / 'kubeconfig'
+  kubeconfig.write_text('current-context: ctx-1\n', encoding='utf-8')
+  monkeypatch.setenv('KUBECONFIG', str(kubeconfig))
+  monkeypatch.setenv('CLOUDSDK_CONFIG', str(tmp_path / 'gcloud'))
+  monkeypatch.delenv('CLOUDSDK_CORE_PROJECT', raising=False)
+  get_config().set(COMMAND_CACHE_KEY, 'true')
+  yield kubeconfig
+  get_config().set(COMMAND_CACHE_KEY, None)
+
+
+def _run(command: str, run: MagicMock) -> tuple[int, str]:
+  return run_cached_command(command, variant='', run=run)
+
+
+def test_caches_successful_read_only_commands():
+  run = MagicMock(return_value=(0, 'us-central1'))
+
+  assert _run(CLUSTERS_LIST, run) == (0, 'us-central1')
+  assert _run(CLUSTERS_LIST, run) == (0, 'us-central1')
+  run.assert_called_once()
+
+
+def test_normalizes_flag_order():
+  run = MagicMock(return_value=(0, 'us-central1'))
+
+  _run(CLUSTERS_LIST, run)
+  _run(
+      'gcloud container clusters list --format="value(location)"'
+      ' --filter=name=c   --project=p',
+      run,
+  )
+
+  run.assert_called_once()
+
+
+def test_does_not_cache_when_disabled():
+  get_config().set(COMMAND_CACHE_KEY, None)
+  run = MagicMock(return_value=(0, 'us-central1'))
+
+  _run(CLUSTERS_LIST, run)
+  _run(CLUSTERS_LIST, run)
+
+  assert run.call_count == 2
+
+
+def test_does_not_cache_failures():
+  run = MagicMock(return_value=(1, 'error'))
+
+  _run(CLUSTERS_LIST, run)
+  _run(CLUSTERS_LIST, run)
+
+  assert run.call_count == 2
+
+
+def test_does_not_cache_other_commands():
+  run = MagicMock(return_value=(0, 'pods'))
+
+  _run('kubectl get pods', run)
+  _run('kubectl get pods', run)
+
+  assert run.call_count == 2
+
+
+def test_entries_expire_after_ttl(mocker: MockerFixture):
+  now = time.time()
+  mocker.patch('time.time', return_value=now)
+  run = MagicMock(return_value=(0, 'data'))
+  _run('kubectl get configmap c-resources-configmap', run)
+
+  mocker.patch('time.time', return_value=now + 31)
+  _run('kubectl get configmap c-resources-configmap', run)
+
+  assert run.call_count == 2
+
+
+def test_kubectl_entries_are_partitioned_by_context(cache_env):
+  run = MagicMock(return_value=(0, 'data'))
+  _run('kubectl get configmap c-resources-configmap', run)
+
+  cache_env.write_text('current-context: ctx-2\n', encoding='utf-8')
+  _run('kubectl get configmap c-resources-configmap', run)
+
+  assert run.call_count == 2
+
+
+def test_mutating_gcloud_command_invalidates_project_entries():
+  run = MagicMock(return_value=(0, 'us-central1'))
+  _run(CLUSTERS_LIST, run)
+
+  invalidate_command_cache(
+      'gcloud beta container clusters delete c --project=p --quiet'
+  )
+  _run(CLUSTERS_LIST, run)
+
+  assert run.call_count == 2
+
+
+def test_mutating_gcloud_command_invalidates_default_project_entries(
+    monkeypatch: pytest.MonkeyPatch,
+):
+  monkeypatch.setenv('CLOUDSDK_CORE_PROJECT', 'p')
+  run = MagicMock(return_value=(0, 'us-central1'))
+  _run(CLUSTERS_LIST, run)
+
+  invalidate_command_cache('gcloud beta container clusters delete c --quiet')
+  _run(CLUSTERS_LIST, run)
+
+  assert run.call_count == 2
+
+
+def test_mutating_gcloud_command_of_unknown_project_invalidates_all_projects():
+  run = MagicMock(return_value=(0, 'us-central1'))
+  _run(CLUSTERS_LIST, run)
+
+  invalidate_command_cache('gcloud beta container clusters delete c --quiet')
+  _run(CLUSTERS_LIST, run)
+
+  assert run.call_count == 2
+
+
+def test_does_not_cache_gcloud_commands_of_unknown_project():
+  run = MagicMock(return_value=(0, 'us-central1'))
+
+  _run('gcloud container clusters list --format="value(name)"', run)
+  _run('gcloud container clusters list --format="value(name)"', run)
+
+  assert run.call_count == 2
+
+
+def test_invalidate_kubectl_cache_invalidates_context_entries():
+  run = MagicMock(return_value=(0, 'data'))
+  _run('kubectl get configmap c-resources-configmap', run)
+
+  invalidate_kubectl_cache()
+  _run('kubectl get configmap c-resources-configmap', run)
+
+  assert run.call_count == 2
+
+
+def test_mutating_kubectl_command_invalidates_context_entries():
+  run = MagicMock(return_value=(0, 'data'))
+  _run('kubectl get configmap c-resources-configmap', run)
+
+  invalidate_command_cache('kubectl apply -f /tmp/configmap.yaml')
+  _run('kubectl get configmap c-resources-configmap', run)
+
+  assert run.call_count == 2
+
+
+def test_concurrent_identical_reads_run_once():
+  release = threading.Event()
+
+  def slow_run() -> tuple[int, str]:
+    release.wait(timeout=5)
+    return 0, 'us-central1'
+
+  run = MagicMock(side_effect=slow_run)
+  results = []
+  threads = [
+      threading.Thread(target=lambda: results.append(_run(CLUSTERS_LIST, run)))
+      for _ in range(4)
+  ]
+  for thread in threads:
+    thread.start()
+  release.set()
+  for thread in threads:
+    thread.join()
+
+  run.assert_called_once()
+  assert results == [(0, 'us-central1')] * 4
@@ -0,0 +1,237 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import re
+import secrets
+import shlex
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .config import COMMAND_HISTORY_KEY, XPK_CURRENT_VERSION, get_config
+from ..utils.execution_context import is_dry_run
+from ..utils.file import get_cache_dir
+
+_RETENTION_SECONDS = 90 * 24 * 60 * 60
+# Leading words of a command kept in its template, e.g.
+# `gcloud container clusters get-credentials`.
+_TEMPLATE_WORDS = 5
+_WORD = re.compile(r'^[a-z][a-z0-9-]*$')
+_PLACEHOLDER = '*'
+# Arguments whose values are replaced in the templates of the commands.
+_TEMPLATED_ARGS = ('cluster', 'project', 'zone', 'workload', 'reservation')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS invocations (
+  id TEXT PRIMARY KEY,
+  subcommand TEXT NOT NULL,
+  cluster TEXT,
+  xpk_version TEXT NOT NULL,
+  started_at REAL NOT NULL,
+  duration REAL,
+  exit_code INTEGER
+);
+CREATE TABLE IF NOT EXISTS commands (
+  invocation_id TEXT NOT NULL,
+  template TEXT NOT NULL,
+  task TEXT NOT NULL,
+  started_at REAL NOT NULL,
+  duration REAL NOT NULL,
+  exit_code INTEGER
+);
+CREATE INDEX IF NOT EXISTS commands_started_at ON commands (started_at);
+CREATE INDEX IF NOT EXISTS invocations_started_at ON invocations (started_at);
+"""
+
+
+def get_history_path() -> Path:
+  return get_cache_dir() / 'history.sqlite3'
+
+
+def is_command_history_enabled() -> bool:
+  return get_config().get(COMMAND_HISTORY_KEY) != 'false'
+
+
+def get_command_template(command: str, known_values: set[str]) -> str:
+  """Returns the command with the values that vary between runs removed.
+
+  Args:
+    command: command as run.
+    known_values: values of the invocation, e.g. cluster name or project,
+      replaced wherever they appear.
+
+  Returns:
+    The leading words of the command followed by its flags, with values
+    replaced by placeholders.
+  """
+  try:
+    tokens = shlex.split(command)
+  except ValueError:
+    tokens = command.split()
+  template: list[str] = []
+  words = 0
+  follows_flag = False
+  for token in tokens:
+    if token.startswith('-'):
+      flag, separator, _ = token.partition('=')
+      template.append(f'{flag}={_PLACEHOLDER}' if separator else flag)
+      follows_flag = not separator
+      continue
+    words += 1
+    is_word = (
+        words <= _TEMPLATE_WORDS
+        and not follows_flag
+        and _WORD.match(token)
+        and token not in known_values
+    )
+    follows_flag = False
+    if is_word or token in ('|', '&&', '||', ';'):
+      template.append(token)
+    elif not template or template[-1] != _PLACEHOLDER:
+      template.append(_PLACEHOLDER)
+  return ' '.join(template)
+
+
+@dataclass
+class _Invocation:
+  id: str
+  started_at: float
+  args: Any
+
+  @property
+  def known_values(self) -> set[str]:
+    # Read on every command, as e.g. the project may be resolved after start.
+    values = (getattr(self.args, name, None) for name in _TEMPLATED_ARGS)
+    return {value for value in values if isinstance(value, str) and value}
+
+
+class _CommandHistory:
+  """Local SQLite store of the xpk invocations and the commands they ran."""
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._connection: sqlite3.Connection | None = None
+    self._invocation: _Invocation | None = None
+
+  def start_invocation(self, subcommand: str, args: Any) -> None:
+    """Starts recording the commands run by an xpk invocation.
+
+    Args:
+      subcommand: xpk subcommand invoked, e.g. `cluster create`.
+      args: user provided arguments of the invocation.
+    """
+    if is_dry_run() or not is_command_history_enabled():
+      return
+    invocation = _Invocation(
+        id=secrets.token_hex(8), started_at=time.time(), args=args
+    )
+    cluster = getattr(args, 'cluster', None)
+    if self._execute(
+        'INSERT INTO invocations (id, subcommand, cluster, xpk_version,'
+        ' started_at) VALUES (?, ?, ?, ?, ?)',
+        (
+            invocation.id,
+            subcommand,
+            cluster if isinstance(cluster, str) else None,
+            XPK_CURRENT_VERSION,
+            invocation.started_at,
+        ),
+    ):
+      self._invocation = invocation
+
+  def record_command(
+      self,
+      task: str,
+      command: str,
+      started_at: float,
+      duration: float,
+      exit_code: int | None,
+  ) -> None:
+    """Records a command run by the current invocation, if one is started."""
+    invocation = self._invocation
+    if invocation is None:
+      return
+    self._execute(
+        'INSERT INTO commands (invocation_id, template, task, started_at,'
+        ' duration, exit_code) VALUES (?, ?, ?, ?, ?, ?)',
+        (
+            invocation.id,
+            get_command_template(command, invocation.known_values),
+            task,
+            started_at,
+            duration,
+            exit_code,
+        ),
+    )
+
+  def finish_invocation(self, exit_code: int) -> None:
+    """Records the outcome of the invocation and forgets old entries."""
+    invocation = self._invocation
+    if invocation is None:
+      return
+    self._invocation = None
+    now = time.time()
+    self._execute(
+        'UPDATE invocations SET duration = ?, exit_code = ? WHERE id = ?',
+        (now - invocation.started_at, exit_code, invocation.id),
+    )
+    cutoff = now - _RETENTION_SECONDS
+    self._execute('DELETE FROM commands WHERE started_at < ?', (cutoff,))
+    self._execute('DELETE FROM invocations WHERE started_at < ?', (cutoff,))
+
+  def _execute(self, statement: str, parameters: tuple) -> bool:
+    """Runs a write, returns whether it succeeded.
+
+    The history is best effort: it is turned off when it cannot be written,
+    e.g. on a read-only cache directory, instead of failing xpk.
+    """
+    with self._lock:
+      try:
+        connection = self._connect()
+        with connection:
+          connection.execute(statement, parameters)
+        return True
+      except (sqlite3.Error, OSError):
+        self._invocation = None
+        return False
+
+  def _connect(self) -> sqlite3.Connection:
+    if self._connection is None:
+      path = get_history_path()
+      path.parent.mkdir(parents=True, exist_ok=True)
+      connection = sqlite3.connect(path, timeout=5, check_same_thread=False)
+      connection.execute('PRAGMA journal_mode=WAL')
+      connection.execute('PRAGMA synchronous=NORMAL')
+      connection.executescript(_SCHEMA)
+      self._connection = connection
+    return self._connection
+
+
+CommandHistory = _CommandHistory()
+
+
+def open_history_for_reading() -> sqlite3.Connection | None:
+  """Returns a connection to the history, None if nothing was recorded."""
+  path = get_history_path()
+  if not path.exists():
+    return None
+  try:
+    return sqlite3.connect(f'file:{path}?mode=ro', uri=True, timeout=5)
+  except sqlite3.Error:
+    return None
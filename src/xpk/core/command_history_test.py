@@ -0,0 +1,99 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import time
+from argparse import Namespace
+
+from .command_history import _CommandHistory, get_command_template, open_history_for_reading
+from .config import COMMAND_HISTORY_KEY, get_config
+from ..utils.execution_context import set_context
+
+
+def test_get_command_template_removes_values():
+  assert (
+      get_command_template(
+          'gcloud container clusters get-credentials my-cluster'
+          ' --location=us-central1 --project my-project --dns-endpoint',
+          {'my-cluster'},
+      )
+      == 'gcloud container clusters get-credentials * --location=* --project'
+      ' * --dns-endpoint'
+  )
+  assert (
+      get_command_template(
+          'gcloud beta container node-pools create my-cluster-np-0'
+          ' --cluster=my-cluster',
+          {'my-cluster'},
+      )
+      == 'gcloud beta container node-pools create * --cluster=*'
+  )
+  assert (
+      get_command_template(
+          "kubectl get pods -o=custom-columns='NAME:.metadata.name' | grep x",
+          set(),
+      )
+      == 'kubectl get pods -o=* | grep *'
+  )
+
+
+def test_records_commands_of_invocation():
+  history = _CommandHistory()
+  history.start_invocation(
+      'cluster create', Namespace(cluster='my-cluster', project='my-project')
+  )
+  history.record_command(
+      'Get credentials',
+      'gcloud container clusters get-credentials my-cluster',
+      started_at=time.time(),
+      duration=2.5,
+      exit_code=0,
+  )
+  history.finish_invocation(0)
+  history.record_command('Ignored', 'kubectl get nodes', 1.0, 1.0, 0)
+
+  connection = open_history_for_reading()
+  assert connection is not None
+  assert connection.execute(
+      'SELECT i.subcommand, i.cluster, i.exit_code, c.template, c.task,'
+      ' c.duration, c.exit_code FROM commands c JOIN invocations i ON'
+      ' c.invocation_id = i.id'
+  ).fetchall() == [(
+      'cluster create',
+      'my-cluster',
+      0,
+      'gcloud container clusters get-credentials *',
+      'Get credentials',
+      2.5,
+      0,
+  )]
+
+
+def test_does_not_record_when_disabled_or_in_dry_run():
+  history = _CommandHistory()
+  get_config().set(COMMAND_HISTORY_KEY, 'false')
+  try:
+    history.start_invocation('cluster create', Namespace())
+  finally:
+    get_config().set(COMMAND_HISTORY_KEY, None)
+  set_context(dry_run_value=True, quiet_value=False)
+  try:
+    history.start_invocation('cluster create', Namespace())
+  finally:
+    set_context(dry_run_value=False, quiet_value=False)
+
+  history.record_command('Get nodes', 'kubectl get nodes', 1.0, 1.0, 0)
+
+  assert open_history_for_reading() is None
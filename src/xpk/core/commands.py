@@ -14,16 +14,28 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import datetime
+import asyncio
+import codecs
+import collections
+import os
+import queue
+import shlex
+import signal
 import subprocess
 import sys
+import threading
 import time
 
 from dataclasses import dataclass
-from ..utils.objects import chunks
+from typing import IO, Callable
+from .command_cache import invalidate_command_cache, run_cached_command
+from .hedging import LatencyHistory, ReadCommandPolicy, get_hedge_delay, get_read_command_policy, is_hedging_enabled
+from .retry import ErrorClass, classify_command_error, get_retry_delay, reserve_api_token
+from .tracing import Tracer
 from ..utils.file import make_tmp_files, write_tmp_file
 from ..utils.console import xpk_print
 from ..utils.execution_context import is_dry_run
+from ..utils.progress import BatchProgress, WaitProgress
 
 
 @dataclass
@@ -34,47 +46,71 @@ class FailedCommand:
   logfile: str
 
 
+@dataclass(frozen=True)
+class Command:
+  """A command executed directly, without a shell.
+
+  Attributes:
+    argv: the program followed by its arguments.
+    postprocess: applied to the stdout of a successful run, in place of piping
+      the output through grep, sort, uniq etc.
+  """
+
+  argv: list[str]
+  postprocess: Callable[[str], str] | None = None
+
+  def __str__(self) -> str:
+    return shlex.join(self.argv)
+
+
+_BATCH_MAX_ATTEMPTS = 5
+# Errors are classified from the end of the command output only.
+_ERROR_OUTPUT_TAIL_BYTES = 64 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+# Same as the return code of the `timeout` utility.
+_TIMEOUT_RETURN_CODE = 124
+_READ_TIMEOUT_ATTEMPTS = 2
+_WAIT_POLL_SECONDS = 0.1
+
+
 def run_commands(
     commands: list[str],
     jobname: str,
     per_command_name: list[str],
     batch: int = 10,
+    idempotent: bool = False,
 ) -> list[FailedCommand]:
-  """Run commands in groups of `batch`.
+  """Run commands keeping up to `batch` of them in flight at once.
 
   Args:
     commands: list of command.
     jobname: the name of the job.
     per_command_name: list of command names.
-    batch: number of commands to run in parallel.
+    batch: maximum number of commands to run in parallel.
+    idempotent: whether commands can safely be retried after retryable errors.
 
   Returns:
     A list of FailedCommand instances containing details of all failing commands.
   """
 
-  temporary_files_batches = chunks(make_tmp_files(per_command_name), batch)
-  commands_batched = chunks(commands, batch)
-  per_command_name_batches = chunks(per_command_name, batch)
+  temporary_files = make_tmp_files(per_command_name)
 
   xpk_print(
-      f'Breaking up a total of {len(commands)} commands into'
-      f' {len(commands_batched)} batches'
+      f'Running a total of {len(commands)} commands with up to {batch} in'
+      ' parallel'
   )
   if is_dry_run():
     xpk_print('Pretending all the jobs succeeded')
     return []
 
-  all_failures = []
-  for i, _ in enumerate(commands_batched):
-    xpk_print(f'Dispatching batch {i}/{len(commands_batched)}')
-    failures = run_command_batch(
-        commands_batched[i],
-        jobname,
-        per_command_name_batches[i],
-        temporary_files_batches[i],
-    )
-    all_failures.extend(failures)
-  return all_failures
+  return run_command_batch(
+      commands,
+      jobname,
+      per_command_name,
+      temporary_files,
+      max_parallelism=batch,
+      idempotent=idempotent,
+  )
 
 
 def run_command_batch(
@@ -82,74 +118,149 @@ def run_command_batch(
     jobname: str,
     per_command_name: list[str],
     output_logs: list[str],
+    max_parallelism: int | None = None,
+    idempotent: bool = False,
 ) -> list[FailedCommand]:
   """Runs commands in parallel.
 
+  Commands are executed as a sliding window: as soon as one of them exits, the
+  next pending command is started, so a single slow command never holds back
+  the rest of the queue.
+
   Args:
     commands: list of n commands, each command is a a list of strings
     jobname: Useful debugging name for the group of commands
     per_command_name: specific name per task
     output_logs: list of n log paths, each command will output to each log.
+    max_parallelism: maximum number of commands in flight, all if not set.
+    idempotent: whether commands can safely be retried after rate-limit and
+      transient errors. Must stay unset for commands like creates, which may
+      have taken effect even though the client saw a timeout or 5xx.
 
   Returns:
     A list of FailedCommand instances containing details of all failing commands.
   """
+  return_codes = asyncio.run(
+      _run_command_batch_async(
+          commands,
+          jobname,
+          per_command_name,
+          output_logs,
+          max_parallelism,
+          idempotent,
+      )
+  )
 
-  files = [open(f, 'w', encoding='utf-8') for f in output_logs]
-  children = []
-  start_time = datetime.datetime.now()
-  for command, file in zip(commands, files):
-    children.append(
-        # subprocess managed by list pylint: disable=consider-using-with
-        subprocess.Popen(command, stdout=file, stderr=file, shell=True)
+  failures: list[FailedCommand] = []
+  for i, return_code in enumerate(return_codes):
+    if return_code == 0:
+      continue
+    failures.append(
+        FailedCommand(
+            return_code=return_code,
+            name=per_command_name[i],
+            command=commands[i],
+            logfile=output_logs[i],
+        )
     )
+  return failures
 
-  failures: list[FailedCommand] = []
-  while True:
-    returncodes = [child.poll() for child in children]
-    completed = len([r for r in returncodes if r is not None])
-    total = len(returncodes)
-    seconds_elapsed = (datetime.datetime.now() - start_time).total_seconds()
-    if completed < total:
-      slow_worker_index = returncodes.index(None)
-      slow_worker_text = per_command_name[slow_worker_index]
-      slow_str = (
-          f', task {slow_worker_text} still working, logfile'
-          f' {output_logs[slow_worker_index]}'
+
+async def _run_command_batch_async(
+    commands: list[str],
+    jobname: str,
+    per_command_name: list[str],
+    output_logs: list[str],
+    max_parallelism: int | None,
+    idempotent: bool,
+) -> list[int]:
+  """Runs commands with at most `max_parallelism` in flight, returns codes."""
+  total = len(commands)
+  parallelism = max(1, max_parallelism or total)
+  return_codes: list[int] = [0] * total
+  pending = collections.deque(range(total))
+  in_flight: dict[asyncio.Task, int] = {}
+  progress = BatchProgress(jobname, per_command_name, output_logs)
+
+  def dispatch() -> None:
+    while pending and len(in_flight) < parallelism:
+      index = pending.popleft()
+      progress.set_running(index)
+      task = asyncio.create_task(
+          _run_logged_command(
+              commands[index],
+              per_command_name[index],
+              output_logs[index],
+              progress,
+              _BATCH_MAX_ATTEMPTS if idempotent else 1,
+          )
       )
-    else:
-      slow_str = ''
-    xpk_print(
-        f'[t={seconds_elapsed:.2f}, {jobname}] Completed'
-        f' {completed}/{total}{slow_str}'
+      in_flight[task] = index
+
+  dispatch()
+  progress.refresh()
+  while in_flight:
+    done, _ = await asyncio.wait(
+        in_flight,
+        timeout=progress.refresh_interval,
+        return_when=asyncio.FIRST_COMPLETED,
     )
+    for task in done:
+      index = in_flight.pop(task)
+      return_codes[index] = task.result()
+      progress.set_done(index, return_codes[index] == 0)
+    dispatch()
+    progress.refresh()
+  progress.finish()
+  return return_codes
 
-    if completed < total:
-      time.sleep(1)
-      continue
 
-    failing_indices = [
-        i for i, x in enumerate(returncodes) if x is not None and x > 0
-    ]
-    for failing_index in failing_indices:
-      xpk_print(
-          f'Failure is {per_command_name[failing_index]}'
-          f' and logfile {output_logs[failing_index]}'
+async def _run_logged_command(
+    command: str,
+    name: str,
+    output_log: str,
+    progress: BatchProgress,
+    max_attempts: int,
+) -> int:
+  """Runs command with output to `output_log`, retrying retryable errors."""
+  with open(output_log, 'w', encoding='utf-8') as file:
+    attempt = 0
+    while True:
+      attempt += 1
+      await asyncio.sleep(reserve_api_token(command))
+      attempt_offset = os.path.getsize(output_log)
+      with Tracer.command(name, command) as span:
+        span['attempt'] = attempt
+        child = await asyncio.create_subprocess_shell(
+            command, stdout=file, stderr=file
+        )
+        return_code = await child.wait()
+        span['exit_code'] = return_code
+      invalidate_command_cache(command)
+      if return_code == 0 or attempt >= max_attempts:
+        return return_code
+
+      error_class = classify_command_error(
+          _read_file_tail(output_log, attempt_offset)
       )
-      failures.append(
-          FailedCommand(
-              return_code=returncodes[failing_index] or 0,
-              name=per_command_name[failing_index],
-              command=commands[failing_index],
-              logfile=output_logs[failing_index],
-          )
+      delay = get_retry_delay(error_class, attempt)
+      if delay is None:
+        return return_code
+      progress.print(
+          f'Task {name} failed with a {error_class.value} error, retrying in'
+          f' {delay:.0f} seconds.'
       )
-    break
+      file.seek(0, os.SEEK_END)
+      file.write(f'\n[XPK] Retry {attempt} after {error_class.value} error.\n')
+      file.flush()
+      await asyncio.sleep(delay)
 
-  for file in files:
-    file.close()
 
-  return failures
+def _read_file_tail(path: str, offset: int) -> str:
+  """Reads the end of a file written past `offset`, for error classification."""
+  with open(path, 'rb') as f:
+    f.seek(max(offset, os.path.getsize(path) - _ERROR_OUTPUT_TAIL_BYTES))
+    return str(f.read(), 'UTF-8', errors='replace')
 
 
 def run_command_with_updates_retry(
@@ -157,30 +268,49 @@ def run_command_with_updates_retry(
 ) -> int:
   """Generic run commands function with updates and retry logic.
 
+  Failures are classified from the command output: rate-limit and transient
+  errors are retried with exponential backoff and jitter, unrecognized errors
+  are retried every `wait_seconds` and known permanent errors are returned
+  right away.
+
   Args:
     command: command to execute
     task: user-facing name of the task
     verbose: shows stdout and stderr if set to true. Set to True by default.
     num_retry_attempts: number of attempts to retry the command.
         This has a default value in the function arguments.
-    wait_seconds: Seconds to wait between attempts.
+    wait_seconds: Seconds to wait before the first retry of a transient error.
         Has a default value in the function arguments.
 
   Returns:
     0 if successful and 1 otherwise.
   """
 
-  i = 0
-  return_code = -1
-  while return_code != 0 and i < num_retry_attempts:
-    # Do not sleep before first try.
-    if i != 0:
-      xpk_print(f'Wait {wait_seconds} seconds before retrying.')
-      time.sleep(wait_seconds)
-    i += 1
-    xpk_print(f'Try {i}: {task}')
-    return_code = run_command_with_updates(command, task, verbose=verbose)
-  return return_code
+  attempt = 0
+  while True:
+    attempt += 1
+    xpk_print(f'Try {attempt}: {task}')
+    return_code, output = _run_command_with_updates(
+        command, task, verbose=verbose, capture_output=True
+    )
+    if return_code == 0 or attempt >= num_retry_attempts:
+      return return_code
+
+    error_class = classify_command_error(output)
+    if error_class == ErrorClass.UNKNOWN:
+      delay = wait_seconds
+    else:
+      delay = get_retry_delay(
+          error_class, attempt, initial_seconds=wait_seconds
+      )
+    if delay is None:
+      xpk_print(f'Task: `{task}` failed with a permanent error, not retrying.')
+      return return_code
+    xpk_print(
+        f'Wait {delay:.0f} seconds before retrying, the error was classified'
+        f' as {error_class.value}.'
+    )
+    time.sleep(delay)
 
 
 def run_command_with_updates(command, task, verbose=True) -> int:
@@ -194,68 +324,148 @@ def run_command_with_updates(command, task, verbose=True) -> int:
   Returns:
     0 if successful and 1 otherwise.
   """
+  return _run_command_with_updates(command, task, verbose)[0]
+
+
+def _run_command_with_updates(
+    command, task, verbose=True, capture_output=False
+) -> tuple[int, str]:
+  """Implements run_command_with_updates, invalidating stale cached reads.
+
+  Args:
+    command: command to execute
+    task: user-facing name of the task
+    verbose: shows stdout and stderr if set to true.
+    capture_output: whether to also return the tail of a streamed stderr.
+
+  Returns:
+    tuple[int, str]
+    int: return code of the command.
+    str: output of the command, only the tail of stderr if it was streamed.
+  """
   if is_dry_run():
     xpk_print(
         f'Task: `{task}` is implemented by the following command'
         ' not running since it is a dry run.'
         f' \n{command}'
     )
-    return 0
-  if verbose:
-    xpk_print(
-        f'Task: `{task}` is implemented by `{command}`, streaming output live.'
-    )
-    with subprocess.Popen(
-        command,
-        stdout=sys.stdout,
-        stderr=sys.stderr,
-        shell=True,
-    ) as child:
-      i = 0
-      while True:
-        return_code = child.poll()
-        if return_code is None:
-          xpk_print(f'Waiting for `{task}`, for {i} seconds...', end='\r')
-          time.sleep(10)
-          i += 10
-        else:
-          xpk_print(f'Task: `{task}` terminated with code `{return_code}`')
-          return return_code
-  else:
-    xpk_print(f'Task: `{task}` is implemented by `{command}`')
+    return 0, ''
+  _wait_for_api_token(command)
+  with Tracer.command(task, command) as span:
     try:
-      subprocess.check_output(command, shell=True, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
-      xpk_print(
-          f'Task: `{task}` terminated with ERROR `{e.returncode}`, printing'
-          ' logs'
+      if verbose:
+        result = _stream_command_with_updates(command, task, capture_output)
+      else:
+        result = _check_command_with_updates(command, task)
+    finally:
+      invalidate_command_cache(command)
+    span['exit_code'] = result[0]
+  return result
+
+
+def _stream_command_with_updates(
+    command, task, capture_output
+) -> tuple[int, str]:
+  xpk_print(
+      f'Task: `{task}` is implemented by `{command}`, streaming output live.'
+  )
+  error_tail: collections.deque[bytes] = collections.deque()
+  # Only stderr is captured, stdout keeps writing to the terminal directly.
+  with subprocess.Popen(
+      command,
+      stdout=sys.stdout,
+      stderr=subprocess.PIPE if capture_output else sys.stderr,
+      shell=True,
+  ) as child:
+    pump = None
+    if capture_output:
+      pump = threading.Thread(
+          target=_pump_output,
+          args=(child.stderr, sys.stderr, error_tail),
+          daemon=True,
       )
-      xpk_print('*' * 80)
-      xpk_print(e.output)
-      xpk_print('*' * 80)
-      return e.returncode
-    xpk_print(f'Task: `{task}` succeeded.')
-    return 0
+      pump.start()
+    wait_progress = WaitProgress(task)
+    i = 0
+    while True:
+      try:
+        return_code = child.wait(timeout=10)
+      except subprocess.TimeoutExpired:
+        i += 10
+        wait_progress.update(i)
+        continue
+      if pump is not None:
+        pump.join()
+      xpk_print(f'Task: `{task}` terminated with code `{return_code}`')
+      return return_code, str(b''.join(error_tail), 'UTF-8', errors='replace')
+
+
+def _check_command_with_updates(command, task) -> tuple[int, str]:
+  xpk_print(f'Task: `{task}` is implemented by `{command}`')
+  try:
+    output = subprocess.check_output(
+        command, shell=True, stderr=subprocess.STDOUT
+    )
+  except subprocess.CalledProcessError as e:
+    xpk_print(
+        f'Task: `{task}` terminated with ERROR `{e.returncode}`, printing logs'
+    )
+    xpk_print('*' * 80)
+    xpk_print(e.output)
+    xpk_print('*' * 80)
+    return e.returncode, str(e.output, 'UTF-8', errors='replace')
+  xpk_print(f'Task: `{task}` succeeded.')
+  return 0, str(output, 'UTF-8', errors='replace')
+
+
+def _pump_output(
+    source: IO[bytes], target: IO[str], output_tail: collections.deque[bytes]
+) -> None:
+  """Forwards `source` to `target`, keeping its tail in `output_tail`."""
+  decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+  tail_size = 0
+  while chunk := os.read(source.fileno(), 4096):
+    target.write(decoder.decode(chunk))
+    target.flush()
+    output_tail.append(chunk)
+    tail_size += len(chunk)
+    while tail_size - len(output_tail[0]) >= _ERROR_OUTPUT_TAIL_BYTES:
+      tail_size -= len(output_tail.popleft())
+  target.write(decoder.decode(b'', final=True))
+  target.flush()
+
+
+def _wait_for_api_token(command: str) -> None:
+  delay = reserve_api_token(command)
+  if delay > 0:
+    time.sleep(delay)
 
 
 def run_command_for_value(
-    command,
+    command: str | Command,
     task,
     dry_run_return_val='0',
     print_timer=False,
     hide_error=False,
     quiet=False,
+    output_handler: Callable[[str], None] | None = None,
 ) -> tuple[int, str]:
   """Runs the command and returns the error code and stdout.
 
   Prints errors and associated user-facing information
 
   Args:
-    command: user provided command to run.
+    command: user provided command to run, a `Command` is run without a shell
+        and with stdout and stderr captured separately.
     task: user provided task name for running the command.
     dry_run_return_val: return value of this command for dry run.
     print_timer: print out the time the command is running.
     hide_error: hide the error from the command output upon success.
+    output_handler: called with chunks of stdout as soon as they are read,
+        e.g. to parse large outputs incrementally. The output is then neither
+        kept in memory nor returned, nor served from the command cache.
+        Without a handler, the whole output is held in memory to be returned.
+        stderr is captured separately and printed if the command fails.
 
   Returns:
     tuple[int, str]
@@ -270,46 +480,335 @@ def run_command_for_value(
     )
     return 0, dry_run_return_val
 
-  if print_timer:
-    if not quiet:
-      xpk_print(f'Task: `{task}` is implemented by `{command}`')
-    with subprocess.Popen(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        shell=True,
-    ) as child:
-      i = 0
-      while True:
-        return_code = child.poll()
-        if return_code is None:
-          if not quiet:
-            xpk_print(f'Waiting for `{task}`, for {i} seconds...', end='\r')
-          time.sleep(1)
-          i += 1
-        else:
-          if not quiet:
-            xpk_print(f'Task: `{task}` terminated with code `{return_code}`')
-          out_bytes, err_bytes = child.communicate()
-          out_str, err_str = str(out_bytes, 'UTF-8'), str(err_bytes, 'UTF-8')
-          return return_code, f'{out_str}\n{err_str}'
+  if output_handler is not None:
+    with Tracer.command(task, str(command)) as span:
+      return_code, output = _run_command_for_value(
+          command, task, print_timer, hide_error, quiet, output_handler
+      )
+      span['exit_code'] = return_code
+    return return_code, output
+
+  is_argv = isinstance(command, Command)
+  with Tracer.command(task, str(command)) as span:
+
+    def print_cache_hit() -> None:
+      span['cached'] = True
+      if not quiet:
+        xpk_print(f'Task: `{task}` is served from cache of `{command}`')
+
+    return_code, output = run_cached_command(
+        str(command),
+        variant=(
+            f'print_timer={print_timer},hide_error={hide_error},argv={is_argv}'
+        ),
+        run=lambda: _run_command_for_value(
+            command, task, print_timer, hide_error, quiet
+        ),
+        on_cache_hit=print_cache_hit,
+    )
+    span['exit_code'] = return_code
+  if (
+      return_code == 0
+      and isinstance(command, Command)
+      and command.postprocess is not None
+  ):
+    output = command.postprocess(output)
+  return return_code, output
+
+
+def _run_command_for_value(
+    command: str | Command,
+    task,
+    print_timer,
+    hide_error,
+    quiet,
+    output_handler: Callable[[str], None] | None = None,
+) -> tuple[int, str]:
+  """Implements run_command_for_value for commands that are actually run."""
+  _wait_for_api_token(str(command))
+  if not quiet:
+    xpk_print(f'Task: `{task}` is implemented by `{command}`')
+
+  if isinstance(command, Command):
+    args: str | list[str] = command.argv
+    stderr: int | None = subprocess.PIPE
   else:
+    args = command
+    if print_timer or output_handler is not None:
+      # Errors must not reach the output handler, they are printed on failure.
+      stderr = subprocess.PIPE
+    else:
+      stderr = None if hide_error else subprocess.STDOUT
+  on_wait = WaitProgress(task).update if print_timer and not quiet else None
+
+  policy = get_read_command_policy(str(command))
+
+  def capture(cancel: threading.Event | None = None) -> tuple[int, str, str]:
+    return _capture_command_output(
+        args,
+        shell=isinstance(command, str),
+        stderr=stderr,
+        output_handler=output_handler,
+        on_wait=on_wait,
+        timeout=policy.timeout_seconds if policy is not None else None,
+        cancel=cancel,
+    )
+
+  if policy is None:
+    return_code, output, error_output = capture()
+  else:
+    # Attempts can only be hedged if their output is not streamed anywhere.
+    return_code, output, error_output = _run_read_command(
+        capture,
+        policy,
+        task,
+        can_hedge=output_handler is None and on_wait is None,
+        quiet=quiet,
+    )
+
+  if print_timer and isinstance(command, str):
     if not quiet:
-      xpk_print(f'Task: `{task}` is implemented by `{command}`')
-    try:
-      output = subprocess.check_output(
-          command,
-          shell=True,
-          stderr=subprocess.STDOUT if not hide_error else None,
+      xpk_print(f'Task: `{task}` terminated with code `{return_code}`')
+    return return_code, f'{output}\n{error_output}'
+  if return_code == 0:
+    return 0, output
+
+  output += error_output
+  if not quiet:
+    xpk_print(f'Task {task} failed with {return_code}')
+    xpk_print('*' * 80)
+    xpk_print(output)
+    xpk_print('*' * 80)
+  return return_code, output
+
+
+def _run_read_command(
+    capture: Callable[[threading.Event | None], tuple[int, str, str]],
+    policy: ReadCommandPolicy,
+    task: str,
+    can_hedge: bool,
+    quiet: bool,
+) -> tuple[int, str, str]:
+  """Runs a read-only command, retrying it once if it times out.
+
+  Args:
+    capture: runs an attempt of the command, until the given event is set.
+    policy: timeout and hedging policy of the command.
+    task: user-facing name of the task.
+    can_hedge: whether two attempts of the command may run concurrently.
+    quiet: whether to hide progress messages.
+
+  Returns:
+    tuple[int, str, str] as returned by `capture`.
+  """
+
+  def timed_capture(cancel: threading.Event | None) -> tuple[int, str, str]:
+    started_at = time.monotonic()
+    result = capture(cancel)
+    if result[0] == 0 and is_hedging_enabled():
+      LatencyHistory.record(policy.name, time.monotonic() - started_at)
+    return result
+
+  attempt = 0
+  while True:
+    attempt += 1
+    hedge_delay = get_hedge_delay(policy) if can_hedge else None
+    if hedge_delay is None:
+      result = timed_capture(None)
+    else:
+      result = _run_hedged(timed_capture, hedge_delay)
+    if result[0] != _TIMEOUT_RETURN_CODE or attempt >= _READ_TIMEOUT_ATTEMPTS:
+      return result
+    if not quiet:
+      xpk_print(
+          f'Task: `{task}` timed out after {policy.timeout_seconds:.0f}'
+          ' seconds, retrying.'
       )
-    except subprocess.CalledProcessError as e:
-      if not quiet:
-        xpk_print(f'Task {task} failed with {e.returncode}')
-        xpk_print('*' * 80)
-        xpk_print(e.output)
-        xpk_print('*' * 80)
-      return e.returncode, str(e.output, 'UTF-8')
-    return 0, str(output, 'UTF-8')
+
+
+def _run_hedged(
+    capture: Callable[[threading.Event | None], tuple[int, str, str]],
+    hedge_after_seconds: float,
+) -> tuple[int, str, str]:
+  """Starts a second attempt if the first one is slow, returns the first done.
+
+  The attempt that finishes last is killed.
+  """
+  results: queue.Queue[tuple[int, str, str]] = queue.Queue()
+  cancel = threading.Event()
+
+  def run_attempt() -> None:
+    results.put(capture(cancel))
+
+  threading.Thread(target=run_attempt, daemon=True).start()
+  try:
+    return results.get(timeout=hedge_after_seconds)
+  except queue.Empty:
+    pass
+  threading.Thread(target=run_attempt, daemon=True).start()
+  try:
+    return results.get()
+  finally:
+    cancel.set()
+
+
+def _capture_command_output(
+    args: str | list[str],
+    shell: bool,
+    stderr: int | None,
+    output_handler: Callable[[str], None] | None = None,
+    on_wait: Callable[[int], None] | None = None,
+    timeout: float | None = None,
+    cancel: threading.Event | None = None,
+) -> tuple[int, str, str]:
+  """Runs a command, draining its output pipes while it runs.
+
+  Args:
+    args: command to execute, a shell string or an argv list.
+    shell: whether to execute the command through the shell.
+    stderr: subprocess.PIPE to capture stderr separately, subprocess.STDOUT to
+        merge it into stdout, None to leave it attached to the terminal.
+    output_handler: receives stdout chunks instead of them being captured.
+    on_wait: called with the number of seconds waited, every second.
+    timeout: seconds after which the command, and all processes it started,
+        are killed.
+    cancel: the command is killed as well once this event is set.
+
+  Returns:
+    tuple[int, str, str]
+    int: return code of the command, 124 if it was killed.
+    str: stdout, empty if `output_handler` is set.
+    str: stderr, empty unless it is captured separately or the command was
+        killed.
+  """
+  stdout_sink = _OutputSink(output_handler)
+  stderr_sink = _OutputSink()
+  # A session of its own lets the command be killed along with its children.
+  killable = timeout is not None or cancel is not None
+  try:
+    child = subprocess.Popen(
+        args,
+        shell=shell,
+        stdout=subprocess.PIPE,
+        stderr=stderr,
+        start_new_session=killable,
+    )
+  except OSError as e:
+    return 127, '', str(e)
+
+  with child:
+    readers = [
+        threading.Thread(target=_drain_pipe, args=(pipe, sink), daemon=True)
+        for pipe, sink in (
+            (child.stdout, stdout_sink),
+            (child.stderr, stderr_sink),
+        )
+        if pipe is not None
+    ]
+    for reader in readers:
+      reader.start()
+    try:
+      return_code = _wait_for_child(child, on_wait, timeout, cancel)
+    except BaseException:
+      _kill_child(child, killable)
+      raise
+    if return_code is None:
+      _kill_child(child, killable)
+      child.wait()
+    for reader in readers:
+      reader.join()
+
+  stdout_sink.close()
+  error_output = stderr_sink.getvalue()
+  if return_code is None:
+    return_code = _TIMEOUT_RETURN_CODE
+    if cancel is not None and cancel.is_set():
+      error_output += '\nCommand was cancelled.'
+    else:
+      error_output += f'\nCommand timed out after {timeout:.0f} seconds.'
+  return return_code, stdout_sink.getvalue(), error_output
+
+
+def _wait_for_child(
+    child: subprocess.Popen,
+    on_wait: Callable[[int], None] | None,
+    timeout: float | None,
+    cancel: threading.Event | None,
+) -> int | None:
+  """Waits for the child to exit, returns None if it has to be killed."""
+  if on_wait is None and timeout is None and cancel is None:
+    return child.wait()
+  started_at = time.monotonic()
+  seconds_reported = 0
+  while True:
+    try:
+      return child.wait(timeout=_WAIT_POLL_SECONDS)
+    except subprocess.TimeoutExpired:
+      pass
+    seconds_waited = time.monotonic() - started_at
+    if timeout is not None and seconds_waited >= timeout:
+      return None
+    if cancel is not None and cancel.is_set():
+      return None
+    if on_wait is not None and int(seconds_waited) > seconds_reported:
+      seconds_reported = int(seconds_waited)
+      on_wait(seconds_reported)
+
+
+def _kill_child(child: subprocess.Popen, kill_process_group: bool) -> None:
+  if not kill_process_group or sys.platform == 'win32':
+    child.kill()
+    return
+  try:
+    os.killpg(child.pid, signal.SIGKILL)
+  except ProcessLookupError:
+    pass
+
+
+def _drain_pipe(pipe, sink: '_OutputSink') -> None:
+  while chunk := os.read(pipe.fileno(), _READ_CHUNK_BYTES):
+    sink.write(chunk)
+
+
+class _OutputSink:
+  """Collects output of a command.
+
+  Output is either passed on to a handler as decoded text, using bounded
+  memory, or captured in memory in full.
+  """
+
+  def __init__(self, handler: Callable[[str], None] | None = None):
+    self._handler = handler
+    self._handler_error: Exception | None = None
+    self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    self._chunks: list[bytes] = []
+
+  def write(self, chunk: bytes) -> None:
+    if self._handler is not None:
+      self._handle(self._decoder.decode(chunk))
+      return
+    self._chunks.append(chunk)
+
+  def close(self) -> None:
+    """Flushes pending output to the handler, raising its error if any."""
+    if self._handler is not None:
+      self._handle(self._decoder.decode(b'', final=True))
+    if self._handler_error is not None:
+      raise self._handler_error
+
+  def getvalue(self) -> str:
+    return str(b''.join(self._chunks), 'UTF-8', errors='replace')
+
+  def _handle(self, text: str) -> None:
+    # The rest of the output is still drained after an error, so that the
+    # command does not block on a full pipe.
+    if not text or self._handler_error is not None:
+      return
+    assert self._handler is not None
+    try:
+      self._handler(text)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      self._handler_error = e
 
 
 def run_command_with_full_controls(
@@ -344,18 +843,22 @@ def run_command_with_full_controls(
   if instructions is not None:
     xpk_print(instructions)
 
-  try:
-    with subprocess.Popen(
-        command,
-        stdout=sys.stdout,
-        stderr=sys.stderr,
-        stdin=sys.stdin,
-        shell=True,
-    ) as child:
-      return_code = child.wait()
-      xpk_print(f'Task: `{task}` terminated with code `{return_code}`')
-  except KeyboardInterrupt:
-    return_code = 0
+  with Tracer.command(task, command) as span:
+    try:
+      with subprocess.Popen(
+          command,
+          stdout=sys.stdout,
+          stderr=sys.stderr,
+          stdin=sys.stdin,
+          shell=True,
+      ) as child:
+        return_code = child.wait()
+        xpk_print(f'Task: `{task}` terminated with code `{return_code}`')
+    except KeyboardInterrupt:
+      return_code = 0
+    finally:
+      invalidate_command_cache(command)
+    span['exit_code'] = return_code
 
   return return_code
 
@@ -0,0 +1,391 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .commands import Command, FailedCommand, run_command_batch, run_command_for_value, run_command_with_updates_retry, run_commands
+from .config import HEDGE_READS_KEY, get_config
+from .hedging import ReadCommandPolicy
+from .retry import ErrorClass
+from ..utils.execution_context import set_dry_run
+
+
+@pytest.fixture(autouse=True)
+def no_dry_run():
+  set_dry_run(False)
+  yield
+  set_dry_run(False)
+
+
+def test_run_command_batch_returns_failures(tmp_path):
+  logs = [str(tmp_path / 'ok.log'), str(tmp_path / 'fail.log')]
+
+  failures = run_command_batch(
+      commands=['echo ok', 'echo failing && exit 3'],
+      jobname='Test batch',
+      per_command_name=['ok', 'fail'],
+      output_logs=logs,
+  )
+
+  assert failures == [
+      FailedCommand(
+          return_code=3,
+          name='fail',
+          command='echo failing && exit 3',
+          logfile=logs[1],
+      )
+  ]
+  with open(logs[0], encoding='utf-8') as f:
+    assert f.read() == 'ok\n'
+
+
+def test_run_command_batch_does_not_wait_for_slow_command(tmp_path):
+  marker = tmp_path / 'marker'
+  # The slow command only finishes once the last quick command has run, which
+  # never happens if the quick commands wait for the slow one to complete.
+  slow_command = (
+      'for i in $(seq 200); do'
+      f' [ -f {marker} ] && exit 0; sleep 0.05;'
+      ' done; exit 1'
+  )
+  commands = [slow_command, 'true', 'true', f'touch {marker}']
+  names = [f'task-{i}' for i in range(len(commands))]
+  logs = [str(tmp_path / f'{name}.log') for name in names]
+
+  failures = run_command_batch(
+      commands=commands,
+      jobname='Test batch',
+      per_command_name=names,
+      output_logs=logs,
+      max_parallelism=2,
+  )
+
+  assert not failures
+
+
+def test_run_commands_limits_commands_in_flight(tmp_path):
+  counter_dir = tmp_path / 'running'
+  counter_dir.mkdir()
+  command = (
+      f'touch {counter_dir}/$$; ls {counter_dir} | wc -l >>'
+      f' {tmp_path}/counts; sleep 0.1; rm {counter_dir}/$$'
+  )
+
+  failures = run_commands(
+      commands=[command] * 6,
+      jobname='Test batch',
+      per_command_name=[f'task-{i}' for i in range(6)],
+      batch=2,
+  )
+
+  assert not failures
+  with open(tmp_path / 'counts', encoding='utf-8') as f:
+    counts = [int(line) for line in f.read().split()]
+  assert len(counts) == 6
+  assert max(counts) <= 2
+
+
+def test_run_commands_dry_run_does_not_run_commands(tmp_path):
+  set_dry_run(True)
+  marker = tmp_path / 'marker'
+
+  failures = run_commands(
+      commands=[f'touch {marker}'],
+      jobname='Test batch',
+      per_command_name=['task'],
+  )
+
+  assert not failures
+  assert not os.path.exists(marker)
+
+
+def test_run_command_batch_retries_transient_errors(
+    tmp_path, mocker: MockerFixture
+):
+  mocker.patch('xpk.core.commands.get_retry_delay', return_value=0)
+  marker = tmp_path / 'marker'
+  command = (
+      f'[ -f {marker} ] && exit 0;'
+      f' touch {marker}; echo "ResponseError: code=503"; exit 1'
+  )
+
+  failures = run_command_batch(
+      commands=[command],
+      jobname='Test batch',
+      per_command_name=['task'],
+      output_logs=[str(tmp_path / 'task.log')],
+      idempotent=True,
+  )
+
+  assert not failures
+
+
+def test_run_command_batch_does_not_retry_non_idempotent_commands(
+    tmp_path, mocker: MockerFixture
+):
+  mocker.patch('xpk.core.commands.get_retry_delay', return_value=0)
+  counter = tmp_path / 'counter'
+
+  failures = run_command_batch(
+      commands=[
+          f'echo run >> {counter}; echo "ResponseError: code=503"; exit 1'
+      ],
+      jobname='Test batch',
+      per_command_name=['task'],
+      output_logs=[str(tmp_path / 'task.log')],
+  )
+
+  assert len(failures) == 1
+  with open(counter, encoding='utf-8') as f:
+    assert f.read() == 'run\n'
+
+
+def test_run_command_batch_does_not_retry_permanent_errors(tmp_path):
+  counter = tmp_path / 'counter'
+
+  failures = run_command_batch(
+      commands=[f'echo run >> {counter}; echo "NOT_FOUND"; exit 1'],
+      jobname='Test batch',
+      per_command_name=['task'],
+      output_logs=[str(tmp_path / 'task.log')],
+      idempotent=True,
+  )
+
+  assert len(failures) == 1
+  with open(counter, encoding='utf-8') as f:
+    assert f.read() == 'run\n'
+
+
+def test_run_command_with_updates_retry_retries_rate_limit_errors(
+    tmp_path, mocker: MockerFixture
+):
+  retry_delay = mocker.patch(
+      'xpk.core.commands.get_retry_delay', return_value=0
+  )
+  marker = tmp_path / 'marker'
+  command = (
+      f'[ -f {marker} ] && exit 0;'
+      f' touch {marker}; echo "Quota exceeded" >&2; exit 1'
+  )
+
+  return_code = run_command_with_updates_retry(command, 'Test task')
+
+  assert return_code == 0
+  retry_delay.assert_called_once_with(
+      ErrorClass.RATE_LIMIT, 1, initial_seconds=10
+  )
+
+
+def test_run_command_with_updates_retry_keeps_stdout_and_stderr_apart(
+    capfd, mocker: MockerFixture
+):
+  mocker.patch('xpk.core.commands.time.sleep')
+
+  return_code = run_command_with_updates_retry(
+      'echo to-stdout; echo to-stderr >&2; exit 1',
+      'Test task',
+      num_retry_attempts=1,
+  )
+
+  assert return_code == 1
+  captured = capfd.readouterr()
+  assert 'to-stdout\n' in captured.out
+  assert 'to-stderr\n' not in captured.out
+  assert 'to-stderr\n' in captured.err
+
+
+def test_run_command_with_updates_retry_retries_unknown_errors_at_fixed_delay(
+    tmp_path, mocker: MockerFixture
+):
+  sleep = mocker.patch('xpk.core.commands.time.sleep')
+  marker = tmp_path / 'marker'
+  command = (
+      f'[ -f {marker} ] && exit 0;'
+      f' touch {marker}; echo "something unexpected"; exit 1'
+  )
+
+  return_code = run_command_with_updates_retry(
+      command, 'Test task', verbose=False, wait_seconds=3
+  )
+
+  assert return_code == 0
+  sleep.assert_called_once_with(3)
+
+
+def test_run_command_with_updates_retry_stops_on_permanent_error(
+    tmp_path, mocker: MockerFixture
+):
+  sleep = mocker.patch('xpk.core.commands.time.sleep')
+  counter = tmp_path / 'counter'
+
+  return_code = run_command_with_updates_retry(
+      f'echo run >> {counter}; echo "PERMISSION_DENIED"; exit 7',
+      'Test task',
+      verbose=False,
+  )
+
+  assert return_code == 7
+  sleep.assert_not_called()
+  with open(counter, encoding='utf-8') as f:
+    assert f.read() == 'run\n'
+
+
+def test_run_command_for_value_runs_argv_without_shell():
+  return_code, output = run_command_for_value(
+      Command(argv=['echo', 'a|b', '$HOME']), 'Echo', quiet=True
+  )
+
+  assert return_code == 0
+  assert output == 'a|b $HOME\n'
+
+
+def test_run_command_for_value_postprocesses_argv_output():
+  return_code, output = run_command_for_value(
+      Command(
+          argv=['printf', 'b\\na\\nb\\n'],
+          postprocess=lambda out: ','.join(sorted(set(out.split()))),
+      ),
+      'Unique lines',
+      quiet=True,
+  )
+
+  assert (return_code, output) == (0, 'a,b')
+
+
+def test_run_command_for_value_returns_errors_of_argv_command():
+  postprocess = MagicMock()
+
+  return_code, output = run_command_for_value(
+      Command(
+          argv=['sh', '-c', 'echo out; echo err >&2; exit 4'],
+          postprocess=postprocess,
+      ),
+      'Failing',
+      quiet=True,
+  )
+
+  assert (return_code, output) == (4, 'out\nerr\n')
+  postprocess.assert_not_called()
+
+
+def test_run_command_for_value_reports_missing_argv_program():
+  return_code, _ = run_command_for_value(
+      Command(argv=['xpk-no-such-program']), 'Missing', quiet=True
+  )
+
+  assert return_code == 127
+
+
+def test_run_command_for_value_with_timer_drains_large_output():
+  # Exceeds the pipe buffer, which stalls the command if it is not drained.
+  command = 'head -c 1000000 /dev/zero | tr "\\0" x; echo done >&2'
+
+  return_code, output = run_command_for_value(
+      command, 'Large output', print_timer=True, quiet=True
+  )
+
+  assert return_code == 0
+  assert output == 'x' * 1000000 + '\ndone\n'
+
+
+def test_run_command_for_value_streams_output_to_handler():
+  chunks: list[str] = []
+
+  return_code, output = run_command_for_value(
+      'seq 100000', 'Streamed output', quiet=True, output_handler=chunks.append
+  )
+
+  assert return_code == 0
+  assert output == ''
+  assert ''.join(chunks).split() == [str(i) for i in range(1, 100001)]
+
+
+def test_run_command_for_value_prints_errors_not_passed_to_output_handler(
+    mocker: MockerFixture,
+):
+  xpk_print = mocker.patch('xpk.core.commands.xpk_print')
+  chunks: list[str] = []
+
+  return_code, output = run_command_for_value(
+      'echo items; echo "not found" >&2; exit 3',
+      'Streamed output',
+      output_handler=chunks.append,
+  )
+
+  assert return_code == 3
+  assert ''.join(chunks) == 'items\n'
+  assert 'not found' in output
+  xpk_print.assert_any_call(output)
+
+
+def test_run_command_for_value_raises_output_handler_errors():
+  def handler(_: str) -> None:
+    raise ValueError('parse error')
+
+  with pytest.raises(ValueError, match='parse error'):
+    run_command_for_value(
+        'seq 100000', 'Streamed output', quiet=True, output_handler=handler
+    )
+
+
+@pytest.fixture
+def read_policy(mocker: MockerFixture) -> ReadCommandPolicy:
+  policy = ReadCommandPolicy(
+      'test', timeout_seconds=0.5, hedge_after_seconds=0.2
+  )
+  mocker.patch('xpk.core.commands.get_read_command_policy', return_value=policy)
+  return policy
+
+
+def test_run_command_for_value_kills_timed_out_process_group(
+    read_policy: ReadCommandPolicy, tmp_path
+):
+  marker = tmp_path / 'marker'
+
+  started_at = time.monotonic()
+  return_code, output = run_command_for_value(
+      f'(sleep 1 && touch {marker}) & sleep 30', 'Hanging read', quiet=True
+  )
+
+  assert return_code == 124
+  assert 'timed out' in output
+  # Both attempts are killed at the timeout, with the background process.
+  assert time.monotonic() - started_at < 5
+  time.sleep(1.5)
+  assert not marker.exists()
+
+
+def test_run_command_for_value_hedges_slow_reads(
+    read_policy: ReadCommandPolicy, tmp_path
+):
+  get_config().set(HEDGE_READS_KEY, 'true')
+  first_attempt = tmp_path / 'first-attempt'
+  command = (
+      f'if [ -e {first_attempt} ]; then echo hedged;'
+      f' else touch {first_attempt}; sleep 30; echo first; fi'
+  )
+
+  try:
+    return_code, output = run_command_for_value(command, 'Read', quiet=True)
+  finally:
+    get_config().set(HEDGE_READS_KEY, None)
+
+  assert (return_code, output) == (0, 'hedged\n')
@@ -14,6 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import io
 import os
 
 import ruamel.yaml
@@ -21,17 +22,30 @@ from abc import ABC, abstractmethod
 from ..utils import file
 from ..utils.execution_context import is_dry_run
 from ..utils.console import xpk_print
-from setuptools_scm import get_version as setuptools_get_version
 from importlib.metadata import version, PackageNotFoundError
 
 
+def _get_scm_version() -> str:
+  """Returns the version from the SCM metadata next to this file.
+
+  setuptools_scm is slow to import, so it is only imported when there is
+  metadata for it to read, i.e. not for installed packages.
+  """
+  root = os.path.dirname(__file__)
+  if not any(os.path.exists(os.path.join(root, m)) for m in ('.git', '.hg')):
+    raise LookupError(f'no SCM metadata in {root}')
+  from setuptools_scm import get_version  # pylint: disable=import-outside-toplevel
+
+  return get_version(relative_to=__file__)
+
+
 def _get_version() -> str:
   xpk_version_override = os.getenv('XPK_VERSION_OVERRIDE', '')
   if xpk_version_override != '':
     return xpk_version_override
 
   try:
-    return setuptools_get_version(relative_to=__file__)
+    return _get_scm_version()
   except LookupError:
     pass
 
@@ -53,8 +67,15 @@ CLUSTER_NAME_KEY = 'cluster-name'
 PROJECT_KEY = 'project-id'
 CLIENT_ID_KEY = 'client-id'
 SEND_TELEMETRY_KEY = 'send-telemetry'
+SEND_TIMING_TELEMETRY_KEY = 'send-timing-telemetry'
 ZONE_KEY = 'zone'
 CUSTOM_BINARIES_PATH_KEY = 'custom-binaries-path'
+COMMAND_CACHE_KEY = 'command-cache'
+HEDGE_READS_KEY = 'hedge-reads'
+COMMAND_HISTORY_KEY = 'command-history'
+VERSION_CHECK_KEY = 'version-check'
+KUBECONFIG_CACHE_KEY = 'kubeconfig-cache'
+METADATA_CACHE_KEY = 'metadata-cache'
 
 DEFAULT_KEYS = [
     CFG_BUCKET_KEY,
@@ -62,8 +83,15 @@ DEFAULT_KEYS = [
     PROJECT_KEY,
     CLIENT_ID_KEY,
     SEND_TELEMETRY_KEY,
+    SEND_TIMING_TELEMETRY_KEY,
     ZONE_KEY,
     CUSTOM_BINARIES_PATH_KEY,
+    COMMAND_CACHE_KEY,
+    HEDGE_READS_KEY,
+    COMMAND_HISTORY_KEY,
+    VERSION_CHECK_KEY,
+    KUBECONFIG_CACHE_KEY,
+    METADATA_CACHE_KEY,
 ]
 VERTEX_TENSORBOARD_FEATURE_FLAG = XPK_CURRENT_VERSION >= '0.4.0'
 
@@ -92,40 +120,62 @@ class Config(ABC):
 
 
 class FileSystemConfig(Config):
-  """XPK Configuration manipulation class leveraging the file system."""
+  """XPK Configuration manipulation class leveraging the file system.
+
+  The parsed file is kept in memory and only read again once its modification
+  time or size changes. Writes hold a lock shared with other xpk processes and
+  replace the file atomically, so concurrent writes are not lost and readers
+  never see a partially written file.
+  """
 
   def __init__(self, custom_config_file: str = XPK_CONFIG_FILE) -> None:
     self._config = custom_config_file
     self._allowed_keys = DEFAULT_KEYS
+    self._cached_stat: tuple[int, int] | None = None
+    self._cached_yaml: dict | None = None
 
-  def _open_configs(self) -> dict | None:
-    file.ensure_directory_exists(os.path.dirname(self._config))
+  def _get_stat(self) -> tuple[int, int] | None:
+    try:
+      stat = os.stat(self._config)
+    except FileNotFoundError:
+      return None
+    return stat.st_mtime_ns, stat.st_size
 
-    if not os.path.exists(self._config):
+  def _open_configs(self, use_cache: bool = True) -> dict | None:
+    stat = self._get_stat()
+    if stat is None:
       return None
+    if use_cache and stat == self._cached_stat:
+      return self._cached_yaml
 
     with open(self._config, encoding='utf-8', mode='r') as stream:
       config_yaml: dict = yaml.load(stream)
-      return config_yaml
+    self._cached_stat, self._cached_yaml = stat, config_yaml
+    return config_yaml
 
   def _save_configs(self, config_yaml: dict) -> None:
-    if is_dry_run():
-      return None
-
-    with open(self._config, encoding='utf-8', mode='w') as stream:
-      yaml.dump(config_yaml, stream)
+    stream = io.StringIO()
+    yaml.dump(config_yaml, stream)
+    file.write_text_atomically(self._config, stream.getvalue())
+    self._cached_stat, self._cached_yaml = self._get_stat(), config_yaml
 
   def set(self, key: str, value: str | None) -> None:
     if key not in self._allowed_keys:
       xpk_print(f'Key {key} is not an allowed xpk config key.')
       return
 
-    config_yaml = self._open_configs()
-    if config_yaml is None:
-      config_yaml = {'version': 'v1', CONFIGS_KEY: {}}
+    if is_dry_run():
+      return
+
+    file.ensure_directory_exists(os.path.dirname(self._config))
+    with file.file_lock(f'{self._config}.lock'):
+      # Another process may have written within the resolution of mtime.
+      config_yaml = self._open_configs(use_cache=False)
+      if config_yaml is None:
+        config_yaml = {'version': 'v1', CONFIGS_KEY: {}}
 
-    config_yaml[CONFIGS_KEY][key] = value
-    self._save_configs(config_yaml)
+      config_yaml[CONFIGS_KEY][key] = value
+      self._save_configs(config_yaml)
 
   def get(self, key: str) -> str | None:
     if key not in self._allowed_keys:
@@ -146,7 +196,7 @@ class FileSystemConfig(Config):
     if config_yaml is None:
       return None
     val: dict[str, str] = config_yaml[CONFIGS_KEY]
-    return val
+    return dict(val)
 
 
 class InMemoryXpkConfig(Config):
@@ -14,12 +14,15 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from xpk.core import config as cfg_module
 from xpk.core.config import FileSystemConfig, InMemoryXpkConfig, CFG_BUCKET_KEY, CLUSTER_NAME_KEY, PROJECT_KEY, ZONE_KEY, _get_version
 from unittest.mock import patch
 from importlib.metadata import PackageNotFoundError
+from concurrent.futures import ThreadPoolExecutor
 
 import os
 import pytest
+from pytest_mock import MockerFixture
 
 config_tmp_path = '/tmp/config/config.yaml'
 
@@ -39,7 +42,7 @@ def test_get_version_returns_overriden_value_when_it_is_overriden(_):
 
 
 @patch('os.getenv', return_value='')
-@patch('xpk.core.config.setuptools_get_version', return_value='10.0.0')
+@patch('xpk.core.config._get_scm_version', return_value='10.0.0')
 def test_get_version_returns_value_from_setuptools_scm_when_there_is_no_override(
     *_,
 ):
@@ -48,7 +51,7 @@ def test_get_version_returns_value_from_setuptools_scm_when_there_is_no_override
 
 @patch('os.getenv', return_value='')
 @patch(
-    'xpk.core.config.setuptools_get_version',
+    'xpk.core.config._get_scm_version',
     side_effect=LookupError('unable to find git version'),
 )
 @patch('xpk.core.config.version', return_value='10.0.0')
@@ -60,7 +63,7 @@ def test_get_version_returns_value_from_pip_when_there_is_no_setuptools_could_be
 
 @patch('os.getenv', return_value='')
 @patch(
-    'xpk.core.config.setuptools_get_version',
+    'xpk.core.config._get_scm_version',
     side_effect=LookupError('unable to find git version'),
 )
 @patch(
@@ -125,3 +128,36 @@ def test_config_set_incorrect(cfg, _):
   cfg.set('foo', 'bar')
   cfg_all = cfg.get_all()
   assert not cfg_all
+
+
+def test_file_system_config_parses_file_once_until_it_changes(
+    tmp_path, mocker: MockerFixture
+):
+  path = str(tmp_path / 'config.yaml')
+  FileSystemConfig(path).set(PROJECT_KEY, 'foo')
+  cfg = FileSystemConfig(path)
+  load = mocker.spy(cfg_module.yaml, 'load')
+
+  assert cfg.get(PROJECT_KEY) == 'foo'
+  assert cfg.get(ZONE_KEY) is None
+  assert load.call_count == 1
+
+  FileSystemConfig(path).set(PROJECT_KEY, 'a-longer-project')
+  load.reset_mock()
+
+  assert cfg.get(PROJECT_KEY) == 'a-longer-project'
+  assert load.call_count == 1
+
+
+def test_file_system_config_set_keeps_concurrent_writes(tmp_path):
+  path = str(tmp_path / 'config.yaml')
+  keys = [PROJECT_KEY, CLUSTER_NAME_KEY, ZONE_KEY, CFG_BUCKET_KEY]
+
+  with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+    for key in keys:
+      executor.submit(FileSystemConfig(path).set, key, f'{key}-value')
+
+  assert FileSystemConfig(path).get_all() == {
+      key: f'{key}-value' for key in keys
+  }
+  assert sorted(os.listdir(tmp_path)) == ['config.yaml', 'config.yaml.lock']
@@ -20,7 +20,6 @@ import random
 import string
 import tarfile
 
-from docker.utils import build
 from .system_characteristics import DockerPlatform
 from ..utils.console import xpk_exit, xpk_print
 from ..utils.feature_flags import FeatureFlags
@@ -136,6 +135,8 @@ def _build_image_archive(script_dir: str) -> str:
           if not line.isspace() and not line.startswith('#')
       ]
 
+  from docker.utils import build  # pylint: disable=import-outside-toplevel
+
   paths_to_add = build.exclude_paths(script_dir, ignore_patterns)
 
   with tarfile.open(image_archive_path, 'w') as tar:
@@ -14,26 +14,83 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import configparser
+import os
 import subprocess
 import sys
 from dataclasses import dataclass
 from functools import lru_cache
-
-from google.api_core.exceptions import PermissionDenied
-from google.cloud import resourcemanager_v3
+from pathlib import Path
+from typing import Any
 
 from ..utils.console import xpk_print, xpk_exit
 from ..utils.versions import ReleaseChannel
 from ..utils.execution_context import is_dry_run
 from .commands import run_command_for_value
+from .gcp_api import container_url, get_json, is_native_gcp_reads_enabled, list_json
+from .metadata_cache import CLUSTER_LOCATIONS, GKE_SERVER_CONFIGS, PROJECT_NUMBERS
+
+
+def _get_gcloud_config_dir() -> Path:
+  config_dir = os.environ.get('CLOUDSDK_CONFIG')
+  if config_dir:
+    return Path(config_dir)
+  if sys.platform == 'win32' and os.environ.get('APPDATA'):
+    return Path(os.environ['APPDATA']) / 'gcloud'
+  return Path.home() / '.config' / 'gcloud'
+
+
+def get_gcloud_property(section: str, name: str) -> str | None:
+  """Reads a property of the active gcloud configuration from its files.
+
+  Follows the precedence of gcloud: `CLOUDSDK_<SECTION>_<NAME>` environment
+  variables override the file of the configuration named by
+  `CLOUDSDK_ACTIVE_CONFIG_NAME` or the `active_config` file. This avoids
+  starting gcloud, which takes about a second.
+
+  Args:
+    section: section of the property, e.g. `core`.
+    name: name of the property, e.g. `project`.
+
+  Returns:
+    The value, None if it is not set in the files or they cannot be read.
+    gcloud may still resolve such a property, e.g. from the properties of its
+    installation or the metadata server.
+  """
+  value = os.environ.get(f'CLOUDSDK_{section.upper()}_{name.upper()}')
+  if value:
+    return value
+  config_dir = _get_gcloud_config_dir()
+  try:
+    config_name = os.environ.get('CLOUDSDK_ACTIVE_CONFIG_NAME')
+    if not config_name:
+      active_config = config_dir / 'active_config'
+      config_name = (
+          active_config.read_text(encoding='utf-8').strip()
+          if active_config.exists()
+          else 'default'
+      )
+    config = configparser.ConfigParser(interpolation=None)
+    with open(
+        config_dir / 'configurations' / f'config_{config_name}',
+        encoding='utf-8',
+    ) as f:
+      config.read_file(f)
+  except (OSError, configparser.Error):
+    return None
+  return config.get(section, name, fallback=None) or None
 
 
 def get_project():
-  """Get GCE project from `gcloud config get project`.
+  """Get GCE project from the gcloud config, as `gcloud config get project`.
 
   Returns:
      The project name.
   """
+  project = get_gcloud_property('core', 'project')
+  if project:
+    return project
+
   completed_command = subprocess.run(
       ['gcloud', 'config', 'get', 'project'], check=True, capture_output=True
   )
@@ -49,11 +106,15 @@ def get_project():
 
 
 def get_zone():
-  """Get GCE zone from `gcloud config get compute/zone`.
+  """Get GCE zone from the gcloud config, as `gcloud config get compute/zone`.
 
   Returns:
      The zone name.
   """
+  zone = get_gcloud_property('compute', 'zone')
+  if zone:
+    return zone
+
   completed_command = subprocess.run(
       ['gcloud', 'config', 'get', 'compute/zone'],
       check=True,
@@ -99,6 +160,32 @@ def zone_to_region(zone: str) -> str:
 @lru_cache()
 def get_cluster_location(project: str, name: str, zone: str) -> str:
   """Helper function to resolve location for a given cluster"""
+  key = (project, name, zone)
+  location = CLUSTER_LOCATIONS.get(key)
+  if location is None:
+    location = _find_cluster_location(project, name, zone)
+    # Clusters that are not found yet may still be created elsewhere.
+    if location is not None:
+      CLUSTER_LOCATIONS.put(key, location)
+  return location if location is not None else zone_to_region(zone)
+
+
+def _find_cluster_location(project: str, name: str, zone: str) -> str | None:
+  """Returns the zone or region of the cluster, None if it is not found."""
+  if is_native_gcp_reads_enabled():
+    return_code, clusters = list_json(
+        'Find cluster region or zone',
+        container_url(project, '-', 'clusters'),
+        'clusters',
+    )
+    if return_code != 0:
+      xpk_print('Error: Unable to determine cluster region or zone')
+      xpk_exit(return_code)
+    locations = [c.get('location') for c in clusters if c.get('name') == name]
+    if not locations:
+      return None
+    return zone if zone in locations else zone_to_region(zone)
+
   return_code, result = run_command_for_value(
       command=(
           'gcloud container clusters list '
@@ -115,6 +202,8 @@ def get_cluster_location(project: str, name: str, zone: str) -> str:
     xpk_exit(return_code)
 
   regions = result.strip().splitlines()
+  if not regions:
+    return None
   return zone if zone in regions else zone_to_region(zone)
 
 
@@ -140,6 +229,32 @@ def get_gke_server_config(
     int: 0 if successful and 1 otherwise.
     GkeServerConfig: stores valid gke version to use in node pool and cluster.
   """
+  key = (args.project, zone_to_region(args.zone), release_channel.value)
+  cached = GKE_SERVER_CONFIGS.get(key)
+  if cached is not None:
+    return 0, GkeServerConfig(
+        default_gke_version=cached['default_gke_version'],
+        valid_versions=set(cached['valid_versions']),
+    )
+
+  return_code, server_config = _get_gke_server_config(args, release_channel)
+  if return_code == 0 and server_config is not None:
+    GKE_SERVER_CONFIGS.put(
+        key,
+        {
+            'default_gke_version': server_config.default_gke_version,
+            'valid_versions': sorted(server_config.valid_versions),
+        },
+    )
+  return return_code, server_config
+
+
+def _get_gke_server_config(
+    args, release_channel: ReleaseChannel
+) -> tuple[int, GkeServerConfig | None]:
+  if is_native_gcp_reads_enabled():
+    return _get_gke_server_config_natively(args, release_channel)
+
   base_command = (
       'gcloud container get-server-config'
       f' --project={args.project} --region={zone_to_region(args.zone)}'
@@ -187,6 +302,30 @@ def get_gke_server_config(
   )
 
 
+def _get_gke_server_config_natively(
+    args, release_channel: ReleaseChannel
+) -> tuple[int, GkeServerConfig | None]:
+  return_code, server_config = get_json(
+      'Determine server supported GKE versions',
+      container_url(args.project, zone_to_region(args.zone), 'serverConfig'),
+  )
+  if return_code != 0 or server_config is None:
+    xpk_print('Unable to get server config for supported GKE versions.')
+    return 1, None
+  channel: dict[str, Any] = next(
+      (
+          c
+          for c in server_config.get('channels') or []
+          if c.get('channel') == release_channel.value
+      ),
+      {},
+  )
+  return 0, GkeServerConfig(
+      default_gke_version=channel.get('defaultVersion', ''),
+      valid_versions=set(channel.get('validVersions') or []),
+  )
+
+
 def get_gke_control_plane_version(
     args, gke_server_config: GkeServerConfig
 ) -> tuple[int, str | None]:
@@ -236,6 +375,18 @@ def project_id_to_project_number(project_id: str) -> str:
     # 12 digit hash
     return str(abs(hash(project_id) % (10**12)))
 
+  project_number = PROJECT_NUMBERS.get((project_id,))
+  if project_number is None:
+    project_number = _get_project_number(project_id)
+    PROJECT_NUMBERS.put((project_id,), project_number)
+  return project_number
+
+
+def _get_project_number(project_id: str) -> str:
+  # pylint: disable=import-outside-toplevel
+  from google.api_core.exceptions import PermissionDenied
+  from google.cloud import resourcemanager_v3
+
   client = resourcemanager_v3.ProjectsClient()
   request = resourcemanager_v3.GetProjectRequest()
   request.name = f'projects/{project_id}'
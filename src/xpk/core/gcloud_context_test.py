@@ -18,11 +18,15 @@ import pytest
 from unittest.mock import MagicMock
 from .gcloud_context import (
     get_cluster_location,
+    get_gcloud_property,
     get_gke_control_plane_version,
     get_gke_server_config,
+    get_project,
+    get_zone,
     GkeServerConfig,
     zone_to_region,
 )
+from ..utils.feature_flags import FeatureFlags
 from ..utils.versions import ReleaseChannel
 
 
@@ -31,6 +35,85 @@ def xpk_print(mocker):
   return mocker.patch("xpk.core.gcloud_context.xpk_print")
 
 
+@pytest.fixture(name="gcloud_config_dir")
+def _gcloud_config_dir(tmp_path, monkeypatch):
+  monkeypatch.setenv("CLOUDSDK_CONFIG", str(tmp_path))
+  for name in (
+      "CLOUDSDK_ACTIVE_CONFIG_NAME",
+      "CLOUDSDK_CORE_PROJECT",
+      "CLOUDSDK_COMPUTE_ZONE",
+  ):
+    monkeypatch.delenv(name, raising=False)
+  (tmp_path / "configurations").mkdir()
+  return tmp_path
+
+
+def _write_gcloud_config(config_dir, name: str, content: str):
+  (config_dir / "configurations" / f"config_{name}").write_text(content)
+
+
+def test_get_gcloud_property_reads_default_configuration(gcloud_config_dir):
+  _write_gcloud_config(
+      gcloud_config_dir,
+      "default",
+      "[core]\nproject = my-project\n[compute]\nzone = us-east5-b\n",
+  )
+
+  assert get_gcloud_property("core", "project") == "my-project"
+  assert get_gcloud_property("compute", "zone") == "us-east5-b"
+  assert get_gcloud_property("compute", "region") is None
+
+
+def test_get_gcloud_property_reads_active_configuration(
+    gcloud_config_dir, monkeypatch
+):
+  _write_gcloud_config(gcloud_config_dir, "default", "[core]\nproject = a\n")
+  _write_gcloud_config(gcloud_config_dir, "dev", "[core]\nproject = b\n")
+  _write_gcloud_config(gcloud_config_dir, "prod", "[core]\nproject = c\n")
+  (gcloud_config_dir / "active_config").write_text("dev\n")
+
+  assert get_gcloud_property("core", "project") == "b"
+
+  monkeypatch.setenv("CLOUDSDK_ACTIVE_CONFIG_NAME", "prod")
+
+  assert get_gcloud_property("core", "project") == "c"
+
+
+def test_get_gcloud_property_prefers_environment_variable(
+    gcloud_config_dir, monkeypatch
+):
+  _write_gcloud_config(gcloud_config_dir, "default", "[core]\nproject = a\n")
+  monkeypatch.setenv("CLOUDSDK_CORE_PROJECT", "from-env")
+
+  assert get_gcloud_property("core", "project") == "from-env"
+
+
+def test_get_project_and_zone_do_not_run_gcloud_when_configured(
+    gcloud_config_dir, mocker
+):
+  _write_gcloud_config(
+      gcloud_config_dir,
+      "default",
+      "[core]\nproject = my-project\n[compute]\nzone = us-east5-b\n",
+  )
+  run = mocker.patch("xpk.core.gcloud_context.subprocess.run")
+
+  assert get_project() == "my-project"
+  assert get_zone() == "us-east5-b"
+  run.assert_not_called()
+
+
+@pytest.mark.usefixtures("gcloud_config_dir")
+def test_get_project_runs_gcloud_when_configuration_is_missing(mocker):
+  run = mocker.patch(
+      "xpk.core.gcloud_context.subprocess.run",
+      return_value=MagicMock(stdout=b"my-project\n"),
+  )
+
+  assert get_project() == "my-project"
+  run.assert_called_once()
+
+
 def test_zone_to_region_raises_when_zone_is_invalid():
   with pytest.raises(ValueError):
     zone_to_region("us")
@@ -109,6 +192,54 @@ def test_get_cluster_location_invokes_command_for_different_input_args(mocker):
   assert mock.call_count == 2
 
 
+def test_get_cluster_location_reuses_location_cached_on_disk(mocker):
+  mock = mocker.patch(
+      "xpk.core.gcloud_context.run_command_for_value",
+      return_value=(0, "us-central1"),
+  )
+
+  get_cluster_location(project="project7", name="name7", zone="us-central1-a")
+  get_cluster_location.cache_clear()
+  result = get_cluster_location(
+      project="project7", name="name7", zone="us-central1-a"
+  )
+
+  assert result == "us-central1"
+  assert mock.call_count == 1
+
+
+def test_get_cluster_location_does_not_cache_missing_cluster_on_disk(mocker):
+  mock = mocker.patch(
+      "xpk.core.gcloud_context.run_command_for_value", return_value=(0, "")
+  )
+
+  get_cluster_location(project="project8", name="name8", zone="us-central1-a")
+  get_cluster_location.cache_clear()
+  get_cluster_location(project="project8", name="name8", zone="us-central1-a")
+
+  assert mock.call_count == 2
+
+
+def test_get_gke_server_config_reuses_config_cached_on_disk(mocker):
+  mock_run_command = mocker.patch(
+      "xpk.core.gcloud_context.run_command_for_value",
+      side_effect=[
+          (0, "1.2.3"),
+          (0, "1.2.3;1.2.4"),
+      ],
+  )
+  args = mocker.Mock(project="test-project", zone="us-central1")
+
+  get_gke_server_config(args, ReleaseChannel.STABLE)
+  return_code, config = get_gke_server_config(args, ReleaseChannel.STABLE)
+
+  assert return_code == 0
+  assert config == GkeServerConfig(
+      default_gke_version="1.2.3", valid_versions={"1.2.3", "1.2.4"}
+  )
+  assert mock_run_command.call_count == 2
+
+
 def test_get_gke_server_config_success(mocker):
   mock_run_command = mocker.patch(
       "xpk.core.gcloud_context.run_command_for_value",
@@ -128,6 +259,45 @@ def test_get_gke_server_config_success(mocker):
   assert mock_run_command.call_count == 2
 
 
+def test_get_gke_server_config_reads_server_config_natively(mocker):
+  mocker.patch.object(FeatureFlags, "NATIVE_GCP_READS_ENABLED", True)
+  mock_run_command = mocker.patch(
+      "xpk.core.gcloud_context.run_command_for_value"
+  )
+  get_json = mocker.patch(
+      "xpk.core.gcloud_context.get_json",
+      return_value=(
+          0,
+          {
+              "channels": [
+                  {
+                      "channel": "RAPID",
+                      "defaultVersion": "1.3.0",
+                      "validVersions": ["1.3.0"],
+                  },
+                  {
+                      "channel": "STABLE",
+                      "defaultVersion": "1.2.3",
+                      "validVersions": ["1.2.3", "1.2.4"],
+                  },
+              ]
+          },
+      ),
+  )
+  args = mocker.Mock(project="test-project", zone="us-central1-a")
+
+  return_code, config = get_gke_server_config(args, ReleaseChannel.STABLE)
+
+  assert return_code == 0
+  assert config == GkeServerConfig(
+      default_gke_version="1.2.3", valid_versions={"1.2.3", "1.2.4"}
+  )
+  assert get_json.call_args.args[1].endswith(
+      "/projects/test-project/locations/us-central1/serverConfig"
+  )
+  mock_run_command.assert_not_called()
+
+
 def test_get_gke_server_config_fails_on_default_version_command(mocker):
   mocker.patch(
       "xpk.core.gcloud_context.run_command_for_value",
@@ -0,0 +1,174 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+from .tracing import Tracer
+from ..utils.console import xpk_print
+from ..utils.execution_context import is_dry_run
+from ..utils.feature_flags import FeatureFlags
+
+# Google auth and requests are slow to import, so they are imported by the
+# reads instead of by every xpk invocation.
+if TYPE_CHECKING:
+  from google.auth.transport.requests import AuthorizedSession
+  from requests import Response
+
+_SCOPES = ['https://www.googleapis.com/auth/cloud-platform']
+_CONNECTION_POOL_SIZE = 16
+_REQUEST_TIMEOUT_SECONDS = 120
+
+# Same overrides as gcloud, so both talk to the same endpoints.
+_COMPUTE_ENDPOINT_OVERRIDE = 'CLOUDSDK_API_ENDPOINT_OVERRIDES_COMPUTE'
+_CONTAINER_ENDPOINT_OVERRIDE = 'CLOUDSDK_API_ENDPOINT_OVERRIDES_CONTAINER'
+
+
+def is_native_gcp_reads_enabled() -> bool:
+  """Returns whether reads go through the GCP REST APIs instead of gcloud.
+
+  Dry runs keep printing the gcloud commands of the reads.
+  """
+  return FeatureFlags.NATIVE_GCP_READS_ENABLED and not is_dry_run()
+
+
+class _SessionCache:
+  """Authorized session shared by all reads, keeping connections alive."""
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._session: 'AuthorizedSession | None' = None
+
+  def get(self) -> 'AuthorizedSession':
+    # pylint: disable=import-outside-toplevel
+    import google.auth
+    import requests
+    from google.auth.transport.requests import AuthorizedSession
+
+    with self._lock:
+      if self._session is None:
+        credentials, _ = google.auth.default(scopes=_SCOPES)
+        session = AuthorizedSession(credentials)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=_CONNECTION_POOL_SIZE,
+            pool_maxsize=_CONNECTION_POOL_SIZE,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        self._session = session
+      return self._session
+
+
+_sessions = _SessionCache()
+
+
+def compute_url(project: str, *path: str) -> str:
+  """Returns the URL of a resource of the Compute Engine beta API."""
+  endpoint = os.getenv(
+      _COMPUTE_ENDPOINT_OVERRIDE, 'https://compute.googleapis.com/compute/'
+  )
+  return _join(endpoint, 'beta', 'projects', project, *path)
+
+
+def container_url(project: str, location: str, *path: str) -> str:
+  """Returns the URL of a resource of the GKE v1beta1 API in a location."""
+  endpoint = os.getenv(
+      _CONTAINER_ENDPOINT_OVERRIDE, 'https://container.googleapis.com/'
+  )
+  return _join(
+      endpoint, 'v1beta1', 'projects', project, 'locations', location, *path
+  )
+
+
+def _join(endpoint: str, *path: str) -> str:
+  return endpoint.rstrip('/') + '/' + '/'.join(path)
+
+
+def get_json(
+    task: str, url: str, params: dict[str, str] | None = None
+) -> tuple[int, dict[str, Any] | None]:
+  """Reads a resource of a GCP REST API.
+
+  Args:
+    task: name of the read, used in errors and traces.
+    url: URL of the resource.
+    params: query parameters of the request.
+
+  Returns:
+    0 and the resource if successful, 1 and None otherwise.
+  """
+  # pylint: disable=import-outside-toplevel
+  import requests
+  from google.auth.exceptions import GoogleAuthError
+
+  with Tracer.command(task, f'GET {url}') as span:
+    span['exit_code'] = 1
+    try:
+      response = _sessions.get().get(
+          url, params=params, timeout=_REQUEST_TIMEOUT_SECONDS
+      )
+    except (GoogleAuthError, requests.RequestException) as e:
+      xpk_print(f'{task} returned ERROR: {e}')
+      return 1, None
+    if not response.ok:
+      _print_error(task, response)
+      return 1, None
+    try:
+      resource = response.json()
+    except ValueError as e:
+      xpk_print(f'{task} returned invalid JSON: {e}')
+      return 1, None
+    span['exit_code'] = 0
+    return 0, resource
+
+
+def list_json(
+    task: str,
+    url: str,
+    items_key: str,
+    params: dict[str, str] | None = None,
+) -> tuple[int, list[dict[str, Any]]]:
+  """Lists resources of a GCP REST API, following all result pages.
+
+  Args:
+    task: name of the read, used in errors and traces.
+    url: URL of the collection.
+    items_key: key of the resources in each response.
+    params: query parameters of the requests.
+
+  Returns:
+    0 and the resources if successful, 1 and no resources otherwise.
+  """
+  items: list[dict[str, Any]] = []
+  page_params = dict(params or {})
+  while True:
+    return_code, page = get_json(task, url, page_params)
+    if return_code != 0 or page is None:
+      return 1, []
+    items.extend(page.get(items_key) or [])
+    page_token = page.get('nextPageToken')
+    if not page_token:
+      return 0, items
+    page_params['pageToken'] = page_token
+
+
+def _print_error(task: str, response: 'Response') -> None:
+  try:
+    message = response.json()['error']['message']
+  except (ValueError, KeyError, TypeError):
+    message = response.reason
+  xpk_print(f'{task} returned ERROR {response.status_code}: {message}')
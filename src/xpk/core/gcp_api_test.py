@@ -0,0 +1,132 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from google.auth.credentials import AnonymousCredentials
+from pytest_mock import MockerFixture
+
+from . import gcp_api
+from .gcp_api import compute_url, container_url, get_json, list_json
+
+
+class _FakeApi:
+  """Local HTTP server answering GET requests with canned responses."""
+
+  def __init__(self) -> None:
+    self.responses: dict[str, list[tuple[int, dict]]] = {}
+    self.requests: list[tuple[str, dict[str, list[str]]]] = []
+    self.client_ports: set[int] = set()
+    fake = self
+
+    class Handler(BaseHTTPRequestHandler):
+      """Answers with the next canned response of the requested path."""
+
+      protocol_version = 'HTTP/1.1'
+
+      def do_GET(self):  # pylint: disable=invalid-name
+        url = urlparse(self.path)
+        fake.requests.append((url.path, parse_qs(url.query)))
+        fake.client_ports.add(self.client_address[1])
+        status, body = fake.responses[url.path].pop(0)
+        content = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+      def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+    self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    self.endpoint = f'http://127.0.0.1:{self._server.server_address[1]}/'
+    threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+  def stop(self) -> None:
+    self._server.shutdown()
+    self._server.server_close()
+
+
+@pytest.fixture
+def fake_api(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[_FakeApi]:
+  fake = _FakeApi()
+  monkeypatch.setenv('CLOUDSDK_API_ENDPOINT_OVERRIDES_COMPUTE', fake.endpoint)
+  monkeypatch.setenv('CLOUDSDK_API_ENDPOINT_OVERRIDES_CONTAINER', fake.endpoint)
+  mocker.patch(
+      'google.auth.default',
+      return_value=(AnonymousCredentials(), None),
+  )
+  mocker.patch.object(gcp_api, '_sessions', gcp_api._SessionCache())
+  yield fake
+  fake.stop()
+
+
+def test_urls_use_gcloud_endpoint_overrides(monkeypatch: pytest.MonkeyPatch):
+  monkeypatch.setenv(
+      'CLOUDSDK_API_ENDPOINT_OVERRIDES_COMPUTE', 'https://compute.test/compute/'
+  )
+  monkeypatch.delenv('CLOUDSDK_API_ENDPOINT_OVERRIDES_CONTAINER', raising=False)
+
+  assert (
+      compute_url('project', 'zones', 'us-central1-a', 'reservations', 'r')
+      == 'https://compute.test/compute/beta/projects/project/zones/us-central1-a/reservations/r'
+  )
+  assert (
+      container_url('project', 'us-central1', 'serverConfig')
+      == 'https://container.googleapis.com/v1beta1/projects/project/locations/us-central1/serverConfig'
+  )
+
+
+def test_list_json_follows_page_tokens_over_one_connection(
+    fake_api: _FakeApi,
+):
+  path = '/beta/projects/project/global/networks'
+  fake_api.responses[path] = [
+      (200, {'items': [{'name': 'a'}], 'nextPageToken': 'next'}),
+      (200, {'items': [{'name': 'b'}]}),
+  ]
+
+  return_code, items = list_json(
+      'Get All Networks', compute_url('project', 'global', 'networks'), 'items'
+  )
+
+  assert return_code == 0
+  assert items == [{'name': 'a'}, {'name': 'b'}]
+  assert fake_api.requests == [(path, {}), (path, {'pageToken': ['next']})]
+  assert len(fake_api.client_ports) == 1
+
+
+def test_get_json_returns_error_code_with_api_message(
+    fake_api: _FakeApi, capsys: pytest.CaptureFixture
+):
+  fake_api.responses['/v1beta1/projects/project/locations/l/clusters/c'] = [
+      (403, {'error': {'code': 403, 'message': 'Permission denied'}})
+  ]
+
+  assert get_json(
+      'Get cluster', container_url('project', 'l', 'clusters', 'c')
+  ) == (1, None)
+  assert 'Get cluster returned ERROR 403: Permission denied' in (
+      capsys.readouterr().out
+  )
@@ -0,0 +1,154 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import math
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from .config import HEDGE_READS_KEY, get_config
+from ..utils.file import file_lock, get_cache_dir, write_text_atomically
+
+
+@dataclass(frozen=True)
+class ReadCommandPolicy:
+  """How a read-only command that occasionally hangs is bounded.
+
+  Attributes:
+    name: identifies latency samples of the command.
+    timeout_seconds: the command is killed once it runs for this long.
+    hedge_after_seconds: delay before a hedged second attempt is started,
+        until enough latency samples are known to derive it from.
+  """
+
+  name: str
+  timeout_seconds: float
+  hedge_after_seconds: float
+
+
+_READ_COMMAND_POLICIES: list[tuple[re.Pattern, ReadCommandPolicy]] = [
+    (
+        re.compile(r'^kubectl get configmap\b'),
+        ReadCommandPolicy('kubectl-get-configmap', 60, 5),
+    ),
+    (
+        re.compile(r'^gcloud (beta )?container clusters (list|describe)\b'),
+        ReadCommandPolicy('gcloud-clusters', 120, 10),
+    ),
+    (
+        re.compile(r'^gcloud (beta )?container node-pools (list|describe)\b'),
+        ReadCommandPolicy('gcloud-node-pools', 120, 10),
+    ),
+    (
+        re.compile(r'^gcloud container get-server-config\b'),
+        ReadCommandPolicy('gcloud-server-config', 120, 10),
+    ),
+    (
+        re.compile(
+            r'^gcloud (beta |alpha )?compute reservations'
+            r' (describe|list|blocks list|sub-blocks list)\b'
+        ),
+        ReadCommandPolicy('gcloud-reservations', 120, 10),
+    ),
+]
+
+_MIN_SAMPLES_FOR_PERCENTILE = 10
+_MAX_SAMPLES = 100
+_MIN_HEDGE_AFTER_SECONDS = 1.0
+
+
+def get_read_command_policy(command: str) -> ReadCommandPolicy | None:
+  """Returns the policy of a read-only command, None for other commands."""
+  for pattern, policy in _READ_COMMAND_POLICIES:
+    if pattern.match(command.strip()):
+      return policy
+  return None
+
+
+def is_hedging_enabled() -> bool:
+  return get_config().get(HEDGE_READS_KEY) == 'true'
+
+
+def get_hedge_delay(policy: ReadCommandPolicy) -> float | None:
+  """Returns seconds after which to start a second attempt of a command.
+
+  Args:
+    policy: policy of the command.
+
+  Returns:
+    The 95th percentile of the recorded latencies of the command, or the
+    policy default if there are too few of them. None if hedging is disabled.
+  """
+  if not is_hedging_enabled():
+    return None
+  p95 = LatencyHistory.get_percentile(policy.name, 0.95)
+  if p95 is None:
+    return policy.hedge_after_seconds
+  return max(_MIN_HEDGE_AFTER_SECONDS, p95)
+
+
+class _LatencyHistory:
+  """Latencies of recent runs of read commands, shared across xpk runs."""
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._samples: dict[str, list[float]] | None = None
+
+  def record(self, name: str, seconds: float) -> None:
+    path = _get_history_path()
+    with self._lock:
+      try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Re-reads the samples, so that runs of concurrent xpk processes are
+        # not overwritten.
+        with file_lock(path.with_suffix('.lock')):
+          samples = self._read(path)
+          samples[name] = (samples.get(name, []) + [round(seconds, 3)])[
+              -_MAX_SAMPLES:
+          ]
+          write_text_atomically(path, json.dumps(samples))
+      except OSError:
+        return
+      self._samples = samples
+
+  def get_percentile(self, name: str, percentile: float) -> float | None:
+    with self._lock:
+      samples = sorted(self._load().get(name, []))
+    if len(samples) < _MIN_SAMPLES_FOR_PERCENTILE:
+      return None
+    return samples[math.ceil(percentile * len(samples)) - 1]
+
+  def _load(self) -> dict[str, list[float]]:
+    if self._samples is None:
+      self._samples = self._read(_get_history_path())
+    return self._samples
+
+  def _read(self, path: Path) -> dict[str, list[float]]:
+    try:
+      with open(path, encoding='utf-8') as f:
+        samples = json.load(f)
+    except (OSError, ValueError):
+      return {}
+    return samples if isinstance(samples, dict) else {}
+
+
+def _get_history_path() -> Path:
+  return get_cache_dir() / 'read-latency.json'
+
+
+LatencyHistory = _LatencyHistory()
@@ -0,0 +1,88 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+
+import pytest
+
+from .config import HEDGE_READS_KEY, get_config
+from .hedging import ReadCommandPolicy, _LatencyHistory, _get_history_path, get_hedge_delay, get_read_command_policy
+
+_POLICY = ReadCommandPolicy('test', timeout_seconds=60, hedge_after_seconds=5)
+
+
+@pytest.fixture(autouse=True)
+def hedging_env(mocker):
+  mocker.patch('xpk.core.hedging.LatencyHistory', _LatencyHistory())
+  get_config().set(HEDGE_READS_KEY, 'true')
+  yield
+  get_config().set(HEDGE_READS_KEY, None)
+
+
+@pytest.mark.parametrize(
+    argnames='command,expected',
+    argvalues=[
+        ('kubectl get configmap c-metadata-configmap', 'kubectl-get-configmap'),
+        (
+            'gcloud beta compute reservations sub-blocks list r --block=b',
+            'gcloud-reservations',
+        ),
+        ('gcloud container clusters list --project=p', 'gcloud-clusters'),
+        ('gcloud container clusters create c', None),
+        ('kubectl apply -f file.yaml', None),
+    ],
+)
+def test_get_read_command_policy(command: str, expected: str | None):
+  policy = get_read_command_policy(command)
+
+  assert (policy.name if policy else None) == expected
+
+
+def test_get_hedge_delay_is_none_when_disabled():
+  get_config().set(HEDGE_READS_KEY, None)
+
+  assert get_hedge_delay(_POLICY) is None
+
+
+def test_get_hedge_delay_defaults_to_policy_without_enough_samples():
+  for _ in range(3):
+    _LatencyHistory().record('test', 1.0)
+
+  assert get_hedge_delay(_POLICY) == 5
+
+
+def test_get_hedge_delay_uses_p95_of_recorded_latencies():
+  history = _LatencyHistory()
+  for seconds in range(1, 21):
+    history.record('test', seconds)
+
+  assert history.get_percentile('test', 0.95) == 19
+  # Samples are shared with later xpk runs.
+  assert _LatencyHistory().get_percentile('test', 0.95) == 19
+
+
+def test_latency_history_keeps_samples_of_concurrent_runs():
+  first = _LatencyHistory()
+  second = _LatencyHistory()
+  first.get_percentile('test', 0.95)
+  second.get_percentile('test', 0.95)
+
+  first.record('test', 1.0)
+  second.record('test', 2.0)
+  first.record('test', 3.0)
+
+  samples = json.loads(_get_history_path().read_text(encoding='utf-8'))
+  assert sorted(samples['test']) == [1.0, 2.0, 3.0]
@@ -0,0 +1,250 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Callable
+
+from .tracing import Tracer
+from ..utils.console import xpk_print
+from ..utils.execution_context import is_dry_run
+from ..utils.feature_flags import FeatureFlags
+
+# The Kubernetes client is slow to import, so it is imported by the reads
+# instead of by every xpk invocation.
+if TYPE_CHECKING:
+  from kubernetes.client import ApiClient
+
+_CONNECTION_POOL_SIZE = 16
+_REQUEST_TIMEOUT_SECONDS = 120
+_PAGE_SIZE = 500
+
+KUEUE_GROUP = 'kueue.x-k8s.io'
+KUEUE_VERSION = 'v1beta1'
+
+
+def is_native_kubernetes_reads_enabled() -> bool:
+  """Returns whether reads go through the Kubernetes API instead of kubectl.
+
+  Dry runs keep printing the kubectl commands of the reads.
+  """
+  return FeatureFlags.NATIVE_KUBERNETES_READS_ENABLED and not is_dry_run()
+
+
+class _ApiClientCache:
+  """Kubernetes API client shared by all reads, with pooled connections.
+
+  The client is created again when the kubeconfig changes, e.g. after
+  fetching credentials of another cluster.
+  """
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._client: 'ApiClient | None' = None
+    self._kubeconfig_key: tuple | None = None
+
+  def get(self) -> 'ApiClient':
+    from kubernetes import client, config  # pylint: disable=import-outside-toplevel
+
+    kubeconfig_key = _get_kubeconfig_key()
+    with self._lock:
+      if self._client is None or kubeconfig_key != self._kubeconfig_key:
+        configuration = client.Configuration()
+        config.load_kube_config(client_configuration=configuration)
+        configuration.connection_pool_maxsize = _CONNECTION_POOL_SIZE
+        if self._client is not None:
+          self._client.close()
+        self._client = client.ApiClient(configuration)
+        self._kubeconfig_key = kubeconfig_key
+      return self._client
+
+
+def _get_kubeconfig_key() -> tuple:
+  kubeconfig = os.environ.get('KUBECONFIG') or os.path.expanduser(
+      '~/.kube/config'
+  )
+  key: list[tuple[str, int | None, int | None]] = []
+  for path in kubeconfig.split(os.pathsep):
+    try:
+      stat = os.stat(path)
+      key.append((path, stat.st_mtime_ns, stat.st_size))
+    except OSError:
+      key.append((path, None, None))
+  return tuple(key)
+
+
+_api_clients = _ApiClientCache()
+
+
+def list_nodes(task: str, on_item: Callable[[dict[str, Any]], None]) -> int:
+  """Passes each node of the cluster to `on_item`, as kubectl's JSON.
+
+  Args:
+    task: name of the read, used in errors and traces.
+    on_item: called with each node.
+
+  Returns:
+    0 if successful, 1 otherwise.
+  """
+  from kubernetes import client  # pylint: disable=import-outside-toplevel
+
+  return _list_pages(
+      task,
+      'nodes',
+      lambda **kwargs: client.CoreV1Api(_api_clients.get()).list_node(**kwargs),
+      on_item,
+  )
+
+
+def list_custom_objects(
+    task: str,
+    group: str,
+    version: str,
+    plural: str,
+    on_item: Callable[[dict[str, Any]], None],
+    namespace: str = 'default',
+    ignore_not_found: bool = False,
+) -> int:
+  """Passes each custom object of a namespace to `on_item`.
+
+  Args:
+    task: name of the read, used in errors and traces.
+    group: API group of the objects.
+    version: API version of the objects.
+    plural: plural name of the objects.
+    on_item: called with each object.
+    namespace: namespace of the objects.
+    ignore_not_found: whether a missing resource type means no objects.
+
+  Returns:
+    0 if successful, 1 otherwise.
+  """
+  from kubernetes import client  # pylint: disable=import-outside-toplevel
+
+  return _list_pages(
+      task,
+      f'{plural}.{group}',
+      lambda **kwargs: client.CustomObjectsApi(
+          _api_clients.get()
+      ).list_namespaced_custom_object(
+          group, version, namespace, plural, **kwargs
+      ),
+      on_item,
+      ignore_not_found=ignore_not_found,
+  )
+
+
+def read_config_map(
+    task: str, name: str, namespace: str = 'default'
+) -> tuple[int, dict[str, Any] | None]:
+  """Returns the ConfigMap, as kubectl's JSON."""
+  from kubernetes import client  # pylint: disable=import-outside-toplevel
+
+  return _read(
+      task,
+      f'configmap {namespace}/{name}',
+      lambda **kwargs: client.CoreV1Api(
+          _api_clients.get()
+      ).read_namespaced_config_map(name, namespace, **kwargs),
+  )
+
+
+def read_deployment(
+    task: str, name: str, namespace: str
+) -> tuple[int, dict[str, Any] | None]:
+  """Returns the Deployment, as kubectl's JSON."""
+  from kubernetes import client  # pylint: disable=import-outside-toplevel
+
+  return _read(
+      task,
+      f'deployment {namespace}/{name}',
+      lambda **kwargs: client.AppsV1Api(
+          _api_clients.get()
+      ).read_namespaced_deployment(name, namespace, **kwargs),
+  )
+
+
+def _read(
+    task: str, resource: str, read: Callable[..., Any]
+) -> tuple[int, dict[str, Any] | None]:
+  # pylint: disable=import-outside-toplevel
+  from kubernetes.client.exceptions import ApiException
+  from kubernetes.config.config_exception import ConfigException
+  from urllib3.exceptions import HTTPError
+
+  with Tracer.command(task, f'get {resource}') as span:
+    try:
+      response = read(
+          _preload_content=False, _request_timeout=_REQUEST_TIMEOUT_SECONDS
+      )
+      span['exit_code'] = 0
+      return 0, json.loads(response.data)
+    except (ApiException, ConfigException, HTTPError, ValueError) as e:
+      _print_error(task, e)
+      span['exit_code'] = 1
+      return 1, None
+
+
+def _list_pages(
+    task: str,
+    resource: str,
+    list_page: Callable[..., Any],
+    on_item: Callable[[dict[str, Any]], None],
+    ignore_not_found: bool = False,
+) -> int:
+  """Lists objects page by page, so memory is bounded by the page size."""
+  # pylint: disable=import-outside-toplevel
+  from kubernetes.client.exceptions import ApiException
+  from kubernetes.config.config_exception import ConfigException
+  from urllib3.exceptions import HTTPError
+
+  with Tracer.command(task, f'list {resource}') as span:
+    span['exit_code'] = 1
+    continue_token = None
+    try:
+      while True:
+        kwargs: dict[str, Any] = {
+            'limit': _PAGE_SIZE,
+            '_preload_content': False,
+            '_request_timeout': _REQUEST_TIMEOUT_SECONDS,
+        }
+        if continue_token:
+          kwargs['_continue'] = continue_token
+        page = json.loads(list_page(**kwargs).data)
+        for item in page.get('items') or []:
+          on_item(item)
+        continue_token = (page.get('metadata') or {}).get('continue')
+        if not continue_token:
+          break
+    except ApiException as e:
+      if not (ignore_not_found and e.status == 404):
+        _print_error(task, e)
+        return 1
+    except (ConfigException, HTTPError, ValueError) as e:
+      _print_error(task, e)
+      return 1
+    span['exit_code'] = 0
+    return 0
+
+
+def _print_error(task: str, error: Exception) -> None:
+  from kubernetes.client.exceptions import ApiException  # pylint: disable=import-outside-toplevel
+
+  if isinstance(error, ApiException):
+    xpk_print(f'{task} returned ERROR {error.status}: {error.reason}')
+  else:
+    xpk_print(f'{task} returned ERROR: {error}')
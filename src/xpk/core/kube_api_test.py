@@ -0,0 +1,133 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.client.exceptions import ApiException
+from pytest_mock import MockerFixture
+
+from . import kube_api
+from .kube_api import (
+    _ApiClientCache,
+    list_custom_objects,
+    list_nodes,
+    read_config_map,
+)
+
+
+def _response(body: dict) -> MagicMock:
+  response = MagicMock()
+  response.data = json.dumps(body).encode('utf-8')
+  return response
+
+
+@pytest.fixture
+def api_clients(mocker: MockerFixture) -> MagicMock:
+  return mocker.patch.object(kube_api, '_api_clients')
+
+
+def test_list_nodes_follows_continue_tokens(
+    mocker: MockerFixture, api_clients: MagicMock
+):
+  core_api = mocker.patch('kubernetes.client.CoreV1Api').return_value
+  core_api.list_node.side_effect = [
+      _response({'items': [{'name': 'a'}], 'metadata': {'continue': 'next'}}),
+      _response({'items': [{'name': 'b'}], 'metadata': {}}),
+  ]
+  nodes: list[dict] = []
+
+  assert list_nodes('List nodes', nodes.append) == 0
+
+  assert nodes == [{'name': 'a'}, {'name': 'b'}]
+  assert '_continue' not in core_api.list_node.call_args_list[0].kwargs
+  assert core_api.list_node.call_args_list[1].kwargs['_continue'] == 'next'
+
+
+def test_list_custom_objects_ignores_missing_resource_type(
+    mocker: MockerFixture, api_clients: MagicMock
+):
+  custom_api = mocker.patch('kubernetes.client.CustomObjectsApi').return_value
+  custom_api.list_namespaced_custom_object.side_effect = ApiException(
+      status=404, reason='Not Found'
+  )
+
+  assert (
+      list_custom_objects(
+          'List workloads',
+          'kueue.x-k8s.io',
+          'v1beta1',
+          'workloads',
+          lambda _: None,
+          ignore_not_found=True,
+      )
+      == 0
+  )
+  assert (
+      list_custom_objects(
+          'List workloads',
+          'kueue.x-k8s.io',
+          'v1beta1',
+          'workloads',
+          lambda _: None,
+      )
+      == 1
+  )
+
+
+def test_read_config_map_returns_error_code(
+    mocker: MockerFixture, api_clients: MagicMock
+):
+  core_api = mocker.patch('kubernetes.client.CoreV1Api').return_value
+  core_api.read_namespaced_config_map.side_effect = ApiException(
+      status=403, reason='Forbidden'
+  )
+
+  assert read_config_map('Get ConfigMap', 'name') == (1, None)
+
+
+def test_read_config_map_returns_object(
+    mocker: MockerFixture, api_clients: MagicMock
+):
+  core_api = mocker.patch('kubernetes.client.CoreV1Api').return_value
+  core_api.read_namespaced_config_map.return_value = _response(
+      {'data': {'key': 'value with spaces'}}
+  )
+
+  assert read_config_map('Get ConfigMap', 'name') == (
+      0,
+      {'data': {'key': 'value with spaces'}},
+  )
+
+
+def test_api_client_is_created_again_when_kubeconfig_changes(
+    mocker: MockerFixture, tmp_path, monkeypatch: pytest.MonkeyPatch
+):
+  kubeconfig = tmp_path / 'config'
+  kubeconfig.write_text('a', encoding='utf-8')
+  monkeypatch.setenv('KUBECONFIG', str(kubeconfig))
+  mocker.patch('kubernetes.config.load_kube_config')
+  api_client = mocker.patch('kubernetes.client.ApiClient')
+  cache = _ApiClientCache()
+
+  cache.get()
+  cache.get()
+  assert api_client.call_count == 1
+
+  kubeconfig.write_text('another cluster', encoding='utf-8')
+  cache.get()
+  assert api_client.call_count == 2
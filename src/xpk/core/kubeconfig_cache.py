@@ -0,0 +1,172 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import shlex
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from .commands import run_command_for_value
+from .config import KUBECONFIG_CACHE_KEY, get_config
+from ..utils.execution_context import is_dry_run
+from ..utils.file import get_cache_dir, write_text_atomically
+
+# Sections of a kubeconfig holding the entries of a context.
+_SECTIONS = ('clusters', 'users', 'contexts')
+
+
+def is_kubeconfig_cache_enabled() -> bool:
+  return not is_dry_run() and get_config().get(KUBECONFIG_CACHE_KEY) != 'false'
+
+
+def get_cached_kubeconfig_path(project: str, zone: str, cluster: str) -> Path:
+  return get_cache_dir() / 'kubeconfigs' / f'{project}_{zone}_{cluster}.yaml'
+
+
+def get_kubeconfig_path() -> Path:
+  """Returns the kubeconfig file that gcloud and kubectl write to."""
+  for path in os.environ.get('KUBECONFIG', '').split(os.pathsep):
+    if path:
+      return Path(path)
+  return Path(os.path.expanduser('~/.kube/config'))
+
+
+def save_current_context(cached_kubeconfig: Path) -> None:
+  """Saves the current context of the kubeconfig with its cluster and user.
+
+  Args:
+    cached_kubeconfig: file to save the context to.
+  """
+  config = _load(get_kubeconfig_path())
+  if config is None:
+    return
+  name = config.get('current-context')
+  context = _find_entry(config, 'contexts', name)
+  if context is None:
+    return
+  cluster = _find_entry(config, 'clusters', context['context'].get('cluster'))
+  user = _find_entry(config, 'users', context['context'].get('user'))
+  if cluster is None or user is None:
+    return
+  cached = {
+      'apiVersion': 'v1',
+      'kind': 'Config',
+      'current-context': name,
+      'clusters': [cluster],
+      'users': [user],
+      'contexts': [context],
+  }
+  try:
+    # Readable only by the user, like the kubeconfig of kubectl.
+    write_text_atomically(
+        cached_kubeconfig,
+        yaml.safe_dump(cached, default_flow_style=False),
+        mode=0o600,
+    )
+  except OSError:
+    pass
+
+
+def load_cached_context(cached_kubeconfig: Path) -> bool:
+  """Merges a saved context into the kubeconfig and makes it current.
+
+  The entries are set through `kubectl config`, which locks the kubeconfig and
+  only changes the entries of the context, as
+  `gcloud container clusters get-credentials` does.
+
+  Args:
+    cached_kubeconfig: file the context was saved to.
+
+  Returns:
+    True if the context was loaded, False if none was saved or it cannot be
+    set through `kubectl config`.
+  """
+  cached = _load(cached_kubeconfig)
+  if cached is None or not all(cached.get(s) for s in _SECTIONS):
+    return False
+  commands: list[str] = []
+  for section in _SECTIONS:
+    for entry in cached[section]:
+      properties = _get_properties(entry.get(section[:-1]))
+      if properties is None or '.' in entry['name']:
+        return False
+      commands.extend(
+          f'kubectl config set {section}.{entry["name"]}.{name}'
+          f' {shlex.quote(value)}'
+          for name, value in properties
+      )
+  commands.append(
+      f'kubectl config use-context {shlex.quote(cached["current-context"])}'
+  )
+  return_code, _ = run_command_for_value(
+      ' && '.join(commands), 'Load cached kubeconfig context', hide_error=True
+  )
+  return return_code == 0
+
+
+def forget_cached_context(cached_kubeconfig: Path) -> None:
+  if is_dry_run():
+    return
+  try:
+    cached_kubeconfig.unlink()
+  except OSError:
+    pass
+
+
+def _find_entry(
+    config: dict[str, Any], section: str, name: str | None
+) -> dict[str, Any] | None:
+  for entry in config.get(section) or []:
+    if isinstance(entry, dict) and entry.get('name') == name:
+      return entry
+  return None
+
+
+def _get_properties(
+    fields: Any, prefix: str = ''
+) -> list[tuple[str, str]] | None:
+  """Returns the paths and values of the fields for `kubectl config set`.
+
+  Returns:
+    The scalar fields, None if a field is a list, which it cannot set.
+  """
+  if not isinstance(fields, dict):
+    return None
+  properties = []
+  for name, value in fields.items():
+    if isinstance(value, dict):
+      nested = _get_properties(value, f'{prefix}{name}.')
+      if nested is None:
+        return None
+      properties.extend(nested)
+    elif isinstance(value, (list, tuple)):
+      return None
+    elif isinstance(value, bool):
+      properties.append((f'{prefix}{name}', str(value).lower()))
+    else:
+      properties.append((f'{prefix}{name}', str(value)))
+  return properties
+
+
+def _load(path: Path) -> dict[str, Any] | None:
+  try:
+    with open(path, encoding='utf-8') as f:
+      config = yaml.safe_load(f)
+  except (OSError, yaml.YAMLError):
+    return None
+  return config if isinstance(config, dict) else None
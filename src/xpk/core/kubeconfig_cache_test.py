@@ -0,0 +1,140 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import stat
+
+import pytest
+import yaml
+from pytest_mock import MockerFixture
+
+from .testing.commands_tester import CommandsTester
+from .kubeconfig_cache import get_cached_kubeconfig_path, get_kubeconfig_path, load_cached_context, save_current_context
+
+
+def _entry(section: str, name: str, **fields) -> dict:
+  return {'name': name, section: fields}
+
+
+def _kubeconfig(cluster: str, server: str) -> dict:
+  return {
+      'apiVersion': 'v1',
+      'kind': 'Config',
+      'current-context': f'gke_{cluster}',
+      'clusters': [_entry('cluster', f'gke_{cluster}', server=server)],
+      'users': [_entry('user', f'gke_{cluster}', token='t')],
+      'contexts': [
+          _entry(
+              'context',
+              f'gke_{cluster}',
+              cluster=f'gke_{cluster}',
+              user=f'gke_{cluster}',
+              namespace='default',
+          )
+      ],
+  }
+
+
+@pytest.fixture
+def commands_tester(mocker: MockerFixture) -> CommandsTester:
+  return CommandsTester(mocker)
+
+
+@pytest.fixture(autouse=True)
+def kubeconfig(tmp_path, monkeypatch):
+  path = tmp_path / 'kube' / 'config'
+  monkeypatch.setenv('KUBECONFIG', os.pathsep.join([str(path), '/other']))
+  return path
+
+
+def _write(path, config: dict):
+  path.parent.mkdir(parents=True, exist_ok=True)
+  path.write_text(yaml.safe_dump(config))
+
+
+def _read(path) -> dict:
+  config: dict = yaml.safe_load(path.read_text())
+  return config
+
+
+def test_get_kubeconfig_path_returns_first_kubeconfig_file(kubeconfig):
+  assert get_kubeconfig_path() == kubeconfig
+
+
+def test_save_current_context_keeps_only_current_context(kubeconfig):
+  config = _kubeconfig('a', 'https://a')
+  for section in ('clusters', 'users', 'contexts'):
+    config[section] += _kubeconfig('b', 'https://b')[section]
+  _write(kubeconfig, config)
+  cached = get_cached_kubeconfig_path('project', 'zone', 'a')
+
+  save_current_context(cached)
+
+  assert _read(cached) == _kubeconfig('a', 'https://a')
+  assert stat.S_IMODE(os.stat(cached).st_mode) == 0o600
+
+
+def test_load_cached_context_sets_entries_through_kubectl(
+    commands_tester: CommandsTester,
+):
+  cached = get_cached_kubeconfig_path('project', 'zone', 'a')
+  config = _kubeconfig('a', 'https://a')
+  config['users'][0]['user'] = {
+      'exec': {'command': 'gke-gcloud-auth-plugin', 'provideClusterInfo': True}
+  }
+  _write(cached, config)
+
+  assert load_cached_context(cached)
+
+  commands_tester.assert_command_run(
+      'kubectl config set clusters.gke_a.server https://a',
+      'kubectl config set users.gke_a.exec.command gke-gcloud-auth-plugin',
+      'kubectl config set users.gke_a.exec.provideClusterInfo true',
+      'kubectl config set contexts.gke_a.cluster gke_a',
+      'kubectl config set contexts.gke_a.namespace default',
+      'kubectl config use-context gke_a',
+  )
+
+
+def test_load_cached_context_returns_false_when_kubectl_fails(
+    commands_tester: CommandsTester,
+):
+  cached = get_cached_kubeconfig_path('project', 'zone', 'a')
+  _write(cached, _kubeconfig('a', 'https://a'))
+  commands_tester.set_result_for_command((1, ''), 'kubectl config')
+
+  assert not load_cached_context(cached)
+
+
+def test_load_cached_context_returns_false_for_list_fields(
+    commands_tester: CommandsTester,
+):
+  cached = get_cached_kubeconfig_path('project', 'zone', 'a')
+  config = _kubeconfig('a', 'https://a')
+  config['users'][0]['user'] = {'exec': {'args': ['--flag']}}
+  _write(cached, config)
+
+  assert not load_cached_context(cached)
+  assert not commands_tester.commands_history
+
+
+def test_load_cached_context_returns_false_without_saved_context(
+    commands_tester: CommandsTester,
+):
+  assert not load_cached_context(
+      get_cached_kubeconfig_path('project', 'zone', 'a')
+  )
+  assert not commands_tester.commands_history
@@ -21,6 +21,7 @@ import json
 from jinja2 import Environment, FileSystemLoader
 
 from .kubectl_common import PatchResources, patch_controller_manager_resources
+from .kube_api import is_native_kubernetes_reads_enabled, read_deployment
 from ..utils.topology import get_slice_topology_level, get_topology_product, is_topology_contained
 from ..utils.kueue import is_queued_cluster
 from kubernetes.utils import parse_quantity
@@ -560,20 +561,29 @@ def get_installed_kueue_version(
     - A Version object if the image tag can be parsed as a valid version.
     - A string if the image tag contains a custom SHA or is unparseable.
   """
-  command = (
-      "kubectl get deployment kueue-controller-manager -n kueue-system -o"
-      " jsonpath='{.spec.template.spec.containers[0].image}'"
-  )
   task = "Get kueue version on server"
-  return_code, val = run_command_for_value(
-      command,
-      task,
-      dry_run_return_val=(
-          f"registry.k8s.io/kueue/kueue:v{dry_run_version}"
-          if dry_run_version
-          else ""
-      ),
-  )
+  if is_native_kubernetes_reads_enabled():
+    return_code, deployment = read_deployment(
+        task, "kueue-controller-manager", "kueue-system"
+    )
+    containers = (deployment or {}).get("spec", {}).get("template", {}).get(
+        "spec", {}
+    ).get("containers") or [{}]
+    val = containers[0].get("image", "")
+  else:
+    command = (
+        "kubectl get deployment kueue-controller-manager -n kueue-system -o"
+        " jsonpath='{.spec.template.spec.containers[0].image}'"
+    )
+    return_code, val = run_command_for_value(
+        command,
+        task,
+        dry_run_return_val=(
+            f"registry.k8s.io/kueue/kueue:v{dry_run_version}"
+            if dry_run_version
+            else ""
+        ),
+    )
   if return_code != 0 or not val:
     return return_code, None
 
@@ -0,0 +1,134 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Generic, TypeVar
+
+from .config import METADATA_CACHE_KEY, get_config
+from ..utils.execution_context import is_dry_run
+from ..utils.file import file_lock, get_cache_dir, write_text_atomically
+
+T = TypeVar('T')
+
+_HOUR = 60 * 60
+_DAY = 24 * _HOUR
+
+
+def is_metadata_cache_enabled() -> bool:
+  return not is_dry_run() and get_config().get(METADATA_CACHE_KEY) != 'false'
+
+
+@dataclass(frozen=True)
+class CachedMetadata(Generic[T]):
+  """A kind of GCP metadata kept on disk for `ttl` seconds.
+
+  Values must survive a JSON round trip. Entries are keyed by the parts
+  identifying the resource, e.g. project and cluster, so all entries of a
+  resource can be invalidated when xpk changes it.
+  """
+
+  name: str
+  ttl: int
+
+  def get(self, key: tuple[str, ...]) -> T | None:
+    """Returns the cached value, None if it is missing or expired.
+
+    Args:
+      key: parts identifying the resource.
+    """
+    if not is_metadata_cache_enabled():
+      return None
+    entry = self._read().get(_format_key(key))
+    if entry is None or time.time() - entry['stored_at'] >= self.ttl:
+      return None
+    value: T = entry['value']
+    return value
+
+  def put(self, key: tuple[str, ...], value: T) -> None:
+    """Caches the current value of a resource."""
+    if not is_metadata_cache_enabled():
+      return
+
+    def store(entries: dict[str, Any]) -> None:
+      entries[_format_key(key)] = {'stored_at': time.time(), 'value': value}
+
+    self._update(store)
+
+  def invalidate(self, *key_prefix: str) -> None:
+    """Forgets entries whose keys start with the given parts."""
+    if not is_metadata_cache_enabled():
+      return
+    prefix = _format_key(key_prefix)
+
+    def remove(entries: dict[str, Any]) -> None:
+      for key in list(entries):
+        if key == prefix or key.startswith(f'{prefix}/'):
+          del entries[key]
+
+    self._update(remove)
+
+  def _get_path(self) -> Path:
+    return get_cache_dir() / 'metadata' / f'{self.name}.json'
+
+  def _read(self) -> dict[str, Any]:
+    try:
+      with open(self._get_path(), encoding='utf-8') as f:
+        entries = json.load(f)
+    except (OSError, ValueError):
+      return {}
+    return entries if isinstance(entries, dict) else {}
+
+  def _update(self, change: Callable[[dict[str, Any]], None]) -> None:
+    path = self._get_path()
+    try:
+      path.parent.mkdir(parents=True, exist_ok=True)
+      with file_lock(path.with_suffix('.lock')):
+        entries = self._read()
+        change(entries)
+        now = time.time()
+        entries = {
+            key: entry
+            for key, entry in entries.items()
+            if now - entry['stored_at'] < self.ttl
+        }
+        write_text_atomically(path, json.dumps(entries))
+    except OSError:
+      pass
+
+
+def _format_key(parts: tuple[str, ...]) -> str:
+  return '/'.join(parts)
+
+
+CLUSTER_LOCATIONS: CachedMetadata[str] = CachedMetadata(
+    'cluster-location', ttl=_DAY
+)
+# Project numbers never change.
+PROJECT_NUMBERS: CachedMetadata[str] = CachedMetadata(
+    'project-number', ttl=30 * _DAY
+)
+GKE_SERVER_CONFIGS: CachedMetadata[dict[str, Any]] = CachedMetadata(
+    'gke-server-config', ttl=_HOUR
+)
+RESOURCE_POLICIES: CachedMetadata[bool] = CachedMetadata(
+    'resource-policy', ttl=_HOUR
+)
+GKE_DASHBOARDS: CachedMetadata[str] = CachedMetadata('gke-dashboard', ttl=_DAY)
+# Short, as the machine may move to another network.
+MACHINE_IPS: CachedMetadata[str] = CachedMetadata('machine-ip', ttl=5 * 60)
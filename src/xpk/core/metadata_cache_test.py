@@ -0,0 +1,72 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .metadata_cache import CachedMetadata
+from ..utils.file import get_cache_dir
+
+_CACHE: CachedMetadata[str] = CachedMetadata('test', ttl=60)
+
+
+@pytest.fixture(autouse=True)
+def config(mocker: MockerFixture):
+  return mocker.patch(
+      'xpk.core.metadata_cache.get_config', return_value=mocker.Mock()
+  )
+
+
+def test_get_returns_stored_value():
+  _CACHE.put(('project', 'cluster'), 'us-central1')
+
+  assert _CACHE.get(('project', 'cluster')) == 'us-central1'
+  assert _CACHE.get(('project', 'other-cluster')) is None
+
+
+def test_get_returns_none_when_entry_expired(mocker: MockerFixture):
+  time = mocker.patch('xpk.core.metadata_cache.time.time', return_value=1000)
+  _CACHE.put(('project',), 'value')
+
+  time.return_value = 1060
+
+  assert _CACHE.get(('project',)) is None
+
+
+def test_invalidate_removes_entries_with_key_prefix():
+  _CACHE.put(('project', 'cluster', 'zone'), 'a')
+  _CACHE.put(('project', 'cluster-2', 'zone'), 'b')
+
+  _CACHE.invalidate('project', 'cluster')
+
+  assert _CACHE.get(('project', 'cluster', 'zone')) is None
+  assert _CACHE.get(('project', 'cluster-2', 'zone')) == 'b'
+
+
+def test_cache_is_disabled_by_config(config):
+  config.return_value.get.return_value = 'false'
+
+  _CACHE.put(('project',), 'value')
+
+  assert _CACHE.get(('project',)) is None
+
+
+def test_cache_is_not_written_in_dry_run(mocker: MockerFixture):
+  mocker.patch('xpk.core.metadata_cache.is_dry_run', return_value=True)
+
+  _CACHE.put(('project',), 'value')
+
+  assert not (get_cache_dir() / 'metadata').exists()
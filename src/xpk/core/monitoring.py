@@ -16,6 +16,7 @@ limitations under the License.
 
 from ..utils.console import xpk_print
 from .commands import run_command_for_value
+from .metadata_cache import GKE_DASHBOARDS
 
 
 def get_gke_dashboard(args, dashboard_filter) -> tuple[bool, str | None]:
@@ -33,6 +34,12 @@ def get_gke_dashboard(args, dashboard_filter) -> tuple[bool, str | None]:
       identifier of dashboard if deployed in project,
       None otherwise.
   """
+  # Only dashboards that are found are cached, as they may be deployed later.
+  key = (args.project, dashboard_filter)
+  cached_dashboard = GKE_DASHBOARDS.get(key)
+  if cached_dashboard is not None:
+    return False, cached_dashboard
+
   command = (
       'gcloud monitoring dashboards list'
       f' --project={args.project} --filter="{dashboard_filter}"'
@@ -69,7 +76,9 @@ def get_gke_dashboard(args, dashboard_filter) -> tuple[bool, str | None]:
     return True, None
 
   if dashboards[0]:
-    return False, dashboards[0].strip().split('/')[-1]
+    dashboard = dashboards[0].strip().split('/')[-1]
+    GKE_DASHBOARDS.put(key, dashboard)
+    return False, dashboard
 
   return True, None
 
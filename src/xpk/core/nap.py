@@ -154,6 +154,7 @@ def enable_autoprovisioning_on_cluster(
       commands,
       'Update node pools with autoprovisioning support',
       task_names,
+      idempotent=True,
   )
   if maybe_failure:
     xpk_print(
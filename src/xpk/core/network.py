@@ -18,6 +18,7 @@ from ..utils.console import xpk_exit, xpk_print
 from ..utils.file import write_tmp_file
 from .commands import run_command_for_value, run_command_with_updates
 from .gcloud_context import zone_to_region, get_cluster_location
+from .gcp_api import compute_url, is_native_gcp_reads_enabled, list_json
 
 # cluster_network_yaml: the config when creating the network for a3 cluster
 CLUSTER_NETWORK_YAML = """
@@ -320,6 +321,9 @@ def get_all_networks_programmatic(args) -> tuple[list[str], int]:
   Returns:
     List of networks and 0 if successful and 1 otherwise.
   """
+  if is_native_gcp_reads_enabled():
+    return _list_global_resource_names(args, 'networks', 'Get All Networks')
+
   command = (
       'gcloud compute networks list --format="csv[no-heading](name)" '
       f' --project={args.project}'
@@ -374,6 +378,11 @@ def get_all_firewall_rules_programmatic(args) -> tuple[list[str], int]:
   Returns:
     List of firewall rules and 0 if successful and 1 otherwise.
   """
+  if is_native_gcp_reads_enabled():
+    return _list_global_resource_names(
+        args, 'firewalls', 'Get All Firewall Rules'
+    )
+
   command = (
       'gcloud compute firewall-rules list --format="csv[no-heading](name)" '
       f' --project={args.project}'
@@ -386,3 +395,15 @@ def get_all_firewall_rules_programmatic(args) -> tuple[list[str], int]:
     return [], 1
 
   return raw_subnets_output.splitlines(), 0
+
+
+def _list_global_resource_names(
+    args, collection: str, task: str
+) -> tuple[list[str], int]:
+  return_code, resources = list_json(
+      task, compute_url(args.project, 'global', collection), 'items'
+  )
+  if return_code != 0:
+    xpk_print(f'{task} returned ERROR {return_code}')
+    return [], 1
+  return [str(resource['name']) for resource in resources], 0
@@ -35,13 +35,17 @@ from .reservation import (
     ReservationLink,
 )
 from .commands import run_command_for_value, run_commands, FailedCommand
+from .operations import run_gke_operations
 from .gcloud_context import GkeServerConfig, get_cluster_location, zone_to_region
+from .gcp_api import container_url, get_json, is_native_gcp_reads_enabled, list_json
+from .metadata_cache import RESOURCE_POLICIES
 from .resources import (
     ConfigMapType,
     check_cluster_resources,
     update_cluster_configmap,
 )
 from .system_characteristics import AcceleratorType, SystemCharacteristics
+from .tracing import trace_phase
 
 
 CLOUD_PLATFORM_AUTH_SCOPE_URL = (
@@ -51,6 +55,7 @@ CLOUD_PLATFORM_AUTH_SCOPE_URL = (
 OLDER_PATHWAYS_CPU_NP_TO_DELETE = ['cpu-rm-np', 'cpu-proxy-np', 'cpu-user-np']
 
 
+@trace_phase('nodepools')
 def run_gke_node_pool_create_command(
     args, system: SystemCharacteristics, gke_node_pool_version: str
 ) -> int:
@@ -203,7 +208,8 @@ def run_gke_node_pool_create_command(
       xpk_print(
           f'To complete {delete_task_names[i]} we are executing {command}'
       )
-    maybe_failure = run_commands(
+    maybe_failure = _run_nodepool_commands(
+        args,
         delete_commands,
         'Delete Nodepools',
         delete_task_names,
@@ -233,6 +239,7 @@ def run_gke_node_pool_create_command(
           update_WI_commands,
           'Enable Workload Identity on existing Nodepools',
           update_WI_task_names,
+          idempotent=True,
       )
       if maybe_failure:
         xpk_print(
@@ -421,7 +428,8 @@ def run_gke_node_pool_create_command(
 
   for i, command in enumerate(create_commands):
     xpk_print(f'To complete {create_task_names[i]} we are executing {command}')
-  maybe_failure = run_commands(
+  maybe_failure = _run_nodepool_commands(
+      args,
       create_commands,
       'Create Nodepools',
       create_task_names,
@@ -443,6 +451,26 @@ def run_gke_node_pool_create_command(
   return 0
 
 
+def _run_nodepool_commands(
+    args,
+    commands: list[str],
+    jobname: str,
+    per_command_name: list[str],
+    batch: int = 10,
+) -> list[FailedCommand]:
+  """Runs node pool commands, tracking their operations if requested."""
+  if getattr(args, 'async_nodepool_operations', False) is True:
+    return run_gke_operations(
+        commands,
+        jobname,
+        per_command_name,
+        project=args.project,
+        location=get_cluster_location(args.project, args.cluster, args.zone),
+        batch=batch,
+    )
+  return run_commands(commands, jobname, per_command_name, batch=batch)
+
+
 def display_nodepool_creation_error(maybe_failure: FailedCommand) -> None:
   """Display nodepool creation errors to the user."""
 
@@ -528,6 +556,15 @@ def get_all_nodepools_programmatic(args) -> tuple[list[str], int]:
   Returns:
     List of nodepools and 0 if successful and 1 otherwise.
   """
+  if is_native_gcp_reads_enabled():
+    return_code, node_pools = list_json(
+        'Get All Node Pools', _get_cluster_url(args, 'nodePools'), 'nodePools'
+    )
+    if return_code != 0:
+      xpk_print(f'Get All Node Pools returned ERROR {return_code}')
+      return [], 1
+    return [str(node_pool['name']) for node_pool in node_pools], 0
+
   command = (
       'gcloud beta container node-pools list'
       ' --cluster'
@@ -557,6 +594,16 @@ def get_nodepool_zone(args, nodepool_name) -> tuple[int, str | None]:
     int is the return code - 0 if successful, 1 otherwise.
     str is the zone of nodepool.
   """
+  if is_native_gcp_reads_enabled():
+    return_code, node_pool = get_json(
+        'Get Node Pool Zone',
+        _get_cluster_url(args, 'nodePools', nodepool_name),
+    )
+    if return_code != 0 or node_pool is None:
+      xpk_print(f'Get Node Pool Zone returned ERROR {return_code}')
+      return 1, None
+    return 0, ';'.join(node_pool.get('locations') or [])
+
   command = (
       f'gcloud beta container node-pools describe {nodepool_name}'
       f' --cluster {args.cluster} --project={args.project}'
@@ -589,15 +636,18 @@ def get_gke_node_pool_version(
 
   # By default use the current gke master version for creating node pools.
   command_description = 'Determine current gke master version'
-  command = (
-      f'gcloud beta container clusters describe {args.cluster} --location'
-      f' {get_cluster_location(args.project, args.cluster, args.zone)} --project'
-      f' {args.project} --format="value(currentMasterVersion)"'
-  )
-
-  return_code, current_gke_master_version = run_command_for_value(
-      command, command_description
-  )
+  if is_native_gcp_reads_enabled():
+    return_code, cluster = get_json(command_description, _get_cluster_url(args))
+    current_gke_master_version = (cluster or {}).get('currentMasterVersion', '')
+  else:
+    command = (
+        f'gcloud beta container clusters describe {args.cluster} --location'
+        f' {get_cluster_location(args.project, args.cluster, args.zone)}'
+        f' --project {args.project} --format="value(currentMasterVersion)"'
+    )
+    return_code, current_gke_master_version = run_command_for_value(
+        command, command_description
+    )
   if return_code != 0:
     xpk_print(
         f'Unable to get server config for command: {command_description}.'
@@ -652,6 +702,20 @@ def get_nodepool_workload_metadata_mode(
     int is the return code - 0 if successful, 1 otherwise.
     str is the workload metadata mode of nodepool.
   """
+  if is_native_gcp_reads_enabled():
+    return_code, node_pool = get_json(
+        'Get Node Pool Workload Identity Metadata Mode',
+        _get_cluster_url(args, 'nodePools', nodepool_name),
+    )
+    if return_code != 0 or node_pool is None:
+      xpk_print(
+          'Get Node Pool Workload Identity Metadata Mode returned ERROR'
+          f' {return_code}'
+      )
+      return 1, None
+    config = node_pool.get('config') or {}
+    return 0, (config.get('workloadMetadataConfig') or {}).get('mode', '')
+
   command = (
       f'gcloud beta container node-pools describe {nodepool_name}'
       f' --cluster {args.cluster} --project={args.project}'
@@ -670,6 +734,16 @@ def get_nodepool_workload_metadata_mode(
   return 0, nodepool_WI_mode.strip()
 
 
+def _get_cluster_url(args, *path: str) -> str:
+  return container_url(
+      args.project,
+      get_cluster_location(args.project, args.cluster, args.zone),
+      'clusters',
+      args.cluster,
+      *path,
+  )
+
+
 def get_desired_node_pool_names(
     existing_node_pool_names: List[str],
     cluster_name: str,
@@ -695,6 +769,10 @@ def ensure_resource_policy_exists(
     topology: str,
     super_slicing: bool,
 ) -> None:
+  key = (project, zone_to_region(zone), resource_policy_name)
+  if RESOURCE_POLICIES.get(key):
+    return
+
   return_code, _ = run_command_for_value(
       (
           'gcloud beta compute resource-policies describe'
@@ -706,6 +784,7 @@ def ensure_resource_policy_exists(
   )
 
   if return_code == 0:
+    RESOURCE_POLICIES.put(key, True)
     return
 
   accelerator_topology_mode = (
@@ -722,6 +801,7 @@ def ensure_resource_policy_exists(
 
   if return_code != 0:
     raise RuntimeError('Unable to create resource policy')
+  RESOURCE_POLICIES.put(key, True)
 
 
 def _validate_reservation_count(
@@ -131,6 +131,21 @@ def test_ensure_resource_policy_exists_with_existing_policy_retrieves_existing_p
   )
 
 
+def test_ensure_resource_policy_exists_reuses_cached_policy(
+    commands_tester: CommandsTester,
+):
+  for _ in range(2):
+    ensure_resource_policy_exists(
+        resource_policy_name="resource-policy",
+        project="test-project",
+        zone="us-central1-a",
+        topology="2x2x1",
+        super_slicing=False,
+    )
+
+  assert len(commands_tester.commands_history) == 1
+
+
 def test_ensure_resource_policy_exists_without_existing_policy_creates_policy(
     commands_tester: CommandsTester,
 ):
@@ -1172,6 +1187,72 @@ def test_run_gke_node_pool_create_command_no_ignore_errors_returns_1(
   assert result == 1
 
 
+def test_run_gke_node_pool_create_command_async_operations(
+    mocker,
+    commands_tester: CommandsTester,
+):
+  """Tests that nodepools are created as tracked operations when requested."""
+  mocker.patch(
+      "xpk.core.nodepool.get_cluster_location", return_value="us-central1"
+  )
+  mocker.patch("xpk.core.capacity.verify_reservations_exist", return_value=0)
+  mocker.patch(
+      "xpk.core.nodepool.get_capacity_type", return_value=("on-demand", 0)
+  )
+  mocker.patch(
+      "xpk.core.nodepool.get_capacity_arguments_from_capacity_type",
+      return_value=("--on-demand", 0),
+  )
+  mock_run_commands = mocker.patch("xpk.core.nodepool.run_commands")
+  mock_run_gke_operations = mocker.patch(
+      "xpk.core.nodepool.run_gke_operations", return_value=[]
+  )
+  args = mocker.Mock(
+      num_slices=1,
+      reservation=None,
+      tpu_type="v4-8",
+      device_type=None,
+      cluster="test-cluster",
+      project="test-project",
+      zone="us-central1-a",
+      on_demand=False,
+      spot=False,
+      flex=False,
+      enable_workload_identity=False,
+      enable_gcsfuse_csi_driver=False,
+      host_maintenance_interval="AS_NEEDED",
+      custom_nodepool_arguments="",
+      super_slicing=False,
+      num_nodes=1,
+      async_nodepool_operations=True,
+  )
+  system = SystemCharacteristics(
+      topology="2x2x1",
+      vms_per_slice=2,
+      gke_accelerator="tpu-v4",
+      gce_machine_type="ct4p-hightpu-4t",
+      chips_per_vm=4,
+      accelerator_type=AcceleratorType.TPU,
+      device_type="v4-8",
+      requires_workload_policy=False,
+      supports_sub_slicing=False,
+      supports_super_slicing=False,
+      supports_accelerator_network_profile=True,
+      docker_platform=DockerPlatform.AMD,
+  )
+  commands_tester.set_result_for_command(
+      (0, ""), "gcloud beta container node-pools list"
+  )
+
+  result = run_gke_node_pool_create_command(args, system, "1.2.3")
+
+  assert result == 0
+  mock_run_commands.assert_not_called()
+  mock_run_gke_operations.assert_called_once()
+  assert mock_run_gke_operations.call_args.kwargs["project"] == "test-project"
+  assert mock_run_gke_operations.call_args.kwargs["location"] == "us-central1"
+
+
 def test_run_gke_node_pool_create_command_skips_reservation_check_when_no_nodepools_to_create_with_empty_reservation(
     mocker,
     commands_tester: CommandsTester,
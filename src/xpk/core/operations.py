@@ -0,0 +1,248 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from .commands import Command, FailedCommand, run_command_batch, run_command_for_value
+from .gcp_api import container_url, is_native_gcp_reads_enabled, list_json
+from ..utils.console import xpk_print
+from ..utils.execution_context import is_dry_run
+from ..utils.file import make_tmp_files
+from ..utils.progress import BatchProgress
+
+_OPERATION_NAME = re.compile(r'\boperation-[0-9a-z-]+\b')
+_POLL_INTERVAL_SECONDS = 20
+_MAX_POLL_FAILURES = 5
+_MAX_WAIT_SECONDS = 3 * 60 * 60
+
+
+@dataclass
+class _TrackedOperation:
+  index: int
+  name: str
+  status: str = 'PENDING'
+
+
+def run_gke_operations(
+    commands: list[str],
+    jobname: str,
+    per_command_name: list[str],
+    project: str,
+    location: str,
+    batch: int = 10,
+) -> list[FailedCommand]:
+  """Runs gcloud container commands with --async and waits for them.
+
+  Instead of keeping one gcloud process per command polling its own operation,
+  the operations are submitted and then all tracked by a single periodic
+  `gcloud container operations list`.
+
+  Args:
+    commands: gcloud container commands supporting --async.
+    jobname: the name of the job.
+    per_command_name: list of command names.
+    project: project of the cluster the commands operate on.
+    location: location of the cluster the commands operate on.
+    batch: maximum number of commands submitting operations in parallel.
+
+  Returns:
+    A list of FailedCommand instances of commands that failed to submit their
+    operation or whose operation failed.
+  """
+  async_commands = [f'{command} --async' for command in commands]
+  output_logs = make_tmp_files(per_command_name)
+
+  xpk_print(
+      f'Submitting a total of {len(commands)} operations with up to {batch} in'
+      ' parallel'
+  )
+  if is_dry_run():
+    xpk_print('Pretending all the operations succeeded')
+    return []
+
+  failures = run_command_batch(
+      async_commands,
+      jobname,
+      per_command_name,
+      output_logs,
+      max_parallelism=batch,
+  )
+  failed_names = {failure.name for failure in failures}
+
+  operations = []
+  for i, name in enumerate(per_command_name):
+    if name in failed_names:
+      continue
+    operation_name = _read_operation_name(output_logs[i])
+    if operation_name is None:
+      xpk_print(
+          f'Unable to find the operation started by {name}, logfile'
+          f' {output_logs[i]}'
+      )
+      failures.append(
+          FailedCommand(
+              return_code=1,
+              name=name,
+              command=async_commands[i],
+              logfile=output_logs[i],
+          )
+      )
+      continue
+    operations.append(_TrackedOperation(index=i, name=operation_name))
+
+  for operation, error in _wait_for_operations(
+      operations, jobname, per_command_name, output_logs, project, location
+  ):
+    with open(output_logs[operation.index], 'a', encoding='utf-8') as f:
+      f.write(f'\nOperation {operation.name} finished with error: {error}\n')
+    failures.append(
+        FailedCommand(
+            return_code=1,
+            name=per_command_name[operation.index],
+            command=async_commands[operation.index],
+            logfile=output_logs[operation.index],
+        )
+    )
+  return failures
+
+
+def _read_operation_name(output_log: str) -> str | None:
+  with open(output_log, encoding='utf-8', errors='replace') as f:
+    match = _OPERATION_NAME.search(f.read())
+  return match.group(0) if match else None
+
+
+def _wait_for_operations(
+    operations: list[_TrackedOperation],
+    jobname: str,
+    per_command_name: list[str],
+    output_logs: list[str],
+    project: str,
+    location: str,
+) -> list[tuple[_TrackedOperation, str]]:
+  """Polls operations until they are done, returns the failed ones."""
+  pending = {operation.name: operation for operation in operations}
+  failures: list[tuple[_TrackedOperation, str]] = []
+  progress = BatchProgress(
+      jobname,
+      [per_command_name[operation.index] for operation in operations],
+      [output_logs[operation.index] for operation in operations],
+  )
+  positions = {operation.name: i for i, operation in enumerate(operations)}
+  for i in range(len(operations)):
+    progress.set_running(i)
+  progress.refresh()
+  start_time = time.monotonic()
+  poll_failures = 0
+  while pending:
+    if time.monotonic() - start_time > _MAX_WAIT_SECONDS:
+      break
+    time.sleep(_POLL_INTERVAL_SECONDS)
+    statuses = _list_operations(project, location, list(pending))
+    if statuses is None:
+      poll_failures += 1
+      if poll_failures >= _MAX_POLL_FAILURES:
+        break
+      continue
+    poll_failures = 0
+
+    for operation_name, (status, error) in statuses.items():
+      operation = pending.get(operation_name)
+      if operation is None:
+        continue
+      operation.status = status
+      if status != 'DONE':
+        continue
+      del pending[operation_name]
+      progress.set_done(positions[operation_name], not error, error)
+      if error:
+        failures.append((operation, error))
+
+    progress.refresh()
+
+  progress.finish()
+  for operation in pending.values():
+    task = per_command_name[operation.index]
+    xpk_print(
+        f'Stopped waiting for task {task}, check the status of operation'
+        f' {operation.name} with `gcloud container operations describe'
+        f' {operation.name} --project={project} --location={location}`.'
+    )
+    failures.append(
+        (operation, f'status is unknown, last seen as {operation.status}')
+    )
+  return failures
+
+
+def _list_operations(
+    project: str, location: str, operation_names: list[str]
+) -> dict[str, tuple[str, str]] | None:
+  """Returns status and error message of operations, None if polling failed."""
+  if is_native_gcp_reads_enabled():
+    return_code, operations = list_json(
+        'Poll operations',
+        container_url(project, location, 'operations'),
+        'operations',
+    )
+    if return_code != 0:
+      return None
+    # The API returns all recent operations of the location.
+    names = set(operation_names)
+    return _get_statuses(
+        operation for operation in operations if operation['name'] in names
+    )
+
+  return_code, output = run_command_for_value(
+      Command(
+          argv=[
+              'gcloud',
+              'container',
+              'operations',
+              'list',
+              f'--project={project}',
+              f'--location={location}',
+              f'--filter=name=({" ".join(operation_names)})',
+              '--format=json',
+          ]
+      ),
+      'Poll operations',
+      dry_run_return_val='[]',
+      quiet=True,
+  )
+  if return_code != 0:
+    return None
+  try:
+    operations = json.loads(output)
+  except ValueError:
+    return None
+  return _get_statuses(operations)
+
+
+def _get_statuses(
+    operations: Iterable[dict[str, Any]],
+) -> dict[str, tuple[str, str]]:
+  return {
+      operation['name']: (
+          operation.get('status', ''),
+          (operation.get('error') or {}).get('message')
+          or operation.get('statusMessage', ''),
+      )
+      for operation in operations
+  }
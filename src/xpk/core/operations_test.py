@@ -0,0 +1,157 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .operations import run_gke_operations
+from .testing.commands_tester import CommandsTester
+
+_COMMANDS = [
+    'gcloud beta container node-pools create np-0',
+    'gcloud beta container node-pools create np-1',
+]
+_TASKS = ['NodepoolCreate-np-0', 'NodepoolCreate-np-1']
+
+
+@pytest.fixture
+def commands_tester(mocker: MockerFixture) -> CommandsTester:
+  mocker.patch('xpk.core.operations.time.sleep')
+  tester = CommandsTester(mocker)
+  tester.set_result_for_command(
+      (0, 'operation-1-aaa\n'), 'node-pools create np-0', '--async'
+  )
+  tester.set_result_for_command(
+      (0, 'operation-2-bbb\n'), 'node-pools create np-1', '--async'
+  )
+  return tester
+
+
+def _operations_list_result(*operations: dict) -> tuple[int, str]:
+  return 0, json.dumps(list(operations))
+
+
+def test_run_gke_operations_tracks_operations_with_single_poll(
+    commands_tester: CommandsTester,
+):
+  commands_tester.set_result_for_command(
+      _operations_list_result(
+          {'name': 'operation-1-aaa', 'status': 'DONE'},
+          {'name': 'operation-2-bbb', 'status': 'DONE'},
+      ),
+      'gcloud container operations list',
+  )
+
+  failures = run_gke_operations(
+      _COMMANDS, 'Create Nodepools', _TASKS, 'project', 'us-central1'
+  )
+
+  assert not failures
+  commands_tester.assert_command_run('node-pools create', '--async', times=2)
+  commands_tester.assert_command_run(
+      'gcloud container operations list',
+      '--project=project',
+      '--location=us-central1',
+      '--filter=name=(operation-1-aaa operation-2-bbb)',
+      times=1,
+  )
+
+
+def test_run_gke_operations_polls_until_operations_are_done(
+    commands_tester: CommandsTester, mocker: MockerFixture
+):
+  list_results = iter([
+      _operations_list_result(
+          {'name': 'operation-1-aaa', 'status': 'DONE'},
+          {'name': 'operation-2-bbb', 'status': 'RUNNING'},
+      ),
+      (1, 'transient error'),
+      _operations_list_result({'name': 'operation-2-bbb', 'status': 'DONE'}),
+  ])
+  mocker.patch(
+      'xpk.core.operations.run_command_for_value',
+      side_effect=lambda *args, **kwargs: next(list_results),
+  )
+
+  failures = run_gke_operations(
+      _COMMANDS, 'Create Nodepools', _TASKS, 'project', 'us-central1'
+  )
+
+  assert not failures
+
+
+def test_run_gke_operations_reports_failed_operations(
+    commands_tester: CommandsTester,
+):
+  commands_tester.set_result_for_command(
+      _operations_list_result(
+          {'name': 'operation-1-aaa', 'status': 'DONE'},
+          {
+              'name': 'operation-2-bbb',
+              'status': 'DONE',
+              'error': {'code': 8, 'message': 'lack of capacity'},
+          },
+      ),
+      'gcloud container operations list',
+  )
+
+  failures = run_gke_operations(
+      _COMMANDS, 'Create Nodepools', _TASKS, 'project', 'us-central1'
+  )
+
+  assert [f.name for f in failures] == ['NodepoolCreate-np-1']
+  with open(failures[0].logfile, encoding='utf-8') as f:
+    assert 'finished with error: lack of capacity' in f.read()
+
+
+def test_run_gke_operations_reports_failed_submissions(
+    commands_tester: CommandsTester,
+):
+  commands_tester.set_result_for_command(
+      (1, ''), 'node-pools create np-0', '--async'
+  )
+  commands_tester.set_result_for_command(
+      _operations_list_result({'name': 'operation-2-bbb', 'status': 'DONE'}),
+      'gcloud container operations list',
+  )
+
+  failures = run_gke_operations(
+      _COMMANDS, 'Create Nodepools', _TASKS, 'project', 'us-central1'
+  )
+
+  assert [f.name for f in failures] == ['NodepoolCreate-np-0']
+  commands_tester.assert_command_run(
+      'gcloud container operations list', '--filter=name=(operation-2-bbb)'
+  )
+
+
+def test_run_gke_operations_stops_after_repeated_poll_failures(
+    commands_tester: CommandsTester,
+):
+  commands_tester.set_result_for_command(
+      (1, ''), 'gcloud container operations list'
+  )
+
+  failures = run_gke_operations(
+      _COMMANDS, 'Create Nodepools', _TASKS, 'project', 'us-central1'
+  )
+
+  assert [f.name for f in failures] == _TASKS
+  commands_tester.assert_command_run(
+      'gcloud container operations list', times=5
+  )
@@ -21,6 +21,7 @@ from functools import lru_cache
 from typing import Any
 
 from .commands import run_command_with_updates, run_command_for_value
+from .gcp_api import compute_url, get_json, is_native_gcp_reads_enabled, list_json
 from .system_characteristics import AcceleratorType, SystemCharacteristics
 from ..utils.console import xpk_print, xpk_exit
 
@@ -177,6 +178,25 @@ def _get_reservation_cached(
   Returns:
     Reservation object or None on failure.
   """
+  if is_native_gcp_reads_enabled():
+    return_code, resource = get_json(
+        f'Get reservation {reservation.name}',
+        compute_url(
+            reservation.project,
+            'zones',
+            reservation.zone,
+            'reservations',
+            reservation.name,
+        ),
+    )
+    if return_code != 0 or not resource or resource.get('status') != 'READY':
+      return None
+    try:
+      return _parse_reservation(reservation, resource)
+    except (ValueError, IndexError, AttributeError) as e:
+      xpk_print(f'Error processing reservation data: {e}.')
+      return None
+
   command = (
       f'gcloud beta compute reservations describe {reservation.name} '
       f'--project={reservation.project} --zone={reservation.zone} '
@@ -466,6 +486,9 @@ def list_healthy_sub_blocks(
     filter_arg = 'healthInfo.healthStatus=HEALTHY'
     task_name = f'Count healthy fitting sub-blocks in {reservation.block_name}'
 
+  if is_native_gcp_reads_enabled():
+    return _list_healthy_sub_blocks_natively(reservation, task_name)
+
   command = (
       f'gcloud beta compute reservations sub-blocks list {reservation.name} '
       f'--block-name={reservation.block_name} '
@@ -494,21 +517,73 @@ def list_healthy_sub_blocks(
     return [], 1
 
 
+def _list_healthy_sub_blocks_natively(
+    reservation: BlockReservationLink | SubBlockReservationLink,
+    task_name: str,
+) -> tuple[list[ReservationSubBlock], int]:
+  return_code, sub_blocks = list_json(
+      task_name,
+      compute_url(
+          reservation.project,
+          'zones',
+          reservation.zone,
+          'reservations',
+          reservation.name,
+          'reservationBlocks',
+          reservation.block_name,
+          'reservationSubBlocks',
+      ),
+      'items',
+  )
+  if return_code != 0:
+    return [], return_code
+
+  try:
+    return [
+        _parse_reservation_sub_block(sub_block, reservation)
+        for sub_block in sub_blocks
+        if (sub_block.get('healthInfo') or {}).get('healthStatus') == 'HEALTHY'
+        and (
+            not isinstance(reservation, SubBlockReservationLink)
+            or sub_block.get('name') == reservation.sub_block_name
+        )
+    ], 0
+  except (ValueError, AttributeError) as e:
+    xpk_print(f'Error processing sub-block data: {e}.')
+    return [], 1
+
+
 def get_blocks_in_reservation(
     reservation: ReservationLink,
 ) -> tuple[list[BlockReservationLink], int]:
   """Get blocks in a reservation."""
-  command = (
-      f'gcloud beta compute reservations blocks list {reservation.name} '
-      f'--project={reservation.project} '
-      f'--zone={reservation.zone} '
-      '--format="value(name)"'
-  )
-  return_code, output = run_command_for_value(
-      command,
-      f'Get blocks in reservation {reservation.name}',
-      dry_run_return_val='block0',
-  )
+  if is_native_gcp_reads_enabled():
+    return_code, blocks = list_json(
+        f'Get blocks in reservation {reservation.name}',
+        compute_url(
+            reservation.project,
+            'zones',
+            reservation.zone,
+            'reservations',
+            reservation.name,
+            'reservationBlocks',
+        ),
+        'items',
+    )
+    block_names = [str(block.get('name', '')) for block in blocks]
+  else:
+    command = (
+        f'gcloud beta compute reservations blocks list {reservation.name} '
+        f'--project={reservation.project} '
+        f'--zone={reservation.zone} '
+        '--format="value(name)"'
+    )
+    return_code, output = run_command_for_value(
+        command,
+        f'Get blocks in reservation {reservation.name}',
+        dry_run_return_val='block0',
+    )
+    block_names = output.strip().splitlines()
   if return_code != 0:
     xpk_print(
         f'Get blocks in reservation {reservation.name} failed with'
@@ -523,6 +598,6 @@ def get_blocks_in_reservation(
           zone=reservation.zone,
           block_name=name,
       )
-      for name in output.strip().splitlines()
+      for name in block_names
       if name
   ], 0
@@ -39,7 +39,10 @@ from .reservation import (
     _get_reservation_cached,
     get_reservation_accelerator_type,
     ReservationSubBlock,
+    get_blocks_in_reservation,
+    list_healthy_sub_blocks,
 )
+from ..utils.feature_flags import FeatureFlags
 from .system_characteristics import (
     SystemCharacteristics,
     AcceleratorType,
@@ -584,3 +587,52 @@ def test_reservation_accelerator_type_derived_correctly_for_cpu():
   reservation_accelerator_type = get_reservation_accelerator_type(cpu_system)
 
   assert reservation_accelerator_type is None
+
+
+def test_reservation_blocks_and_sub_blocks_are_read_natively(
+    mocker, commands_tester: CommandsTester
+):
+  mocker.patch.object(FeatureFlags, 'NATIVE_GCP_READS_ENABLED', True)
+  list_json = mocker.patch(
+      'xpk.core.reservation.list_json',
+      side_effect=[
+          (0, [{'name': 'block0'}]),
+          (
+              0,
+              [
+                  {
+                      'name': 'sub0',
+                      'count': 16,
+                      'inUseCount': 4,
+                      'healthInfo': {'healthStatus': 'HEALTHY'},
+                  },
+                  {
+                      'name': 'sub1',
+                      'count': 16,
+                      'inUseCount': 0,
+                      'healthInfo': {'healthStatus': 'DEGRADED'},
+                  },
+              ],
+          ),
+      ],
+  )
+  reservation = ReservationLink(project='p', name='r', zone='z')
+
+  blocks, return_code = get_blocks_in_reservation(reservation)
+  sub_blocks, sub_blocks_return_code = list_healthy_sub_blocks(blocks[0])
+
+  assert return_code == 0 and sub_blocks_return_code == 0
+  assert blocks == [
+      BlockReservationLink(project='p', name='r', zone='z', block_name='block0')
+  ]
+  assert [
+      (b.link.sub_block_name, b.count, b.in_use_count) for b in sub_blocks
+  ] == [('sub0', 16, 4)]
+  assert (
+      list_json.call_args_list[1]
+      .args[1]
+      .endswith(
+          '/projects/p/zones/z/reservations/r/reservationBlocks/block0/reservationSubBlocks'
+      )
+  )
+  commands_tester.assert_command_not_run('gcloud')
@@ -30,6 +30,8 @@ from .capacity import (
 from .reservation import RESERVATION_CONFIG_KEY
 from .commands import run_command_for_value, run_commands
 from .config import XPK_CURRENT_VERSION
+from .kube_api import is_native_kubernetes_reads_enabled, read_config_map
+from .tracing import trace_phase
 from .system_characteristics import AcceleratorType, get_system_characteristics_by_device_type, SystemCharacteristics
 from enum import Enum
 
@@ -73,6 +75,17 @@ def get_cluster_configmap(
     key:value pairs stored in cluster ConfigMap.
   """
   config_map_name = get_config_map_name(cluster_name, config_map_type)
+  if is_native_kubernetes_reads_enabled():
+    return_code, config_map_object = read_config_map(
+        'GKE Cluster Get ConfigMap', config_map_name
+    )
+    if return_code != 0 or config_map_object is None:
+      xpk_print(
+          f'GKE Cluster Get ConfigMap request returned ERROR {return_code}'
+      )
+      return None
+    return dict(config_map_object.get('data') or {})
+
   command = (
       'kubectl get configmap'
       f' {config_map_name} -o=custom-columns="ConfigData:data"'
@@ -113,6 +126,7 @@ def _get_dry_run_config_map_value(config_map_type: ConfigMapType) -> str:
   return default_value
 
 
+@trace_phase('configmaps')
 def create_cluster_configmaps(
     args,
     system: SystemCharacteristics,
@@ -205,6 +219,7 @@ def _create_or_update_cluster_configmap(configmap_yml: dict[str, str]) -> int:
       commands,
       'GKE Cluster CreateOrUpdate ConfigMap(s)',
       task_names,
+      idempotent=True,
   )
   if maybe_failure:
     xpk_print(
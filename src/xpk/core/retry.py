@@ -0,0 +1,238 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import random
+import re
+import shlex
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+
+
+class ErrorClass(Enum):
+  """Represents how a failed gcloud/kubectl command should be retried."""
+
+  RATE_LIMIT = 'rate-limit'
+  TRANSIENT = 'transient'
+  PERMANENT = 'permanent'
+  UNKNOWN = 'unknown'
+
+
+_RATE_LIMIT_PATTERNS = [
+    r'\b(code|status|error)[=: ]+429\b',
+    r'\b429 Too Many Requests\b',
+    r'\bRESOURCE_EXHAUSTED\b',
+    r'\b(user)?rateLimitExceeded\b',
+    r'\bquota exceeded\b',
+    r'\bexceeded quota\b',
+    r'\boperation .* (is )?(currently )?in progress\b',
+    r'\bis currently (creating|deleting|updating|upgrading|repairing)\b',
+    r'\bplease wait and try again\b',
+]
+
+_TRANSIENT_PATTERNS = [
+    r'\b(code|status|error)[=: ]+50[0-4]\b',
+    r'\b50[0-4] (Internal Server Error|Bad Gateway|Service Unavailable|'
+    r'Gateway Timeout)\b',
+    r'(?-i:\b(INTERNAL|UNAVAILABLE|DEADLINE_EXCEEDED)\b)',
+    r'\binternal error\b',
+    r'\bconnection (reset|refused|aborted)\b',
+    r'\b(i/o|TLS handshake) timeout\b',
+    r'\bcontext deadline exceeded\b',
+    r'\btimed out\b',
+    r'\bunexpected EOF\b',
+    r'\bUnable to connect to the server\b',
+    r'\bfailed calling webhook\b',
+    r'\bno endpoints available for service\b',
+    r'\bServiceUnavailable\b',
+    r'\(Conflict\)',
+    r'\bthe object has been modified\b',
+    r'\bensure CRDs are installed first\b',
+    r"\bdoesn't have a resource type\b",
+]
+
+_PERMANENT_PATTERNS = [
+    r'(?-i:\b(NOT_FOUND|PERMISSION_DENIED|ALREADY_EXISTS|INVALID_ARGUMENT)\b)',
+    r'\((NotFound|Forbidden|AlreadyExists|Invalid|BadRequest)\)',
+    r'\b(code|status|error)[=: ]+40[034]\b',
+    r'\balready exists\b',
+    r'\binvalid argument\b',
+    r'\bunrecognized arguments\b',
+]
+
+_RATE_LIMIT_REGEX = re.compile('|'.join(_RATE_LIMIT_PATTERNS), re.IGNORECASE)
+_TRANSIENT_REGEX = re.compile('|'.join(_TRANSIENT_PATTERNS), re.IGNORECASE)
+_PERMANENT_REGEX = re.compile('|'.join(_PERMANENT_PATTERNS), re.IGNORECASE)
+
+
+def classify_command_error(output: str) -> ErrorClass:
+  """Classifies the output of a failed gcloud/kubectl command.
+
+  Args:
+    output: stdout and stderr of the failed command.
+
+  Returns:
+    ErrorClass of the failure, UNKNOWN if no known error was recognized.
+  """
+  if _RATE_LIMIT_REGEX.search(output):
+    return ErrorClass.RATE_LIMIT
+  if _TRANSIENT_REGEX.search(output):
+    return ErrorClass.TRANSIENT
+  if _PERMANENT_REGEX.search(output):
+    return ErrorClass.PERMANENT
+  return ErrorClass.UNKNOWN
+
+
+@dataclass(frozen=True)
+class BackoffPolicy:
+  """Exponential backoff with jitter."""
+
+  initial_seconds: float
+  max_seconds: float
+
+  def get_delay(self, attempt: int) -> float:
+    """Returns seconds to wait after the given (1-based) failed attempt."""
+    delay = min(self.max_seconds, self.initial_seconds * 2 ** (attempt - 1))
+    return random.uniform(delay / 2, delay)
+
+
+BACKOFF_POLICIES = {
+    ErrorClass.RATE_LIMIT: BackoffPolicy(initial_seconds=15, max_seconds=300),
+    ErrorClass.TRANSIENT: BackoffPolicy(initial_seconds=5, max_seconds=60),
+}
+
+
+def get_retry_delay(
+    error_class: ErrorClass,
+    attempt: int,
+    initial_seconds: float | None = None,
+) -> float | None:
+  """Returns seconds to wait before retrying, None if it should not be retried.
+
+  Args:
+    error_class: class of the error returned by the failed attempt.
+    attempt: number of the failed attempt, starting from 1.
+    initial_seconds: overrides the initial delay of transient errors.
+  """
+  policy = BACKOFF_POLICIES.get(error_class)
+  if policy is None:
+    return None
+  if initial_seconds is not None and error_class == ErrorClass.TRANSIENT:
+    policy = BackoffPolicy(
+        initial_seconds, max(initial_seconds, policy.max_seconds)
+    )
+  return policy.get_delay(attempt)
+
+
+class TokenBucket:
+  """Thread-safe token bucket handing out delays instead of blocking."""
+
+  def __init__(self, rate_per_second: float, capacity: float):
+    self._rate_per_second = rate_per_second
+    self._capacity = capacity
+    self._tokens = capacity
+    self._updated_at = time.monotonic()
+    self._lock = threading.Lock()
+
+  def reserve(self) -> float:
+    """Takes a token and returns the number of seconds to wait before use."""
+    with self._lock:
+      now = time.monotonic()
+      self._tokens = min(
+          self._capacity,
+          self._tokens + (now - self._updated_at) * self._rate_per_second,
+      )
+      self._updated_at = now
+      self._tokens -= 1
+      if self._tokens >= 0:
+        return 0.0
+      return -self._tokens / self._rate_per_second
+
+
+_DEFAULT_API = 'default'
+# Sized well below the default per-project mutating request quotas.
+_API_TOKEN_BUCKETS = {
+    'compute': TokenBucket(rate_per_second=10, capacity=20),
+    'container': TokenBucket(rate_per_second=5, capacity=20),
+    _DEFAULT_API: TokenBucket(rate_per_second=5, capacity=10),
+}
+
+_GCLOUD_RELEASE_TRACKS = ('alpha', 'beta')
+_MUTATING_VERBS = (
+    'create',
+    'delete',
+    'update',
+    'resize',
+    'upgrade',
+    'rollback',
+    'complete-upgrade',
+    'enable',
+    'disable',
+)
+_MUTATING_VERB_PREFIXES = ('add-', 'remove-', 'set-')
+_READ_VERBS = ('describe', 'list')
+_READ_VERB_PREFIXES = ('get-', 'list-', 'describe-')
+
+
+def get_mutating_gcloud_api(command: str) -> str | None:
+  """Returns the gcloud API group of a mutating gcloud command, None otherwise.
+
+  Args:
+    command: shell command, only its first gcloud invocation is considered.
+  """
+  try:
+    tokens = shlex.split(command)
+  except ValueError:
+    tokens = command.split()
+  if 'gcloud' not in tokens:
+    return None
+
+  args: list[str] = []
+  for token in tokens[tokens.index('gcloud') + 1 :]:
+    if token in ('&&', '||', '|', ';'):
+      break
+    if not token.startswith('-'):
+      args.append(token)
+  if args and args[0] in _GCLOUD_RELEASE_TRACKS:
+    args = args[1:]
+  if not args:
+    return None
+
+  # Groups come first and verbs are followed by positional arguments, so the
+  # first recognized verb decides.
+  for arg in args[1:]:
+    if arg in _MUTATING_VERBS or arg.startswith(_MUTATING_VERB_PREFIXES):
+      return args[0]
+    if arg in _READ_VERBS or arg.startswith(_READ_VERB_PREFIXES):
+      return None
+  return None
+
+
+def reserve_api_token(command: str) -> float:
+  """Rate-limits mutating gcloud commands per API.
+
+  Args:
+    command: command about to be executed.
+
+  Returns:
+    Seconds the caller has to wait before executing the command.
+  """
+  api = get_mutating_gcloud_api(command)
+  if api is None:
+    return 0.0
+  bucket = _API_TOKEN_BUCKETS.get(api, _API_TOKEN_BUCKETS[_DEFAULT_API])
+  return bucket.reserve()
@@ -0,0 +1,195 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .retry import BackoffPolicy, ErrorClass, TokenBucket, classify_command_error, get_mutating_gcloud_api, get_retry_delay
+
+
+@pytest.mark.parametrize(
+    argnames='output,expected',
+    argvalues=[
+        (
+            (
+                'ERROR: (gcloud.compute.instances.create) Quota exceeded for'
+                " quota metric 'Write requests'"
+            ),
+            ErrorClass.RATE_LIMIT,
+        ),
+        ('ResponseError: code=429, message=Too many', ErrorClass.RATE_LIMIT),
+        (
+            (
+                'code=400, message=Operation operation-123 is currently'
+                ' creating node pool np-1. Please wait and try again once it is'
+                ' done.'
+            ),
+            ErrorClass.RATE_LIMIT,
+        ),
+        (
+            'ResponseError: code=503, message=Backend error',
+            ErrorClass.TRANSIENT,
+        ),
+        ('read: connection reset by peer', ErrorClass.TRANSIENT),
+        (
+            (
+                'Internal error occurred: failed calling webhook'
+                ' "mresourceflavor.kb.io"'
+            ),
+            ErrorClass.TRANSIENT,
+        ),
+        (
+            (
+                'ERROR: (gcloud.container.clusters.describe) NOT_FOUND: cluster'
+                ' not found'
+            ),
+            ErrorClass.PERMANENT,
+        ),
+        (
+            (
+                'Error from server (Conflict): Operation cannot be fulfilled'
+                ' on deployments.apps "kueue-controller-manager": the object'
+                ' has been modified; please apply your changes to the latest'
+                ' version and try again'
+            ),
+            ErrorClass.TRANSIENT,
+        ),
+        (
+            'the object has been modified; please apply your changes',
+            ErrorClass.TRANSIENT,
+        ),
+        (
+            (
+                'error: resource mapping not found for name: "cluster-queue":'
+                ' no matches for kind "ClusterQueue" in version'
+                ' "kueue.x-k8s.io/v1beta1"\nensure CRDs are installed first'
+            ),
+            ErrorClass.TRANSIENT,
+        ),
+        (
+            'error: the server doesn\'t have a resource type "rayclusters"',
+            ErrorClass.TRANSIENT,
+        ),
+        (
+            (
+                'ERROR: (gcloud.container.node-pools.create) PERMISSION_DENIED:'
+                ' Required "container.clusters.update" permission'
+            ),
+            ErrorClass.PERMANENT,
+        ),
+        (
+            (
+                'Error from server (AlreadyExists): jobsets.jobset.x-k8s.io "w"'
+                ' already exists'
+            ),
+            ErrorClass.PERMANENT,
+        ),
+        (
+            (
+                'ERROR: (gcloud.container.node-pools.create) ResponseError:'
+                ' code=409, message=Already exists: projects/p/np-1.'
+            ),
+            ErrorClass.PERMANENT,
+        ),
+        (
+            'ERROR: (gcloud.compute.reservations.describe) INVALID_ARGUMENT',
+            ErrorClass.PERMANENT,
+        ),
+        ('Service account is unavailable to this user', ErrorClass.UNKNOWN),
+        ('', ErrorClass.UNKNOWN),
+    ],
+)
+def test_classify_command_error(output: str, expected: ErrorClass):
+  assert classify_command_error(output) == expected
+
+
+@pytest.mark.parametrize(
+    argnames='attempt,expected_max',
+    argvalues=[(1, 5), (2, 10), (3, 20), (10, 60)],
+)
+def test_backoff_policy_grows_exponentially_up_to_max(
+    attempt: int, expected_max: float
+):
+  policy = BackoffPolicy(initial_seconds=5, max_seconds=60)
+
+  delays = [policy.get_delay(attempt) for _ in range(50)]
+
+  assert all(expected_max / 2 <= d <= expected_max for d in delays)
+
+
+def test_get_retry_delay_does_not_retry_permanent_errors():
+  assert get_retry_delay(ErrorClass.PERMANENT, attempt=1) is None
+
+
+def test_get_retry_delay_does_not_back_off_unknown_errors():
+  assert get_retry_delay(ErrorClass.UNKNOWN, attempt=1) is None
+
+
+def test_get_retry_delay_waits_longer_for_rate_limits():
+  assert get_retry_delay(ErrorClass.RATE_LIMIT, attempt=1) > get_retry_delay(
+      ErrorClass.TRANSIENT, attempt=1
+  )
+
+
+def test_get_retry_delay_overrides_initial_transient_delay():
+  assert get_retry_delay(
+      ErrorClass.TRANSIENT, attempt=1, initial_seconds=1
+  ) == pytest.approx(0.75, abs=0.25)
+
+
+def test_token_bucket_returns_delays_once_capacity_is_used(
+    mocker: MockerFixture,
+):
+  mocker.patch('time.monotonic', return_value=100.0)
+  bucket = TokenBucket(rate_per_second=2, capacity=2)
+
+  delays = [bucket.reserve() for _ in range(4)]
+
+  assert delays == [0.0, 0.0, 0.5, 1.0]
+
+
+def test_token_bucket_refills_over_time(mocker: MockerFixture):
+  monotonic = mocker.patch('time.monotonic', return_value=100.0)
+  bucket = TokenBucket(rate_per_second=2, capacity=2)
+  bucket.reserve()
+  bucket.reserve()
+
+  monotonic.return_value = 101.0
+
+  assert bucket.reserve() == 0.0
+
+
+@pytest.mark.parametrize(
+    argnames='command,expected',
+    argvalues=[
+        (
+            'gcloud beta container node-pools create np-1 --cluster=c',
+            'container',
+        ),
+        ('gcloud compute resource-policies create p --project=x', 'compute'),
+        ('gcloud container clusters update c --enable-x', 'container'),
+        ('gcloud container clusters describe create', None),
+        ('gcloud container clusters get-credentials c', None),
+        ('gcloud compute networks subnets list', None),
+        ('kubectl delete pod foo', None),
+        (
+            'kubectl get nodes && gcloud compute routers create r',
+            'compute',
+        ),
+    ],
+)
+def test_get_mutating_gcloud_api(command: str, expected: str | None):
+  assert get_mutating_gcloud_api(command) == expected
@@ -33,6 +33,7 @@ from ..utils.console import xpk_exit, xpk_print
 from ..utils.file import ensure_directory_exists
 from ..utils import templates
 from .cluster import XPK_SA
+from .command_cache import invalidate_kubectl_cache
 
 yaml = ruamel.yaml.YAML()
 
@@ -330,6 +331,7 @@ def install_storage_crd(k8s_api_client: ApiClient) -> None:
         f"{os.path.dirname(__file__)}{STORAGE_CRD_PATH}",
         verbose=True,
     )
+    invalidate_kubectl_cache()
     xpk_print(f"Created a CRD: {STORAGE_CRD_NAME} successfully")
   except FailToCreateError as e:
     for api_exception in e.api_exceptions:
@@ -337,7 +339,7 @@ def install_storage_crd(k8s_api_client: ApiClient) -> None:
         xpk_print(
             f"CRD: {STORAGE_CRD_NAME} already exists. Skipping its creation"
         )
-      break
+        break
     else:
       xpk_print(f"Encountered error during installing Storage CRD: {e}")
       xpk_exit(1)
@@ -477,6 +479,7 @@ def save_storage_crds(k8s_api_client: ApiClient, data: Any):
       plural=STORAGE_CRD_PLURAL,
       body=data,
   )
+  invalidate_kubectl_cache()
   xpk_print(f"Created {STORAGE_CRD_KIND} object: {data['metadata']['name']}")
 
 
@@ -14,6 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 import dataclasses
 from typing import Callable, Literal, Optional
@@ -104,7 +105,7 @@ class GpuConfig:
     return f"GpuConfig({', '.join(parts)})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SystemCharacteristics:
   """Contains the defining characteristics of a specific accelerator system.
 
@@ -153,7 +154,7 @@ class SystemCharacteristics:
 
   def __post_init__(self):
     if self.accelerator_type == AcceleratorType.GPU:
-      self.requires_workload_policy = True
+      object.__setattr__(self, 'requires_workload_policy', True)
 
       if self.gpu_config is None:
         raise ValueError(
@@ -222,12 +223,19 @@ def generate_tpu_topologies(
     enforce_nondecreasing: whether to enforce A <= B <= C or not
   """
   topologies = ['2x2x1', '2x2x2', '2x2x4', '2x4x4']
-  MAX = 256
-  for x in range(4, MAX + 1, 4):
-    for y in range(x if enforce_nondecreasing else 4, MAX + 1, 4):
-      for z in range(y if enforce_nondecreasing else 4, MAX + 1, 4):
-        if (x // 4) * (y // 4) * (z // 4) <= max_cubes:
-          topologies.append(f'{x}x{y}x{z}')
+  MAX_CUBES_PER_DIMENSION = 256 // 4
+  # Cubes grow with each dimension, so loops stop at the first that is over.
+  for x in range(1, MAX_CUBES_PER_DIMENSION + 1):
+    for y in range(
+        x if enforce_nondecreasing else 1, MAX_CUBES_PER_DIMENSION + 1
+    ):
+      min_z = y if enforce_nondecreasing else 1
+      if x * y * min_z > max_cubes:
+        break
+      for z in range(min_z, MAX_CUBES_PER_DIMENSION + 1):
+        if x * y * z > max_cubes:
+          break
+        topologies.append(f'{4 * x}x{4 * y}x{4 * z}')
   return topologies
 
 
@@ -246,40 +254,178 @@ def get_tpu_system_characteristics_map(
     super_slicing_topologies: set[str] | None = None,
     parallel_containers: int = 1,
 ) -> dict[str, SystemCharacteristics]:
-  system_characteristics_map = {}
-  default_topologies = default_topologies or set()
-  sub_slicing_topologies = sub_slicing_topologies or set()
-  super_slicing_topologies = super_slicing_topologies or set()
-  for topology in supported_topologies:
-    chips_per_vm = compute_chips_per_vm(topology)
+  return dict(
+      _TpuSystemCharacteristicsMap(
+          prefix=prefix,
+          tensorcores_per_chip=tensorcores_per_chip,
+          gke_accelerator=gke_accelerator,
+          machine_type=machine_type,
+          supported_topologies=supported_topologies,
+          docker_platform=docker_platform,
+          supports_accelerator_network_profile=supports_accelerator_network_profile,
+          pathways_tpu_version=pathways_tpu_version,
+          tpu_type_requires_workload_policy=tpu_type_requires_workload_policy,
+          default_topologies=default_topologies,
+          sub_slicing_topologies=sub_slicing_topologies,
+          super_slicing_topologies=super_slicing_topologies,
+          parallel_containers=parallel_containers,
+      )
+  )
+
+
+class _TpuSystemCharacteristicsMap(Mapping[str, SystemCharacteristics]):
+  """TPU systems of a machine type, each created when first looked up.
+
+  Every topology is available as `<prefix>-<topology>` and as
+  `<prefix>-<tensorcores>`, the latter taken by the first topology with that
+  many tensorcores unless one of `default_topologies` has it. Names are derived
+  from the topologies alone, so listing them does not create any system.
+  """
+
+  accelerator_type = AcceleratorType.TPU
+
+  def __init__(
+      self,
+      prefix: str,
+      tensorcores_per_chip: int,
+      gke_accelerator: str,
+      machine_type: str,
+      supported_topologies: list[str],
+      docker_platform: DockerPlatform,
+      supports_accelerator_network_profile: bool,
+      pathways_tpu_version: str,
+      tpu_type_requires_workload_policy: bool = False,
+      default_topologies: set[str] | None = None,
+      sub_slicing_topologies: set[str] | None = None,
+      super_slicing_topologies: set[str] | None = None,
+      parallel_containers: int = 1,
+  ):
+    self._prefix = prefix
+    self._tensorcores_per_chip = tensorcores_per_chip
+    self._gke_accelerator = gke_accelerator
+    self._machine_type = machine_type
+    self._supported_topologies = supported_topologies
+    self._docker_platform = docker_platform
+    self._supports_accelerator_network_profile = (
+        supports_accelerator_network_profile
+    )
+    self._pathways_tpu_version = pathways_tpu_version
+    self._tpu_type_requires_workload_policy = tpu_type_requires_workload_policy
+    self._default_topologies = default_topologies or set()
+    self._sub_slicing_topologies = sub_slicing_topologies or set()
+    self._super_slicing_topologies = super_slicing_topologies or set()
+    self._parallel_containers = parallel_containers
+    self._topology_by_name: dict[str, str] | None = None
+    self._systems: dict[str, SystemCharacteristics] = {}
+
+  def __getitem__(self, name: str) -> SystemCharacteristics:
+    topology = self._get_topology_by_name()[name]
+    system = self._systems.get(topology)
+    if system is None:
+      system = self._systems[topology] = self._create_system(topology)
+    return system
+
+  def __contains__(self, name: object) -> bool:
+    return (
+        isinstance(name, str)
+        and name.startswith(f'{self._prefix}-')
+        and name in self._get_topology_by_name()
+    )
+
+  def __iter__(self) -> Iterator[str]:
+    return iter(self._get_topology_by_name())
+
+  def __len__(self) -> int:
+    return len(self._get_topology_by_name())
+
+  def _get_device_type(self, topology: str) -> str:
+    num_tensorcores = compute_num_tensorcores(
+        self._tensorcores_per_chip, topology
+    )
+    return f'{self._prefix}-{num_tensorcores}'
+
+  def _get_topology_by_name(self) -> dict[str, str]:
+    if self._topology_by_name is None:
+      topology_by_name: dict[str, str] = {}
+      for topology in self._supported_topologies:
+        device_type = self._get_device_type(topology)
+        topology_by_name[f'{self._prefix}-{topology}'] = topology
+        if (
+            topology in self._default_topologies
+            or device_type not in topology_by_name
+        ):
+          topology_by_name[device_type] = topology
+      self._topology_by_name = topology_by_name
+    return self._topology_by_name
+
+  def _create_system(self, topology: str) -> SystemCharacteristics:
     vms_per_slice = compute_vms_per_slice(topology)
-    num_tensorcores = compute_num_tensorcores(tensorcores_per_chip, topology)
-    device_type = f'{prefix}-{num_tensorcores}'
-    system = SystemCharacteristics(
+    return SystemCharacteristics(
         topology=topology,
         vms_per_slice=vms_per_slice,
-        gke_accelerator=gke_accelerator,
-        gce_machine_type=machine_type,
-        chips_per_vm=chips_per_vm,
+        gke_accelerator=self._gke_accelerator,
+        gce_machine_type=self._machine_type,
+        chips_per_vm=compute_chips_per_vm(topology),
         accelerator_type=AcceleratorType.TPU,
-        device_type=device_type,
-        requires_workload_policy=tpu_type_requires_workload_policy
+        device_type=self._get_device_type(topology),
+        requires_workload_policy=self._tpu_type_requires_workload_policy
         and vms_per_slice > 1,
-        supports_sub_slicing=topology in sub_slicing_topologies,
-        supports_super_slicing=topology in super_slicing_topologies,
-        supports_accelerator_network_profile=supports_accelerator_network_profile,
-        docker_platform=docker_platform,
-        parallel_containers=parallel_containers,
-        pathways_tpu_version=pathways_tpu_version,
+        supports_sub_slicing=topology in self._sub_slicing_topologies,
+        supports_super_slicing=topology in self._super_slicing_topologies,
+        supports_accelerator_network_profile=self._supports_accelerator_network_profile,
+        docker_platform=self._docker_platform,
+        parallel_containers=self._parallel_containers,
+        pathways_tpu_version=self._pathways_tpu_version,
     )
-    system_characteristics_map[f'{prefix}-{topology}'] = system
-    if (
-        topology in default_topologies
-        or device_type not in system_characteristics_map
-    ):
-      system_characteristics_map[device_type] = system
 
-  return system_characteristics_map
+
+class _SystemCharacteristicsMap(Mapping[str, SystemCharacteristics]):
+  """Systems by user facing name, merged from maps of accelerator families.
+
+  Like a dict literal unpacking the families in order: a name keeps the
+  position of its first family and the system of its last one. Looking up a
+  name only lists the names of TPU families with its prefix, and systems of
+  TPU families are only created when looked up.
+  """
+
+  def __init__(self, families: list[Mapping[str, SystemCharacteristics]]):
+    self._families = families
+    self._family_by_name: (
+        dict[str, Mapping[str, SystemCharacteristics]] | None
+    ) = None
+
+  def __getitem__(self, name: str) -> SystemCharacteristics:
+    for family in reversed(self._families):
+      if name in family:
+        return family[name]
+    raise KeyError(name)
+
+  def __contains__(self, name: object) -> bool:
+    return any(name in family for family in self._families)
+
+  def __iter__(self) -> Iterator[str]:
+    return iter(self._get_family_by_name())
+
+  def __len__(self) -> int:
+    return len(self._get_family_by_name())
+
+  def get_accelerator_type(self, name: str) -> AcceleratorType:
+    """Returns the accelerator type of a system without creating it."""
+    family = self._get_family_by_name()[name]
+    if isinstance(family, _TpuSystemCharacteristicsMap):
+      return family.accelerator_type
+    return family[name].accelerator_type
+
+  def _get_family_by_name(
+      self,
+  ) -> dict[str, Mapping[str, SystemCharacteristics]]:
+    if self._family_by_name is None:
+      family_by_name = {}
+      for family in self._families:
+        for name in family:
+          family_by_name[name] = family
+      self._family_by_name = family_by_name
+    return self._family_by_name
 
 
 def compute_chips_per_vm(topology: str) -> int:
@@ -301,240 +447,242 @@ IF YOU MODIFY THE BELOW UserFacingNameToSystemCharacteristics MAP YOU SHOULD
 ALSO ADD CORRESPONDING MODIFICATIONS TO UserFacingNameToSystemCharacteristics
 IN MaxText/accelerator_to_spec_map.py !!!!! """
 # vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
-UserFacingNameToSystemCharacteristics = {
-    # GPU system characteristics
-    # l4-$CHIPSc
-    'l4-1': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-l4',
-        gce_machine_type='g2-standard-12',
-        chips_per_vm=1,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='l4-1',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        gpu_config=GpuConfig(requires_topology=False),
-        docker_platform=AMD_PLATFORM,
-    ),
-    'l4-2': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-l4',
-        gce_machine_type='g2-standard-24',
-        chips_per_vm=2,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='l4-2',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        gpu_config=GpuConfig(requires_topology=False),
-        docker_platform=AMD_PLATFORM,
-    ),
-    'l4-4': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-l4',
-        gce_machine_type='g2-standard-48',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='l4-4',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        gpu_config=GpuConfig(requires_topology=False),
-        docker_platform=AMD_PLATFORM,
-    ),
-    'l4-8': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-l4',
-        gce_machine_type='g2-standard-96',
-        chips_per_vm=8,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='l4-8',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        gpu_config=GpuConfig(requires_topology=False),
-        docker_platform=AMD_PLATFORM,
-    ),
-    # A100-40gb-$CHIPSc
-    'a100-40gb-1': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-tesla-a100',
-        gce_machine_type='a2-highgpu-1g',
-        chips_per_vm=1,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='a100-40gb-1',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        gpu_config=GpuConfig(requires_topology=False),
-        docker_platform=AMD_PLATFORM,
-    ),
-    'a100-40gb-2': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-tesla-a100',
-        gce_machine_type='a2-highgpu-2g',
-        chips_per_vm=2,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='a100-40gb-2',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        gpu_config=GpuConfig(requires_topology=False),
-        docker_platform=AMD_PLATFORM,
-    ),
-    'a100-40gb-4': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-tesla-a100',
-        gce_machine_type='a2-highgpu-4g',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='a100-40gb-4',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        gpu_config=GpuConfig(requires_topology=False),
-        docker_platform=AMD_PLATFORM,
-    ),
-    'a100-40gb-8': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-tesla-a100',
-        gce_machine_type='a2-highgpu-8g',
-        chips_per_vm=8,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='a100-40gb-8',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        gpu_config=GpuConfig(requires_topology=False),
-        docker_platform=AMD_PLATFORM,
-    ),
-    'gb200-4': SystemCharacteristics(
-        topology='1x72',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-gb200',
-        gce_machine_type='a4x-highgpu-4g',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='gb200-4',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=True,
-        gpu_config=GpuConfig(
-            requires_topology=True,
-            nccl_installer=INSTALLER_NCCL_RDMA_A4X,
-            jobset_decorator_fn=rdma_decorator.decorate_jobset,
-            gpu_direct_name='rdma',
+UserFacingNameToSystemCharacteristics = _SystemCharacteristicsMap([
+    {
+        # GPU system characteristics
+        # l4-$CHIPSc
+        'l4-1': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-l4',
+            gce_machine_type='g2-standard-12',
+            chips_per_vm=1,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='l4-1',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            gpu_config=GpuConfig(requires_topology=False),
+            docker_platform=AMD_PLATFORM,
         ),
-        docker_platform=ARM_PLATFORM,
-    ),
-    'gb200-4-nolssd': SystemCharacteristics(
-        topology='1x72',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-gb200',
-        gce_machine_type='a4x-highgpu-4g-nolssd',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='gb200-4',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=True,
-        gpu_config=GpuConfig(
-            requires_topology=True,
-            nccl_installer=INSTALLER_NCCL_RDMA_A4X,
-            jobset_decorator_fn=rdma_decorator.decorate_jobset,
-            gpu_direct_name='rdma',
+        'l4-2': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-l4',
+            gce_machine_type='g2-standard-24',
+            chips_per_vm=2,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='l4-2',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            gpu_config=GpuConfig(requires_topology=False),
+            docker_platform=AMD_PLATFORM,
         ),
-        docker_platform=ARM_PLATFORM,
-    ),
-    'b200-8': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-b200',
-        gce_machine_type='a4-highgpu-8g',
-        chips_per_vm=8,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='b200-8',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=True,
-        gpu_config=GpuConfig(
-            requires_topology=True,
-            nccl_installer=INSTALLER_NCCL_RDMA,
-            jobset_decorator_fn=rdma_decorator.decorate_jobset,
-            gpu_direct_name='rdma',
+        'l4-4': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-l4',
+            gce_machine_type='g2-standard-48',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='l4-4',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            gpu_config=GpuConfig(requires_topology=False),
+            docker_platform=AMD_PLATFORM,
         ),
-        docker_platform=AMD_PLATFORM,
-    ),
-    'h200-141gb-8': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-h200-141gb',
-        gce_machine_type='a3-ultragpu-8g',
-        chips_per_vm=8,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='h200-141gb-8',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=True,
-        gpu_config=GpuConfig(
-            requires_topology=True,
-            nccl_installer=INSTALLER_NCCL_RDMA,
-            jobset_decorator_fn=rdma_decorator.decorate_jobset,
-            gpu_direct_name='rdma',
+        'l4-8': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-l4',
+            gce_machine_type='g2-standard-96',
+            chips_per_vm=8,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='l4-8',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            gpu_config=GpuConfig(requires_topology=False),
+            docker_platform=AMD_PLATFORM,
         ),
-        docker_platform=AMD_PLATFORM,
-    ),
-    # H100-80gb-$CHIPS
-    'h100-80gb-8': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-h100-80gb',
-        gce_machine_type='a3-highgpu-8g',
-        chips_per_vm=8,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='h100-80gb-8',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=True,
-        gpu_config=GpuConfig(
-            requires_topology=True,
-            nccl_installer=INSTALLER_NCCL_TCPX,
-            jobset_decorator_fn=tcpx_decorator.decorate_jobset,
-            gpu_direct_name='tcpx',
+        # A100-40gb-$CHIPSc
+        'a100-40gb-1': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-tesla-a100',
+            gce_machine_type='a2-highgpu-1g',
+            chips_per_vm=1,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='a100-40gb-1',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            gpu_config=GpuConfig(requires_topology=False),
+            docker_platform=AMD_PLATFORM,
         ),
-        docker_platform=AMD_PLATFORM,
-    ),
-    # H100-mega-80gb-$CHIPS
-    'h100-mega-80gb-8': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='nvidia-h100-mega-80gb',
-        gce_machine_type='a3-megagpu-8g',
-        chips_per_vm=8,
-        accelerator_type=AcceleratorType.GPU,
-        device_type='h100-mega-80gb-8',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=True,
-        gpu_config=GpuConfig(
-            requires_topology=True,
-            nccl_installer=INSTALLER_NCCL_TCPXO,
-            jobset_decorator_fn=tcpxo_decorator.decorate_jobset,
-            gpu_direct_name='tcpxo',
+        'a100-40gb-2': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-tesla-a100',
+            gce_machine_type='a2-highgpu-2g',
+            chips_per_vm=2,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='a100-40gb-2',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            gpu_config=GpuConfig(requires_topology=False),
+            docker_platform=AMD_PLATFORM,
         ),
-        docker_platform=AMD_PLATFORM,
-    ),
+        'a100-40gb-4': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-tesla-a100',
+            gce_machine_type='a2-highgpu-4g',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='a100-40gb-4',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            gpu_config=GpuConfig(requires_topology=False),
+            docker_platform=AMD_PLATFORM,
+        ),
+        'a100-40gb-8': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-tesla-a100',
+            gce_machine_type='a2-highgpu-8g',
+            chips_per_vm=8,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='a100-40gb-8',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            gpu_config=GpuConfig(requires_topology=False),
+            docker_platform=AMD_PLATFORM,
+        ),
+        'gb200-4': SystemCharacteristics(
+            topology='1x72',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-gb200',
+            gce_machine_type='a4x-highgpu-4g',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='gb200-4',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=True,
+            gpu_config=GpuConfig(
+                requires_topology=True,
+                nccl_installer=INSTALLER_NCCL_RDMA_A4X,
+                jobset_decorator_fn=rdma_decorator.decorate_jobset,
+                gpu_direct_name='rdma',
+            ),
+            docker_platform=ARM_PLATFORM,
+        ),
+        'gb200-4-nolssd': SystemCharacteristics(
+            topology='1x72',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-gb200',
+            gce_machine_type='a4x-highgpu-4g-nolssd',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='gb200-4',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=True,
+            gpu_config=GpuConfig(
+                requires_topology=True,
+                nccl_installer=INSTALLER_NCCL_RDMA_A4X,
+                jobset_decorator_fn=rdma_decorator.decorate_jobset,
+                gpu_direct_name='rdma',
+            ),
+            docker_platform=ARM_PLATFORM,
+        ),
+        'b200-8': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-b200',
+            gce_machine_type='a4-highgpu-8g',
+            chips_per_vm=8,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='b200-8',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=True,
+            gpu_config=GpuConfig(
+                requires_topology=True,
+                nccl_installer=INSTALLER_NCCL_RDMA,
+                jobset_decorator_fn=rdma_decorator.decorate_jobset,
+                gpu_direct_name='rdma',
+            ),
+            docker_platform=AMD_PLATFORM,
+        ),
+        'h200-141gb-8': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-h200-141gb',
+            gce_machine_type='a3-ultragpu-8g',
+            chips_per_vm=8,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='h200-141gb-8',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=True,
+            gpu_config=GpuConfig(
+                requires_topology=True,
+                nccl_installer=INSTALLER_NCCL_RDMA,
+                jobset_decorator_fn=rdma_decorator.decorate_jobset,
+                gpu_direct_name='rdma',
+            ),
+            docker_platform=AMD_PLATFORM,
+        ),
+        # H100-80gb-$CHIPS
+        'h100-80gb-8': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-h100-80gb',
+            gce_machine_type='a3-highgpu-8g',
+            chips_per_vm=8,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='h100-80gb-8',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=True,
+            gpu_config=GpuConfig(
+                requires_topology=True,
+                nccl_installer=INSTALLER_NCCL_TCPX,
+                jobset_decorator_fn=tcpx_decorator.decorate_jobset,
+                gpu_direct_name='tcpx',
+            ),
+            docker_platform=AMD_PLATFORM,
+        ),
+        # H100-mega-80gb-$CHIPS
+        'h100-mega-80gb-8': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='nvidia-h100-mega-80gb',
+            gce_machine_type='a3-megagpu-8g',
+            chips_per_vm=8,
+            accelerator_type=AcceleratorType.GPU,
+            device_type='h100-mega-80gb-8',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=True,
+            gpu_config=GpuConfig(
+                requires_topology=True,
+                nccl_installer=INSTALLER_NCCL_TCPXO,
+                jobset_decorator_fn=tcpxo_decorator.decorate_jobset,
+                gpu_direct_name='tcpxo',
+            ),
+            docker_platform=AMD_PLATFORM,
+        ),
+    },
     # TPU system characteristics
-    **get_tpu_system_characteristics_map(
+    _TpuSystemCharacteristicsMap(
         prefix='tpu7',
         tensorcores_per_chip=2,
         gke_accelerator='tpu7',
@@ -545,7 +693,7 @@ UserFacingNameToSystemCharacteristics = {
         docker_platform=AMD_PLATFORM,
         pathways_tpu_version='tpu7',
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuSystemCharacteristicsMap(
         prefix='tpu7',
         tensorcores_per_chip=2,
         gke_accelerator='tpu7',
@@ -569,7 +717,7 @@ UserFacingNameToSystemCharacteristics = {
         ]),
         pathways_tpu_version='tpu7',
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuSystemCharacteristicsMap(
         prefix='tpu7x',
         tensorcores_per_chip=2,
         gke_accelerator='tpu7x',
@@ -580,7 +728,7 @@ UserFacingNameToSystemCharacteristics = {
         docker_platform=AMD_PLATFORM,
         pathways_tpu_version='tpu7x',
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuSystemCharacteristicsMap(
         prefix='tpu7x',
         tensorcores_per_chip=2,
         gke_accelerator='tpu7x',
@@ -693,7 +841,7 @@ UserFacingNameToSystemCharacteristics = {
             '8x8x92',
         ]),
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuSystemCharacteristicsMap(
         prefix='v6e',
         tensorcores_per_chip=1,
         gke_accelerator='tpu-v6e-slice',
@@ -703,7 +851,7 @@ UserFacingNameToSystemCharacteristics = {
         supports_accelerator_network_profile=True,
         pathways_tpu_version='tpuv6e',
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuSystemCharacteristicsMap(
         prefix='v6e',
         tensorcores_per_chip=1,
         gke_accelerator='tpu-v6e-slice',
@@ -714,7 +862,7 @@ UserFacingNameToSystemCharacteristics = {
         supports_accelerator_network_profile=True,
         pathways_tpu_version='tpuv6e',
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuSystemCharacteristicsMap(
         prefix='v5p',
         tensorcores_per_chip=2,
         gke_accelerator='tpu-v5p-slice',
@@ -822,7 +970,7 @@ UserFacingNameToSystemCharacteristics = {
             '16x20x28',
         ]),
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuSystemCharacteristicsMap(
         prefix='v5litepod',
         tensorcores_per_chip=1,
         gke_accelerator='tpu-v5-lite-podslice',
@@ -832,7 +980,7 @@ UserFacingNameToSystemCharacteristics = {
         supports_accelerator_network_profile=False,
         pathways_tpu_version='tpuv5e',
     ),
-    **get_tpu_system_characteristics_map(
+    _TpuSystemCharacteristicsMap(
         prefix='v4',
         tensorcores_per_chip=2,
         gke_accelerator='tpu-v4-podslice',
@@ -857,311 +1005,313 @@ UserFacingNameToSystemCharacteristics = {
             '8x16x16',
         ]),
     ),
-    # CPU system characteristics.
-    # Note that chips_per_vm is actually the number of vCPUs in that CPU.
-    # There are no chips in CPUs.
-    # m1-megamem-#vCPUs-#VMs
-    'm1-megamem-96-1': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='N/A',
-        gce_machine_type='m1-megamem-96',
-        chips_per_vm=96,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='m1-megamem-96-1',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    # n2-standard-#vCPUs-#VMs
-    'n2-standard-64-1': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-64',
-        chips_per_vm=64,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-64-1',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-4-1': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-4',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-4-1',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-4-2': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=2,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-4',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-4-2',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-4-4': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=4,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-4',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-4-4',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-4-8': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=8,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-4',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-4-8',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-4-16': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=16,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-4',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-4-16',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-4-32': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=32,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-4',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-4-32',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-4-64': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=64,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-4',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-4-64',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-4-128': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=128,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-4',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-4-128',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-4-256': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=256,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-4',
-        chips_per_vm=4,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-4-256',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-32-1': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-32',
-        chips_per_vm=32,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-32-1',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-32-2': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=2,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-32',
-        chips_per_vm=32,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-32-2',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-32-4': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=4,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-32',
-        chips_per_vm=32,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-32-4',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-32-8': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=8,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-32',
-        chips_per_vm=32,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-32-8',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-32-16': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=16,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-32',
-        chips_per_vm=32,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-32-16',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-32-32': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=32,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-32',
-        chips_per_vm=32,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-32-32',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-32-64': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=64,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-32',
-        chips_per_vm=32,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-32-64',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-32-128': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=128,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-32',
-        chips_per_vm=32,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-32-128',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-32-256': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=256,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-32',
-        chips_per_vm=32,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-32-256',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-32-512': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=512,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-32',
-        chips_per_vm=32,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-32-512',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-32-1024': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=1024,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-32',
-        chips_per_vm=32,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-32-1024',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-    'n2-standard-32-2048': SystemCharacteristics(
-        topology='N/A',
-        vms_per_slice=2048,
-        gke_accelerator='N/A',
-        gce_machine_type='n2-standard-32',
-        chips_per_vm=32,
-        accelerator_type=AcceleratorType.CPU,
-        device_type='n2-standard-32-2048',
-        supports_sub_slicing=False,
-        supports_super_slicing=False,
-        supports_accelerator_network_profile=False,
-        docker_platform=AMD_PLATFORM,
-    ),
-}
+    {
+        # CPU system characteristics.
+        # Note that chips_per_vm is actually the number of vCPUs in that CPU.
+        # There are no chips in CPUs.
+        # m1-megamem-#vCPUs-#VMs
+        'm1-megamem-96-1': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='N/A',
+            gce_machine_type='m1-megamem-96',
+            chips_per_vm=96,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='m1-megamem-96-1',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        # n2-standard-#vCPUs-#VMs
+        'n2-standard-64-1': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-64',
+            chips_per_vm=64,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-64-1',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-4-1': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-4',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-4-1',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-4-2': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=2,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-4',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-4-2',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-4-4': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=4,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-4',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-4-4',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-4-8': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=8,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-4',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-4-8',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-4-16': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=16,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-4',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-4-16',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-4-32': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=32,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-4',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-4-32',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-4-64': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=64,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-4',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-4-64',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-4-128': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=128,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-4',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-4-128',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-4-256': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=256,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-4',
+            chips_per_vm=4,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-4-256',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-32-1': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-32',
+            chips_per_vm=32,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-32-1',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-32-2': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=2,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-32',
+            chips_per_vm=32,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-32-2',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-32-4': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=4,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-32',
+            chips_per_vm=32,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-32-4',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-32-8': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=8,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-32',
+            chips_per_vm=32,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-32-8',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-32-16': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=16,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-32',
+            chips_per_vm=32,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-32-16',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-32-32': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=32,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-32',
+            chips_per_vm=32,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-32-32',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-32-64': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=64,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-32',
+            chips_per_vm=32,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-32-64',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-32-128': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=128,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-32',
+            chips_per_vm=32,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-32-128',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-32-256': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=256,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-32',
+            chips_per_vm=32,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-32-256',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-32-512': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=512,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-32',
+            chips_per_vm=32,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-32-512',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-32-1024': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=1024,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-32',
+            chips_per_vm=32,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-32-1024',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+        'n2-standard-32-2048': SystemCharacteristics(
+            topology='N/A',
+            vms_per_slice=2048,
+            gke_accelerator='N/A',
+            gce_machine_type='n2-standard-32',
+            chips_per_vm=32,
+            accelerator_type=AcceleratorType.CPU,
+            device_type='n2-standard-32-2048',
+            supports_sub_slicing=False,
+            supports_super_slicing=False,
+            supports_accelerator_network_profile=False,
+            docker_platform=AMD_PLATFORM,
+        ),
+    },
+])
 """ If you modify UserFacingNameToSystemCharacteristics you should also modify
 the corresponding Map in MaxText/accelerator_to_spec_map.py """
 
@@ -1174,8 +1324,9 @@ def get_system_characteristics_keys_by_accelerator_type(
     accelerators = list(AcceleratorType)
   return [
       key
-      for key, value in UserFacingNameToSystemCharacteristics.items()
-      if value.accelerator_type in accelerators
+      for key in UserFacingNameToSystemCharacteristics
+      if UserFacingNameToSystemCharacteristics.get_accelerator_type(key)
+      in accelerators
   ]
 
 
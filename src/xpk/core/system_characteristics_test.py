@@ -14,8 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import dataclasses
 import pytest
 from .system_characteristics import (
+    _SystemCharacteristicsMap,
+    _TpuSystemCharacteristicsMap,
     get_tpu_system_characteristics_map,
     generate_tpu_topologies,
     DockerPlatform,
@@ -247,3 +250,52 @@ def test_system_characteristics_post_init_throws_for_gpu_without_config():
         supports_accelerator_network_profile=False,
         docker_platform=DockerPlatform.AMD,
     )
+
+
+def _create_test_tpu_systems(prefix: str) -> _TpuSystemCharacteristicsMap:
+  return _TpuSystemCharacteristicsMap(
+      prefix=prefix,
+      tensorcores_per_chip=2,
+      gke_accelerator="test",
+      machine_type="test",
+      supported_topologies=generate_tpu_topologies(max_cubes=4),
+      docker_platform=DockerPlatform.AMD,
+      supports_accelerator_network_profile=False,
+      pathways_tpu_version="test",
+  )
+
+
+def test_system_characteristics_map_creates_only_looked_up_systems(mocker):
+  create_system = mocker.spy(_TpuSystemCharacteristicsMap, "_create_system")
+  systems = _SystemCharacteristicsMap(
+      [_create_test_tpu_systems("a"), _create_test_tpu_systems("b")]
+  )
+
+  assert "a-4x4x4" in systems
+  assert len(systems) == 2 * len(_create_test_tpu_systems("a"))
+  assert systems.get_accelerator_type("b-16") == AcceleratorType.TPU
+  create_system.assert_not_called()
+
+  assert systems["b-2x2x2"].device_type == "b-16"
+  assert systems["b-16"] is systems["b-2x2x2"]
+  create_system.assert_called_once()
+
+
+def test_system_characteristics_map_merges_families_like_dict_literal():
+  first = _create_test_tpu_systems("a")
+  overriding = {"a-2x2x1": first["a-2x2x2"], "c": first["a-4x4x4"]}
+
+  systems = _SystemCharacteristicsMap([first, overriding])
+
+  assert list(systems) == [*first, "c"]
+  assert systems["a-2x2x1"].topology == "2x2x2"
+  assert "d" not in systems
+  with pytest.raises(KeyError):
+    _ = systems["d"]
+
+
+def test_system_characteristics_is_immutable():
+  system = _create_test_tpu_systems("a")["a-2x2x1"]
+
+  with pytest.raises(dataclasses.FrozenInstanceError):
+    system.topology = "2x2x2"
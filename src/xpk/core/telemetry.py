@@ -22,15 +22,26 @@ import time
 import sys
 import importlib
 import subprocess
-import tempfile
-import requests
 from enum import Enum
+from pathlib import Path
 from typing import Any
 from dataclasses import dataclass
-from .config import get_config, CLIENT_ID_KEY, SEND_TELEMETRY_KEY, __version__ as xpk_version
+from .config import get_config, CLIENT_ID_KEY, SEND_TELEMETRY_KEY, SEND_TIMING_TELEMETRY_KEY, __version__ as xpk_version
+from .tracing import TimingSummary
 from ..utils.execution_context import is_dry_run
 from ..utils.user_agent import get_user_agent
 from ..utils.feature_flags import FeatureFlags, is_tester
+from ..utils.file import file_lock, get_cache_dir, write_text_atomically
+
+# Payloads are spooled on disk and sent in batches, so sweeps running many
+# xpk commands do not start an uploader process for each of them.
+_FLUSH_INTERVAL_SECONDS = 60
+_FLUSH_SPOOL_BYTES = 256 * 1024
+_MAX_SPOOLED_PAYLOADS = 1000
+_MAX_PAYLOAD_AGE_SECONDS = 7 * 24 * 60 * 60
+_UPLOAD_TIMEOUT_SECONDS = 30
+_SPOOL_LOCK_FILE = "spool.lock"
+_LAST_FLUSH_FILE = "last_flush"
 
 
 def should_send_telemetry():
@@ -40,40 +51,79 @@ def should_send_telemetry():
   )
 
 
+def should_send_timing_telemetry() -> bool:
+  """Timing events are opt-in, on top of telemetry being enabled."""
+  return (
+      should_send_telemetry()
+      and get_config().get(SEND_TIMING_TELEMETRY_KEY) == "true"
+  )
+
+
+def get_telemetry_spool_dir() -> Path:
+  return get_cache_dir() / "telemetry"
+
+
 def send_clearcut_payload(data: str, wait_to_complete: bool = False) -> None:
-  """Sends payload to clearcut endpoint."""
+  """Spools payload and schedules a flush of the spool when one is due.
+
+  Spooled payloads are sent to the clearcut endpoint in a single request, at
+  most once per _FLUSH_INTERVAL_SECONDS, or sooner once the spool grows to
+  _FLUSH_SPOOL_BYTES.
+
+  Args:
+    data: clearcut payload to send.
+    wait_to_complete: whether to flush the spool now and wait for it.
+  """
   try:
-    file_path = _store_payload_in_temp_file(data)
-    if not _schedule_clearcut_background_flush(file_path, wait_to_complete):
-      _clearcut_flush(file_path)
+    spool_dir = get_telemetry_spool_dir()
+    if not _spool_payload(spool_dir, data, force_flush=wait_to_complete):
+      return
+    if not _schedule_clearcut_background_flush(spool_dir, wait_to_complete):
+      flush_telemetry_spool(spool_dir)
   except Exception:  # pylint: disable=broad-exception-caught
     pass
 
 
-def _store_payload_in_temp_file(data: str) -> str:
-  with tempfile.NamedTemporaryFile(
-      mode="w", delete=False, encoding="utf-8"
-  ) as file:
-    json.dump(
-        {
-            "data": data,
-            "url": "https://play.googleapis.com/log",
-            "params": {"format": "json_proto"},
-            "headers": {"User-Agent": get_user_agent()},
-            "method": "POST",
-        },
-        file,
+def _spool_payload(spool_dir: Path, data: str, force_flush: bool) -> bool:
+  """Adds payload to the spool and claims the next flush if it is due.
+
+  Args:
+    spool_dir: directory holding the spooled payloads.
+    data: clearcut payload to spool.
+    force_flush: whether to claim the next flush even if it is not due.
+
+  Returns:
+    True if the caller claimed the next flush and False otherwise.
+  """
+  spool_dir.mkdir(parents=True, exist_ok=True)
+  with file_lock(spool_dir / _SPOOL_LOCK_FILE):
+    write_text_atomically(
+        spool_dir / f"{time.time_ns()}-{uuid.uuid4().hex}.json", data
     )
-    return file.name
+    if not force_flush and not _is_flush_due(spool_dir):
+      return False
+    (spool_dir / _LAST_FLUSH_FILE).touch()
+    return True
+
+
+def _is_flush_due(spool_dir: Path) -> bool:
+  try:
+    last_flush = (spool_dir / _LAST_FLUSH_FILE).stat().st_mtime
+  except OSError:
+    return True
+  if time.time() - last_flush >= _FLUSH_INTERVAL_SECONDS:
+    return True
+  spool_bytes = sum(path.stat().st_size for path in spool_dir.glob("*.json"))
+  return spool_bytes >= _FLUSH_SPOOL_BYTES
 
 
 def _schedule_clearcut_background_flush(
-    file_path: str, wait_to_complete: bool
+    spool_dir: Path, wait_to_complete: bool
 ) -> bool:
   """Schedules clearcut background flush.
 
   Args:
-    file_path: path to the temporary file where the events are stored.
+    spool_dir: directory holding the spooled payloads.
     wait_to_complete: whenever to wait for the background script completion.
 
   Returns:
@@ -95,7 +145,7 @@ def _schedule_clearcut_background_flush(
         args=[
             sys.executable,
             str(path),
-            file_path,
+            str(spool_dir),
         ],
         stdout=sys.stdout if wait_to_complete else subprocess.DEVNULL,
         stderr=sys.stderr if wait_to_complete else subprocess.DEVNULL,
@@ -106,11 +156,88 @@ def _schedule_clearcut_background_flush(
     return True
 
 
-def _clearcut_flush(file_path: str) -> None:
-  with open(file_path, mode="r", encoding="utf-8") as file:
-    kwargs = json.load(file)
-    requests.request(**kwargs)
-    os.remove(file_path)
+def flush_telemetry_spool(spool_dir: str | Path) -> int | None:
+  """Sends all spooled payloads to the clearcut endpoint in one request.
+
+  Payloads older than _MAX_PAYLOAD_AGE_SECONDS, and the oldest ones beyond
+  _MAX_SPOOLED_PAYLOADS, are dropped. Payloads are spooled again if the
+  request cannot be sent, is throttled or fails on the server.
+
+  Args:
+    spool_dir: directory holding the spooled payloads.
+
+  Returns:
+    Status code of the request, None if nothing was sent.
+  """
+  # Only the uploader process sends requests, so only it pays the import.
+  import requests  # pylint: disable=import-outside-toplevel
+
+  spool_dir = Path(spool_dir)
+  payloads = _take_spooled_payloads(spool_dir)
+  log_events = []
+  for data in payloads.values():
+    try:
+      log_events.extend(json.loads(data)["log_event"])
+    except (ValueError, KeyError, TypeError):
+      continue
+  if not log_events:
+    return None
+
+  try:
+    response = requests.request(
+        data=_get_clearcut_payload(log_events),
+        url="https://play.googleapis.com/log",
+        params={"format": "json_proto"},
+        headers={"User-Agent": get_user_agent()},
+        method="POST",
+        timeout=_UPLOAD_TIMEOUT_SECONDS,
+    )
+  except requests.RequestException:
+    _restore_spooled_payloads(spool_dir, payloads)
+    return None
+  status_code: int = response.status_code
+  if status_code == 429 or status_code >= 500:
+    _restore_spooled_payloads(spool_dir, payloads)
+  return status_code
+
+
+def _take_spooled_payloads(spool_dir: Path) -> dict[str, str]:
+  """Removes all payloads from the spool, dropping stale ones.
+
+  Returns:
+    Payloads that are not stale, by the name of their file.
+  """
+  payloads = {}
+  oldest_time_ns = time.time_ns() - _MAX_PAYLOAD_AGE_SECONDS * 10**9
+  with file_lock(spool_dir / _SPOOL_LOCK_FILE):
+    paths = sorted(spool_dir.glob("*.json"))
+    for i, path in enumerate(paths):
+      try:
+        if (
+            i >= len(paths) - _MAX_SPOOLED_PAYLOADS
+            and _get_spool_time_ns(path) >= oldest_time_ns
+        ):
+          payloads[path.name] = path.read_text(encoding="utf-8")
+        path.unlink()
+      except OSError:
+        continue
+  return payloads
+
+
+def _restore_spooled_payloads(
+    spool_dir: Path, payloads: dict[str, str]
+) -> None:
+  with file_lock(spool_dir / _SPOOL_LOCK_FILE):
+    for name, data in payloads.items():
+      (spool_dir / name).write_text(data, encoding="utf-8")
+
+
+def _get_spool_time_ns(path: Path) -> int:
+  """Returns the time the payload was spooled at, 0 if it is unknown."""
+  try:
+    return int(path.name.split("-")[0])
+  except ValueError:
+    return 0
 
 
 class MetricsEventMetadataKey(Enum):
@@ -129,6 +256,14 @@ class MetricsEventMetadataKey(Enum):
   LATENCY_SECONDS = "XPK_LATENCY_SECONDS"
   TESTER = "XPK_TESTER"
   FLAGS = "XPK_FLAGS"
+  WALL_SECONDS = "XPK_WALL_SECONDS"
+  COMMAND_SECONDS = "XPK_COMMAND_SECONDS"
+  PYTHON_SECONDS = "XPK_PYTHON_SECONDS"
+  GCLOUD_INVOCATIONS = "XPK_GCLOUD_INVOCATIONS"
+  KUBECTL_INVOCATIONS = "XPK_KUBECTL_INVOCATIONS"
+  OTHER_INVOCATIONS = "XPK_OTHER_INVOCATIONS"
+  SLOWEST_PHASE = "XPK_SLOWEST_PHASE"
+  SLOWEST_PHASE_SECONDS = "XPK_SLOWEST_PHASE_SECONDS"
 
 
 @dataclass
@@ -184,6 +319,40 @@ class _MetricsCollector:
         )
     )
 
+  def log_timing(self, summary: TimingSummary) -> None:
+    """Logs timing event, holding only durations, counts and phase names."""
+    self._events.append(
+        _MetricsEvent(
+            time=time.time(),
+            type="performance",
+            name="timing",
+            metadata={
+                MetricsEventMetadataKey.WALL_SECONDS: (
+                    f"{summary.wall_seconds:.3f}"
+                ),
+                MetricsEventMetadataKey.COMMAND_SECONDS: (
+                    f"{summary.command_seconds:.3f}"
+                ),
+                MetricsEventMetadataKey.PYTHON_SECONDS: (
+                    f"{summary.python_seconds:.3f}"
+                ),
+                MetricsEventMetadataKey.GCLOUD_INVOCATIONS: str(
+                    summary.command_counts.get("gcloud", 0)
+                ),
+                MetricsEventMetadataKey.KUBECTL_INVOCATIONS: str(
+                    summary.command_counts.get("kubectl", 0)
+                ),
+                MetricsEventMetadataKey.OTHER_INVOCATIONS: str(
+                    summary.command_counts.get("other", 0)
+                ),
+                MetricsEventMetadataKey.SLOWEST_PHASE: summary.slowest_phase,
+                MetricsEventMetadataKey.SLOWEST_PHASE_SECONDS: (
+                    f"{summary.slowest_phase_seconds:.3f}"
+                ),
+            },
+        )
+    )
+
   def flush(self) -> str:
     """Flushes collected events into concord payload."""
     result = _generate_payload(self._events)
@@ -220,11 +389,15 @@ def _generate_payload(events: list[_MetricsEvent]) -> str:
         }),
     })
 
+  return _get_clearcut_payload(serialized_events)
+
+
+def _get_clearcut_payload(log_events: list[dict[str, Any]]) -> str:
   return json.dumps({
       "client_info": {"client_type": "XPK"},
       "log_source_name": "CONCORD",
       "request_time_ms": int(time.time() * 1000),
-      "log_event": serialized_events,
+      "log_event": log_events,
   })
 
 
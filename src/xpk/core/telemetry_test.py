@@ -15,10 +15,14 @@ limitations under the License.
 """
 
 import itertools
+import os
+import time
 import pytest
 import json
-from .config import get_config, CLIENT_ID_KEY, SEND_TELEMETRY_KEY
-from .telemetry import MetricsCollector, MetricsEventMetadataKey, should_send_telemetry
+import requests
+from .config import get_config, CLIENT_ID_KEY, SEND_TELEMETRY_KEY, SEND_TIMING_TELEMETRY_KEY
+from .telemetry import MetricsCollector, MetricsEventMetadataKey, flush_telemetry_spool, get_telemetry_spool_dir, send_clearcut_payload, should_send_telemetry, should_send_timing_telemetry
+from .tracing import TimingSummary
 from ..utils.execution_context import set_dry_run
 from ..utils.feature_flags import FeatureFlags
 from pytest_mock import MockerFixture
@@ -56,6 +60,26 @@ def test_should_send_telemetry_returns_correct_value(
   assert should_send_telemetry() is expected
 
 
+@pytest.mark.parametrize(
+    argnames='send_telemetry,config_value,expected',
+    argvalues=[
+        ('true', 'true', True),
+        ('true', None, False),
+        ('false', 'true', False),
+    ],
+)
+def test_should_send_timing_telemetry_is_opt_in(
+    send_telemetry: str, config_value: str, expected: bool
+):
+  FeatureFlags.TELEMETRY_ENABLED = True
+  get_config().set(SEND_TELEMETRY_KEY, send_telemetry)
+  get_config().set(SEND_TIMING_TELEMETRY_KEY, config_value)
+  try:
+    assert should_send_timing_telemetry() is expected
+  finally:
+    get_config().set(SEND_TIMING_TELEMETRY_KEY, None)
+
+
 def test_metrics_collector_generates_client_id_if_not_present():
   get_config().set(CLIENT_ID_KEY, None)
   MetricsCollector.log_start(command='test', flags='bar')
@@ -146,6 +170,32 @@ def test_metrics_collector_logs_custom_event_correctly():
   }
 
 
+def test_metrics_collector_logs_timing_event_correctly():
+  MetricsCollector.log_timing(
+      TimingSummary(
+          wall_seconds=20.0,
+          command_seconds=15.5,
+          command_counts={'gcloud': 3, 'other': 1},
+          slowest_phase='Create Nodepools',
+          slowest_phase_seconds=9.25,
+      )
+  )
+  payload = json.loads(MetricsCollector.flush())
+  extension_json = json.loads(payload['log_event'][0]['source_extension_json'])
+  assert extension_json['event_type'] == 'performance'
+  assert extension_json['event_name'] == 'timing'
+  assert extension_json['event_metadata'][6:-1] == [
+      {'key': 'XPK_WALL_SECONDS', 'value': '20.000'},
+      {'key': 'XPK_COMMAND_SECONDS', 'value': '15.500'},
+      {'key': 'XPK_PYTHON_SECONDS', 'value': '4.500'},
+      {'key': 'XPK_GCLOUD_INVOCATIONS', 'value': '3'},
+      {'key': 'XPK_KUBECTL_INVOCATIONS', 'value': '0'},
+      {'key': 'XPK_OTHER_INVOCATIONS', 'value': '1'},
+      {'key': 'XPK_SLOWEST_PHASE', 'value': 'Create Nodepools'},
+      {'key': 'XPK_SLOWEST_PHASE_SECONDS', 'value': '9.250'},
+  ]
+
+
 def test_metrics_collector_computest_latency_correctly():
   MetricsCollector.log_start(command='test', flags='bar')
   MetricsCollector.log_complete(exit_code=0)
@@ -259,6 +309,152 @@ def test_metrics_collectors_logs_correct_tester_value_for_trash_variable(
   assert _get_metadata_value(payload, 'XPK_TESTER') == expected
 
 
+@pytest.fixture(name='schedule_flush')
+def _schedule_flush(mocker: MockerFixture):
+  # Spooled files get real modification times, unlike the mocked time.time.
+  mocker.patch('time.time', return_value=time.time_ns() / 10**9)
+  return mocker.patch(
+      'xpk.core.telemetry._schedule_clearcut_background_flush',
+      return_value=True,
+  )
+
+
+def _spool_events(count: int) -> list[str]:
+  payloads = []
+  for i in range(count):
+    MetricsCollector.log_start(command=f'test-{i}', flags='bar')
+    payloads.append(MetricsCollector.flush())
+    send_clearcut_payload(payloads[-1])
+  return payloads
+
+
+def test_send_clearcut_payload_schedules_one_flush_per_interval(
+    schedule_flush,
+):
+
+  _spool_events(3)
+
+  schedule_flush.assert_called_once()
+  assert len(list(get_telemetry_spool_dir().glob('*.json'))) == 3
+
+
+def test_send_clearcut_payload_schedules_flush_after_interval(
+    schedule_flush,
+):
+  send_clearcut_payload('{}')
+  last_flush = time.time() - 60
+  os.utime(get_telemetry_spool_dir() / 'last_flush', (last_flush, last_flush))
+
+  send_clearcut_payload('{}')
+
+  assert schedule_flush.call_count == 2
+
+
+def test_send_clearcut_payload_schedules_flush_when_spool_is_large(
+    schedule_flush, mocker: MockerFixture
+):
+  mocker.patch('xpk.core.telemetry._FLUSH_SPOOL_BYTES', 100)
+
+  send_clearcut_payload('{}')
+  send_clearcut_payload('{}')
+  send_clearcut_payload('x' * 100)
+
+  assert schedule_flush.call_count == 2
+
+
+def test_send_clearcut_payload_schedules_flush_when_waiting_to_complete(
+    schedule_flush,
+):
+
+  send_clearcut_payload('{}')
+  send_clearcut_payload('{}', wait_to_complete=True)
+
+  assert schedule_flush.call_count == 2
+  assert schedule_flush.call_args.args[1] is True
+
+
+def test_flush_telemetry_spool_sends_all_events_in_one_request(
+    schedule_flush, mocker: MockerFixture
+):
+  request = mocker.patch('requests.request')
+  request.return_value.status_code = 200
+  payloads = _spool_events(3)
+
+  status_code = flush_telemetry_spool(get_telemetry_spool_dir())
+
+  assert status_code == 200
+  request.assert_called_once()
+  sent = json.loads(request.call_args.kwargs['data'])
+  assert sent['log_event'] == [
+      json.loads(payload)['log_event'][0] for payload in payloads
+  ]
+  assert not list(get_telemetry_spool_dir().glob('*.json'))
+
+
+def test_flush_telemetry_spool_drops_old_payloads(
+    schedule_flush, mocker: MockerFixture
+):
+  request = mocker.patch('requests.request')
+  request.return_value.status_code = 200
+  spool_dir = get_telemetry_spool_dir()
+  payloads = _spool_events(2)
+  (spool_dir / '1-1.json').write_text(payloads[0], encoding='utf-8')
+
+  flush_telemetry_spool(spool_dir)
+
+  sent = json.loads(request.call_args.kwargs['data'])
+  assert sent['log_event'] == [
+      json.loads(payload)['log_event'][0] for payload in payloads
+  ]
+  assert not list(spool_dir.glob('*.json'))
+
+
+def test_flush_telemetry_spool_drops_oldest_payloads_over_limit(
+    schedule_flush, mocker: MockerFixture
+):
+  request = mocker.patch('requests.request')
+  request.return_value.status_code = 200
+  mocker.patch('xpk.core.telemetry._MAX_SPOOLED_PAYLOADS', 2)
+  payloads = _spool_events(3)
+
+  flush_telemetry_spool(get_telemetry_spool_dir())
+
+  sent = json.loads(request.call_args.kwargs['data'])
+  assert sent['log_event'] == [
+      json.loads(payload)['log_event'][0] for payload in payloads[1:]
+  ]
+
+
+def test_flush_telemetry_spool_keeps_payloads_when_request_fails(
+    schedule_flush, mocker: MockerFixture
+):
+  mocker.patch(
+      'requests.request', side_effect=requests.ConnectionError('offline')
+  )
+  _spool_events(2)
+  spool_dir = get_telemetry_spool_dir()
+  names = sorted(path.name for path in spool_dir.glob('*.json'))
+
+  status_code = flush_telemetry_spool(spool_dir)
+
+  assert status_code is None
+  assert sorted(path.name for path in spool_dir.glob('*.json')) == names
+
+
+@pytest.mark.parametrize(argnames='status_code', argvalues=[429, 503])
+def test_flush_telemetry_spool_keeps_payloads_when_request_is_rejected(
+    schedule_flush, mocker: MockerFixture, status_code: int
+):
+  mocker.patch('requests.request').return_value.status_code = status_code
+  _spool_events(2)
+  spool_dir = get_telemetry_spool_dir()
+  names = sorted(path.name for path in spool_dir.glob('*.json'))
+
+  assert flush_telemetry_spool(spool_dir) == status_code
+
+  assert sorted(path.name for path in spool_dir.glob('*.json')) == names
+
+
 def _get_metadata_value(payload_str: str, key: str) -> str | None:
   payload = json.loads(payload_str)
   metadata = json.loads(payload['log_event'][0]['source_extension_json'])[
@@ -16,9 +16,10 @@ limitations under the License.
 
 import re
 import sys
+from typing import Callable
 from pytest_mock import MockerFixture
 
-from ..commands import FailedCommand
+from ..commands import Command, FailedCommand
 
 
 class CommandsTester:
@@ -107,14 +108,28 @@ class CommandsTester:
 
   def __fake_run_command_for_value(
       self,
-      command: str,
+      command: str | Command,
       task: str,
       dry_run_return_val="0",
       print_timer=False,
       hide_error=False,
       quiet=False,
+      output_handler: Callable[[str], None] | None = None,
   ) -> tuple[int, str]:
-    return self.__common_fake_run_command(command, (0, dry_run_return_val))
+    default_result = (0, dry_run_return_val)
+    result = self.__common_fake_run_command(str(command), default_result)
+    if result is default_result:
+      return result
+    if output_handler is not None:
+      output_handler(result[1])
+      return result[0], ""
+    if (
+        result[0] == 0
+        and isinstance(command, Command)
+        and command.postprocess is not None
+    ):
+      return result[0], command.postprocess(result[1])
+    return result
 
   def __fake_run_command_batch(
       self,
@@ -122,10 +137,15 @@ class CommandsTester:
       jobname: str,
       per_command_name: list[str],
       output_logs: list[str],
+      max_parallelism: int | None = None,
+      idempotent: bool = False,
   ) -> list[FailedCommand]:
     failures = []
     for i, command in enumerate(commands):
-      result = self.__common_fake_run_command(command, (0, ""))[0]
+      result, output = self.__common_fake_run_command(command, (0, ""))
+      if output:
+        with open(output_logs[i], "w", encoding="utf-8") as f:
+          f.write(output)
       if result != 0:
         failures.append(
             FailedCommand(
@@ -0,0 +1,343 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import contextlib
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Iterator
+
+from .command_history import CommandHistory
+from ..utils.console import xpk_print
+
+PHASE_SEPARATOR = ' > '
+
+
+class TraceFormat(Enum):
+  """Represents supported trace file formats."""
+
+  CHROME = 'chrome'
+  OTLP = 'otlp'
+
+
+@dataclass
+class Span:
+  """A timed operation: a phase of an xpk command or a subprocess it ran."""
+
+  name: str
+  category: str
+  span_id: str
+  parent_span_id: str | None
+  phase: str
+  start_ns: int
+  end_ns: int = 0
+  lane: int = 0
+  attributes: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class TimingSummary:
+  """Where the time of an xpk run went, without any user data.
+
+  Attributes:
+    wall_seconds: time since xpk started.
+    command_seconds: time during which at least one subprocess or API request
+      was running.
+    command_counts: number of commands run per program, e.g. gcloud.
+    slowest_phase: name of the slowest phase, empty if no phase ran.
+    slowest_phase_seconds: duration of the slowest phase.
+  """
+
+  wall_seconds: float
+  command_seconds: float
+  command_counts: dict[str, int]
+  slowest_phase: str
+  slowest_phase_seconds: float
+
+  @property
+  def python_seconds(self) -> float:
+    return max(self.wall_seconds - self.command_seconds, 0.0)
+
+
+# Programs counted separately in timing summaries, others count as 'other'.
+_COUNTED_PROGRAMS = ('gcloud', 'kubectl')
+
+
+def _get_program(command: str) -> str:
+  words = command.split(maxsplit=1)
+  program = os.path.basename(words[0]) if words else ''
+  return program if program in _COUNTED_PROGRAMS else 'other'
+
+
+class _Timings:
+  """Aggregated timings of commands and phases, kept even when not tracing."""
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._start = time.monotonic()
+    self._running_commands = 0
+    self._busy_since = 0.0
+    self._command_seconds = 0.0
+    self._command_counts: dict[str, int] = {}
+    self._phase_seconds: dict[str, float] = {}
+
+  def start_command(self, command: str) -> None:
+    with self._lock:
+      program = _get_program(command)
+      self._command_counts[program] = self._command_counts.get(program, 0) + 1
+      if self._running_commands == 0:
+        self._busy_since = time.monotonic()
+      self._running_commands += 1
+
+  def end_command(self) -> None:
+    with self._lock:
+      self._running_commands -= 1
+      if self._running_commands == 0:
+        self._command_seconds += time.monotonic() - self._busy_since
+
+  def end_phase(self, name: str, seconds: float) -> None:
+    with self._lock:
+      self._phase_seconds[name] = self._phase_seconds.get(name, 0.0) + seconds
+
+  def get_summary(self) -> TimingSummary:
+    with self._lock:
+      now = time.monotonic()
+      command_seconds = self._command_seconds
+      if self._running_commands > 0:
+        command_seconds += now - self._busy_since
+      slowest_phase = max(
+          self._phase_seconds, key=self._phase_seconds.__getitem__, default=''
+      )
+      return TimingSummary(
+          wall_seconds=now - self._start,
+          command_seconds=command_seconds,
+          command_counts=dict(self._command_counts),
+          slowest_phase=slowest_phase,
+          slowest_phase_seconds=self._phase_seconds.get(slowest_phase, 0.0),
+      )
+
+
+@dataclass(frozen=True)
+class _PhaseContext:
+  path: tuple[str, ...]
+  span_id: str | None
+
+
+_current_phase: contextvars.ContextVar[_PhaseContext] = contextvars.ContextVar(
+    'xpk_trace_phase', default=_PhaseContext(path=(), span_id=None)
+)
+
+
+class _Tracer:
+  """Records spans of xpk phases and commands and writes them to a file."""
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._spans: list[Span] = []
+    self._busy_lanes: set[int] = set()
+    self._trace_file: str | None = None
+    self._trace_format = TraceFormat.CHROME
+    self._trace_id = secrets.token_hex(16)
+    self._timings = _Timings()
+
+  def enable(
+      self, trace_file: str, trace_format: TraceFormat = TraceFormat.CHROME
+  ) -> None:
+    """Starts recording spans, to be written to `trace_file`."""
+    self._trace_file = trace_file
+    self._trace_format = trace_format
+
+  def is_enabled(self) -> bool:
+    return self._trace_file is not None
+
+  @contextlib.contextmanager
+  def phase(self, name: str) -> Iterator[None]:
+    """Marks commands run within the context as part of the `name` phase."""
+    parent = _current_phase.get()
+    path = parent.path + (name,)
+    span = self._start_span(name, 'phase', parent)
+    token = _current_phase.set(
+        _PhaseContext(path=path, span_id=span.span_id if span else None)
+    )
+    start = time.monotonic()
+    try:
+      yield
+    finally:
+      _current_phase.reset(token)
+      self._end_span(span)
+      # The outermost phase is the whole xpk command.
+      if parent.path:
+        self._timings.end_phase(name, time.monotonic() - start)
+
+  @contextlib.contextmanager
+  def command(self, task: str, command: str) -> Iterator[dict[str, Any]]:
+    """Records a span of a subprocess run within the context.
+
+    The run is also recorded in the command history, unless it was served from
+    the command cache.
+
+    Yields:
+      Attributes of the span, callers set 'exit_code' once it is known and
+      'cached' if the result came from the command cache.
+    """
+    span = self._start_span(task, 'command', _current_phase.get())
+    attributes: dict[str, Any] = {'command': command}
+    started_at = time.time()
+    start_ns = time.monotonic_ns()
+    self._timings.start_command(command)
+    try:
+      yield attributes
+    finally:
+      self._timings.end_command()
+      if span is not None:
+        span.attributes.update(attributes)
+      self._end_span(span)
+      # Cache hits would pull down the latencies reported by `xpk stats`.
+      if not attributes.get('cached'):
+        CommandHistory.record_command(
+            task,
+            command,
+            started_at,
+            (time.monotonic_ns() - start_ns) / 1e9,
+            attributes.get('exit_code'),
+        )
+
+  def get_timing_summary(self) -> TimingSummary:
+    """Returns where the time of this xpk run went so far."""
+    return self._timings.get_summary()
+
+  def write(self) -> None:
+    """Writes recorded spans to the trace file, if tracing is enabled."""
+    if self._trace_file is None:
+      return
+    with self._lock:
+      spans = list(self._spans)
+    if self._trace_format == TraceFormat.OTLP:
+      content = _to_otlp_json(spans, self._trace_id)
+    else:
+      content = _to_chrome_trace(spans)
+    try:
+      with open(self._trace_file, mode='w', encoding='utf-8') as f:
+        json.dump(content, f)
+    except OSError as e:
+      xpk_print(f'Unable to write trace file {self._trace_file}: {e}')
+      return
+    xpk_print(f'Trace of {len(spans)} spans written to {self._trace_file}')
+
+  def _start_span(
+      self, name: str, category: str, parent: _PhaseContext
+  ) -> Span | None:
+    if not self.is_enabled():
+      return None
+    with self._lock:
+      lane = 0
+      if category == 'command':
+        lane = min(set(range(1, len(self._busy_lanes) + 2)) - self._busy_lanes)
+        self._busy_lanes.add(lane)
+      span = Span(
+          name=name,
+          category=category,
+          span_id=secrets.token_hex(8),
+          parent_span_id=parent.span_id,
+          phase=PHASE_SEPARATOR.join(parent.path),
+          start_ns=time.time_ns(),
+          lane=lane,
+      )
+      self._spans.append(span)
+      return span
+
+  def _end_span(self, span: Span | None) -> None:
+    if span is None:
+      return
+    with self._lock:
+      span.end_ns = time.time_ns()
+      self._busy_lanes.discard(span.lane)
+
+
+Tracer = _Tracer()
+
+
+# Marks commands run within it as part of a phase, as a context manager or as a
+# function decorator.
+trace_phase = Tracer.phase
+
+
+def _to_chrome_trace(spans: list[Span]) -> dict[str, Any]:
+  pid = os.getpid()
+  events: list[dict[str, Any]] = [{
+      'name': 'thread_name',
+      'ph': 'M',
+      'pid': pid,
+      'tid': 0,
+      'args': {'name': 'phases'},
+  }]
+  for span in spans:
+    events.append({
+        'name': span.name,
+        'cat': span.category,
+        'ph': 'X',
+        'ts': span.start_ns // 1000,
+        'dur': (span.end_ns - span.start_ns) // 1000,
+        'pid': pid,
+        'tid': span.lane,
+        'args': {'phase': span.phase, **span.attributes},
+    })
+  return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def _to_otlp_json(spans: list[Span], trace_id: str) -> dict[str, Any]:
+  otlp_spans = []
+  for span in spans:
+    exit_code = span.attributes.get('exit_code', 0)
+    otlp_spans.append({
+        'traceId': trace_id,
+        'spanId': span.span_id,
+        'parentSpanId': span.parent_span_id or '',
+        'name': span.name,
+        'kind': 1,
+        'startTimeUnixNano': str(span.start_ns),
+        'endTimeUnixNano': str(span.end_ns),
+        'attributes': [
+            _to_otlp_attribute(f'xpk.{key}', value)
+            for key, value in {
+                'category': span.category,
+                'phase': span.phase,
+                **span.attributes,
+            }.items()
+        ],
+        'status': {'code': 2 if exit_code else 1},
+    })
+  return {
+      'resourceSpans': [{
+          'resource': {
+              'attributes': [_to_otlp_attribute('service.name', 'xpk')]
+          },
+          'scopeSpans': [{'scope': {'name': 'xpk'}, 'spans': otlp_spans}],
+      }]
+  }
+
+
+def _to_otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+  if isinstance(value, bool):
+    return {'key': key, 'value': {'boolValue': value}}
+  if isinstance(value, int):
+    return {'key': key, 'value': {'intValue': str(value)}}
+  return {'key': key, 'value': {'stringValue': str(value)}}
@@ -0,0 +1,155 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import threading
+
+import pytest
+
+from .tracing import TraceFormat, _Tracer
+
+
+@pytest.fixture
+def trace_path(tmp_path):
+  return tmp_path / 'trace.json'
+
+
+def _read_events(trace_path) -> list[dict]:
+  with open(trace_path, encoding='utf-8') as f:
+    return [e for e in json.load(f)['traceEvents'] if e['ph'] == 'X']
+
+
+def test_disabled_tracer_does_not_record_or_write(trace_path):
+  tracer = _Tracer()
+
+  with tracer.phase('cluster create'), tracer.command('task', 'ls') as span:
+    span['exit_code'] = 0
+  tracer.write()
+
+  assert not trace_path.exists()
+
+
+def test_chrome_trace_records_commands_with_phase(trace_path):
+  tracer = _Tracer()
+  tracer.enable(str(trace_path))
+
+  with tracer.phase('cluster create'), tracer.phase('nodepools'):
+    with tracer.command('Create np-1', 'gcloud node-pools create') as span:
+      span['exit_code'] = 1
+  tracer.write()
+
+  events = _read_events(trace_path)
+  assert [e['name'] for e in events] == [
+      'cluster create',
+      'nodepools',
+      'Create np-1',
+  ]
+  command = events[2]
+  assert command['cat'] == 'command'
+  assert command['args'] == {
+      'phase': 'cluster create > nodepools',
+      'command': 'gcloud node-pools create',
+      'exit_code': 1,
+  }
+  assert command['dur'] >= 0
+
+
+def test_concurrent_commands_are_recorded_on_separate_lanes(trace_path):
+  tracer = _Tracer()
+  tracer.enable(str(trace_path))
+  started = threading.Barrier(2)
+
+  def run(name: str) -> None:
+    with tracer.command(name, name):
+      started.wait(timeout=5)
+
+  threads = [threading.Thread(target=run, args=(n,)) for n in ('a', 'b')]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  with tracer.command('c', 'c'):
+    pass
+  tracer.write()
+
+  lanes = {e['name']: e['tid'] for e in _read_events(trace_path)}
+  assert {lanes['a'], lanes['b']} == {1, 2}
+  assert lanes['c'] == 1
+
+
+def test_otlp_trace_links_commands_to_their_phase(trace_path):
+  tracer = _Tracer()
+  tracer.enable(str(trace_path), TraceFormat.OTLP)
+
+  with tracer.phase('cluster create'):
+    with tracer.command('Get credentials', 'gcloud get-credentials') as span:
+      span['exit_code'] = 0
+  tracer.write()
+
+  with open(trace_path, encoding='utf-8') as f:
+    spans = json.load(f)['resourceSpans'][0]['scopeSpans'][0]['spans']
+  phase, command = spans
+  assert command['parentSpanId'] == phase['spanId']
+  assert command['traceId'] == phase['traceId']
+  assert command['status'] == {'code': 1}
+  assert {
+      'key': 'xpk.phase',
+      'value': {'stringValue': 'cluster create'},
+  } in command['attributes']
+  assert {
+      'key': 'xpk.exit_code',
+      'value': {'intValue': '0'},
+  } in command['attributes']
+
+
+def test_timing_summary_counts_commands_and_slowest_phase(mocker):
+  clock = mocker.patch('xpk.core.tracing.time.monotonic', return_value=0.0)
+  tracer = _Tracer()
+
+  with tracer.phase('cluster create'):
+    with tracer.phase('nodepools'):
+      with tracer.command('Create np', '/usr/bin/gcloud node-pools create'):
+        clock.return_value = 10.0
+      with tracer.command('Get pods', 'kubectl get pods'):
+        clock.return_value = 12.0
+    with tracer.phase('kueue'):
+      with tracer.command('Install', 'helm install kueue'):
+        clock.return_value = 13.0
+    clock.return_value = 15.0
+
+  summary = tracer.get_timing_summary()
+  assert summary.wall_seconds == 15.0
+  assert summary.command_seconds == 13.0
+  assert summary.python_seconds == 2.0
+  assert summary.command_counts == {'gcloud': 1, 'kubectl': 1, 'other': 1}
+  assert summary.slowest_phase == 'nodepools'
+  assert summary.slowest_phase_seconds == 12.0
+
+
+def test_cached_commands_are_not_recorded_in_history(mocker):
+  record_command = mocker.patch(
+      'xpk.core.tracing.CommandHistory.record_command'
+  )
+  tracer = _Tracer()
+
+  with tracer.command('Get pods', 'kubectl get pods') as span:
+    span['cached'] = True
+    span['exit_code'] = 0
+  with tracer.command('Get nodes', 'kubectl get nodes') as span:
+    span['exit_code'] = 0
+
+  record_command.assert_called_once()
+  assert record_command.call_args.args[:2] == ('Get nodes', 'kubectl get nodes')
@@ -15,12 +15,21 @@ limitations under the License.
 """
 
 import json
+import subprocess
+import sys
+import time
 from json.decoder import JSONDecodeError
+from pathlib import Path
+from typing import Any
 from .commands import run_command_for_value
 from ..utils.console import xpk_print
 from ..utils.execution_context import is_dry_run
-from packaging.version import Version
-from .config import __version__
+from ..utils.file import get_cache_dir, write_text_atomically
+from packaging.version import InvalidVersion, Version
+from .config import VERSION_CHECK_KEY, __version__, get_config
+
+# The latest version is looked up in the background at most this often.
+_CHECK_INTERVAL_SECONDS = 24 * 60 * 60
 
 
 def get_latest_xpk_version() -> tuple[int, Version | None]:
@@ -43,11 +52,39 @@ def get_latest_xpk_version() -> tuple[int, Version | None]:
     return 1, None
 
 
+def get_latest_version_cache_path() -> Path:
+  return get_cache_dir() / "latest_version.json"
+
+
+def is_version_check_enabled() -> bool:
+  return get_config().get(VERSION_CHECK_KEY) != "false"
+
+
+def refresh_latest_version_cache() -> None:
+  """Looks up the latest version and caches it, failed lookups included."""
+  return_code, latest_version = get_latest_xpk_version()
+  _write_cache(
+      str(latest_version) if return_code == 0 and latest_version else None
+  )
+
+
 def print_xpk_hello() -> None:
+  """Prints the xpk version, and whether a newer one is available.
+
+  The latest version is read from a cache, refreshed by a detached process
+  once a day, so xpk never waits for PyPI.
+  """
   current_version = Version(__version__)
   xpk_print(f"Starting xpk v{current_version}", flush=True)
-  return_code, latest_version = get_latest_xpk_version()
-  if return_code != 0 or latest_version is None:
+  if is_dry_run() or not is_version_check_enabled():
+    return
+  cache = _read_cache() or {}
+  if time.time() - cache.get("checked_at", 0) > _CHECK_INTERVAL_SECONDS:
+    # Recorded before the lookup, so concurrent xpk runs do not repeat it.
+    _write_cache(cache.get("latest"))
+    _schedule_cache_refresh()
+  latest_version = _parse_version(cache.get("latest"))
+  if latest_version is None:
     return
   if current_version < latest_version:
     xpk_print(
@@ -55,3 +92,58 @@ def print_xpk_hello() -> None:
         f" to v{latest_version}",
         flush=True,
     )
+
+
+def _parse_version(value: Any) -> Version | None:
+  try:
+    return Version(value) if isinstance(value, str) else None
+  except InvalidVersion:
+    return None
+
+
+def _read_cache() -> dict[str, Any] | None:
+  try:
+    with open(get_latest_version_cache_path(), encoding="utf-8") as f:
+      cache = json.load(f)
+  except (OSError, ValueError):
+    return None
+  return cache if isinstance(cache, dict) else None
+
+
+def _write_cache(latest_version: str | None) -> None:
+  try:
+    write_text_atomically(
+        get_latest_version_cache_path(),
+        json.dumps({"checked_at": time.time(), "latest": latest_version}),
+    )
+  except OSError:
+    pass
+
+
+def _schedule_cache_refresh() -> None:
+  """Runs `refresh_latest_version_cache` in a detached process."""
+  kwargs: dict[str, Any] = {}
+  if sys.platform == "win32":
+    kwargs["creationflags"] = (
+        subprocess.DETACHED_PROCESS | subprocess.CREATE_NO_WINDOW
+    )
+  else:
+    kwargs["start_new_session"] = True
+  try:
+    # `-m` looks for the module in the working directory first, which may
+    # hold another `xpk`, e.g. xpk.py of the repository. The directory of the
+    # xpk package resolves it to this installation.
+    subprocess.Popen(  # pylint: disable=consider-using-with
+        args=[sys.executable, "-m", __name__],
+        cwd=Path(__file__).resolve().parents[2],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **kwargs,
+    )
+  except OSError:
+    pass
+
+
+if __name__ == "__main__":
+  refresh_latest_version_cache()
@@ -14,11 +14,33 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import json
+import time
+from pathlib import Path
+
+import pytest
 from ..utils.execution_context import set_dry_run
-from .updates import get_latest_xpk_version, print_xpk_hello
+from .updates import _schedule_cache_refresh, get_latest_version_cache_path, get_latest_xpk_version, print_xpk_hello, refresh_latest_version_cache
 from packaging.version import Version
-from .config import __version__
+from .config import VERSION_CHECK_KEY, __version__, get_config
 from unittest.mock import MagicMock, patch
+from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def schedule_cache_refresh(mocker: MockerFixture) -> MagicMock:
+  return mocker.patch('xpk.core.updates._schedule_cache_refresh')
+
+
+def _write_cache(checked_at: float, latest: str | None) -> None:
+  path = get_latest_version_cache_path()
+  path.parent.mkdir(parents=True, exist_ok=True)
+  path.write_text(json.dumps({'checked_at': checked_at, 'latest': latest}))
+
+
+def _read_cache() -> dict:
+  cache: dict = json.loads(get_latest_version_cache_path().read_text())
+  return cache
 
 
 def test_get_latest_xpk_version_returns_current_version_for_dry_run():
@@ -51,30 +73,98 @@ def test_get_latest_xpk_version_returns_version_returned_from_command(
 
 
 @patch('xpk.core.updates.xpk_print')
-@patch('xpk.core.updates.get_latest_xpk_version')
-def test_print_xpk_hello_does_not_print_update_when_version_check_fails(
-    get_latest_xpk_version: MagicMock, xpk_print: MagicMock
+def test_print_xpk_hello_prints_update_from_fresh_cache_without_lookup(
+    xpk_print: MagicMock, schedule_cache_refresh: MagicMock
 ):
-  get_latest_xpk_version.return_value = (1, None)
+  set_dry_run(False)
+  _write_cache(time.time(), '99.99.99')
+
   print_xpk_hello()
-  xpk_print.assert_called_once()
+
+  assert xpk_print.call_count == 2
+  assert 'upgrading to v99.99.99' in xpk_print.call_args[0][0]
+  schedule_cache_refresh.assert_not_called()
 
 
 @patch('xpk.core.updates.xpk_print')
-@patch('xpk.core.updates.get_latest_xpk_version')
 def test_print_xpk_hello_does_not_print_update_when_xpk_is_up_to_date(
-    get_latest_xpk_version: MagicMock, xpk_print: MagicMock
+    xpk_print: MagicMock, schedule_cache_refresh: MagicMock
 ):
-  get_latest_xpk_version.return_value = (0, Version(__version__))
+  set_dry_run(False)
+  _write_cache(time.time(), __version__)
+
   print_xpk_hello()
+
   xpk_print.assert_called_once()
+  schedule_cache_refresh.assert_not_called()
 
 
 @patch('xpk.core.updates.xpk_print')
-@patch('xpk.core.updates.get_latest_xpk_version')
-def test_print_xpk_hello_prints_update_when_xpk_is_outdated(
-    get_latest_xpk_version: MagicMock, xpk_print: MagicMock
+def test_print_xpk_hello_schedules_lookup_once_cache_is_stale(
+    xpk_print: MagicMock, schedule_cache_refresh: MagicMock
 ):
-  get_latest_xpk_version.return_value = (0, Version('99.99.99'))
+  set_dry_run(False)
+  _write_cache(time.time() - 2 * 24 * 60 * 60, '99.99.99')
+
   print_xpk_hello()
-  assert xpk_print.call_count == 2
+  print_xpk_hello()
+
+  schedule_cache_refresh.assert_called_once()
+  assert _read_cache()['latest'] == '99.99.99'
+  assert xpk_print.call_count == 4
+
+
+@patch('xpk.core.updates.xpk_print')
+def test_print_xpk_hello_schedules_lookup_without_cache(
+    xpk_print: MagicMock, schedule_cache_refresh: MagicMock
+):
+  set_dry_run(False)
+
+  print_xpk_hello()
+
+  schedule_cache_refresh.assert_called_once()
+  xpk_print.assert_called_once()
+
+
+def test_print_xpk_hello_does_not_check_version_when_disabled(
+    schedule_cache_refresh: MagicMock,
+):
+  set_dry_run(False)
+  get_config().set(VERSION_CHECK_KEY, 'false')
+  try:
+    print_xpk_hello()
+  finally:
+    get_config().set(VERSION_CHECK_KEY, None)
+
+  schedule_cache_refresh.assert_not_called()
+  assert not get_latest_version_cache_path().exists()
+
+
+@pytest.mark.parametrize(
+    argnames='lookup,expected',
+    argvalues=[
+        ((0, Version('1.2.3')), '1.2.3'),
+        ((1, None), None),
+    ],
+)
+def test_refresh_latest_version_cache_records_lookup_result(
+    mocker: MockerFixture, lookup, expected
+):
+  mocker.patch('xpk.core.updates.get_latest_xpk_version', return_value=lookup)
+
+  refresh_latest_version_cache()
+
+  cache = _read_cache()
+  assert cache['latest'] == expected
+  assert time.time() - cache['checked_at'] < 60
+
+
+def test_cache_refresh_runs_from_the_xpk_package_directory(
+    mocker: MockerFixture,
+):
+  popen = mocker.patch('xpk.core.updates.subprocess.Popen')
+
+  _schedule_cache_refresh()
+
+  cwd = Path(popen.call_args.kwargs['cwd'])
+  assert (cwd / 'xpk' / 'core' / 'updates.py').is_file()
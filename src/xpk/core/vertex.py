@@ -15,7 +15,6 @@ limitations under the License.
 """
 
 from ..utils.console import xpk_print
-from .resources import ConfigMapType, get_cluster_configmap
 
 DEFAULT_VERTEX_TENSORBOARD_NAME = 'tb-instance'
 
@@ -64,6 +63,9 @@ def create_vertex_experiment(args) -> dict | None:
   from cloud_accelerator_diagnostics import (  # pylint: disable=import-outside-toplevel
       tensorboard,
   )
+  # Imported here, so parsers can read the defaults above without loading
+  # the cluster resources.
+  from .resources import ConfigMapType, get_cluster_configmap  # pylint: disable=import-outside-toplevel
 
   cluster_config_map = get_cluster_configmap(
       args.cluster, ConfigMapType.METADATA
@@ -22,8 +22,10 @@ import re
 from typing import Any, Optional, Callable, Union
 
 from ..utils.console import xpk_exit, xpk_print
+from ..utils.json_stream import ListItemsParser
 from .commands import run_command_for_value
 from .gcloud_context import get_cluster_location
+from .kube_api import KUEUE_GROUP, KUEUE_VERSION, is_native_kubernetes_reads_enabled, list_custom_objects
 from .kubectl_common import KubernetesCondition, KubernetesStatus, parse_kubernetes_status
 
 _ACCELERATOR_LABELS = frozenset({
@@ -223,26 +225,36 @@ def _fetch_workloads(
   if filter_by_job:
     task += f' with filter-by-job={filter_by_job}'
 
-  return_code, data = run_command_for_value(
-      command, task, dry_run_return_val=''
+  # The list can be hundreds of MB on large clusters, so it is parsed as it is
+  # read instead of being held in memory.
+  data_rows: list[_WorkloadListRow] = []
+  if is_native_kubernetes_reads_enabled():
+    return_code = list_custom_objects(
+        task,
+        KUEUE_GROUP,
+        KUEUE_VERSION,
+        'workloads',
+        lambda item: data_rows.append(_parse_workload_item(item)),
+        ignore_not_found=True,
+    )
+    return return_code, data_rows if return_code == 0 else []
+
+  parser = ListItemsParser(
+      lambda item: data_rows.append(_parse_workload_item(item))
+  )
+  return_code, _ = run_command_for_value(
+      command, task, dry_run_return_val='', output_handler=parser.feed
   )
 
   if return_code != 0:
     return return_code, []
 
-  if not data:
-    return 0, []
-
   try:
-    parsed_data = json.loads(data)
-  except json.JSONDecodeError:
+    parser.close()
+  except ValueError:
     xpk_print('Error: Failed to parse JSON output from kubectl.')
     return 1, []
 
-  data_rows = [
-      _parse_workload_item(item) for item in parsed_data.get('items', [])
-  ]
-
   return 0, data_rows
 
 
@@ -386,27 +398,36 @@ def check_if_workload_exists(args) -> bool:
   Returns:
     returns true if workload exist, otherwise returns false.
   """
-  columns = {
-      'Jobset': '.metadata.ownerReferences[0].name',
-  }
+  task = 'Check if Workload Already Exists'
+  if is_native_kubernetes_reads_enabled():
+    jobset_names: list[str] = []
+    return_code = list_custom_objects(
+        task,
+        KUEUE_GROUP,
+        KUEUE_VERSION,
+        'workloads',
+        lambda item: jobset_names.append(
+            (item.get('metadata', {}).get('ownerReferences') or [{}])[0].get(
+                'name', ''
+            )
+        ),
+    )
+  else:
+    columns = {
+        'Jobset': '.metadata.ownerReferences[0].name',
+    }
 
-  s = ','.join([key + ':' + value for key, value in columns.items()])
+    s = ','.join([key + ':' + value for key, value in columns.items()])
 
-  command = f"kubectl get workloads -o=custom-columns='{s}'"
-  return_code, return_msg = run_command_for_value(
-      command, 'Check if Workload Already Exists'
-  )
+    command = f"kubectl get workloads -o=custom-columns='{s}'"
+    return_code, return_msg = run_command_for_value(command, task)
+    jobset_names = return_msg.split('\n')
 
   if return_code != 0:
     xpk_print(f'List Job request returned ERROR {return_code}')
     xpk_exit(return_code)
 
-  lines = return_msg.split('\n')
-  new_workload_name = args.workload
-  for line in lines:
-    if line == new_workload_name:
-      return True
-  return False
+  return args.workload in jobset_names
 
 
 def _get_jobset_status(workload_name: str) -> tuple[int, str]:
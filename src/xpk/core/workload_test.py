@@ -21,10 +21,11 @@ import re
 import json
 from pytest_mock import MockerFixture
 from xpk.core.testing.commands_tester import CommandsTester
-from xpk.core.workload import _parse_workload_item, get_jobsets_list_gcp_link, get_workload_list, wait_for_job_completion, _get_jobset_status
+from xpk.core.workload import _parse_workload_item, check_if_workload_exists, get_jobsets_list_gcp_link, get_workload_list, wait_for_job_completion, _get_jobset_status
 
 
 from dataclasses import dataclass
+from xpk.utils.feature_flags import FeatureFlags
 
 
 def _parse_workload_table(table_str: str) -> list[dict[str, str]]:
@@ -155,6 +156,45 @@ def test_get_workload_list(commands_tester: CommandsTester):
   assert parsed_table[0]['Priority'] == 'high'
 
 
+def test_get_workload_list_reads_workloads_natively(
+    commands_tester: CommandsTester, mocker: MockerFixture
+):
+  mocker.patch.object(FeatureFlags, 'NATIVE_KUBERNETES_READS_ENABLED', True)
+  workload = _create_mock_workload_json(
+      _MockWorkloadData(
+          jobset_name='job-test',
+          created_time='2024-01-01T00:00:00Z',
+          priority='high',
+          needed=[32],
+          running=[32],
+          done=[0],
+          status='Running',
+          message='All good',
+          status_time='2024-01-01T00:01:00Z',
+      )
+  )
+  mocker.patch(
+      'xpk.core.workload.list_custom_objects',
+      side_effect=lambda task, group, version, plural, on_item, **kwargs: (
+          on_item(workload) or 0
+      ),
+  )
+  args = MagicMock()
+  args.filter_by_status = 'EVERYTHING'
+  args.filter_by_job = None
+
+  return_code, return_value = get_workload_list(args)
+
+  assert return_code == 0
+  assert _parse_workload_table(return_value)[0]['Jobset Name'] == 'job-test'
+  commands_tester.assert_command_not_run('kubectl', 'get', 'workloads')
+
+  args.workload = 'job-test'
+  assert check_if_workload_exists(args)
+  args.workload = 'job-other'
+  assert not check_if_workload_exists(args)
+
+
 def test_get_workload_list_filter_by_job(commands_tester: CommandsTester):
   mock_output = json.dumps({
       'items': [
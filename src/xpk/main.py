@@ -32,19 +32,10 @@ Next Steps:
 """
 
 import argparse
-import argcomplete
 import contextlib
 import sys
 
-from .parser.core import set_parser
-from .parser.common import extract_command_path, enable_flags_usage_tracking, retrieve_flags
-from .core.updates import print_xpk_hello
-from .core.config import set_config, get_config, FileSystemConfig, CUSTOM_BINARIES_PATH_KEY
-from .core.telemetry import MetricsCollector, send_clearcut_payload, should_send_telemetry
-from .utils.console import xpk_print, exit_code_to_int
-from .utils.execution_context import set_context
-from .utils.environment import custom_binaries_path_env
-from .utils.kubectl import sandbox_kubeconfig
+from .parser.completion import autocomplete_from_index
 ################### Compatibility Check ###################
 # Check that the user runs the below version or greater.
 
@@ -66,12 +57,28 @@ if (
 
 
 def main() -> None:
+  # Shell completion is answered before the parsers and the modules they use
+  # are imported.
+  autocomplete_from_index()
+
+  # pylint: disable=import-outside-toplevel
+  from .parser.core import set_parser
+  from .parser.common import extract_command_path, enable_flags_usage_tracking, retrieve_flags
+  from .core.updates import print_xpk_hello
+  from .core.config import set_config, get_config, FileSystemConfig, CUSTOM_BINARIES_PATH_KEY
+  from .core.command_history import CommandHistory
+  from .core.telemetry import MetricsCollector, send_clearcut_payload, should_send_telemetry, should_send_timing_telemetry
+  from .core.tracing import Tracer, TraceFormat, trace_phase
+  from .utils.console import xpk_print, exit_code_to_int
+  from .utils.execution_context import set_context
+  from .utils.environment import custom_binaries_path_env
+  from .utils.kubectl import sandbox_kubeconfig
+
   try:
     # Create top level parser for xpk command.
     parser = argparse.ArgumentParser(description='xpk command', prog='xpk')
     set_parser(parser=parser)
     enable_flags_usage_tracking(parser)
-    argcomplete.autocomplete(parser)
 
     main_args = parser.parse_args()
     main_args.enable_ray_cluster = False
@@ -83,10 +90,14 @@ def main() -> None:
             or ('force' in main_args and main_args.force)
         ),
     )
+    command_path = extract_command_path(parser, main_args)
+    if getattr(main_args, 'trace_file', None):
+      Tracer.enable(main_args.trace_file, TraceFormat(main_args.trace_format))
     MetricsCollector.log_start(
-        command=extract_command_path(parser, main_args),
+        command=command_path,
         flags=retrieve_flags(main_args),
     )
+    CommandHistory.start_invocation(command_path, main_args)
     print_xpk_hello()
     is_sandbox = (
         hasattr(main_args, 'sandbox_kubeconfig')
@@ -96,18 +107,25 @@ def main() -> None:
     with (
         opt_sandbox(),
         custom_binaries_path_env(get_config().get(CUSTOM_BINARIES_PATH_KEY)),
+        trace_phase(command_path),
     ):
       main_args.func(main_args)
     xpk_print('XPK Done.', flush=True)
     MetricsCollector.log_complete(0)
+    CommandHistory.finish_invocation(0)
   except SystemExit as e:
     MetricsCollector.log_complete(exit_code_to_int(e.code))
+    CommandHistory.finish_invocation(exit_code_to_int(e.code))
     raise
   except:
     MetricsCollector.log_complete(-1)
+    CommandHistory.finish_invocation(-1)
     raise
   finally:
+    Tracer.write()
     if should_send_telemetry():
+      if should_send_timing_telemetry():
+        MetricsCollector.log_timing(Tracer.get_timing_summary())
       send_clearcut_payload(MetricsCollector.flush())
 
 
@@ -0,0 +1,82 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cold start import time of xpk modules, with headroom for slow machines.
+# Importing every command module with its dependencies takes over a second.
+_IMPORT_TIME_BUDGET_SECONDS = 1.0
+_HEAVY_MODULES = (
+    'kubernetes',
+    'google.cloud.storage',
+    'google.cloud.resourcemanager_v3',
+    'google.cloud.filestore',
+    'docker',
+    'jinja2',
+    'requests',
+)
+
+
+def _run_xpk_with_importtime(tmp_path, *args: str) -> tuple[set[str], float]:
+  """Runs xpk in a new interpreter and reports its imports.
+
+  Returns:
+    Names of all imported modules and the seconds spent importing xpk.
+  """
+  env = {
+      **os.environ,
+      'HOME': str(tmp_path),
+      'XPK_CACHE_HOME': str(tmp_path),
+      'XPK_VERSION_OVERRIDE': 'v0.0.0',
+      'TELEMETRY_ENABLED': 'false',
+  }
+  result = subprocess.run(
+      [sys.executable, '-X', 'importtime', '-m', 'xpk.main', *args],
+      env=env,
+      cwd=tmp_path,
+      capture_output=True,
+      text=True,
+      check=True,
+  )
+  modules = set()
+  xpk_microseconds = 0
+  for line in result.stderr.splitlines():
+    if not line.startswith('import time:') or 'cumulative' in line:
+      continue
+    _, cumulative, name = line.split('|')
+    modules.add(name.strip())
+    # Modules imported by other modules are indented under them.
+    if name.startswith(' xpk'):
+      xpk_microseconds += int(cumulative)
+  return modules, xpk_microseconds / 1e6
+
+
+@pytest.mark.parametrize(
+    argnames='args',
+    argvalues=[
+        ('version', '--dry-run'),
+        ('workload', 'list', '--help'),
+    ],
+)
+def test_cold_start_imports_stay_within_budget(tmp_path, args):
+  modules, xpk_seconds = _run_xpk_with_importtime(tmp_path, *args)
+
+  assert xpk_seconds < _IMPORT_TIME_BUDGET_SECONDS
+  assert not [module for module in _HEAVY_MODULES if module in modules]
@@ -16,20 +16,11 @@ limitations under the License.
 
 from argparse import ArgumentParser
 
-from ..commands.cluster import (
-    cluster_adapt,
-    cluster_cacheimage,
-    cluster_create,
-    cluster_create_pathways,
-    cluster_create_ray_cluster,
-    cluster_delete,
-    cluster_describe,
-    cluster_list,
-)
+from ..core.cluster_journal import CLUSTER_CREATE_PHASES
 from ..core.config import get_config
 from ..core.config import CFG_BUCKET_KEY
 from ..core.vertex import DEFAULT_VERTEX_TENSORBOARD_NAME
-from .common import add_shared_arguments, ParserOrArgumentGroup, add_tpu_type_argument, add_tpu_and_device_type_arguments
+from .common import add_shared_arguments, lazy_command, LazySubParsersAction, ParserOrArgumentGroup, add_tpu_type_argument, add_tpu_and_device_type_arguments
 from .validators import name_type
 from ..utils.feature_flags import FeatureFlags
 
@@ -42,47 +33,48 @@ def set_cluster_parser(cluster_parser: ArgumentParser):
           'These are commands related to cluster management. Look at help for'
           ' specific subcommands for more details.'
       ),
+      action=LazySubParsersAction,
   )
 
-  cluster_create_parser = cluster_subcommands.add_parser(
-      'create', help='Create cloud clusters.'
+  cluster_subcommands.add_parser(
+      'create',
+      help='Create cloud clusters.',
+      build=set_cluster_create_parser,
   )
-  cluster_create_pathways_parser = cluster_subcommands.add_parser(
+  cluster_subcommands.add_parser(
       'create-pathways',
       help='Create Pathways-on-Cloud clusters.',
+      build=set_cluster_create_pathways_parser,
   )
-  cluster_create_ray_cluster_parser = cluster_subcommands.add_parser(
+  cluster_subcommands.add_parser(
       'create-ray',
       help='Create RayCluster',
+      build=set_cluster_create_ray_parser,
   )
-  cluster_delete_parser = cluster_subcommands.add_parser(
+  cluster_subcommands.add_parser(
       'delete',
       help='Delete cloud clusters.',
+      build=set_cluster_delete_parser,
   )
-  cluster_cacheimage_parser = cluster_subcommands.add_parser(
+  cluster_subcommands.add_parser(
       'cacheimage',
       help='Cache image.',
+      build=set_cluster_cacheimage_parser,
   )
-  cluster_describe_parser = cluster_subcommands.add_parser(
+  cluster_subcommands.add_parser(
       'describe',
       help='Describe a cluster.',
+      build=set_cluster_describe_parser,
   )
-  cluster_list_parser = cluster_subcommands.add_parser(
-      'list', help='List cloud clusters.'
+  cluster_subcommands.add_parser(
+      'list', help='List cloud clusters.', build=set_cluster_list_parser
   )
-  cluster_adapt_parser = cluster_subcommands.add_parser(
-      'adapt', help='Adapt an existing cluster for XPK.'
+  cluster_subcommands.add_parser(
+      'adapt',
+      help='Adapt an existing cluster for XPK.',
+      build=set_cluster_adapt_parser,
   )
 
-  set_cluster_create_parser(cluster_create_parser)
-  set_cluster_create_pathways_parser(cluster_create_pathways_parser)
-  set_cluster_create_ray_parser(cluster_create_ray_cluster_parser)
-  set_cluster_delete_parser(cluster_delete_parser)
-  set_cluster_cacheimage_parser(cluster_cacheimage_parser)
-  set_cluster_describe_parser(cluster_describe_parser)
-  set_cluster_list_parser(cluster_list_parser)
-  set_cluster_adapt_parser(cluster_adapt_parser)
-
 
 def set_cluster_create_parser(cluster_create_parser: ArgumentParser):
   ### Required arguments specific to "cluster create"
@@ -172,7 +164,9 @@ def set_cluster_create_parser(cluster_create_parser: ArgumentParser):
   )
   add_resource_limits(cluster_create_resource_limits)
 
-  cluster_create_parser.set_defaults(func=cluster_create)
+  cluster_create_parser.set_defaults(
+      func=lazy_command('cluster', 'cluster_create')
+  )
 
 
 def set_cluster_create_pathways_parser(
@@ -256,7 +250,9 @@ def set_cluster_create_pathways_parser(
   )
   add_resource_limits(cluster_create_resource_limits)
 
-  cluster_create_pathways_parser.set_defaults(func=cluster_create_pathways)
+  cluster_create_pathways_parser.set_defaults(
+      func=lazy_command('cluster', 'cluster_create_pathways')
+  )
 
 
 def set_cluster_create_ray_parser(cluster_create_ray_parser: ArgumentParser):
@@ -334,7 +330,7 @@ def set_cluster_create_ray_parser(cluster_create_ray_parser: ArgumentParser):
   add_resource_limits(cluster_create_resource_limits)
 
   cluster_create_ray_parser.set_defaults(
-      func=cluster_create_ray_cluster,
+      func=lazy_command('cluster', 'cluster_create_ray_cluster'),
       sub_slicing=False,
       super_slicing=False,
       num_cubes=None,
@@ -376,7 +372,9 @@ def set_cluster_delete_parser(cluster_delete_parser: ArgumentParser):
       ),
   )
 
-  cluster_delete_parser.set_defaults(func=cluster_delete)
+  cluster_delete_parser.set_defaults(
+      func=lazy_command('cluster', 'cluster_delete')
+  )
 
 
 def set_cluster_cacheimage_parser(cluster_cacheimage_parser: ArgumentParser):
@@ -425,7 +423,9 @@ def set_cluster_cacheimage_parser(cluster_cacheimage_parser: ArgumentParser):
       required=False,
   )
 
-  cluster_cacheimage_parser.set_defaults(func=cluster_cacheimage)
+  cluster_cacheimage_parser.set_defaults(
+      func=lazy_command('cluster', 'cluster_cacheimage')
+  )
 
 
 def set_cluster_describe_parser(cluster_describe_parser: ArgumentParser):
@@ -452,7 +452,9 @@ def set_cluster_describe_parser(cluster_describe_parser: ArgumentParser):
   )
   add_shared_arguments(cluster_describe_optional_arguments)
 
-  cluster_describe_parser.set_defaults(func=cluster_describe)
+  cluster_describe_parser.set_defaults(
+      func=lazy_command('cluster', 'cluster_describe')
+  )
 
 
 def set_cluster_list_parser(cluster_list_parser: ArgumentParser):
@@ -462,7 +464,7 @@ def set_cluster_list_parser(cluster_list_parser: ArgumentParser):
   )
   add_shared_arguments(cluster_list_optional_arguments)
 
-  cluster_list_parser.set_defaults(func=cluster_list)
+  cluster_list_parser.set_defaults(func=lazy_command('cluster', 'cluster_list'))
 
 
 def set_cluster_adapt_parser(cluster_adapt_parser: ArgumentParser):
@@ -501,6 +503,7 @@ def set_cluster_adapt_parser(cluster_adapt_parser: ArgumentParser):
       required=False,
   )
   add_ignore_nodepool_creation_errors_argument(cluster_adapt_optional_arguments)
+  add_async_nodepool_operations_argument(cluster_adapt_optional_arguments)
   add_driver_arguments(cluster_adapt_optional_arguments)
   add_shared_arguments(cluster_adapt_optional_arguments)
   add_resource_limits(cluster_adapt_optional_arguments)
@@ -531,7 +534,9 @@ def set_cluster_adapt_parser(cluster_adapt_parser: ArgumentParser):
       cluster_adapt_tensorboard_arguments
   )
 
-  cluster_adapt_parser.set_defaults(func=cluster_adapt)
+  cluster_adapt_parser.set_defaults(
+      func=lazy_command('cluster', 'cluster_adapt')
+  )
 
 
 def add_autoprovisioning_arguments(parser_or_group: ParserOrArgumentGroup):
@@ -768,6 +773,17 @@ def add_shared_cluster_create_optional_arguments(
       help='Enable Workload Identity Federation on the cluster and node-pools.',
   )
   add_ignore_nodepool_creation_errors_argument(parser_or_group)
+  add_async_nodepool_operations_argument(parser_or_group)
+  parser_or_group.add_argument(
+      '--force-phase',
+      action='append',
+      choices=[*CLUSTER_CREATE_PHASES, 'all'],
+      help=(
+          'Run the given phase of cluster create and the phases depending on'
+          ' it, even if a previous failed run with the same arguments'
+          ' completed them. Can be repeated, `all` runs every phase.'
+      ),
+  )
   add_driver_arguments(parser_or_group)
 
 
@@ -997,3 +1013,18 @@ def add_ignore_nodepool_creation_errors_argument(
           ' creation.'
       ),
   )
+
+
+def add_async_nodepool_operations_argument(
+    parser_or_group: ParserOrArgumentGroup,
+):
+  parser_or_group.add_argument(
+      '--async-nodepool-operations',
+      action='store_true',
+      help=(
+          'Submit node pool creations and deletions as asynchronous'
+          ' operations and track all of them with a single periodic poll,'
+          ' instead of keeping a gcloud process waiting for each node pool.'
+          ' Useful when creating many node pools.'
+      ),
+  )
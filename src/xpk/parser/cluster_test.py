@@ -300,3 +300,47 @@ def test_cluster_create_ignore_nodepool_creation_errors_can_be_set():
   ])
 
   assert args.ignore_nodepool_creation_errors is True
+
+
+def test_cluster_create_async_nodepool_operations_is_false_by_default():
+  parser = argparse.ArgumentParser()
+
+  set_cluster_create_parser(parser)
+  args = parser.parse_args(
+      ["--cluster", "test-cluster", "--tpu-type", "tpu7x-2"]
+  )
+
+  assert args.async_nodepool_operations is False
+
+
+def test_cluster_create_async_nodepool_operations_can_be_set():
+  parser = argparse.ArgumentParser()
+
+  set_cluster_create_parser(parser)
+  args = parser.parse_args([
+      "--cluster",
+      "test-cluster",
+      "--tpu-type",
+      "tpu7x-2",
+      "--async-nodepool-operations",
+  ])
+
+  assert args.async_nodepool_operations is True
+
+
+def test_cluster_create_force_phase_can_be_repeated():
+  parser = argparse.ArgumentParser()
+
+  set_cluster_create_parser(parser)
+  args = parser.parse_args([
+      "--cluster",
+      "test-cluster",
+      "--tpu-type",
+      "tpu7x-2",
+      "--force-phase",
+      "nodepools",
+      "--force-phase",
+      "kueue",
+  ])
+
+  assert args.force_phase == ["nodepools", "kueue"]
@@ -15,7 +15,9 @@ limitations under the License.
 """
 
 import argparse
-from typing import Protocol, Any
+import importlib
+from typing import Callable, Protocol, Any
+from ..core.tracing import TraceFormat
 from ..core.system_characteristics import get_system_characteristics_keys_by_accelerator_type, AcceleratorType
 from ..utils.feature_flags import FeatureFlags
 import difflib
@@ -25,6 +27,78 @@ from argparse import Action, ArgumentError
 _DEFAULT_DEST_ATTR_NAME = '_supplied_flags'
 
 
+def lazy_command(module: str, name: str) -> Callable[[argparse.Namespace], Any]:
+  """Returns a subcommand function whose module is imported once it runs.
+
+  Command modules import heavy dependencies, e.g. the Kubernetes and Cloud
+  Storage clients, so only the module of the selected subcommand is loaded.
+
+  Args:
+    module: name of the module in `xpk.commands`, e.g. `cluster`.
+    name: name of the function in the module, e.g. `cluster_create`.
+
+  Returns:
+    Function running the subcommand with the parsed arguments.
+  """
+
+  def run(args: argparse.Namespace) -> Any:
+    commands = importlib.import_module(f'..commands.{module}', __package__)
+    return getattr(commands, name)(args)
+
+  run.__name__ = run.__qualname__ = name
+  return run
+
+
+class _LazyParserMap(dict):
+  """Subparsers by name, each built when it is first looked up."""
+
+  def __init__(self) -> None:
+    super().__init__()
+    self.builders: dict[str, Callable[[argparse.ArgumentParser], None]] = {}
+    self.build_hooks: list[Callable[[argparse.ArgumentParser], None]] = []
+
+  def __getitem__(self, name: str) -> argparse.ArgumentParser:
+    parser: argparse.ArgumentParser = super().__getitem__(name)
+    build = self.builders.pop(name, None)
+    if build is not None:
+      build(parser)
+      for hook in self.build_hooks:
+        hook(parser)
+    return parser
+
+
+class LazySubParsersAction(argparse._SubParsersAction):  # pylint: disable=protected-access
+  """Subparsers action adding the arguments of a subcommand once selected.
+
+  Use with `add_subparsers(action=LazySubParsersAction)` and pass `build` to
+  `add_parser`, so arguments of subcommands that are not run, e.g. long
+  choice lists of device types, are never added.
+  """
+
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    self._lazy_parsers = _LazyParserMap()
+    self._name_parser_map = self.choices = self._lazy_parsers
+
+  def add_parser(self, name, **kwargs):
+    build = kwargs.pop('build', None)
+    parser = super().add_parser(name, **kwargs)
+    if build is not None:
+      self._lazy_parsers.builders[name] = build
+    return parser
+
+  def add_build_hook(
+      self, hook: Callable[[argparse.ArgumentParser], None]
+  ) -> None:
+    """Calls `hook` with each subparser once its arguments are added."""
+    self._lazy_parsers.build_hooks.append(hook)
+
+  def build_all(self) -> None:
+    """Adds the arguments of all subcommands."""
+    for name in list(self._lazy_parsers):
+      _ = self._lazy_parsers[name]
+
+
 class ParserOrArgumentGroup(Protocol):
 
   def add_argument(self, *args, **kwargs) -> Any:
@@ -146,6 +220,27 @@ def add_shared_arguments(
       help='Whether to sandbox k8s config. (Experimental)',
       required=required,
   )
+  custom_parser_or_group.add_argument(
+      '--trace-file',
+      type=str,
+      default=None,
+      help=(
+          'Path to write a trace of all commands run by xpk to, with their'
+          ' timing, exit code and phase of the xpk command they belong to.'
+      ),
+      required=False,
+  )
+  custom_parser_or_group.add_argument(
+      '--trace-format',
+      type=str,
+      choices=[trace_format.value for trace_format in TraceFormat],
+      default=TraceFormat.CHROME.value,
+      help=(
+          'Format of --trace-file: `chrome` loads in Perfetto and'
+          ' chrome://tracing, `otlp` is OpenTelemetry OTLP JSON.'
+      ),
+      required=False,
+  )
   if FeatureFlags.DEPENDENCY_AUTO_DOWNLOAD:
     custom_parser_or_group.add_argument(
         '--dependency-auto-download',
@@ -301,6 +396,11 @@ def enable_flags_usage_tracking(
       action.__class__ = get_instrumented_class(action.__class__)
 
     if isinstance(action, argparse._SubParsersAction):  # pylint: disable=protected-access
+      # Subparsers not built yet are instrumented once they are built.
+      if isinstance(action, LazySubParsersAction):
+        action.add_build_hook(
+            lambda p: enable_flags_usage_tracking(p, dest_attr)
+        )
       for sub_parser in action.choices.values():
         enable_flags_usage_tracking(sub_parser, dest_attr)
 
@@ -15,7 +15,7 @@ limitations under the License.
 """
 
 import argparse
-from .common import extract_command_path, enable_flags_usage_tracking, retrieve_flags, add_shared_arguments, FeatureFlags
+from .common import extract_command_path, enable_flags_usage_tracking, retrieve_flags, add_shared_arguments, lazy_command, FeatureFlags, LazySubParsersAction
 from .core import set_parser
 
 
@@ -34,6 +34,31 @@ def test_enable_flags_usage_tracking():
   assert retrieve_flags(args) == 'bar baz foo'
 
 
+def test_lazy_subparsers_add_arguments_of_selected_subcommand_only():
+  built = []
+
+  def build(name):
+    def add_arguments(parser):
+      built.append(name)
+      parser.add_argument('--baz', action='store_true')
+
+    return add_arguments
+
+  parser = argparse.ArgumentParser()
+  subparsers = parser.add_subparsers(
+      dest='command', action=LazySubParsersAction
+  )
+  subparsers.add_parser('run', build=build('run'))
+  subparsers.add_parser('stop', build=build('stop'))
+  enable_flags_usage_tracking(parser)
+
+  args = parser.parse_args(['run', '--baz'])
+
+  assert built == ['run']
+  assert args.baz
+  assert retrieve_flags(args) == 'baz'
+
+
 def test_extract_zero_level_nested_command():
   parser = argparse.ArgumentParser()
   set_parser(parser=parser)
@@ -78,3 +103,14 @@ def test_add_shared_arguments_dependency_auto_download_disabled():
   add_shared_arguments(parser)
 
   assert '--dependency-auto-download' not in parser.format_help()
+
+
+def test_lazy_command_runs_function_of_commands_module(mocker):
+  mocker.patch('xpk.commands.config.get_xpk_config')
+  xpk_print = mocker.patch('xpk.commands.config.xpk_print')
+  command = lazy_command('config', 'get_config')
+
+  command(argparse.Namespace(get_config_key=['zone']))
+
+  assert command.__name__ == 'get_config'
+  xpk_print.assert_called_once()
@@ -0,0 +1,174 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from ..utils.feature_flags import FeatureFlags
+from ..utils.file import get_cache_dir, write_text_atomically
+
+# Sources defining the arguments of xpk, relative to the xpk package.
+_PARSER_SOURCES = ('parser', os.path.join('core', 'system_characteristics.py'))
+
+
+def get_completion_index_path() -> Path:
+  return get_cache_dir() / 'completion_index.json'
+
+
+def autocomplete_from_index() -> None:
+  """Answers a shell completion request of argcomplete, if this is one.
+
+  Completions come from an index of all subcommands and their arguments,
+  cached on disk, so the parsers and the modules they use are not imported.
+  The index is built from the parsers again whenever their sources or the
+  feature flags change.
+  """
+  if '_ARGCOMPLETE' not in os.environ:
+    return
+  import argcomplete  # pylint: disable=import-outside-toplevel
+
+  key = _get_index_key()
+  index = _read_index(key)
+  if index is None:
+    index = build_completion_index(_build_full_parser())
+    _write_index(key, index)
+  argcomplete.autocomplete(parser_from_completion_index(index))
+
+
+def build_completion_index(parser: argparse.ArgumentParser) -> dict[str, Any]:
+  """Returns the subcommands and arguments of the parser, recursively."""
+  # pylint: disable=protected-access
+  actions = []
+  subcommands = {}
+  for action in parser._actions:
+    if isinstance(action, argparse._HelpAction):
+      continue
+    if isinstance(action, argparse._SubParsersAction):
+      helps = {a.dest: a.help for a in action._choices_actions}
+      for name in list(action.choices):
+        subcommands[name] = {
+            'help': helps.get(name),
+            'parser': build_completion_index(action.choices[name]),
+        }
+      continue
+    completer = getattr(action, 'completer', None)
+    choices = getattr(completer, 'choices', None) or action.choices
+    actions.append({
+        'option_strings': action.option_strings,
+        'dest': action.dest,
+        'nargs': action.nargs,
+        'help': action.help,
+        'choices': [str(c) for c in choices] if choices else None,
+    })
+  return {'actions': actions, 'subcommands': subcommands}
+
+
+def parser_from_completion_index(
+    index: dict[str, Any],
+) -> argparse.ArgumentParser:
+  """Returns a parser with the subcommands and arguments of the index.
+
+  The parser is only good for completing arguments: values are neither
+  converted nor validated, and subcommands have no functions to run.
+  """
+  parser = argparse.ArgumentParser(prog='xpk')
+  _add_indexed_arguments(parser, index)
+  return parser
+
+
+def _add_indexed_arguments(
+    parser: argparse.ArgumentParser, index: dict[str, Any]
+) -> None:
+  from argcomplete import ChoicesCompleter  # pylint: disable=import-outside-toplevel
+
+  for action in index['actions']:
+    kwargs: dict[str, Any] = {'help': action['help']}
+    if action['nargs'] == 0:
+      kwargs['action'] = 'store_true'
+    else:
+      kwargs['nargs'] = action['nargs']
+    if action['option_strings']:
+      argument = parser.add_argument(
+          *action['option_strings'], dest=action['dest'], **kwargs
+      )
+    else:
+      argument = parser.add_argument(action['dest'], **kwargs)
+    if action['choices'] is not None:
+      argument.completer = ChoicesCompleter(action['choices'])  # type: ignore[attr-defined]
+  if index['subcommands']:
+    subparsers = parser.add_subparsers()
+    for name, subcommand in index['subcommands'].items():
+      _add_indexed_arguments(
+          subparsers.add_parser(name, help=subcommand['help']),
+          subcommand['parser'],
+      )
+
+
+def _build_full_parser() -> argparse.ArgumentParser:
+  # pylint: disable=import-outside-toplevel
+  from .core import set_parser
+
+  parser = argparse.ArgumentParser(description='xpk command', prog='xpk')
+  set_parser(parser=parser)
+  return parser
+
+
+def _get_index_key() -> str:
+  """Returns a key that changes with the arguments xpk accepts."""
+  package_dir = Path(__file__).parent.parent
+  files: list[Path] = []
+  for source in _PARSER_SOURCES:
+    path = package_dir / source
+    files.extend(sorted(path.glob('*.py')) if path.is_dir() else [path])
+  fingerprint: list[Any] = []
+  for path in files:
+    try:
+      stat = path.stat()
+      fingerprint.append([str(path), stat.st_mtime_ns, stat.st_size])
+    except OSError:
+      fingerprint.append([str(path), None, None])
+  # Feature flags add and remove arguments.
+  fingerprint.append({
+      name: getattr(FeatureFlags, name)
+      for name in dir(FeatureFlags)
+      if name.isupper()
+  })
+  return hashlib.sha256(json.dumps(fingerprint).encode()).hexdigest()
+
+
+def _read_index(key: str) -> dict[str, Any] | None:
+  try:
+    with open(get_completion_index_path(), encoding='utf-8') as f:
+      cached = json.load(f)
+  except (OSError, ValueError):
+    return None
+  if not isinstance(cached, dict) or cached.get('key') != key:
+    return None
+  index: dict[str, Any] = cached['index']
+  return index
+
+
+def _write_index(key: str, index: dict[str, Any]) -> None:
+  try:
+    write_text_atomically(
+        get_completion_index_path(), json.dumps({'key': key, 'index': index})
+    )
+  except OSError:
+    pass
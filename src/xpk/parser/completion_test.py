@@ -0,0 +1,106 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import argparse
+import io
+
+import argcomplete
+import pytest
+from pytest_mock import MockerFixture
+
+from . import completion
+from .completion import autocomplete_from_index, build_completion_index, get_completion_index_path, parser_from_completion_index
+from .core import set_parser
+
+
+@pytest.fixture(autouse=True)
+def debug_stream(mocker: MockerFixture):
+  # argcomplete writes debug output to fd 9, which pytest uses.
+  mocker.patch('argcomplete.CompletionFinder._init_debug_stream')
+
+
+def _complete(
+    parser: argparse.ArgumentParser,
+    monkeypatch: pytest.MonkeyPatch,
+    line: str,
+) -> set[str]:
+  monkeypatch.setenv('_ARGCOMPLETE', '1')
+  monkeypatch.setenv('_ARGCOMPLETE_IFS', '\n')
+  monkeypatch.setenv('COMP_LINE', line)
+  monkeypatch.setenv('COMP_POINT', str(len(line)))
+  output = io.StringIO()
+  with pytest.raises(SystemExit):
+    argcomplete.autocomplete(parser, exit_method=exit, output_stream=output)
+  return set(output.getvalue().split('\n'))
+
+
+def _get_full_parser() -> argparse.ArgumentParser:
+  parser = argparse.ArgumentParser(prog='xpk')
+  set_parser(parser=parser)
+  return parser
+
+
+@pytest.mark.parametrize(
+    argnames='line',
+    argvalues=[
+        'xpk ',
+        'xpk cluster ',
+        'xpk cluster create --',
+        'xpk cluster create --tpu-type v5p-1',
+        'xpk workload create --device-type h1',
+        'xpk workload list --cluster c --',
+        'xpk storage ',
+    ],
+)
+def test_index_completes_like_parsers(
+    monkeypatch: pytest.MonkeyPatch, line: str
+):
+  index = build_completion_index(_get_full_parser())
+
+  completions = _complete(
+      parser_from_completion_index(index), monkeypatch, line
+  )
+
+  assert completions == _complete(_get_full_parser(), monkeypatch, line)
+  assert len(completions) > 1
+
+
+def test_autocomplete_from_index_builds_index_once(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+):
+  monkeypatch.setenv('_ARGCOMPLETE', '1')
+  autocomplete = mocker.patch('argcomplete.autocomplete')
+  build_full_parser = mocker.spy(completion, '_build_full_parser')
+
+  autocomplete_from_index()
+  autocomplete_from_index()
+
+  assert build_full_parser.call_count == 1
+  assert get_completion_index_path().exists()
+  parser = autocomplete.call_args[0][0]
+  assert 'cluster' in parser.format_help()
+
+
+def test_autocomplete_from_index_does_nothing_outside_completion(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+):
+  monkeypatch.delenv('_ARGCOMPLETE', raising=False)
+  autocomplete = mocker.patch('argcomplete.autocomplete')
+
+  autocomplete_from_index()
+
+  autocomplete.assert_not_called()
+  assert not get_completion_index_path().exists()
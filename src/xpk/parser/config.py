@@ -14,9 +14,8 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from ..commands.config import get_config, set_config
 from ..core.config import DEFAULT_KEYS
-from .common import add_shared_arguments
+from .common import add_shared_arguments, lazy_command
 
 
 def set_config_parsers(config_parser):
@@ -45,5 +44,5 @@ def set_config_parsers(config_parser):
       type=str,
       nargs=1,
   )
-  config_set_parser.set_defaults(func=set_config)
-  config_get_parser.set_defaults(func=get_config)
+  config_set_parser.set_defaults(func=lazy_command('config', 'set_config'))
+  config_get_parser.set_defaults(func=lazy_command('config', 'get_config'))
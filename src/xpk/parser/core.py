@@ -19,42 +19,64 @@ import argparse
 from .config import set_config_parsers
 
 from ..utils.console import xpk_print
+from .common import LazySubParsersAction
 from .cluster import set_cluster_parser
 from .inspector import set_inspector_parser
 from .storage import set_storage_parser
 from .workload import set_workload_parsers
 from .info import set_info_parser
 from .version import set_version_parser
+from .stats import set_stats_parser
 
 
 def set_parser(parser: argparse.ArgumentParser):
-  xpk_subcommands = parser.add_subparsers(
-      title="xpk subcommands", dest="xpk_subcommands", help="Top level commands"
+  # Arguments of each subcommand are only added once it is selected.
+  xpk_subcommands: LazySubParsersAction = parser.add_subparsers(  # type: ignore[assignment]
+      title="xpk subcommands",
+      dest="xpk_subcommands",
+      help="Top level commands",
+      action=LazySubParsersAction,
   )
   workload_parser = xpk_subcommands.add_parser(
-      "workload", help="Commands around workload management"
+      "workload",
+      help="Commands around workload management",
+      build=set_workload_parsers,
   )
   storage_parser = xpk_subcommands.add_parser(
-      "storage", help="Commands around storage management"
+      "storage",
+      help="Commands around storage management",
+      build=set_storage_parser,
   )
   cluster_parser = xpk_subcommands.add_parser(
       "cluster",
       help="Commands around creating, deleting, and viewing clusters.",
+      build=set_cluster_parser,
   )
-  inspector_parser = xpk_subcommands.add_parser(
+  xpk_subcommands.add_parser(
       "inspector",
       help="Commands around investigating workload, and Kueue failures.",
+      build=set_inspector_parser,
   )
   info_parser = xpk_subcommands.add_parser(
       "info",
       help="Commands around listing kueue clusterqueues and localqueues.",
+      build=set_info_parser,
   )
   version_parser = xpk_subcommands.add_parser(
-      "version", help="Command to get xpk version"
+      "version",
+      help="Command to get xpk version",
+      build=set_version_parser,
   )
 
   config_parser = xpk_subcommands.add_parser(
-      "config", help="Commands to set and retrieve values from xpk config."
+      "config",
+      help="Commands to set and retrieve values from xpk config.",
+      build=set_config_parsers,
+  )
+  xpk_subcommands.add_parser(
+      "stats",
+      help="Command to report latencies of past xpk commands.",
+      build=set_stats_parser,
   )
 
   def default_subcommand_function(
@@ -69,6 +91,7 @@ def set_parser(parser: argparse.ArgumentParser):
       0 if successful and 1 otherwise.
     """
     xpk_print("Welcome to XPK! See below for overall commands:", flush=True)
+    xpk_subcommands.build_all()
     parser.print_help()
     cluster_parser.print_help()
     workload_parser.print_help()
@@ -86,11 +109,3 @@ def set_parser(parser: argparse.ArgumentParser):
   storage_parser.set_defaults(func=default_subcommand_function)
   version_parser.set_defaults(func=default_subcommand_function)
   config_parser.set_defaults(func=default_subcommand_function)
-
-  set_workload_parsers(workload_parser=workload_parser)
-  set_cluster_parser(cluster_parser=cluster_parser)
-  set_inspector_parser(inspector_parser=inspector_parser)
-  set_info_parser(info_parser=info_parser)
-  set_storage_parser(storage_parser=storage_parser)
-  set_version_parser(version_parser=version_parser)
-  set_config_parsers(config_parser=config_parser)
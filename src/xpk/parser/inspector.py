@@ -14,9 +14,8 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from ..commands.inspector import inspector
 from .validators import name_type
-from .common import add_shared_arguments
+from .common import add_shared_arguments, lazy_command
 
 
 def set_inspector_parser(inspector_parser):
@@ -62,4 +61,4 @@ def set_inspector_parser(inspector_parser):
       ),
   )
 
-  inspector_parser.set_defaults(func=inspector)
+  inspector_parser.set_defaults(func=lazy_command('inspector', 'inspector'))
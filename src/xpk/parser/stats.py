@@ -0,0 +1,45 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import argparse
+
+from .common import lazy_command
+from .validators import name_type
+
+
+def set_stats_parser(stats_parser: argparse.ArgumentParser) -> None:
+  stats_optional_arguments = stats_parser.add_argument_group(
+      'Optional Arguments', 'Arguments optional for stats.'
+  )
+  stats_optional_arguments.add_argument(
+      '--days',
+      type=int,
+      default=30,
+      help='Number of past days to report on, 30 by default.',
+  )
+  stats_optional_arguments.add_argument(
+      '--limit',
+      type=int,
+      default=10,
+      help='Number of commands and slowest runs listed, 10 by default.',
+  )
+  stats_optional_arguments.add_argument(
+      '--cluster',
+      type=name_type,
+      default=None,
+      help='Only report on invocations working on this cluster.',
+  )
+  stats_parser.set_defaults(func=lazy_command('stats', 'stats'))
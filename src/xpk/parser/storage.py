@@ -16,16 +16,10 @@ limitations under the License.
 
 import argparse
 
-from ..commands.storage import (
-    storage_attach,
-    storage_create,
-    storage_delete,
-    storage_detach,
-    storage_list,
-)
 from .common import (
     add_cluster_arguments,
     add_shared_arguments,
+    lazy_command,
 )
 from typing import Protocol, Any
 
@@ -61,7 +55,9 @@ def add_storage_attach_parser(
           'attach', help='attach XPK Storage.'
       )
   )
-  storage_attach_parser.set_defaults(func=storage_attach)
+  storage_attach_parser.set_defaults(
+      func=lazy_command('storage', 'storage_attach')
+  )
   req_args = storage_attach_parser.add_argument_group(
       'Required Arguments',
       'Arguments required for storage attach.',
@@ -192,7 +188,9 @@ def add_storage_create_parser(storage_subcommands_parser: Subcommands) -> None:
           'create', help='create XPK Storage.'
       )
   )
-  storage_create_parser.set_defaults(func=storage_create)
+  storage_create_parser.set_defaults(
+      func=lazy_command('storage', 'storage_create')
+  )
   req_args = storage_create_parser.add_argument_group(
       'Required Arguments',
       'Arguments required for storage create.',
@@ -287,7 +285,7 @@ def add_storage_list_parser(storage_subcommands_parser: Subcommands) -> None:
   storage_list_parser: argparse.ArgumentParser = (
       storage_subcommands_parser.add_parser('list', help='List XPK Storages.')
   )
-  storage_list_parser.set_defaults(func=storage_list)
+  storage_list_parser.set_defaults(func=lazy_command('storage', 'storage_list'))
   add_shared_arguments(storage_list_parser)
   req_args = storage_list_parser.add_argument_group(
       'Required Arguments',
@@ -305,7 +303,9 @@ def add_storage_detach_parser(storage_subcommands_parser: Subcommands) -> None:
           'detach', help='Detach XPK Storage.'
       )
   )
-  storage_detach_parser.set_defaults(func=storage_detach)
+  storage_detach_parser.set_defaults(
+      func=lazy_command('storage', 'storage_detach')
+  )
   add_shared_arguments(storage_detach_parser)
 
   req_args = storage_detach_parser.add_argument_group(
@@ -322,7 +322,9 @@ def add_storage_delete_parser(storage_subcommands_parser: Subcommands) -> None:
           'delete', help='Delete XPK Storage.'
       )
   )
-  storage_delete_parser.set_defaults(func=storage_delete)
+  storage_delete_parser.set_defaults(
+      func=lazy_command('storage', 'storage_delete')
+  )
   add_shared_arguments(storage_delete_parser)
 
   req_args = storage_delete_parser.add_argument_group(
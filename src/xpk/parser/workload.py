@@ -16,14 +16,8 @@ limitations under the License.
 
 import argparse
 from argparse import ArgumentParser
-from ..commands.workload import (
-    workload_create,
-    workload_create_pathways,
-    workload_delete,
-    workload_list,
-)
 from ..core.docker_image import DEFAULT_DOCKER_IMAGE, DEFAULT_SCRIPT_DIR
-from .common import add_shared_arguments, add_tpu_type_argument, add_tpu_and_device_type_arguments
+from .common import add_shared_arguments, lazy_command, LazySubParsersAction, add_tpu_type_argument, add_tpu_and_device_type_arguments
 from .validators import directory_path_type, name_type
 
 
@@ -35,31 +29,30 @@ def set_workload_parsers(workload_parser: ArgumentParser):
           '`create`, `create-pathways`, `list` and `delete` workloads on'
           ' clusters'
       ),
+      action=LazySubParsersAction,
   )
 
   # "workload create" command parser.
-  workload_create_parser = workload_subcommands.add_parser(
-      'create', help='Create a new job.'
+  workload_subcommands.add_parser(
+      'create', help='Create a new job.', build=set_workload_create_parser
   )
-  set_workload_create_parser(workload_create_parser)
 
   # "workload create-pathways" command parser.
-  workload_create_pathways_parser = workload_subcommands.add_parser(
-      'create-pathways', help='Create a new job.'
+  workload_subcommands.add_parser(
+      'create-pathways',
+      help='Create a new job.',
+      build=set_workload_create_pathways_parser,
   )
-  set_workload_create_pathways_parser(workload_create_pathways_parser)
 
   # "workload delete" command parser.
-  workload_delete_parser = workload_subcommands.add_parser(
-      'delete', help='Delete job.'
+  workload_subcommands.add_parser(
+      'delete', help='Delete job.', build=set_workload_delete_parser
   )
-  set_workload_delete_parser(workload_delete_parser)
 
   # "workload list" command parser.
-  workload_list_parser = workload_subcommands.add_parser(
-      'list', help='List jobs.'
+  workload_subcommands.add_parser(
+      'list', help='List jobs.', build=set_workload_list_parser
   )
-  set_workload_list_parser(workload_list_parser)
 
 
 def set_workload_create_parser(workload_create_parser: ArgumentParser):
@@ -224,7 +217,9 @@ def set_workload_create_parser(workload_create_parser: ArgumentParser):
   add_shared_workload_create_autoprovisioning_arguments([
       workload_create_autoprovisioning_arguments,
   ])
-  workload_create_parser.set_defaults(func=workload_create)
+  workload_create_parser.set_defaults(
+      func=lazy_command('workload', 'workload_create')
+  )
 
 
 def set_workload_create_pathways_parser(
@@ -402,7 +397,9 @@ def set_workload_create_pathways_parser(
   add_shared_workload_create_autoprovisioning_arguments([
       workload_create_pathways_autoprovisioning_arguments,
   ])
-  workload_create_pathways_parser.set_defaults(func=workload_create_pathways)
+  workload_create_pathways_parser.set_defaults(
+      func=lazy_command('workload', 'workload_create_pathways')
+  )
 
 
 def set_workload_delete_parser(workload_delete_parser: ArgumentParser):
@@ -471,7 +468,9 @@ def set_workload_delete_parser(workload_delete_parser: ArgumentParser):
           'Forces workload deletion command to run without additional approval.'
       ),
   )
-  workload_delete_parser.set_defaults(func=workload_delete)
+  workload_delete_parser.set_defaults(
+      func=lazy_command('workload', 'workload_delete')
+  )
 
 
 def set_workload_list_parser(workload_list_parser: ArgumentParser):
@@ -541,7 +540,9 @@ def set_workload_list_parser(workload_list_parser: ArgumentParser):
 
   add_shared_arguments(workload_list_parser)
 
-  workload_list_parser.set_defaults(func=workload_list)
+  workload_list_parser.set_defaults(
+      func=lazy_command('workload', 'workload_list')
+  )
 
 
 def add_shared_workload_create_required_arguments(args_parsers):
@@ -14,16 +14,14 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import sys
 import os
-import requests
-import json
+import sys
+
+# Makes xpk importable when it is run from source.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-file_path = sys.argv[1]
-if os.path.exists(file_path):
-  with open(file_path, mode="r", encoding="utf-8") as file:
-    kwargs = json.load(file)
-    response = requests.request(**kwargs)
-    print(f"Telemetry upload finished with {response.status_code} status code")
+from xpk.core.telemetry import flush_telemetry_spool  # pylint: disable=wrong-import-position
 
-  os.remove(file_path)
+status_code = flush_telemetry_spool(sys.argv[1])
+if status_code is not None:
+  print(f"Telemetry upload finished with {status_code} status code")
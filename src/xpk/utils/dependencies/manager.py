@@ -19,11 +19,12 @@ from pathlib import Path
 
 from xpk.utils.dependencies.binary_dependencies import BinaryDependencies, BinaryDependency
 from xpk.utils.dependencies.downloader import fetch_dependency
+from xpk.utils.dependencies.validation_cache import mark_validated
+from xpk.utils.file import get_cache_dir
 
 
 def _get_cache_bin_dir() -> Path:
-  cache_dir = os.environ.get("XPK_CACHE_HOME", Path.home() / ".cache")
-  return Path(cache_dir).expanduser() / "xpk" / "bin"
+  return get_cache_dir() / "bin"
 
 
 def _filename(dependency: BinaryDependency) -> str:
@@ -46,7 +47,12 @@ def ensure_dependency(dependency: BinaryDependency) -> bool:
   if binary_path.exists() and os.access(binary_path, os.X_OK):
     return True
 
-  return fetch_dependency(
+  fetched = fetch_dependency(
       binary_dependency=dependency,
       target_dir=version_dir,
   )
+  if fetched:
+    # Downloads are verified against their checksums, so they are not run to
+    # validate them.
+    mark_validated([str(binary_path)])
+  return fetched
@@ -20,6 +20,7 @@ from pytest_mock import MockerFixture
 
 from xpk.utils.dependencies import manager
 from xpk.utils.dependencies.binary_dependencies import BinaryDependencies
+from xpk.utils.dependencies.validation_cache import is_validated
 
 
 def test_get_dependencies_path_default_cache_dir(
@@ -134,3 +135,30 @@ def test_ensure_dependency_needs_download(
   mock_fetch.assert_called_once_with(
       binary_dependency=dep, target_dir=expected_version_dir
   )
+
+
+def test_ensure_dependency_marks_download_validated(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+) -> None:
+  monkeypatch.setenv('XPK_CACHE_HOME', str(tmp_path))
+  dep = BinaryDependencies.KUBECTL.value
+  binary_path = (
+      tmp_path / 'xpk' / 'bin' / f'{dep.binary_name}-{dep.version}' / 'kubectl'
+  )
+
+  def fetch_dependency(binary_dependency, target_dir):
+    target_dir.mkdir(parents=True)
+    binary_path.touch()
+    binary_path.chmod(0o755)
+    return True
+
+  mocker.patch(
+      'xpk.utils.dependencies.manager.fetch_dependency',
+      side_effect=fetch_dependency,
+  )
+
+  manager.ensure_dependency(dep)
+
+  assert is_validated([str(binary_path)])
@@ -0,0 +1,83 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable
+
+from xpk.utils.execution_context import is_dry_run
+from xpk.utils.file import get_cache_dir, write_text_atomically
+
+
+def get_validation_cache_path() -> Path:
+  return get_cache_dir() / "validated_binaries.json"
+
+
+def _get_identity(binary: str) -> tuple[str, list[int]] | None:
+  """Returns the resolved path of the binary with its mtime and size."""
+  path = shutil.which(binary)
+  if path is None:
+    return None
+  try:
+    real_path = os.path.realpath(path)
+    stat = os.stat(real_path)
+  except OSError:
+    return None
+  return real_path, [stat.st_mtime_ns, stat.st_size]
+
+
+def _read_validated() -> dict[str, list[int]]:
+  try:
+    with open(get_validation_cache_path(), encoding="utf-8") as f:
+      validated = json.load(f)
+  except (OSError, ValueError):
+    return {}
+  return validated if isinstance(validated, dict) else {}
+
+
+def is_validated(binaries: Iterable[str]) -> bool:
+  """Returns whether the binaries were validated and did not change since.
+
+  Args:
+    binaries: names or paths of binaries, resolved like the shell does.
+
+  Returns:
+    True if each binary, as currently found on PATH, was marked validated
+    with the same modification time and size.
+  """
+  validated = _read_validated()
+  identities = [_get_identity(binary) for binary in binaries]
+  return bool(identities) and all(
+      identity is not None and validated.get(identity[0]) == identity[1]
+      for identity in identities
+  )
+
+
+def mark_validated(binaries: Iterable[str]) -> None:
+  """Records the binaries, as currently found on PATH, as validated."""
+  if is_dry_run():
+    return
+  validated = _read_validated()
+  for binary in binaries:
+    identity = _get_identity(binary)
+    if identity is not None:
+      validated[identity[0]] = identity[1]
+  try:
+    write_text_atomically(get_validation_cache_path(), json.dumps(validated))
+  except OSError:
+    pass
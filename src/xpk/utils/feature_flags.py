@@ -47,6 +47,12 @@ class _FeatureFlags:
   NATIVE_CLUSTER_TOOLKIT_ENABLED = _get_boolean_flag(
       "NATIVE_CLUSTER_TOOLKIT_ENABLED", default=False
   )
+  NATIVE_KUBERNETES_READS_ENABLED = _get_boolean_flag(
+      "NATIVE_KUBERNETES_READS_ENABLED", default=False
+  )
+  NATIVE_GCP_READS_ENABLED = _get_boolean_flag(
+      "NATIVE_GCP_READS_ENABLED", default=False
+  )
 
 
 FeatureFlags = _FeatureFlags()
@@ -14,9 +14,14 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import contextlib
 import tempfile
 import os
 import hashlib
+import sys
+import threading
+from pathlib import Path
+from typing import Iterator
 from .execution_context import is_dry_run
 from .console import xpk_print
 
@@ -94,6 +99,66 @@ def ensure_directory_exists(directory_path: str) -> None:
     os.makedirs(directory_path)
 
 
+def get_cache_dir() -> Path:
+  """Returns the directory where xpk keeps its cached data."""
+  cache_home = os.environ.get('XPK_CACHE_HOME', Path.home() / '.cache')
+  return Path(cache_home).expanduser() / 'xpk'
+
+
+@contextlib.contextmanager
+def file_lock(path: str | Path) -> Iterator[None]:
+  """Holds an exclusive lock on `path`, shared with other xpk processes.
+
+  The lock is advisory and only taken on platforms that support fcntl.
+
+  Args:
+    path: The lock file, created if it does not exist.
+  """
+  if sys.platform == 'win32':
+    yield
+    return
+
+  import fcntl  # pylint: disable=import-outside-toplevel
+
+  with open(path, mode='a', encoding='utf-8') as f:
+    fcntl.flock(f, fcntl.LOCK_EX)
+    try:
+      yield
+    finally:
+      fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def write_text_atomically(
+    path: str | Path, text: str, mode: int = 0o666
+) -> None:
+  """Replaces the contents of a file, so readers never see a partial write.
+
+  The text is written to a temporary file next to `path`, which is then
+  renamed over it. Missing parent directories are created.
+
+  Args:
+    path: The file to write.
+    text: The new contents of the file.
+    mode: Permissions of the file if it is created, before the umask.
+
+  Raises:
+    OSError: if the file cannot be written.
+  """
+  path = Path(path)
+  path.parent.mkdir(parents=True, exist_ok=True)
+  tmp_path = path.with_name(
+      f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp'
+  )
+  try:
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with open(fd, 'w', encoding='utf-8') as f:
+      f.write(text)
+    os.replace(tmp_path, path)
+  except BaseException:
+    tmp_path.unlink(missing_ok=True)
+    raise
+
+
 def _hash_filename(seed: str) -> str:
   m = hashlib.sha256()
   m.update(seed.encode('utf-8'))
@@ -0,0 +1,55 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import stat
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .file import write_text_atomically
+
+
+def test_write_text_atomically_replaces_file(tmp_path):
+  path = tmp_path / "dir" / "file.json"
+
+  write_text_atomically(path, "old")
+  write_text_atomically(path, "new", mode=0o600)
+
+  assert path.read_text(encoding="utf-8") == "new"
+  assert os.listdir(path.parent) == ["file.json"]
+
+
+def test_write_text_atomically_creates_file_with_mode(tmp_path):
+  path = tmp_path / "file"
+
+  write_text_atomically(path, "secret", mode=0o600)
+
+  assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_write_text_atomically_keeps_file_when_write_fails(
+    tmp_path, mocker: MockerFixture
+):
+  path = tmp_path / "file"
+  write_text_atomically(path, "old")
+  mocker.patch("os.replace", side_effect=OSError("disk full"))
+
+  with pytest.raises(OSError):
+    write_text_atomically(path, "new")
+
+  assert path.read_text(encoding="utf-8") == "old"
+  assert os.listdir(tmp_path) == ["file"]
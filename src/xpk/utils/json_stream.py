@@ -0,0 +1,85 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import re
+from typing import Any, Callable
+
+_ITEMS_START = re.compile(r'"items"\s*:\s*\[')
+_SEPARATORS = ' \t\r\n,'
+
+
+class ListItemsParser:
+  """Incrementally parses the items of a Kubernetes List JSON document.
+
+  Items are passed to `on_item` as soon as they are complete, so memory use is
+  bounded by the size of a single item rather than of the whole document.
+  """
+
+  def __init__(self, on_item: Callable[[Any], None]):
+    self._on_item = on_item
+    self._decoder = json.JSONDecoder()
+    self._buffer = ''
+    self._in_items = False
+    self._done = False
+
+  def feed(self, chunk: str) -> None:
+    """Parses the next chunk of the document."""
+    if self._done:
+      return
+    self._buffer += chunk
+    if not self._in_items:
+      # "items" is the first non-scalar field of a List, so its first
+      # occurrence is the top-level one.
+      match = _ITEMS_START.search(self._buffer)
+      if match is None:
+        return
+      self._buffer = self._buffer[match.end() :]
+      self._in_items = True
+    self._parse_items()
+
+  def close(self) -> None:
+    """Validates the end of the document.
+
+    Raises:
+      ValueError: if the document is not valid JSON or is truncated.
+    """
+    if not self._in_items:
+      # A document without items, validate it as a whole.
+      if self._buffer.strip():
+        json.loads(self._buffer)
+    elif not self._done:
+      raise ValueError('JSON document ended before the end of its items.')
+
+  def _parse_items(self) -> None:
+    position = 0
+    while True:
+      while (
+          position < len(self._buffer) and self._buffer[position] in _SEPARATORS
+      ):
+        position += 1
+      if position >= len(self._buffer):
+        break
+      if self._buffer[position] == ']':
+        self._done = True
+        break
+      try:
+        item, position = self._decoder.raw_decode(self._buffer, position)
+      except json.JSONDecodeError:
+        # The item is incomplete, wait for the next chunk.
+        break
+      self._on_item(item)
+    self._buffer = '' if self._done else self._buffer[position:]
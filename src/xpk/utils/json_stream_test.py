@@ -0,0 +1,67 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+
+import pytest
+
+from .json_stream import ListItemsParser
+
+_ITEMS = [
+    {'metadata': {'name': 'a', 'items': [1, 2]}, 'spec': {'x': '] ,'}},
+    {'metadata': {'name': 'b'}},
+]
+
+
+@pytest.mark.parametrize(argnames='chunk_size', argvalues=[1, 7, 1000000])
+@pytest.mark.parametrize(argnames='indent', argvalues=[None, 4])
+def test_parses_items_of_chunked_document(chunk_size: int, indent: int | None):
+  document = json.dumps(
+      {'apiVersion': 'v1', 'items': _ITEMS, 'kind': 'List'}, indent=indent
+  )
+  items: list = []
+  parser = ListItemsParser(items.append)
+
+  for i in range(0, len(document), chunk_size):
+    parser.feed(document[i : i + chunk_size])
+  parser.close()
+
+  assert items == _ITEMS
+
+
+@pytest.mark.parametrize(
+    argnames='document', argvalues=['', '{"kind": "List"}', '{"items": []}']
+)
+def test_accepts_documents_without_items(document: str):
+  items: list = []
+  parser = ListItemsParser(items.append)
+
+  parser.feed(document)
+  parser.close()
+
+  assert not items
+
+
+@pytest.mark.parametrize(
+    argnames='document',
+    argvalues=['not json', '{"items": [{"a": 1}, {"b":'],
+)
+def test_rejects_invalid_documents(document: str):
+  parser = ListItemsParser(lambda _: None)
+
+  parser.feed(document)
+  with pytest.raises(ValueError):
+    parser.close()
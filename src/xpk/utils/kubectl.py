@@ -19,13 +19,14 @@ import os
 import tempfile
 from typing import Iterator
 
-from kubernetes.client.exceptions import ApiException
-from kubernetes.dynamic import DynamicClient
-
 from .console import xpk_print
 
 
 def apply_kubectl_manifest(client, manifest) -> int:
+  # pylint: disable=import-outside-toplevel
+  from kubernetes.client.exceptions import ApiException
+  from kubernetes.dynamic import DynamicClient
+
   xpk_print('Applying manifest')
   dynamic_client = DynamicClient(client)
 
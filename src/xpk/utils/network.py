@@ -19,6 +19,7 @@ import socket
 import requests
 from .console import xpk_print
 from .execution_context import is_dry_run
+from ..core.metadata_cache import MACHINE_IPS
 
 # Retrives machine's external IP address
 ip_resolver_url = "http://api.ipify.org"
@@ -43,13 +44,24 @@ def get_current_machine_ip(external_ip=True):
   try:
     if external_ip:
       # Get external IP address
+      cached_ip = MACHINE_IPS.get(("external",))
+      if cached_ip is not None:
+        return 0, cached_ip
       response = requests.get(ip_resolver_url, timeout=30)
-      return 0, response.text
+      response.raise_for_status()
+      # Error pages of the resolver must not be used, or cached, as an IP.
+      ip = str(ipaddress.ip_address(response.text.strip()))
+      MACHINE_IPS.put(("external",), ip)
+      return 0, ip
     else:
       # Get internal IP address
       hostname = socket.gethostname()
       return 0, socket.gethostbyname(hostname)
-  except (requests.exceptions.RequestException, socket.gaierror) as e:
+  except (
+      requests.exceptions.RequestException,
+      socket.gaierror,
+      ValueError,
+  ) as e:
     xpk_print(f"Error getting IP address: {e}")
     return 1, None
 
@@ -0,0 +1,55 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+from .network import get_current_machine_ip
+
+
+@pytest.fixture(autouse=True)
+def xpk_print(mocker: MockerFixture):
+  return mocker.patch("xpk.utils.network.xpk_print")
+
+
+def _mock_response(mocker: MockerFixture, text: str, status_code: int = 200):
+  response = requests.Response()
+  response.status_code = status_code
+  response._content = text.encode()  # pylint: disable=protected-access
+  return mocker.patch("requests.get", return_value=response)
+
+
+def test_get_current_machine_ip_caches_external_ip(mocker: MockerFixture):
+  get = _mock_response(mocker, "203.0.113.7\n")
+
+  assert get_current_machine_ip() == (0, "203.0.113.7")
+  assert get_current_machine_ip() == (0, "203.0.113.7")
+  get.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    argnames="text,status_code",
+    argvalues=[("203.0.113.7", 429), ("<html>Rate limited</html>", 200)],
+)
+def test_get_current_machine_ip_does_not_cache_invalid_response(
+    mocker: MockerFixture, text: str, status_code: int
+):
+  get = _mock_response(mocker, text, status_code)
+
+  assert get_current_machine_ip() == (1, None)
+  assert get_current_machine_ip() == (1, None)
+  assert get.call_count == 2
@@ -0,0 +1,226 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import enum
+import shutil
+import sys
+import time
+from typing import Callable, Sequence, TextIO
+
+from tabulate import tabulate
+
+# A terminal shows a single status line, redrawn at most this often.
+_TTY_REFRESH_SECONDS = 1.0
+# Logs get a summary line at most this often.
+_LOG_REFRESH_SECONDS = 60.0
+_SLOWEST_TASKS_SHOWN = 3
+_PREFIX = '[XPK] '
+
+
+class TaskState(enum.Enum):
+  PENDING = 'pending'
+  RUNNING = 'running'
+  SUCCEEDED = 'succeeded'
+  FAILED = 'failed'
+
+
+def _is_tty(stream: TextIO) -> bool:
+  isatty = getattr(stream, 'isatty', None)
+  return bool(isatty and isatty())
+
+
+def _format_duration(seconds: float) -> str:
+  seconds = int(seconds)
+  if seconds < 60:
+    return f'{seconds}s'
+  if seconds < 3600:
+    return f'{seconds // 60}m{seconds % 60:02d}s'
+  return f'{seconds // 3600}h{seconds // 60 % 60:02d}m'
+
+
+class BatchProgress:
+  """Reports the progress of a batch of long running tasks.
+
+  On a terminal a single status line is kept up to date. Otherwise, e.g. in CI
+  logs, a summary line is printed at most once per minute, and failures as
+  they happen. Both show counts of tasks by state, an estimate of the
+  remaining time and the slowest running tasks with their logs. Once the
+  batch is done a table of task durations is printed.
+  """
+
+  def __init__(
+      self,
+      jobname: str,
+      task_names: Sequence[str],
+      log_paths: Sequence[str] | None = None,
+      stream: TextIO | None = None,
+      clock: Callable[[], float] = time.monotonic,
+  ):
+    self._jobname = jobname
+    self._task_names = list(task_names)
+    self._log_paths = list(log_paths) if log_paths is not None else None
+    self._stream = stream if stream is not None else sys.stdout
+    self._clock = clock
+    self._is_tty = _is_tty(self._stream)
+    self._states = [TaskState.PENDING] * len(self._task_names)
+    self._started_at: dict[int, float] = {}
+    self._durations: dict[int, float] = {}
+    self._start_time = clock()
+    self._last_render: float | None = None
+    self._live_line_shown = False
+
+  @property
+  def refresh_interval(self) -> float:
+    """Seconds after which `refresh` has something new to show."""
+    return _TTY_REFRESH_SECONDS if self._is_tty else _LOG_REFRESH_SECONDS
+
+  def set_running(self, index: int) -> None:
+    self._states[index] = TaskState.RUNNING
+    self._started_at[index] = self._clock()
+
+  def set_done(self, index: int, succeeded: bool, error: str = '') -> None:
+    """Records that a task finished, failures are reported right away."""
+    self._states[index] = TaskState.SUCCEEDED if succeeded else TaskState.FAILED
+    started_at = self._started_at.get(index, self._start_time)
+    self._durations[index] = self._clock() - started_at
+    if not succeeded:
+      self.print(
+          f'Task {self._describe(index)} failed'
+          + (f': {error}' if error else '.')
+      )
+
+  def print(self, message: str) -> None:
+    """Prints a message without garbling the status line."""
+    self._clear_live_line()
+    self._write(f'{_PREFIX}{message}\n')
+    if self._is_tty:
+      self._render()
+
+  def refresh(self) -> None:
+    """Shows the current progress, if the last update is old enough."""
+    now = self._clock()
+    if (
+        self._last_render is not None
+        and now - self._last_render < self.refresh_interval
+    ):
+      return
+    self._render()
+
+  def finish(self) -> None:
+    """Shows the final progress and the durations of the tasks."""
+    self._clear_live_line()
+    self._write(f'{_PREFIX}{self._status_line()}\n')
+    if not self._durations:
+      return
+    rows = []
+    for index in sorted(
+        self._durations, key=self._durations.__getitem__, reverse=True
+    ):
+      failed = self._states[index] == TaskState.FAILED
+      rows.append([
+          self._task_names[index],
+          self._states[index].value,
+          _format_duration(self._durations[index]),
+          self._log_paths[index] if failed and self._log_paths else '',
+      ])
+    self._write(
+        f'{_PREFIX}Durations of tasks of {self._jobname}:\n'
+        + tabulate(rows, headers=['Task', 'Result', 'Duration', 'Log'])
+        + '\n'
+    )
+
+  def _render(self) -> None:
+    self._last_render = self._clock()
+    line = f'{_PREFIX}{self._status_line()}'
+    if self._is_tty:
+      width = shutil.get_terminal_size().columns
+      self._write(f'\r{line[: max(width - 1, 1)]}\x1b[K')
+      self._live_line_shown = True
+    else:
+      self._write(f'{line}\n')
+
+  def _clear_live_line(self) -> None:
+    if self._live_line_shown:
+      self._write('\r\x1b[K')
+      self._live_line_shown = False
+
+  def _status_line(self) -> str:
+    counts = {state: 0 for state in TaskState}
+    for state in self._states:
+      counts[state] += 1
+    done = counts[TaskState.SUCCEEDED] + counts[TaskState.FAILED]
+    total = len(self._states)
+    elapsed = self._clock() - self._start_time
+    parts = [
+        f'{done}/{total} done',
+        f'{counts[TaskState.RUNNING]} running',
+        f'{counts[TaskState.PENDING]} pending',
+        f'{counts[TaskState.FAILED]} failed',
+    ]
+    if 0 < done < total:
+      eta = elapsed / done * (total - done)
+      parts.append(f'ETA {_format_duration(eta)}')
+    line = (
+        f'[t={_format_duration(elapsed)}, {self._jobname}] {", ".join(parts)}'
+    )
+    running = sorted(
+        (i for i, s in enumerate(self._states) if s == TaskState.RUNNING),
+        key=self._started_at.__getitem__,
+    )[:_SLOWEST_TASKS_SHOWN]
+    if running:
+      now = self._clock()
+      slowest = ', '.join(
+          f'{self._describe(i)} running for'
+          f' {_format_duration(now - self._started_at[i])}'
+          for i in running
+      )
+      line += f'; slowest: {slowest}'
+    return line
+
+  def _describe(self, index: int) -> str:
+    if self._log_paths is None:
+      return self._task_names[index]
+    return f'{self._task_names[index]} (log {self._log_paths[index]})'
+
+  def _write(self, text: str) -> None:
+    self._stream.write(text)
+    self._stream.flush()
+
+
+class WaitProgress:
+  """Reports how long a single command has been running.
+
+  On a terminal the wait is shown on a line redrawn every update. Otherwise a
+  line is printed at most once per minute.
+  """
+
+  def __init__(self, task: str, stream: TextIO | None = None):
+    self._task = task
+    self._stream = stream if stream is not None else sys.stdout
+    self._is_tty = _is_tty(self._stream)
+    self._last_reported = 0
+
+  def update(self, seconds: int) -> None:
+    if not self._is_tty:
+      if seconds - self._last_reported < _LOG_REFRESH_SECONDS:
+        return
+      self._last_reported = seconds
+    end = '\r' if self._is_tty else '\n'
+    self._stream.write(
+        f'{_PREFIX}Waiting for `{self._task}`, for'
+        f' {_format_duration(seconds)}...{end}'
+    )
+    self._stream.flush()
@@ -0,0 +1,142 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import io
+
+from .progress import BatchProgress, WaitProgress
+
+
+class _FakeClock:
+
+  def __init__(self) -> None:
+    self.now = 0.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+class _TtyStream(io.StringIO):
+
+  def isatty(self) -> bool:
+    return True
+
+
+def test_batch_progress_rate_limits_summaries_in_logs():
+  clock = _FakeClock()
+  stream = io.StringIO()
+  progress = BatchProgress(
+      'Create Nodepools',
+      [f'np-{i}' for i in range(200)],
+      stream=stream,
+      clock=clock,
+  )
+  for i in range(200):
+    progress.set_running(i)
+  progress.refresh()
+
+  for i in range(100):
+    clock.now += 1
+    progress.set_done(i, succeeded=True)
+    progress.refresh()
+
+  lines = stream.getvalue().splitlines()
+  assert len(lines) == 2
+  assert lines[1] == (
+      '[XPK] [t=1m00s, Create Nodepools] 60/200 done, 140 running, 0 pending,'
+      ' 0 failed, ETA 2m20s; slowest: np-60 running for 1m00s, np-61 running'
+      ' for 1m00s, np-62 running for 1m00s'
+  )
+
+
+def test_batch_progress_reports_failures_with_logs_right_away():
+  clock = _FakeClock()
+  stream = io.StringIO()
+  progress = BatchProgress(
+      'Create Nodepools',
+      ['np-0', 'np-1'],
+      ['/tmp/np-0.log', '/tmp/np-1.log'],
+      stream=stream,
+      clock=clock,
+  )
+  progress.set_running(0)
+  progress.set_running(1)
+  progress.refresh()
+  clock.now = 5
+  progress.set_done(1, succeeded=False, error='lack of capacity')
+
+  assert stream.getvalue().splitlines()[-1] == (
+      '[XPK] Task np-1 (log /tmp/np-1.log) failed: lack of capacity'
+  )
+
+
+def test_batch_progress_prints_durations_once_done():
+  clock = _FakeClock()
+  stream = io.StringIO()
+  progress = BatchProgress(
+      'Create Nodepools',
+      ['np-0', 'np-1'],
+      ['/tmp/np-0.log', '/tmp/np-1.log'],
+      stream=stream,
+      clock=clock,
+  )
+  progress.set_running(0)
+  progress.set_running(1)
+  clock.now = 30
+  progress.set_done(0, succeeded=True)
+  clock.now = 90
+  progress.set_done(1, succeeded=False)
+
+  progress.finish()
+
+  output = stream.getvalue()
+  assert '[t=1m30s, Create Nodepools] 2/2 done, 0 running' in output
+  table = output.split('Durations of tasks of Create Nodepools:\n')[1]
+  rows = [line.split() for line in table.splitlines()[2:]]
+  assert rows == [
+      ['np-1', 'failed', '1m30s', '/tmp/np-1.log'],
+      ['np-0', 'succeeded', '30s'],
+  ]
+
+
+def test_batch_progress_keeps_single_line_on_terminal():
+  clock = _FakeClock()
+  stream = _TtyStream()
+  progress = BatchProgress(
+      'Delete Nodepools', ['np-0'], stream=stream, clock=clock
+  )
+  progress.set_running(0)
+
+  for _ in range(3):
+    clock.now += 1
+    progress.refresh()
+
+  assert '\n' not in stream.getvalue()
+  assert stream.getvalue().count('\r[XPK] [t=') == 3
+  assert '[t=3s, Delete Nodepools] 0/1 done, 1 running' in stream.getvalue()
+
+
+def test_wait_progress_prints_once_per_minute_in_logs():
+  stream = io.StringIO()
+  progress = WaitProgress('Cluster Create', stream=stream)
+
+  for seconds in range(1, 181):
+    progress.update(seconds)
+
+  assert stream.getvalue().splitlines() == [
+      '[XPK] Waiting for `Cluster Create`, for 1m00s...',
+      '[XPK] Waiting for `Cluster Create`, for 2m00s...',
+      '[XPK] Waiting for `Cluster Create`, for 3m00s...',
+  ]
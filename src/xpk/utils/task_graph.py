@@ -0,0 +1,135 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Collection, Iterable, Sequence
+
+
+@dataclass(frozen=True)
+class _Task:
+  name: str
+  run: Callable[[], int]
+  dependencies: tuple[str, ...]
+
+
+class TaskGraph:
+  """Runs tasks after the tasks they depend on, independent ones in parallel.
+
+  Tasks return a return code, 0 meaning success. Dependencies have to be added
+  before the tasks depending on them, so the order in which tasks are added is
+  always a valid sequential order, and is the order they run in when running
+  without parallelism.
+  """
+
+  def __init__(self) -> None:
+    self._tasks: dict[str, _Task] = {}
+
+  def add_task(
+      self,
+      name: str,
+      run: Callable[[], int],
+      dependencies: Sequence[str] = (),
+  ) -> None:
+    """Adds a task to the graph.
+
+    Args:
+      name: unique name of the task.
+      run: function running the task and returning its return code.
+      dependencies: names of the tasks that have to succeed before this one.
+
+    Raises:
+      ValueError: if the name is taken or a dependency was not added yet.
+    """
+    if name in self._tasks:
+      raise ValueError(f'Task {name} was already added.')
+    for dependency in dependencies:
+      if dependency not in self._tasks:
+        raise ValueError(f'Task {name} depends on unknown task {dependency}.')
+    self._tasks[name] = _Task(name, run, tuple(dependencies))
+
+  @property
+  def task_names(self) -> list[str]:
+    return list(self._tasks)
+
+  def get_dependents(self, names: Iterable[str]) -> set[str]:
+    """Returns the given tasks and the tasks depending on them, transitively."""
+    dependents = set(names)
+    # Dependencies are added before their dependents.
+    for task in self._tasks.values():
+      if any(d in dependents for d in task.dependencies):
+        dependents.add(task.name)
+    return dependents
+
+  def run(
+      self,
+      max_parallelism: int,
+      skip: Collection[str] = (),
+      on_success: Callable[[str], None] | None = None,
+  ) -> int:
+    """Runs all tasks, starting ready tasks in the order they were added.
+
+    Once a task fails no more tasks are started, and the tasks that are
+    already running are waited for.
+
+    Args:
+      max_parallelism: maximum number of tasks running at the same time.
+      skip: names of tasks not to run, which count as succeeded.
+      on_success: called with the name of each task that succeeded, from the
+        thread calling run.
+
+    Returns:
+      0 if all tasks succeeded, the return code of the first failed task
+      otherwise.
+
+    Raises:
+      BaseException: the first exception raised by a task, including
+        SystemExit, once the running tasks finished.
+    """
+    pending = [task for task in self._tasks.values() if task.name not in skip]
+    succeeded = set(skip)
+    running: dict[Future, _Task] = {}
+    return_code = 0
+    error: BaseException | None = None
+    with ThreadPoolExecutor(max_workers=max_parallelism) as executor:
+      while True:
+        if return_code == 0 and error is None:
+          for task in list(pending):
+            if len(running) >= max_parallelism:
+              break
+            if all(d in succeeded for d in task.dependencies):
+              pending.remove(task)
+              # Tasks inherit the context, e.g. the current tracing phase.
+              context = contextvars.copy_context()
+              running[executor.submit(context.run, task.run)] = task
+        if not running:
+          break
+        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in finished:
+          task = running.pop(future)
+          task_error = future.exception()
+          if task_error is not None:
+            error = error or task_error
+          elif future.result() != 0:
+            return_code = return_code or future.result()
+          else:
+            succeeded.add(task.name)
+            if on_success is not None:
+              on_success(task.name)
+    if error is not None:
+      raise error
+    return return_code
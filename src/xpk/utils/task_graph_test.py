@@ -0,0 +1,136 @@
+"""
+Copyright 2026 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+
+import pytest
+
+from .task_graph import TaskGraph
+
+
+def _record(runs: list[str], name: str, return_code: int = 0):
+  def run() -> int:
+    runs.append(name)
+    return return_code
+
+  return run
+
+
+def test_runs_tasks_in_added_order_without_parallelism():
+  runs: list[str] = []
+  graph = TaskGraph()
+  graph.add_task('a', _record(runs, 'a'))
+  graph.add_task('b', _record(runs, 'b'))
+  graph.add_task('c', _record(runs, 'c'), ['a'])
+  graph.add_task('d', _record(runs, 'd'), ['b', 'c'])
+
+  assert graph.run(max_parallelism=1) == 0
+  assert runs == ['a', 'b', 'c', 'd']
+
+
+def test_runs_independent_tasks_in_parallel():
+  both_started = threading.Barrier(2)
+  runs: list[str] = []
+
+  def wait_for_other() -> int:
+    both_started.wait(timeout=5)
+    return 0
+
+  graph = TaskGraph()
+  graph.add_task('a', wait_for_other)
+  graph.add_task('b', wait_for_other)
+  graph.add_task('c', _record(runs, 'c'), ['a', 'b'])
+
+  assert graph.run(max_parallelism=2) == 0
+  assert runs == ['c']
+
+
+def test_stops_starting_tasks_after_failure():
+  runs: list[str] = []
+  graph = TaskGraph()
+  graph.add_task('a', _record(runs, 'a', return_code=3))
+  graph.add_task('b', _record(runs, 'b'))
+  graph.add_task('c', _record(runs, 'c', return_code=4))
+
+  assert graph.run(max_parallelism=1) == 3
+  assert runs == ['a']
+
+
+def test_does_not_run_tasks_depending_on_failed_task():
+  runs: list[str] = []
+  a_finished = threading.Event()
+
+  def fail() -> int:
+    a_finished.set()
+    return 1
+
+  def wait_for_a() -> int:
+    a_finished.wait(timeout=5)
+    runs.append('b')
+    return 0
+
+  graph = TaskGraph()
+  graph.add_task('a', fail)
+  graph.add_task('b', wait_for_a)
+  graph.add_task('c', _record(runs, 'c'), ['a'])
+
+  assert graph.run(max_parallelism=2) == 1
+  assert runs == ['b']
+
+
+def test_reraises_exit_of_task():
+  def exit_task() -> int:
+    raise SystemExit(5)
+
+  graph = TaskGraph()
+  graph.add_task('a', exit_task)
+
+  with pytest.raises(SystemExit) as e:
+    graph.run(max_parallelism=2)
+  assert e.value.code == 5
+
+
+def test_rejects_unknown_dependencies():
+  graph = TaskGraph()
+
+  with pytest.raises(ValueError):
+    graph.add_task('a', lambda: 0, ['b'])
+
+
+def test_skips_tasks_and_reports_succeeded_ones():
+  runs: list[str] = []
+  succeeded: list[str] = []
+  graph = TaskGraph()
+  graph.add_task('a', _record(runs, 'a'))
+  graph.add_task('b', _record(runs, 'b'), ['a'])
+  graph.add_task('c', _record(runs, 'c', return_code=1), ['b'])
+
+  assert (
+      graph.run(max_parallelism=1, skip={'a'}, on_success=succeeded.append) == 1
+  )
+  assert runs == ['b', 'c']
+  assert succeeded == ['b']
+
+
+def test_get_dependents_returns_tasks_depending_transitively():
+  graph = TaskGraph()
+  graph.add_task('a', lambda: 0)
+  graph.add_task('b', lambda: 0, ['a'])
+  graph.add_task('c', lambda: 0, ['b'])
+  graph.add_task('d', lambda: 0)
+
+  assert graph.get_dependents(['b']) == {'b', 'c'}
+  assert graph.task_names == ['a', 'b', 'c', 'd']
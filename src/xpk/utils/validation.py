@@ -21,28 +21,42 @@ from dataclasses import dataclass
 from .feature_flags import FeatureFlags
 from .dependencies.binary_dependencies import BinaryDependencies
 from .dependencies.manager import ensure_dependency
+from .dependencies.validation_cache import is_validated, mark_validated
 
 
 @dataclass
 class _SystemDependency:
+  """A dependency validated by running `command`.
+
+  Once the command succeeds, it is not run again until one of `binaries`
+  changes. Dependencies without binaries are validated on every run.
+  """
+
   command: str
   binary_dependency: BinaryDependencies | None = None
+  binaries: tuple[str, ...] = ()
 
 
 class SystemDependency(Enum):
   """Represents required system dependencies."""
 
   KUBECTL = _SystemDependency(
-      command='kubectl --help', binary_dependency=BinaryDependencies.KUBECTL
+      command='kubectl --help',
+      binary_dependency=BinaryDependencies.KUBECTL,
+      binaries=('kubectl',),
   )
-  GCLOUD = _SystemDependency(command='gcloud version')
+  GCLOUD = _SystemDependency(command='gcloud version', binaries=('gcloud',))
+  # `docker version` also checks that the daemon is running.
   DOCKER = _SystemDependency(command='docker version')
   KUEUECTL = _SystemDependency(
       command='kubectl kueue --help',
       binary_dependency=BinaryDependencies.KUBECTL_KUEUE,
+      binaries=('kubectl', 'kubectl-kueue'),
   )
   CRANE = _SystemDependency(
-      command='crane --help', binary_dependency=BinaryDependencies.CRANE
+      command='crane --help',
+      binary_dependency=BinaryDependencies.CRANE,
+      binaries=('crane',),
   )
 
 
@@ -68,7 +82,12 @@ def validate_dependencies_list(args, dependencies: list[SystemDependency]):
 def _validate_dependency(dependency: SystemDependency) -> None:
   """Validates system dependency and returns none or exits with error."""
   name, cmd = dependency.name, dependency.value.command
+  binaries = dependency.value.binaries
+  if binaries and is_validated(binaries):
+    return
   code, _ = run_command_for_value(cmd, f'Validate {name} installation.')
+  if code == 0 and binaries:
+    mark_validated(binaries)
   if code != 0:
     xpk_print(
         f'`{name.lower()}` not installed. Please follow  '
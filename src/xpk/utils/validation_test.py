@@ -27,6 +27,18 @@ class Args:
   pass
 
 
+@pytest.fixture(name='bin_dir')
+def _bin_dir(tmp_path, monkeypatch):
+  bin_dir = tmp_path / 'bin'
+  bin_dir.mkdir()
+  for binary in ('kubectl', 'docker'):
+    (bin_dir / binary).write_text('#!/bin/sh\n')
+    (bin_dir / binary).chmod(0o755)
+  monkeypatch.setenv('PATH', str(bin_dir))
+  FeatureFlags.DEPENDENCY_AUTO_DOWNLOAD = False
+  return bin_dir
+
+
 def test_should_validate_dependencies_returns_true_by_default():
   assert should_validate_dependencies(Args())
 
@@ -145,3 +157,44 @@ def test_validate_dependencies_list_downloads_dependency_if_args_flag_enabled(
   mock_ensure.assert_called_once_with(
       SystemDependency.KUBECTL.value.binary_dependency.value
   )
+
+
+def test_validate_dependencies_list_skips_binaries_validated_before(
+    mocker, bin_dir
+):
+  run = mocker.patch(
+      'xpk.utils.validation.run_command_for_value', return_value=(0, '')
+  )
+
+  validate_dependencies_list(Args(), [SystemDependency.KUBECTL])
+  validate_dependencies_list(Args(), [SystemDependency.KUBECTL])
+  assert run.call_count == 1
+
+  (bin_dir / 'kubectl').write_text('#!/bin/sh\n# updated\n')
+  validate_dependencies_list(Args(), [SystemDependency.KUBECTL])
+  assert run.call_count == 2
+
+
+@pytest.mark.usefixtures('bin_dir')
+def test_validate_dependencies_list_does_not_cache_failed_validation(mocker):
+  run = mocker.patch(
+      'xpk.utils.validation.run_command_for_value', return_value=(1, '')
+  )
+
+  for _ in range(2):
+    with pytest.raises(SystemExit):
+      validate_dependencies_list(Args(), [SystemDependency.KUBECTL])
+
+  assert run.call_count == 2
+
+
+@pytest.mark.usefixtures('bin_dir')
+def test_validate_dependencies_list_always_runs_docker_validation(mocker):
+  run = mocker.patch(
+      'xpk.utils.validation.run_command_for_value', return_value=(0, '')
+  )
+
+  validate_dependencies_list(Args(), [SystemDependency.DOCKER])
+  validate_dependencies_list(Args(), [SystemDependency.DOCKER])
+
+  assert run.call_count == 2